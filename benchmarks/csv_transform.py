@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the source to canonical exposures transformation with the XSLT
+``Translator`` and with the ``ColumnMapper``, using a column mapping
+converted from the same XSLT file, on a synthetic source exposures file of
+copies of the rows of the test source exposures file.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.csv_transform [-n <num. locations>] [-c <chunk size>] [-p <num. Translator processes>]
+"""
+from __future__ import print_function
+
+import argparse
+import filecmp
+import os
+import time
+
+import pandas as pd
+
+from backports.tempfile import TemporaryDirectory
+
+from oasislmf.exposures.csv_map import (
+    ColumnMapper,
+    convert_xslt_to_column_mapping,
+)
+from oasislmf.exposures.csv_trans import Translator
+
+
+input_data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests', 'exposures', 'csv_trans_data', 'input')
+
+
+def run(num_locations, chunk_size, num_processes):
+    xslt_fp = os.path.join(input_data_dir, 'source_to_canonical.xslt')
+    xsd_fp = os.path.join(input_data_dir, 'source_to_canonical.xsd')
+
+    with TemporaryDirectory() as d:
+        src_df = pd.read_csv(os.path.join(input_data_dir, 'source.csv'), dtype=object)
+        src_df = src_df.iloc[[i % len(src_df) for i in range(num_locations)]]
+        src_fp = os.path.join(d, 'source.csv')
+        src_df.to_csv(src_fp, index=False)
+
+        xslt_out_fp = os.path.join(d, 'canonical_xslt.csv')
+        start = time.time()
+        Translator(src_fp, xslt_out_fp, xslt_fp, xsd_path=xsd_fp, append_row_nums=True, chunk_size=chunk_size, num_processes=num_processes)()
+        xslt_time = time.time() - start
+
+        mapping_out_fp = os.path.join(d, 'canonical_mapping.csv')
+        start = time.time()
+        mapping = convert_xslt_to_column_mapping(xslt_fp)
+        ColumnMapper(src_fp, mapping_out_fp, mapping, append_row_nums=True)()
+        mapping_time = time.time() - start
+
+        print('Locations: {}'.format(num_locations))
+        print('XSLT transformation: {:.3f}s'.format(xslt_time))
+        print('Column mapping transformation: {:.3f}s ({:.1f}x)'.format(mapping_time, xslt_time / mapping_time))
+        print('Identical outputs: {}'.format(filecmp.cmp(xslt_out_fp, mapping_out_fp, shallow=False)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Source to canonical transformation benchmark')
+    parser.add_argument('-n', '--num-locations', type=int, default=100000, help='Number of locations')
+    parser.add_argument('-c', '--chunk-size', type=int, default=5000, help='Translator chunk size')
+    parser.add_argument('-p', '--num-processes', type=int, default=None, help='Number of Translator worker processes (default threads)')
+    args = parser.parse_args()
+    run(args.num_locations, args.chunk_size, args.num_processes)
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of FM items generation (``OasisExposuresManager.generate_fm_items``)
+on a synthetic canonical exposures and accounts portfolio, with a
+configurable number of locations, accounts and policies (layers) per account.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.fm_items [-n <num. locations>] [-a <num. accounts>] [-p <max. policies per account>]
+"""
+from __future__ import print_function
+
+import argparse
+import copy
+import resource
+import time
+
+import numpy as np
+import pandas as pd
+
+from oasislmf.exposures.manager import OasisExposuresManager
+
+from tests.data import (
+    canonical_accounts_profile,
+    canonical_exposures_profile,
+    oasis_fm_agg_profile,
+)
+
+from .gul_items import synthetic_portfolio
+
+
+def synthetic_fm_portfolio(num_locations, num_accounts, max_policies=1, seed=1234):
+    """
+    Returns a triple of canonical exposures, keys and canonical accounts data
+    frames for a portfolio of ``num_locations`` locations spread over
+    ``num_accounts`` accounts, each account having between one and
+    ``max_policies`` policies (layers).
+    """
+    rs = np.random.RandomState(seed)
+
+    canexp_df, keys_df = synthetic_portfolio(num_locations, seed=seed)
+
+    acc_nums = np.array(['A{}'.format(i) for i in range(1, num_accounts + 1)], dtype=object)
+    canexp_df['accntnum'] = acc_nums[rs.randint(0, num_accounts, num_locations)]
+    canexp_df['wscombinedded'] = rs.uniform(0, 10**3, num_locations)
+    canexp_df['wscombinedlim'] = rs.uniform(0, 10**5, num_locations)
+    canexp_df['wssiteded'] = rs.uniform(0, 10**3, num_locations)
+    canexp_df['wssitelim'] = rs.uniform(0, 10**5, num_locations)
+    canexp_df['cond1name'] = 0
+    canexp_df['cond1deductible'] = 0.0
+    canexp_df['cond1limit'] = 0.0
+    canexp_df['index'] = canexp_df.index
+
+    num_policies = rs.randint(1, max_policies + 1, num_accounts)
+    num_acc_rows = num_policies.sum()
+
+    canacc_df = pd.DataFrame({
+        'row_id': np.arange(1, num_acc_rows + 1),
+        'accntnum': np.repeat(acc_nums, num_policies),
+        'policynum': ['{}P{}'.format(a, p + 1) for a, n in zip(acc_nums, num_policies) for p in range(n)],
+        'blandedamt': rs.uniform(0, 10**3, num_acc_rows),
+        'mindedamt': 0.0,
+        'maxdedamt': 0.0,
+        'undcovamt': rs.uniform(0, 10**3, num_acc_rows),
+        'partof': rs.uniform(10**5, 10**6, num_acc_rows),
+        'blanlimamt': rs.uniform(0, 1, num_acc_rows),
+    })
+    canacc_df['index'] = canacc_df.index
+
+    return canexp_df, keys_df, canacc_df
+
+
+def run(num_locations, num_accounts, max_policies):
+    cep = copy.deepcopy(canonical_exposures_profile)
+    cap = copy.deepcopy(canonical_accounts_profile)
+    fmap = copy.deepcopy(oasis_fm_agg_profile)
+
+    canexp_df, keys_df, canacc_df = synthetic_fm_portfolio(num_locations, num_accounts, max_policies=max_policies)
+
+    manager = OasisExposuresManager()
+
+    gul_items_df = manager.generate_gul_items(cep, canexp_df.copy(deep=True), keys_df)
+
+    start = time.time()
+    fm_items_df = manager.generate_fm_items(canexp_df, gul_items_df, cep, cap, canacc_df, fmap)
+    fm_time = time.time() - start
+
+    print('Locations: {}, accounts: {}, account policies: {}'.format(num_locations, num_accounts, len(canacc_df)))
+    print('GUL items: {}, FM items: {}'.format(len(gul_items_df), len(fm_items_df)))
+    print('FM items generation: {:.3f}s'.format(fm_time))
+    print('Peak RSS: {:.1f} MB'.format(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='FM items generation benchmark')
+    parser.add_argument('-n', '--num-locations', type=int, default=1000, help='Number of locations')
+    parser.add_argument('-a', '--num-accounts', type=int, default=10, help='Number of accounts')
+    parser.add_argument('-p', '--max-policies', type=int, default=2, help='Max. number of policies (layers) per account')
+    args = parser.parse_args()
+    run(args.num_locations, args.num_accounts, args.max_policies)
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the columnar GUL items generator in
+``OasisExposuresManager.generate_gul_items`` against the previous row-wise
+(``iterrows``) generator, on a synthetic canonical exposures portfolio and
+keys set.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.gul_items [-n <num. locations>]
+"""
+from __future__ import print_function
+
+import argparse
+import copy
+import itertools
+import time
+
+import numpy as np
+import pandas as pd
+
+from oasislmf.exposures.manager import OasisExposuresManager
+from oasislmf.utils.fm import unified_canonical_fm_profile_by_level_and_term_group
+
+from tests.data import canonical_exposures_profile
+
+
+def legacy_gul_items(canonical_exposures_profile, canexp_df, keys_df):
+    """
+    The row-wise GUL items generator replaced by the columnar engine - kept
+    here as the benchmark baseline.
+    """
+    ufcp = unified_canonical_fm_profile_by_level_and_term_group(profiles=(canonical_exposures_profile,))
+    cov_level_id = tuple(ufcp.keys())[0]
+
+    merged_df = pd.merge(canexp_df, keys_df, left_on='row_id', right_on='locid').drop_duplicates()
+
+    tiv_terms = tuple(t for t in [ufcp[cov_level_id][gid].get('tiv') for gid in ufcp[cov_level_id]] if t)
+
+    fm_terms = {
+        tiv_tgid: {
+            term_type: (
+                ufcp[cov_level_id][tiv_tgid][term_type]['ProfileElementName'].lower() if ufcp[cov_level_id][tiv_tgid].get(term_type) else None
+            ) for term_type in ('deductible', 'deductiblemin', 'deductiblemax', 'limit', 'share',)
+        } for tiv_tgid in ufcp[cov_level_id]
+    }
+
+    group_id = 0
+    prev_it_loc_id = -1
+    item_id = 0
+    positive_tiv_elements = lambda it: [t for t in tiv_terms if it.get(t['ProfileElementName'].lower()) and it[t['ProfileElementName'].lower()] > 0 and t['CoverageTypeID'] == it['coveragetypeid']] or [0]
+
+    for it, ptiv in itertools.chain((it, ptiv) for _, it in merged_df.iterrows() for it, ptiv in itertools.product([it], positive_tiv_elements(it))):
+        if ptiv == 0:
+            continue
+
+        item_id += 1
+        if it['row_id'] != prev_it_loc_id:
+            group_id += 1
+
+        tiv_elm = ptiv['ProfileElementName'].lower()
+        tiv_tgid = ptiv['FMTermGroupID']
+
+        yield {
+            'item_id': item_id,
+            'canexp_id': it['row_id'] - 1,
+            'peril_id': it['perilid'],
+            'coverage_type_id': it['coveragetypeid'],
+            'coverage_id': item_id,
+            'tiv_elm': tiv_elm,
+            'tiv': it[tiv_elm],
+            'tiv_tgid': tiv_tgid,
+            'ded_elm': fm_terms[tiv_tgid].get('deductible'),
+            'ded_min_elm': fm_terms[tiv_tgid].get('deductiblemin'),
+            'ded_max_elm': fm_terms[tiv_tgid].get('deductiblemax'),
+            'lim_elm': fm_terms[tiv_tgid].get('limit'),
+            'shr_elm': fm_terms[tiv_tgid].get('share'),
+            'areaperil_id': it['areaperilid'],
+            'vulnerability_id': it['vulnerabilityid'],
+            'group_id': group_id,
+            'summary_id': 1,
+            'summaryset_id': 1
+        }
+        prev_it_loc_id = it['row_id']
+
+
+def synthetic_portfolio(num_locations, seed=1234):
+    """
+    Returns a pair of canonical exposures and keys data frames for a
+    portfolio of ``num_locations`` locations, with keys for all four
+    coverage types and some zero TIVs.
+    """
+    rs = np.random.RandomState(seed)
+
+    row_ids = np.arange(1, num_locations + 1)
+
+    canexp_df = pd.DataFrame({
+        'row_id': row_ids,
+        'accntnum': rs.randint(1, 100, num_locations),
+        'locnum': row_ids,
+    })
+    for i in range(1, 5):
+        tivs = rs.uniform(0, 10**6, num_locations)
+        tivs[rs.uniform(size=num_locations) < 0.1] = 0.0
+        canexp_df['wscv{}val'.format(i)] = tivs
+        canexp_df['wscv{}ded'.format(i)] = rs.uniform(0, 10**3, num_locations)
+        canexp_df['wscv{}limit'.format(i)] = rs.uniform(0, 10**5, num_locations)
+
+    keys_df = pd.DataFrame({
+        'locid': np.repeat(row_ids, 4),
+        'perilid': 1,
+        'coveragetypeid': np.tile(np.arange(1, 5), num_locations),
+        'areaperilid': rs.randint(1, 1000, 4 * num_locations),
+        'vulnerabilityid': rs.randint(1, 100, 4 * num_locations),
+    })
+
+    return canexp_df, keys_df
+
+
+def run(num_locations):
+    profile = copy.deepcopy(canonical_exposures_profile)
+    canexp_df, keys_df = synthetic_portfolio(num_locations)
+
+    start = time.time()
+    legacy_df = pd.DataFrame(data=list(legacy_gul_items(profile, canexp_df.copy(deep=True), keys_df.copy(deep=True))), dtype=object)
+    legacy_time = time.time() - start
+
+    start = time.time()
+    gul_items_df = OasisExposuresManager().generate_gul_items(profile, canexp_df.copy(deep=True), keys_df.copy(deep=True))
+    columnar_time = time.time() - start
+
+    cols = [c for c in legacy_df.columns]
+    same = (
+        len(legacy_df) == len(gul_items_df) and
+        all((legacy_df[c].astype(gul_items_df[c].dtype).values == gul_items_df[c].values).all() for c in cols if not c.endswith('_elm')) and
+        all(list(legacy_df[c]) == list(gul_items_df[c]) for c in cols if c.endswith('_elm'))
+    )
+
+    print('Locations: {}, GUL items: {}'.format(num_locations, len(gul_items_df)))
+    print('Row-wise generator: {:.3f}s'.format(legacy_time))
+    print('Columnar generator: {:.3f}s ({:.1f}x)'.format(columnar_time, legacy_time / columnar_time if columnar_time else float('inf')))
+    print('Identical items: {}'.format(same))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='GUL items generation benchmark')
+    parser.add_argument('-n', '--num-locations', type=int, default=10000, help='Number of locations')
+    run(parser.parse_args().num_locations)
@@ -0,0 +1,303 @@
+"""
+    Provides an asyncio based Oasis API client, which runs many analyses
+    concurrently from one event loop.
+
+    This module is Python 3 only (it uses ``async``/``await``), and so is not
+    imported by the package - import it directly.
+"""
+import asyncio
+import functools
+import logging
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+
+from requests import RequestException
+
+from .client import OasisAPIClient
+from ..utils.exceptions import OasisException
+from ..utils.status import STATUS_FAILURE, STATUS_SUCCESS
+
+__all__ = [
+    'AsyncOasisAPIClient'
+]
+
+
+class AsyncOasisAPIClient(object):
+    """
+    Class for running many analyses concurrently on the oasis api server.
+
+    The analyses are submitted, and their statuses polled, from a single
+    event loop - all pending analyses which are due a status check are
+    checked in one batch, and the poll interval of each analysis is
+    increased while it remains pending. The outputs of each analysis are
+    downloaded as soon as it completes, while the others are polled.
+
+    The HTTP requests are made with an ``OasisAPIClient`` on a bounded
+    executor, over a connection pool shared by all the analyses, so the
+    number of connections and threads is bounded by ``max_connections``
+    however many analyses are run.
+
+    :param oasis_api_url: The root URL for the API. This should
+        include the scheme and port (eg. http://localhost:8001)
+    :type oasis_api_url: str
+
+    :param logger: The logger to use for message logging. If None
+        the root logger is used.
+    :type logger: Logger
+
+    :param max_connections: The maximum number of concurrent requests
+        (and pooled connections) to the server
+    :type max_connections: int
+
+    :param poll_interval: The initial interval between the status checks
+        of an analysis, in seconds
+    :type poll_interval: float
+
+    :param max_poll_interval: The maximum interval between the status
+        checks of an analysis, in seconds
+    :type max_poll_interval: float
+
+    :param poll_backoff: The factor the interval between the status checks
+        of an analysis is increased by after each check it is pending
+    :type poll_backoff: float
+
+    :param client_kwargs: Other ``OasisAPIClient`` arguments, e.g. the
+        ``retry_policies``
+    """
+    def __init__(
+        self,
+        oasis_api_url,
+        logger=None,
+        max_connections=10,
+        poll_interval=1,
+        max_poll_interval=30,
+        poll_backoff=1.5,
+        **client_kwargs
+    ):
+        if max_connections < 1:
+            raise OasisException('The maximum number of connections must be at least 1: {}'.format(max_connections))
+
+        self._logger = logger or logging.getLogger()
+        self._client = OasisAPIClient(oasis_api_url, logger=self._logger, max_connections=max_connections, **client_kwargs)
+
+        self._executor = ThreadPoolExecutor(max_workers=max_connections)
+
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.poll_backoff = poll_backoff
+
+    @property
+    def client(self):
+        """
+        The (blocking) ``OasisAPIClient`` the requests are made with.
+        """
+        return self._client
+
+    def close(self):
+        """
+        Shuts down the request executor and closes the pooled connections.
+        """
+        self._executor.shutdown(wait=True)
+        self._client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _call(self, fn, *args, **kwargs):
+        """
+        Runs a blocking function on the request executor, returns an
+        awaitable of its result.
+        """
+        return asyncio.get_event_loop().run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    def _fetch_analysis_status(self, analysis_status_location):
+        """
+        Fetches the analysis status for the requested analysis - unlike
+        ``OasisAPIClient.get_analysis_status`` a failed analysis is returned
+        rather than raised, and server errors (after retries) are raised as
+        ``RequestException``, so that the analysis is polled again.
+
+        :return: A 3 tuple of the status, the output location (if the
+            analysis completed) and the error message (if it failed)
+        """
+        response = self._client._request('status', 'GET', self._client.build_uri('/analysis_status/' + analysis_status_location))
+        if response.status_code >= 500:
+            raise RequestException('GET analysis status failed: {}'.format(response.status_code))
+        elif response.status_code != 200:
+            raise OasisException('GET analysis status failed: {}'.format(response.status_code))
+
+        result = response.json()
+        self._logger.debug('Analysis status: {}'.format(result))
+
+        return result['status'], result.get('outputs_location') or '', result.get('message') or ''
+
+    async def upload_inputs_from_directory(self, *args, **kwargs):
+        """
+        Uploads inputs, see ``OasisAPIClient.upload_inputs_from_directory``.
+        """
+        return await self._call(self._client.upload_inputs_from_directory, *args, **kwargs)
+
+    async def get_analysis_status(self, analysis_status_location):
+        """
+        Fetches the analysis status for the requested analysis.
+
+        :return: A 3 tuple of the status, the output location (if the
+            analysis completed) and the error message (if it failed)
+        """
+        return await self._call(self._fetch_analysis_status, analysis_status_location)
+
+    async def _complete_analysis(self, analysis, outputs_directory, cleanup):
+        """
+        Downloads the outputs of a completed analysis, and cleans up its
+        resources on the server.
+        """
+        outputs_file = os.path.join(outputs_directory, analysis['outputs_location'] + '.tar.gz')
+        try:
+            start = asyncio.get_event_loop().time()
+            await self._call(self._client.download_outputs, analysis['outputs_location'], outputs_file)
+            analysis['timings']['download'] = asyncio.get_event_loop().time() - start
+            analysis['outputs_file'] = outputs_file
+            analysis['status'] = STATUS_SUCCESS
+            self._logger.info('Analysis {} completed: {}'.format(analysis['analysis_status_location'], outputs_file))
+        except Exception as e:
+            analysis['status'] = STATUS_FAILURE
+            analysis['error'] = 'Failed to download outputs: {}'.format(e)
+            self._logger.error('Analysis {}: {}'.format(analysis['analysis_status_location'], analysis['error']))
+
+        if cleanup:
+            await self._call(self._client.delete_outputs, analysis['outputs_location'])
+
+    async def _submit_analysis(self, analysis_settings_json, analysis):
+        try:
+            start = asyncio.get_event_loop().time()
+            analysis['analysis_status_location'] = await self._call(
+                self._client.run_analysis, analysis_settings_json, analysis['input_location']
+            )
+            analysis['submitted'] = asyncio.get_event_loop().time()
+            analysis['timings']['submit'] = analysis['submitted'] - start
+        except Exception as e:
+            analysis['status'] = STATUS_FAILURE
+            analysis['error'] = 'Failed to start analysis: {}'.format(e)
+            self._logger.error('Analysis of {}: {}'.format(analysis['input_location'], analysis['error']))
+
+    async def run_analyses(self, analysis_settings_json, input_locations, outputs_directory, cleanup=True):
+        """
+        Runs analyses of uploaded inputs to completion or failure, and
+        downloads their outputs as each completes. The failure of an
+        analysis does not affect the others - the errors are returned in the
+        results rather than raised.
+
+        :param analysis_setting_json: The analysis settings encoded as JSON.
+        :type analysis_settings_json: str
+
+        :param input_locations: The locations of the inputs resources to run
+            the analyses of (an input location may be repeated)
+        :type input_locations: list
+
+        :param outputs_directory: The local directory to save the outputs to.
+        :type outputs_directory: str
+
+        :param cleanup: Whether to delete the outputs resource of each
+            analysis on the server once it has completed, and the inputs
+            resources once all the analyses have finished
+        :type cleanup: bool
+
+        :return: A list of analysis dicts, in the order of the input
+            locations, with the ``input_location``, the
+            ``analysis_status_location``, the final ``status``, either
+            the ``outputs_file`` or the ``error``, and the ``timings`` of
+            the stages of the analysis completed - the times taken, in
+            seconds, to ``submit`` the analysis, to ``run`` it (until its
+            completion is polled), and to ``download`` the outputs
+        """
+        loop = asyncio.get_event_loop()
+
+        analyses = [
+            {
+                'input_location': input_location,
+                'analysis_status_location': None,
+                'outputs_location': None,
+                'outputs_file': None,
+                'status': None,
+                'error': None,
+                'num_status_checks': 0,
+                'submitted': None,
+                'timings': {},
+            }
+            for input_location in input_locations
+        ]
+
+        await asyncio.gather(*(self._submit_analysis(analysis_settings_json, analysis) for analysis in analyses))
+        self._logger.info('{} analyses started'.format(len([a for a in analyses if a['status'] is None])))
+
+        # The time each pending analysis is next due a status check, and its
+        # current poll interval
+        pending = {i: (loop.time(), self.poll_interval) for i, analysis in enumerate(analyses) if analysis['status'] is None}
+        completions = []
+
+        while pending:
+            now = loop.time()
+            due = [i for i, (due_time, _) in pending.items() if due_time <= now]
+
+            statuses = await asyncio.gather(
+                *(self.get_analysis_status(analyses[i]['analysis_status_location']) for i in due),
+                return_exceptions=True
+            )
+
+            now = loop.time()
+            for i, result in zip(due, statuses):
+                analysis = analyses[i]
+                analysis['num_status_checks'] += 1
+                interval = pending[i][1]
+
+                if isinstance(result, RequestException):
+                    self._logger.warning('Analysis {} status check failed: {}'.format(analysis['analysis_status_location'], result))
+                    pending[i] = (now + interval, min(interval * self.poll_backoff, self.max_poll_interval))
+                    continue
+                elif isinstance(result, Exception):
+                    status, outputs_location, message = STATUS_FAILURE, '', str(result)
+                else:
+                    status, outputs_location, message = result
+
+                if status == STATUS_SUCCESS:
+                    del pending[i]
+                    analysis['timings']['run'] = now - analysis['submitted']
+                    analysis['outputs_location'] = outputs_location
+                    completions.append(asyncio.ensure_future(self._complete_analysis(analysis, outputs_directory, cleanup)))
+                elif status == STATUS_FAILURE:
+                    del pending[i]
+                    analysis['status'] = STATUS_FAILURE
+                    analysis['error'] = 'Analysis failed: {}'.format(message)
+                    self._logger.error('Analysis {}: {}'.format(analysis['analysis_status_location'], analysis['error']))
+                else:
+                    pending[i] = (now + interval, min(interval * self.poll_backoff, self.max_poll_interval))
+
+            if pending:
+                await asyncio.sleep(max(0, min(due_time for due_time, _ in pending.values()) - loop.time()))
+
+        await asyncio.gather(*completions)
+
+        if cleanup:
+            # Input locations may be shared by analyses, so are deleted once
+            # all have finished
+            input_locations = sorted(set(a['input_location'] for a in analyses if a['analysis_status_location']))
+            await asyncio.gather(*(self._call(self._client.delete_exposure, l) for l in input_locations))
+
+        return analyses
+
+    def run(self, coro):
+        """
+        Runs a coroutine of the client (e.g. ``run_analyses``) to completion
+        on a new event loop, returns its result.
+        """
+        loop = asyncio.new_event_loop()
+        try:
+            asyncio.set_event_loop(loop)
+            return loop.run_until_complete(coro)
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
@@ -8,22 +8,31 @@ from six.moves import urllib
 
 from ..model_execution.files import TAR_FILE
 from ..model_execution.bin import create_binary_tar_file, create_binary_files, check_inputs_directory, \
-    cleanup_bin_directory, check_conversion_tools
+    cleanup_bin_directory, check_conversion_tools, write_binary_tar
 from ..utils.exceptions import OasisException
 
 __all__ = [
-    'OasisAPIClient'
+    'OasisAPIClient',
+    'RetryPolicy'
 ]
 
 
 # Python 2 standard imports
+import hashlib
 import os
 import io
+import threading
 import time
+import uuid
+
+from multiprocessing.pool import ThreadPool
+
+from six.moves.queue import Queue, Full
 
 # Python 3rd party imports
 import requests
 
+from requests.adapters import HTTPAdapter
 from requests_toolbelt.multipart.encoder import MultipartEncoder
 
 # Oasis imports
@@ -31,6 +40,56 @@ from ..utils.log import oasis_log
 from ..utils.status import STATUS_PENDING, STATUS_SUCCESS, STATUS_FAILURE
 
 
+class RetryPolicy(object):
+    """
+    A policy for retrying failed requests - requests which fail with a
+    connection error or a timeout (if ``retry_connection_errors`` is set),
+    or with a
+    response status in ``retry_statuses``, are retried up to
+    ``max_retries`` times. The delay before the first retry is ``backoff``
+    seconds, which is multiplied by ``backoff_factor`` for each further
+    retry, up to ``max_backoff`` seconds.
+    """
+    def __init__(
+        self,
+        max_retries=3,
+        backoff=0.5,
+        backoff_factor=2,
+        max_backoff=30,
+        retry_statuses=(500, 502, 503, 504),
+        retry_connection_errors=True
+    ):
+        if max_retries < 0:
+            raise OasisException('The maximum number of retries must be at least 0: {}'.format(max_retries))
+
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = retry_statuses
+        self.retry_connection_errors = retry_connection_errors
+
+    def __repr__(self):
+        return '{}({})'.format(
+            self.__class__.__name__,
+            ', '.join('{}={!r}'.format(k, v) for k, v in sorted(self.__dict__.items()))
+        )
+
+    def replace(self, **kwargs):
+        """
+        Returns a copy of the policy with some settings replaced.
+        """
+        settings = dict(self.__dict__)
+        settings.update(kwargs)
+        return self.__class__(**settings)
+
+    def get_delay(self, retry):
+        """
+        The delay before a retry (1 for the first retry), in seconds.
+        """
+        return min(self.backoff * self.backoff_factor ** (retry - 1), self.max_backoff)
+
+
 class OasisAPIClient(object):
     """
     Class for interacting with the oasis api server
@@ -42,11 +101,74 @@ class OasisAPIClient(object):
     :param logger: The logger to use for message logging. If None
         the root logger is used.
     :type logger: Logger
-    """
-    #: The chunk size to use when streaming data from the server
-    DOWNLOAD_CHUCK_SIZE_IN_BYTES = 1024
 
-    def __init__(self, oasis_api_url, logger=None):
+    :param stream_inputs: The default for whether inputs are uploaded as
+        they are packaged (see ``upload_inputs_from_directory``)
+    :type stream_inputs: bool
+
+    :param inputs_compression_level: The default gzip compression level
+        of the inputs tar, from 0 (no compression) to 9
+    :type inputs_compression_level: int
+
+    :param inputs_compression_threads: The default number of threads to
+        compress the inputs tar with
+    :type inputs_compression_threads: int
+
+    :param max_connections: The maximum number of connections to the server
+        kept alive in the client's connection pool
+    :type max_connections: int
+
+    :param retry_policies: The retry policies for some or all of the types
+        of call (see ``DEFAULT_RETRY_POLICIES``), which override the defaults
+    :type retry_policies: dict
+
+    :param connect_timeout: The timeout, in seconds, for connecting to the
+        server, or ``None`` for no timeout
+    :type connect_timeout: float
+
+    :param read_timeout: The timeout, in seconds, for each read of a
+        response from the server, or ``None`` for no timeout
+    :type read_timeout: float
+    """
+    #: The minimum chunk size to use when streaming data from the server -
+    #: the chunk size is scaled with the size of the resource
+    DOWNLOAD_CHUCK_SIZE_IN_BYTES = 64 * 1024
+
+    #: The maximum chunk size to use when streaming data from the server
+    DOWNLOAD_MAX_CHUNK_SIZE_IN_BYTES = 8 * 1024 * 1024
+
+    #: The chunk size to use when streaming inputs to the server
+    UPLOAD_CHUNK_SIZE_IN_BYTES = 1024 * 1024
+
+    #: The maximum number of packaged chunks waiting to be streamed to the server
+    UPLOAD_MAX_PENDING_CHUNKS = 16
+
+    #: The default retry policies of the types of call - the retries of
+    #: downloads are consecutive retries without progress, as downloads are
+    #: resumed where they failed, analyses are only resubmitted if a
+    #: gateway reports the server is unavailable, to avoid duplicate runs,
+    #: and health checks are retried for any response other than a 200
+    DEFAULT_RETRY_POLICIES = {
+        'health_check': RetryPolicy(max_retries=0, backoff=5, backoff_factor=1, retry_statuses=tuple(s for s in range(100, 600) if s != 200)),
+        'upload': RetryPolicy(),
+        'run_analysis': RetryPolicy(retry_statuses=(502, 503, 504), retry_connection_errors=False),
+        'status': RetryPolicy(),
+        'download': RetryPolicy(max_retries=5, backoff=1),
+        'delete': RetryPolicy(),
+    }
+
+    def __init__(
+        self,
+        oasis_api_url,
+        logger=None,
+        stream_inputs=False,
+        inputs_compression_level=9,
+        inputs_compression_threads=1,
+        max_connections=10,
+        retry_policies=None,
+        connect_timeout=10,
+        read_timeout=300
+    ):
         """
         Construct the client.
         """
@@ -54,6 +176,33 @@ class OasisAPIClient(object):
         self._oasis_api_url = oasis_api_url
         self._logger = logger or logging.getLogger()
 
+        invalid_call_types = set(retry_policies or {}) - set(self.DEFAULT_RETRY_POLICIES)
+        if invalid_call_types:
+            raise OasisException('Invalid retry policy call types: {}'.format(', '.join(sorted(invalid_call_types))))
+        self.retry_policies = dict(self.DEFAULT_RETRY_POLICIES, **(retry_policies or {}))
+
+        self.timeout = (connect_timeout, read_timeout)
+
+        # Connections are kept alive in the session's pool, and reused by
+        # all calls
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+        self._metrics = {}
+        self._metrics_lock = threading.Lock()
+
+        self._stream_inputs = stream_inputs
+        self._inputs_compression_level = inputs_compression_level
+        self._inputs_compression_threads = inputs_compression_threads
+
+    def close(self):
+        """
+        Closes the pooled connections of the client.
+        """
+        self._session.close()
+
     def build_uri(self, path):
         """
         Builds the uri for the requested resource
@@ -65,9 +214,158 @@ class OasisAPIClient(object):
         """
         return urllib.parse.urljoin(self._oasis_api_url, path)
 
+    def _record_request(self, method, url, elapsed, status_code=None):
+        """
+        Records the latency of a request (and whether it failed) in the
+        metrics of its endpoint - the method and the first segment of the
+        path, e.g. ``GET /analysis_status``.
+        """
+        endpoint = '{} /{}'.format(method, urllib.parse.urlparse(url).path.lstrip('/').split('/')[0])
+
+        with self._metrics_lock:
+            metrics = self._metrics.setdefault(endpoint, {'count': 0, 'errors': 0, 'total_time': 0.0, 'max_time': 0.0})
+            metrics['count'] += 1
+            metrics['errors'] += int(status_code is None or status_code >= 400)
+            metrics['total_time'] += elapsed
+            metrics['max_time'] = max(metrics['max_time'], elapsed)
+
+    def get_request_metrics(self):
+        """
+        Gets the request metrics of the endpoints called by the client.
+
+        :return: A dict of the metrics of each endpoint (e.g.
+            ``GET /analysis_status``) - the number of requests (including
+            retries), the number of failed requests (connection errors and
+            4xx/5xx responses), and the total, mean and maximum latencies, in
+            seconds, of the requests
+        """
+        with self._metrics_lock:
+            return {
+                endpoint: dict(metrics, mean_time=metrics['total_time'] / metrics['count'])
+                for endpoint, metrics in self._metrics.items()
+            }
+
+    def _send(self, method, url, **kwargs):
+        """
+        Makes a single request over the session's connection pool, with the
+        client's connect and read timeouts, and records its latency.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+
+        start = time.time()
+        try:
+            response = self._session.request(method, url, **kwargs)
+        except RequestException:
+            self._record_request(method, url, time.time() - start)
+            raise
+
+        self._record_request(method, url, time.time() - start, response.status_code)
+        return response
+
+    def _request(self, call_type, method, url, retry_policy=None, data=None, **kwargs):
+        """
+        Makes a request, retrying it on failure according to the retry
+        policy of the type of call (or ``retry_policy`` if set). The response
+        of the last attempt is returned, whatever its status - a connection
+        error or timeout of the last attempt is raised.
+
+        If ``data`` is callable, it is called to get the body of each
+        attempt, so that bodies which are consumed by a request (file
+        objects, generators) can be retried.
+        """
+        policy = retry_policy or self.retry_policies[call_type]
+
+        retries = 0
+        while True:
+            try:
+                response = self._send(method, url, data=data() if callable(data) else data, **kwargs)
+                if retries >= policy.max_retries or response.status_code not in policy.retry_statuses:
+                    return response
+                reason = response.status_code
+                response.close()
+            except RequestException as e:
+                if retries >= policy.max_retries or not policy.retry_connection_errors:
+                    raise
+                reason = e
+
+            retries += 1
+            delay = policy.get_delay(retries)
+            self._logger.warning('{} {} failed ({}) - retrying in {}s ({}/{})'.format(method, url, reason, delay, retries, policy.max_retries))
+            time.sleep(delay)
+
+    def _iter_streamed_inputs(self, bin_directory, boundary, compression_level, compression_threads):
+        """
+        Generates the multipart form data body of an inputs upload, with the
+        inputs tar packaged from the binaries in ``bin_directory`` as the
+        body is consumed - the tar is written by a packaging thread to a
+        bounded queue of chunks, so that packaging and uploading overlap.
+        Any packaging error is raised as an ``OasisException``.
+        """
+        chunks = Queue(maxsize=self.UPLOAD_MAX_PENDING_CHUNKS)
+        stopped = threading.Event()
+        errors = []
+        chunk_size = self.UPLOAD_CHUNK_SIZE_IN_BYTES
+
+        def put(chunk):
+            while not stopped.is_set():
+                try:
+                    chunks.put(chunk, timeout=0.1)
+                    return
+                except Full:
+                    pass
+            raise OasisException('Inputs upload stopped')
+
+        class ChunkWriter(object):
+            def __init__(self):
+                self.buffer = []
+                self.size = 0
+
+            def write(self, data):
+                self.buffer.append(data)
+                self.size += len(data)
+                if self.size >= chunk_size:
+                    self.flush()
+
+            def flush(self):
+                if self.size:
+                    put(b''.join(self.buffer))
+                    self.buffer, self.size = [], 0
+
+        def package():
+            try:
+                writer = ChunkWriter()
+                write_binary_tar(bin_directory, writer, compression_level=compression_level, num_threads=compression_threads)
+                writer.flush()
+            except Exception as e:
+                errors.append(e)
+            finally:
+                if not stopped.is_set():
+                    put(None)
+
+        packager = threading.Thread(target=package)
+        packager.daemon = True
+        packager.start()
+
+        try:
+            yield (
+                '--{}\r\nContent-Disposition: form-data; name="file"; filename="{}"\r\nContent-Type: text/plain\r\n\r\n'.format(boundary, TAR_FILE)
+            ).encode('utf-8')
+
+            for chunk in iter(chunks.get, None):
+                yield chunk
+
+            if errors:
+                raise OasisException('Failed to package inputs: {}'.format(errors[0]))
+
+            yield '\r\n--{}--\r\n'.format(boundary).encode('utf-8')
+        finally:
+            stopped.set()
+            packager.join()
+
     @oasis_log
     def upload_inputs_from_directory(
-        self, directory, bin_directory=None, do_il=False, do_ri=False, do_build=False, do_clean=False):
+            self, directory, bin_directory=None, do_il=False, do_ri=False, do_build=False, do_clean=False,
+            stream=None, compression_level=None, compression_threads=None):
         """
         Upload the CSV files from a specified directory.
 
@@ -89,32 +387,72 @@ class OasisAPIClient(object):
         :param do_clean: if True, remove the tar and bin files
         :type do_clean: bool
 
+        :param stream: if True, the input tar is not written to a file but
+            packaged from the binary files in ``bin_directory`` as it is
+            uploaded, in a chunked request body, so that the compression
+            and the upload overlap - the server must accept chunked
+            requests. By default the client's ``stream_inputs`` setting.
+        :type stream: bool
+
+        :param compression_level: the gzip compression level of the input
+            tar, from 0 (no compression - the fastest, for fast local
+            networks) to 9. By default the client's ``inputs_compression_level``
+            setting.
+        :type compression_level: int
+
+        :param compression_threads: the number of threads to compress the
+            input tar with. By default the client's
+            ``inputs_compression_threads`` setting.
+        :type compression_threads: int
+
         :return: The location of the uploaded inputs.
         """
         bin_directory = bin_directory or directory
 
+        stream = self._stream_inputs if stream is None else stream
+        compression_level = self._inputs_compression_level if compression_level is None else compression_level
+        compression_threads = self._inputs_compression_threads if compression_threads is None else compression_threads
+
         try:
             if do_build:
                 check_inputs_directory(directory, do_il=do_il, do_ri=do_ri)
                 check_conversion_tools(do_il=do_il)
                 create_binary_files(directory, bin_directory, do_il=do_il, do_ri=do_ri)
-                create_binary_tar_file(bin_directory)
-
-            self._logger.debug("Uploading inputs")
-            inputs_tar_to_upload = os.path.join(bin_directory, TAR_FILE)
-
-            with io.open(inputs_tar_to_upload, 'rb') as f:
-                inputs_multipart_data = MultipartEncoder(
-                    fields={
-                        'file': (TAR_FILE, f, 'text/plain')
-                    }
-                )
-
-                response = requests.post(
-                    self.build_uri('/exposure'),
-                    data=inputs_multipart_data,
-                    headers={'Content-Type': inputs_multipart_data.content_type}
+                if not stream:
+                    create_binary_tar_file(bin_directory, compression_level=compression_level, num_threads=compression_threads)
+
+            if stream:
+                self._logger.debug("Packaging and uploading inputs")
+                boundary = uuid.uuid4().hex
+
+                # The inputs are repackaged for each attempt
+                response = self._request(
+                    'upload', 'POST', self.build_uri('/exposure'),
+                    data=lambda: self._iter_streamed_inputs(bin_directory, boundary, compression_level, compression_threads),
+                    headers={'Content-Type': 'multipart/form-data; boundary={}'.format(boundary)}
                 )
+            else:
+                self._logger.debug("Uploading inputs")
+                inputs_tar_to_upload = os.path.join(bin_directory, TAR_FILE)
+
+                boundary = uuid.uuid4().hex
+
+                with io.open(inputs_tar_to_upload, 'rb') as f:
+                    def inputs_multipart_data():
+                        # The tar is reread from the start for each attempt
+                        f.seek(0)
+                        return MultipartEncoder(
+                            fields={
+                                'file': (TAR_FILE, f, 'text/plain')
+                            },
+                            boundary=boundary
+                        )
+
+                    response = self._request(
+                        'upload', 'POST', self.build_uri('/exposure'),
+                        data=inputs_multipart_data,
+                        headers={'Content-Type': 'multipart/form-data; boundary={}'.format(boundary)}
+                    )
 
             if not response.ok:
                 self._logger.error(
@@ -146,8 +484,8 @@ class OasisAPIClient(object):
 
         :return: The location of analysis status, to poll.
         """
-        response = requests.post(
-            self.build_uri("/analysis/" + input_location),
+        response = self._request(
+            'run_analysis', 'POST', self.build_uri("/analysis/" + input_location),
             json=analysis_settings_json,
         )
 
@@ -174,7 +512,7 @@ class OasisAPIClient(object):
         :return: A 2 tuple of the status and output location. If the
             status is pending the output location is empty.
         """
-        response = requests.get(self.build_uri('/analysis_status/' + analysis_status_location))
+        response = self._request('status', 'GET', self.build_uri('/analysis_status/' + analysis_status_location))
         if response.status_code != 200:
             raise OasisException("GET analysis status failed: {}".format(response.status_code))
 
@@ -192,7 +530,7 @@ class OasisAPIClient(object):
             return status, ''
 
     @oasis_log
-    def run_analysis_and_poll(self, analysis_settings_json, input_location, outputs_directory, analysis_poll_interval=5):
+    def run_analysis_and_poll(self, analysis_settings_json, input_location, outputs_directory, analysis_poll_interval=5, delete_exposure=True):
         """
         Run an analysis to completion or failure. resources on the server are
         cleaned up once the analysis is complete.
@@ -209,10 +547,21 @@ class OasisAPIClient(object):
         :param analysis_poll_interval: The interval time to wait between status checks
         :type analysis_poll_interval: int
 
+        :param delete_exposure: Whether to delete the inputs resource once the
+            analysis is complete - it should be kept if it is shared by other
+            analyses
+        :type delete_exposure: bool
+
         :raises OasisException: If the analysis fails.
         :raises OasisException: If a http request is not successful
+
+        :return: The times taken by the stages of the analysis, in seconds -
+            a dict of the time to ``submit`` the analysis, to ``run`` it
+            (until its completion is polled), and to ``download`` the outputs
         """
+        start = time.time()
         analysis_status_location = self.run_analysis(analysis_settings_json, input_location)
+        submitted = time.time()
 
         self._logger.info("Analysis started")
 
@@ -224,16 +573,21 @@ class OasisAPIClient(object):
             status, outputs_location = self.get_analysis_status(analysis_status_location)
 
         self._logger.debug("Analysis completed")
+        completed = time.time()
 
         self._logger.debug("Downloading outputs")
         outputs_file = os.path.join(outputs_directory, outputs_location + ".tar.gz")
         self.download_outputs(outputs_location, outputs_file)
         self._logger.debug("Downloaded outputs")
+        downloaded = time.time()
 
         # cleanup
-        self.delete_exposure(input_location)
+        if delete_exposure:
+            self.delete_exposure(input_location)
         self.delete_outputs(outputs_location)
 
+        return {'submit': submitted - start, 'run': completed - submitted, 'download': downloaded - completed}
+
     def delete_resource(self, path):
         """
         Cleans up a resource on the server
@@ -241,7 +595,7 @@ class OasisAPIClient(object):
         :param path: The path to the resource to delete
         :type path: str
         """
-        response = requests.delete(self.build_uri(path))
+        response = self._request('delete', 'DELETE', self.build_uri(path))
         if response.status_code != 200:
             self._logger.warning("DELETE {} failed: {}".format(response.request.url, response.status_code))
         else:
@@ -269,31 +623,187 @@ class OasisAPIClient(object):
         self._logger.info("Deleting outputs")
         self.delete_resource('/outputs/' + outputs_location)
 
-    def download_resource(self, path, localfile):
+    def _get_download_chunk_size(self, size):
+        """
+        Gets the chunk size for streaming a resource of a given size (if
+        known) - about 1/64th of the size, within the minimum and maximum
+        download chunk sizes.
+        """
+        if not size:
+            return self.DOWNLOAD_CHUCK_SIZE_IN_BYTES
+
+        return int(min(max(size // 64, self.DOWNLOAD_CHUCK_SIZE_IN_BYTES), self.DOWNLOAD_MAX_CHUNK_SIZE_IN_BYTES))
+
+    def _download_range(self, url, localfile, start=0, end=None):
+        """
+        Streams a byte range ``[start, end)`` of a resource (to the end of the
+        resource if ``end`` is not set) into a local file, at the same
+        offset. If the download fails, with a connection error, a timeout, a
+        server error or a short read, it is resumed from where it failed with an
+        HTTP Range request, according to the ``download`` retry policy - the
+        retries are counted from the last attempt which made progress. If
+        the server does not support ranges a download from the start of the
+        resource is restarted.
+
+        :return: The size of the resource, if known, otherwise ``None``
+        """
+        policy = self.retry_policies['download']
+
+        pos = start
+        size = None
+        retries = 0
+
+        while True:
+            headers = {'Accept-Encoding': 'identity'}
+            if pos > 0 or end is not None:
+                headers['Range'] = 'bytes={}-{}'.format(pos, '' if end is None else end - 1)
+
+            attempt_start = pos
+            try:
+                response = self._send('GET', url, headers=headers, stream=True)
+                try:
+                    if response.status_code in policy.retry_statuses:
+                        raise RequestException('GET {} failed: {}'.format(response.request.url, response.status_code))
+                    elif not response.ok:
+                        exception_message = 'GET {} failed: {}'.format(response.request.url, response.status_code)
+                        self._logger.error(exception_message)
+                        raise OasisException(exception_message)
+
+                    if response.status_code == 206:
+                        content_range = response.headers.get('Content-Range', '')
+                        total = content_range.rsplit('/', 1)[-1]
+                        size = int(total) if total.isdigit() else size
+                    else:
+                        if 'Range' in headers and start > 0:
+                            raise OasisException('GET {} failed: the server does not support range requests'.format(response.request.url))
+                        # The whole resource is being sent - restart from the start
+                        pos = attempt_start = 0
+                        length = response.headers.get('Content-Length')
+                        size = int(length) if length and length.isdigit() else None
+
+                    end = end if end is not None else size
+
+                    with io.open(localfile, 'r+b') as f:
+                        f.seek(pos)
+                        if end is None and pos == 0:
+                            f.truncate()
+                        for chunk in response.iter_content(chunk_size=self._get_download_chunk_size(size)):
+                            if end is not None:
+                                chunk = chunk[:end - pos]
+                            f.write(chunk)
+                            pos += len(chunk)
+                            if end is not None and pos >= end:
+                                break
+                finally:
+                    response.close()
+
+                if end is not None and pos < end:
+                    raise RequestException('GET {} ended after {} of {} bytes'.format(url, pos - start, end - start))
+
+                return size
+            except RequestException as e:
+                retries = 1 if pos > attempt_start else retries + 1
+                if retries > policy.max_retries:
+                    exception_message = 'GET {} failed after {} retries: {}'.format(url, policy.max_retries, e)
+                    self._logger.error(exception_message)
+                    raise OasisException(exception_message)
+
+                delay = policy.get_delay(retries)
+                self._logger.warning('GET {} failed at byte {} ({}) - resuming in {}s'.format(url, pos, e, delay))
+                time.sleep(delay)
+
+    def _get_range_download_size(self, url):
+        """
+        Gets the size of a resource if the server supports range requests
+        for it (from a ``HEAD`` request), otherwise ``None``.
+        """
+        try:
+            response = self._send('HEAD', url, headers={'Accept-Encoding': 'identity'}, allow_redirects=True)
+        except RequestException:
+            return None
+
+        length = response.headers.get('Content-Length')
+        if not (response.ok and response.headers.get('Accept-Ranges') == 'bytes' and length and length.isdigit()):
+            return None
+
+        return int(length)
+
+    def download_resource(self, path, localfile, num_parts=1, checksum=None, checksum_algorithm='sha256'):
         """
         Streams a resource from the server to a local file
 
+        The resource is downloaded to a temporary ``.part`` file, which is
+        renamed to the local file once the download is complete and
+        verified. Failed downloads are resumed where they failed (see
+        ``_download_range``). If ``num_parts`` is more than one, and the
+        server supports range requests, the resource is downloaded in
+        ``num_parts`` byte ranges concurrently.
+
+        The size of the downloaded file is checked against the size of the
+        resource, if known, and its checksum against ``checksum``, if set.
+
         :param path: The path of the resource to download
         :type path: str
 
         :param localfile: The path to the local file to download the
             resource to.
         :type localfile: str
+
+        :param num_parts: The number of byte ranges to download concurrently
+        :type num_parts: int
+
+        :param checksum: The expected hex digest of the resource (optional)
+        :type checksum: str
+
+        :param checksum_algorithm: The ``hashlib`` algorithm of ``checksum``
+        :type checksum_algorithm: str
         """
         if os.path.exists(localfile):
             error_message = 'Local file alreday exists: {}'.format(localfile)
             self._logger.error(error_message)
             raise OasisException(error_message)
 
-        response = requests.get(self.build_uri(path), stream=True)
-        if not response.ok:
-            exception_message = 'GET {} failed: {}'.format(response.request.url, response.status_code)
-            self._logger.error(exception_message)
-            raise OasisException(exception_message)
+        url = self.build_uri(path)
+        partfile = '{}.part'.format(localfile)
 
-        with io.open(localfile, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUCK_SIZE_IN_BYTES):
-                f.write(chunk)
+        try:
+            io.open(partfile, 'wb').close()
+
+            size = self._get_range_download_size(url) if num_parts > 1 else None
+
+            if size and size >= num_parts * self.DOWNLOAD_CHUCK_SIZE_IN_BYTES:
+                with io.open(partfile, 'r+b') as f:
+                    f.truncate(size)
+
+                bounds = [size * i // num_parts for i in range(num_parts + 1)]
+                pool = ThreadPool(num_parts)
+                try:
+                    pool.map(lambda i: self._download_range(url, partfile, bounds[i], bounds[i + 1]), range(num_parts))
+                finally:
+                    pool.close()
+                    pool.join()
+            else:
+                size = self._download_range(url, partfile)
+
+            downloaded_size = os.path.getsize(partfile)
+            if size is not None and downloaded_size != size:
+                raise OasisException('GET {} failed: downloaded {} of {} bytes'.format(url, downloaded_size, size))
+
+            if checksum:
+                digest = hashlib.new(checksum_algorithm)
+                with io.open(partfile, 'rb') as f:
+                    for block in iter(lambda: f.read(self.DOWNLOAD_MAX_CHUNK_SIZE_IN_BYTES), b''):
+                        digest.update(block)
+                if digest.hexdigest().lower() != checksum.lower():
+                    raise OasisException(
+                        'GET {} failed: {} checksum {} does not match the expected checksum {}'.format(url, checksum_algorithm, digest.hexdigest(), checksum)
+                    )
+
+            os.rename(partfile, localfile)
+        except Exception:
+            if os.path.exists(partfile):
+                os.remove(partfile)
+            raise
 
     @oasis_log
     def download_exposure(self, exposure_location, localfile):
@@ -324,32 +834,37 @@ class OasisAPIClient(object):
         self.download_resource('/outputs/' + outputs_location, localfile)
 
     @oasis_log
-    def health_check(self, poll_attempts=1, retry_delay=5):
+    def health_check(self, poll_attempts=None, retry_delay=None):
         """
-        Checks the health of the server.
+        Checks the health of the server, retrying according to the
+        ``health_check`` retry policy.
 
-        :param poll_attempts: The maximum number of checks to make
+        :param poll_attempts: The maximum number of checks to make, by
+            default one more than the maximum retries of the policy
         :type poll_attempts: int
 
-        :param retry_delay: The amount of time to wait between retry attempts
+        :param retry_delay: The amount of time to wait between retry
+            attempts, by default the backoff of the policy
         :type retry_delay: int
 
         :return: True If the server is healthy, otherwise False
         """
-        for attempt in range(poll_attempts):
-            try:
-                if attempt > 0:
-                    time.sleep(retry_delay)
-
-                resp = requests.get('{}/healthcheck'.format(self._oasis_api_url))
-                if resp.status_code == 200:
-                    return True
-            except RequestException:
-                pass
-        else:
-            self._logger.error(
-                'Could not connect to the api server after {} attempts. Check it is running and try again later.'.format(
-                    poll_attempts,
-                )
+        policy = self.retry_policies['health_check']
+        if poll_attempts is not None:
+            policy = policy.replace(max_retries=poll_attempts - 1)
+        if retry_delay is not None:
+            policy = policy.replace(backoff=retry_delay)
+
+        try:
+            resp = self._request('health_check', 'GET', '{}/healthcheck'.format(self._oasis_api_url), retry_policy=policy)
+            if resp.status_code == 200:
+                return True
+        except RequestException:
+            pass
+
+        self._logger.error(
+            'Could not connect to the api server after {} attempts. Check it is running and try again later.'.format(
+                policy.max_retries + 1,
             )
-            return False
+        )
+        return False
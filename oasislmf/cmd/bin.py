@@ -38,6 +38,16 @@ class BuildCmd(OasisBaseCommand):
             help='Flag to build the binary tar.'
         )
 
+        parser.add_argument(
+            '--native', action='store_true',
+            help='Flag to write the binaries directly, without the ktools conversion tools.'
+        )
+
+        parser.add_argument(
+            '-n', '--num-workers', default=None, type=int,
+            help='The maximum number of concurrent conversions, by default the number of CPUs.'
+        )
+
     def action(self, args):
         """
         Builds the input binary files
@@ -47,9 +57,10 @@ class BuildCmd(OasisBaseCommand):
         """
         destination = args.destination or args.source
 
-        check_conversion_tools(do_il=args.do_il)
+        if not args.native:
+            check_conversion_tools(do_il=args.do_il)
         check_inputs_directory(args.source, do_il=args.do_il, check_binaries=False)
-        create_binary_files(args.source, destination, do_il=args.do_il)
+        create_binary_files(args.source, destination, do_il=args.do_il, native=args.native, num_workers=args.num_workers, logger=self.logger)
 
         if args.build_tar:
             create_binary_tar_file(destination)
@@ -11,18 +11,28 @@ from argparse import RawDescriptionHelpFormatter
 
 from pathlib2 import Path
 
+from ..exposures.csv_map import (
+    ColumnMapper,
+    convert_xslt_to_column_mapping,
+    is_column_mapping_file,
+)
 from ..exposures.csv_trans import Translator
 from ..exposures.manager import OasisExposuresManager
 
 from ..model_execution.bash import genbash
 from ..model_execution import runner
 from ..model_execution.bin import create_binary_files, prepare_model_run_directory, prepare_model_run_inputs
+from ..model_execution.files import GUL_INPUT_FILES, IL_INPUT_FILES
 
 from ..utils.exceptions import OasisException
 from ..utils.path import setcwd
-from ..utils.peril import PerilAreasIndex
+from ..utils.peril import (
+    PerilAreasIndex,
+    PERIL_AREAS_GRID_EXTENSION,
+)
 from ..utils.values import get_utctimestamp
 
+from ..keys.cache import OasisLookupCache
 from ..keys.lookup import OasisLookupFactory
 
 from .cleaners import as_path
@@ -161,17 +171,23 @@ class GeneratePerilAreasRtreeFileIndexCmd(OasisBaseCommand):
             area_poly_coords_seq_start_idx=area_poly_coords_seq_start_idx,
             area_reg_poly_radius=area_reg_poly_radius,
             index_fp=index_fp,
-            index_props=index_props
+            index_props=index_props,
+            grid_spec=peril_config.get('grid'),
+            detect_grid=peril_config.get('detect_grid', True)
         )
 
         self.logger.info('\nSuccessfully generated index files {}.{{idx.dat}}'.format(index_fp))
 
+        grid_fp = '{}.{}'.format(index_fp, PERIL_AREAS_GRID_EXTENSION)
+        if os.path.exists(grid_fp):
+            self.logger.info('\nThe peril areas form a regular grid - generated grid index file {}'.format(grid_fp))
+
 
 class TransformSourceToCanonicalFileCmd(OasisBaseCommand):
     """
     Transform a supplier-specific source exposures/accounts file to a canonical
     Oasis exposures/accounts file using an XSD validation file and an XSLT
-    transformation file.
+    transformation file, or a JSON column mapping file (``.json`` extension).
 
     Calling syntax is::
 
@@ -207,12 +223,16 @@ class TransformSourceToCanonicalFileCmd(OasisBaseCommand):
         )
         parser.add_argument(
             '-x', '--transformation-file-path', default=None,
-            help='XSLT transformation file path',
+            help='XSLT transformation file path, or JSON column mapping file path',
         )
         parser.add_argument(
             '-o', '--output-file-path', default=None,
             help='Output file path',
         )
+        parser.add_argument(
+            '-n', '--num-processes', type=int, default=None,
+            help='Number of worker processes for the transformation (optional argument)',
+        )
 
     def action(self, args):
         """
@@ -230,13 +250,16 @@ class TransformSourceToCanonicalFileCmd(OasisBaseCommand):
         _utc = get_utctimestamp(fmt='%Y%m%d%H%M%S')
 
         validation_file_path = as_path(inputs.get('validation_file_path', required=False, is_path=True), 'XSD validation file path')
-        transformation_file_path = as_path(inputs.get('transformation_file_path', required=True, is_path=True), 'XSLT transformation file path')
+        transformation_file_path = as_path(inputs.get('transformation_file_path', required=True, is_path=True), 'Transformation file path')
 
         output_file_path = as_path(inputs.get('output_file_path', required=False, is_path=True, default='can{}-{}.csv'.format(_sft, _utc)), 'Output file path', preexists=False)
 
         self.logger.info('\nGenerating a canonical {} file {} from source {} file {}'.format(_sft, output_file_path, _sft, source_file_path))
 
-        translator = Translator(source_file_path, output_file_path, transformation_file_path, xsd_path=validation_file_path, append_row_nums=True)
+        if is_column_mapping_file(transformation_file_path):
+            translator = ColumnMapper(source_file_path, output_file_path, transformation_file_path, append_row_nums=True)
+        else:
+            translator = Translator(source_file_path, output_file_path, transformation_file_path, xsd_path=validation_file_path, append_row_nums=True, num_processes=inputs.get('num_processes', required=False))
 
         translator()
 
@@ -246,9 +269,10 @@ class TransformSourceToCanonicalFileCmd(OasisBaseCommand):
 class TransformCanonicalToModelFileCmd(OasisBaseCommand):
     """
     Transform a canonical Oasis exposures file to a model Oasis exposures file
-    using an XSD validation file and an XSLT transformation file. A model exposures
-    file is a simplified version of the canonical exposures file and provides the
-    input to an Oasis keys server for a model and its keys lookup class.
+    using an XSD validation file and an XSLT transformation file, or a JSON column
+    mapping file (``.json`` extension). A model exposures file is a simplified
+    version of the canonical exposures file and provides the input to an Oasis
+    keys server for a model and its keys lookup class.
 
     Calling syntax is::
 
@@ -279,12 +303,16 @@ class TransformCanonicalToModelFileCmd(OasisBaseCommand):
         )
         parser.add_argument(
             '-x', '--transformation-file-path', default=None,
-            help='XSLT transformation file path',
+            help='XSLT transformation file path, or JSON column mapping file path',
         )
         parser.add_argument(
             '-o', '--output-file-path', default=None,
             help='Output file path',
         )
+        parser.add_argument(
+            '-n', '--num-processes', type=int, default=None,
+            help='Number of worker processes for the transformation (optional argument)',
+        )
 
     def action(self, args):
         """
@@ -300,19 +328,77 @@ class TransformCanonicalToModelFileCmd(OasisBaseCommand):
         _utc = get_utctimestamp(fmt='%Y%m%d%H%M%S')
 
         validation_file_path = as_path(inputs.get('validation_file_path', required=False, is_path=True), 'XSD validation file path')
-        transformation_file_path = as_path(inputs.get('transformation_file_path', required=True, is_path=True), 'XSLT transformation file path')
+        transformation_file_path = as_path(inputs.get('transformation_file_path', required=True, is_path=True), 'Transformation file path')
 
         output_file_path = as_path(inputs.get('output_file_path', required=False, is_path=True, default='modexp-{}.csv'.format(_utc)), 'Output file path', preexists=False)
 
         self.logger.info('\nGenerating a model exposures file {} from canonical exposures file {}'.format(output_file_path, canonical_exposures_file_path))
 
-        translator = Translator(canonical_exposures_file_path, output_file_path, transformation_file_path, xsd_path=validation_file_path ,append_row_nums=True)
+        if is_column_mapping_file(transformation_file_path):
+            translator = ColumnMapper(canonical_exposures_file_path, output_file_path, transformation_file_path, append_row_nums=True)
+        else:
+            translator = Translator(canonical_exposures_file_path, output_file_path, transformation_file_path, xsd_path=validation_file_path, append_row_nums=True, num_processes=inputs.get('num_processes', required=False))
 
         translator()
 
         self.logger.info('\nOutput file {} successfully generated'.format(output_file_path))
 
 
+class ConvertXsltToColumnMappingCmd(OasisBaseCommand):
+    """
+    Convert a simple XSLT transformation file, which only renames, selects,
+    defaults and sets constant columns, to a JSON column mapping file, which
+    can be used instead of the XSLT file in the transform commands.
+
+    Calling syntax is::
+
+        oasislmf model convert-xslt-to-column-mapping
+            -x <transformation file>
+            -o <output file path>
+    """
+    formatter_class = RawDescriptionHelpFormatter
+
+    def add_args(self, parser):
+        """
+        Adds arguments to the argument parser.
+
+        :param parser: The argument parser object
+        :type parser: ArgumentParser
+        """
+        super(self.__class__, self).add_args(parser)
+
+        parser.add_argument(
+            '-x', '--transformation-file-path', default=None,
+            help='XSLT transformation file path',
+        )
+        parser.add_argument(
+            '-o', '--output-file-path', default=None,
+            help='Output JSON column mapping file path',
+        )
+
+    def action(self, args):
+        """
+        Convert an XSLT transformation file to a JSON column mapping file.
+
+        :param args: The arguments from the command line
+        :type args: Namespace
+        """
+        inputs = InputValues(args)
+
+        transformation_file_path = as_path(inputs.get('transformation_file_path', required=True, is_path=True), 'XSLT transformation file path')
+        output_file_path = as_path(
+            inputs.get('output_file_path', required=False, is_path=True, default='{}.json'.format(os.path.splitext(transformation_file_path)[0])),
+            'Output file path', preexists=False
+        )
+
+        mapping = convert_xslt_to_column_mapping(transformation_file_path)
+
+        with io.open(output_file_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(mapping, indent=4, ensure_ascii=False))
+
+        self.logger.info('\nColumn mapping file {} successfully generated'.format(output_file_path))
+
+
 class GenerateKeysCmd(OasisBaseCommand):
     """
     Generate Oasis keys records (location records with area peril ID and
@@ -375,6 +461,8 @@ class GenerateKeysCmd(OasisBaseCommand):
         parser.add_argument('-l', '--lookup-package-path', default=None, help='Keys data directory path')
         parser.add_argument('-f', '--keys-format', choices=['oasis', 'json'], help='Keys records / files output format')
         parser.add_argument('-x', '--model-exposures-file-path', default=None, help='Keys records file output format')
+        parser.add_argument('-n', '--num-processes', type=int, default=None, help='Number of worker processes for the lookup')
+        parser.add_argument('--keys-cache-file-path', default=None, help='Keys lookup results cache (SQLite) file path')
 
     def action(self, args):
         """
@@ -398,6 +486,10 @@ class GenerateKeysCmd(OasisBaseCommand):
 
         keys_format = inputs.get('keys_format', default='oasis')
 
+        num_processes = inputs.get('num_processes', required=False)
+        if num_processes is not None and num_processes < 1:
+            raise OasisException('The number of lookup processes must be a positive integer: {}'.format(num_processes))
+
         self.logger.info('\nGetting model info and lookup')
         model_info, lookup = OasisLookupFactory.create(
             lookup_config_fp=lookup_config_fp,
@@ -415,17 +507,28 @@ class GenerateKeysCmd(OasisBaseCommand):
         keys_file_path = as_path(inputs.get('keys_file_path', default=default_keys_file_name.format(utcnow), required=False, is_path=True), 'Keys file path', preexists=False)
         keys_errors_file_path = as_path(inputs.get('keys_errors_file_path', default=default_keys_errors_file_name.format(utcnow), required=False, is_path=True), 'Keys errors file path', preexists=False)
 
+        keys_cache_file_path = as_path(inputs.get('keys_cache_file_path', required=False, is_path=True), 'Keys cache file path', preexists=False)
+        cache = OasisLookupCache(keys_cache_file_path) if keys_cache_file_path else None
+
         self.logger.info('\nSaving keys records to file')
 
         start_time = time.time()
 
-        f1, n1, f2, n2 = OasisLookupFactory.save_results(
-            lookup,
-            keys_file_path,
-            errors_fp=keys_errors_file_path,
-            model_exposures_fp=model_exposures_file_path,
-            format=keys_format
-        )
+        try:
+            f1, n1, f2, n2 = OasisLookupFactory.save_results(
+                lookup,
+                keys_file_path,
+                errors_fp=keys_errors_file_path,
+                model_exposures_fp=model_exposures_file_path,
+                format=keys_format,
+                num_processes=num_processes,
+                cache=cache
+            )
+            if cache is not None:
+                self.logger.info('\nKeys cache {}: {} location hits, {} location misses'.format(cache.fp, cache.hits, cache.misses))
+        finally:
+            if cache is not None:
+                cache.close()
         self.logger.info('\n{} successful results saved to keys file {}'.format(n1, f1))
         self.logger.info('\n{} unsuccessful results saved to keys errors file {}'.format(n2, f2))
 
@@ -497,6 +600,26 @@ class GenerateOasisFilesCmd(OasisBaseCommand):
             help='Supplier FM aggregation profile JSON file path'
 
         )
+        parser.add_argument(
+            '--chunk-size', default=None, type=int,
+            help='Generate the keys and Oasis files in chunks of this many locations, to bound memory use (optional argument)'
+        )
+        parser.add_argument(
+            '--fused', action='store_true',
+            help='Transform the source files to canonical and model exposures in memory, without writing and re-reading the intermediate files - False if absent'
+        )
+        parser.add_argument(
+            '--write-intermediate-files', action='store_true',
+            help='With --fused, also write the canonical and model exposures (and canonical accounts) files, for audit - False if absent'
+        )
+        parser.add_argument(
+            '--force', action='store_true',
+            help='Regenerate all the files, rather than reusing the files of a previous run in the Oasis files directory whose inputs are unchanged - False if absent'
+        )
+        parser.add_argument(
+            '--delta', action='store_true',
+            help='Transform and look up only the locations added or changed since the previous run in the Oasis files directory, by account and location number - False if absent'
+        )
 
     def action(self, args):
         """
@@ -572,6 +695,10 @@ class GenerateOasisFilesCmd(OasisBaseCommand):
                 'source accounts file path, FM aggregation profile JSON file path'
             )
 
+        chunk_size = inputs.get('chunk_size', required=False)
+        if chunk_size is not None and int(chunk_size) < 1:
+            raise OasisException('The chunk size must be a positive number of locations')
+
         start_time = time.time()
         self.logger.info('\nStarting Oasis files generation (@ {}): GUL=True, FM={}'.format(get_utctimestamp(), fm))
 
@@ -618,6 +745,12 @@ class GenerateOasisFilesCmd(OasisBaseCommand):
         oasis_files = manager.start_oasis_files_pipeline(
             oasis_model=model,
             fm=fm,
+            chunk_size=chunk_size,
+            fused=inputs.get('fused', default=False),
+            write_intermediate_files=inputs.get('write_intermediate_files', default=False),
+            force=inputs.get('force', default=False),
+            delta=inputs.get('delta', default=False),
+            binary_files_path=inputs.get('binary_files_path', required=False, is_path=True),
             logger=self.logger
         )
 
@@ -680,6 +813,14 @@ class GenerateLossesCmd(OasisBaseCommand):
         parser.add_argument('-n', '--ktools-num-processes', default=-1, help='Number of ktools calculation processes to use', type=int)
         parser.add_argument('-x', '--no-execute', action='store_true', help='Whether to execute generated ktools script')
         parser.add_argument('-p', '--model-package-path', default=None, help='Path containing model specific package')
+        parser.add_argument(
+            '--native-bin-writer', action='store_true',
+            help='Write the ktools binary input files directly, without the ktools conversion tools - False if absent'
+        )
+        parser.add_argument(
+            '--num-bin-workers', default=None, type=int,
+            help='Maximum number of concurrent ktools binary input file conversions - by default the number of CPUs'
+        )
 
     def action(self, args):
         """
@@ -708,6 +849,9 @@ class GenerateLossesCmd(OasisBaseCommand):
 
         fm = inputs.get('fm', default=False)
 
+        native_bin_writer = inputs.get('native_bin_writer', default=False)
+        num_bin_workers = inputs.get('num_bin_workers', required=False)
+
         start_time = time.time()
         self.logger.info('\nStarting loss generation (@ {})'.format(get_utctimestamp()))
 
@@ -733,7 +877,24 @@ class GenerateLossesCmd(OasisBaseCommand):
         self.logger.info('\nConverting Oasis files to ktools binary files')
         oasis_files_path = os.path.join(model_run_dir_path, 'input', 'csv')
         binary_files_path = os.path.join(model_run_dir_path, 'input')
-        create_binary_files(oasis_files_path, binary_files_path, do_il=fm)
+
+        # In a model run with the native binary writer the binary files of
+        # the Oasis files are written by the Oasis files generation, directly
+        # from the data frames of the files
+        exclude_files = None
+        written_binary_files_path = inputs.get('binary_files_path', required=False, is_path=True)
+        if native_bin_writer and written_binary_files_path and os.path.abspath(written_binary_files_path) == os.path.abspath(binary_files_path):
+            exclude_files = list(GUL_INPUT_FILES) + (list(IL_INPUT_FILES) if fm else [])
+
+        create_binary_files(
+            oasis_files_path,
+            binary_files_path,
+            do_il=fm,
+            native=native_bin_writer,
+            num_workers=num_bin_workers,
+            logger=self.logger,
+            exclude_files=exclude_files
+        )
 
         analysis_settings_json_file_path = os.path.join(model_run_dir_path, 'analysis_settings.json')
         try:
@@ -849,6 +1010,22 @@ class RunCmd(OasisBaseCommand):
             help='Name of the ktools output script (should not contain any filetype extension)'
         )
         parser.add_argument('-n', '--ktools-num-processes', default=2, help='Number of ktools calculation processes to use')
+        parser.add_argument(
+            '--native-bin-writer', action='store_true',
+            help='Write the ktools binary input files directly, without the ktools conversion tools - False if absent'
+        )
+        parser.add_argument(
+            '--num-bin-workers', default=None, type=int,
+            help='Maximum number of concurrent ktools binary input file conversions - by default the number of CPUs'
+        )
+        parser.add_argument(
+            '--force', action='store_true',
+            help='Regenerate all the Oasis files, rather than reusing the files of a previous run in the model run directory whose inputs are unchanged - False if absent'
+        )
+        parser.add_argument(
+            '--delta', action='store_true',
+            help='Transform and look up only the locations added or changed since the previous run in the model run directory, by account and location number - False if absent'
+        )
 
     def action(self, args):
         """
@@ -880,6 +1057,12 @@ class RunCmd(OasisBaseCommand):
 
         Path(args.oasis_files_path).mkdir(parents=True, exist_ok=True)
 
+        # With the native binary writer the ktools binary files of the Oasis
+        # files are written with the Oasis files, from their data frames,
+        # rather than converted from the files by the loss generation
+        if inputs.get('native_bin_writer', default=False):
+            args.binary_files_path = os.path.join(model_run_dir_path, 'input')
+
         gen_oasis_files_cmd = GenerateOasisFilesCmd()
         gen_oasis_files_cmd._logger = self.logger
         gen_oasis_files_cmd.action(args)
@@ -898,6 +1081,7 @@ class ModelsCmd(OasisBaseCommand):
         'generate-peril-areas-rtree-file-index': GeneratePerilAreasRtreeFileIndexCmd,
         'transform-source-to-canonical': TransformSourceToCanonicalFileCmd,
         'transform-canonical-to-model': TransformCanonicalToModelFileCmd,
+        'convert-xslt-to-column-mapping': ConvertXsltToColumnMappingCmd,
         'generate-keys': GenerateKeysCmd,
         'generate-oasis-files': GenerateOasisFilesCmd,
         'generate-losses': GenerateLossesCmd,
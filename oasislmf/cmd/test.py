@@ -1,10 +1,12 @@
 import json
 import os
 import io
+import time
 
 from collections import Counter
 from multiprocessing.pool import ThreadPool
 
+import numpy as np
 import six
 from argparsetree import BaseCommand
 from backports.tempfile import TemporaryDirectory
@@ -13,6 +15,7 @@ from oasislmf.keys.lookup import OasisLookupFactory
 from .. import __version__
 from ..utils.exceptions import OasisException
 from ..utils.conf import replace_in_file
+from ..utils.status import STATUS_SUCCESS
 from ..api_client.client import OasisAPIClient
 from .base import OasisBaseCommand
 from .cleaners import PathCleaner
@@ -62,6 +65,41 @@ class TestModelApiCmd(OasisBaseCommand):
             help='The maximum number of health check attempts.'
         )
 
+        parser.add_argument(
+            '--stream-inputs', action='store_true',
+            help='Upload the inputs tar as it is packaged, without writing the tar file (the server must accept chunked requests).'
+        )
+
+        parser.add_argument(
+            '--inputs-compression-level', type=int, default=9, choices=range(10), metavar='{0-9}',
+            help='The gzip compression level of the inputs tar, 0 for no compression.'
+        )
+
+        parser.add_argument(
+            '--inputs-compression-threads', type=int, default=1,
+            help='The number of threads to compress the inputs tar with.'
+        )
+
+        parser.add_argument(
+            '--async-polling', action='store_true',
+            help='Run the analyses from one event loop, over a shared connection pool, rather than one thread per analysis (Python 3 only).'
+        )
+
+        parser.add_argument(
+            '--max-connections', type=int, default=10,
+            help='The maximum number of connections to the server kept alive, and of concurrent requests with --async-polling.'
+        )
+
+        parser.add_argument(
+            '--poll-interval', type=float, default=5,
+            help='The interval between analysis status checks, in seconds, with --upload-once, or the initial interval with --async-polling.'
+        )
+
+        parser.add_argument(
+            '--upload-once', action='store_true',
+            help='Build and upload the inputs once, and run all the analyses of the uploaded inputs concurrently, then report the throughput and stage latencies.'
+        )
+
     def load_analysis_settings_json(self, analysis_settings_file):
         """
         Loads the analysis settings JSON file into a dict, also creates a separate
@@ -85,7 +123,7 @@ class TestModelApiCmd(OasisBaseCommand):
                 do_il = bool(analysis_settings['analysis_settings']["il_output"])
 
         do_ri = False
-        if 'ri_output' in analysis_settings['analysis_settings']:       
+        if 'ri_output' in analysis_settings['analysis_settings']:
             if isinstance(analysis_settings['analysis_settings']['ri_output'], six.string_types):
                 do_ri = analysis_settings['analysis_settings']["ri_output"].lower() == 'true'
             else:
@@ -107,7 +145,7 @@ class TestModelApiCmd(OasisBaseCommand):
         try:
             with TemporaryDirectory() as upload_directory:
                 input_location = client.upload_inputs_from_directory(
-                    input_directory, bin_directory=upload_directory, 
+                    input_directory, bin_directory=upload_directory,
                     do_il=do_il, do_ri=do_ri, do_build=True)
                 client.run_analysis_and_poll(analysis_settings, input_location, output_directory)
                 counter['completed'] += 1
@@ -116,6 +154,173 @@ class TestModelApiCmd(OasisBaseCommand):
             client._logger.exception("Model API test failed: {}".format(str(e)))
             counter['failed'] += 1
 
+    def upload_inputs(self, args):
+        """
+        Uploads the inputs for an analysis - is used as a worker function for
+        threads.
+
+        :param args: a tuple containing (client, input_directory, upload_directory,
+            do_il, do_ri, counter)
+        :type args: tuple
+
+        :return: The input location, or ``None`` if the upload failed
+        """
+        client, input_directory, upload_directory, do_il, do_ri, counter = args
+
+        try:
+            os.mkdir(upload_directory)
+            return client.upload_inputs_from_directory(
+                input_directory, bin_directory=upload_directory,
+                do_il=do_il, do_ri=do_ri, do_build=True)
+        except Exception as e:
+            client._logger.exception("Model API test failed: {}".format(str(e)))
+            counter['failed'] += 1
+
+    def log_request_metrics(self, client):
+        """
+        Logs the request latency metrics of each endpoint called by a client.
+        """
+        for endpoint, metrics in sorted(client.get_request_metrics().items()):
+            self.logger.info('{}: {} requests, {} failed, mean {:.3f}s, max {:.3f}s'.format(
+                endpoint, metrics['count'], metrics['errors'], metrics['mean_time'], metrics['max_time']
+            ))
+
+    def get_async_client(self, args):
+        """
+        Gets an ``AsyncOasisAPIClient`` for the command line arguments.
+        """
+        if six.PY2:
+            raise OasisException('--async-polling requires Python 3')
+
+        # Python 3 only, so imported on use
+        from ..api_client.async_client import AsyncOasisAPIClient
+
+        return AsyncOasisAPIClient(
+            args.api_server_url,
+            self.logger,
+            max_connections=args.max_connections,
+            poll_interval=args.poll_interval,
+            stream_inputs=args.stream_inputs,
+            inputs_compression_level=args.inputs_compression_level,
+            inputs_compression_threads=args.inputs_compression_threads
+        )
+
+    def run_analyses_async(self, args, analysis_settings, do_il, do_ri, counter):
+        """
+        Invokes the model analyses with an ``AsyncOasisAPIClient`` - the
+        inputs are uploaded by at most ``--max-connections`` threads, and the
+        analyses are then run and polled from one event loop.
+        """
+        with self.get_async_client(args) as client, TemporaryDirectory() as upload_root:
+            threads = ThreadPool(processes=min(args.num_analyses, args.max_connections))
+            input_locations = threads.map(
+                self.upload_inputs,
+                ((
+                    client.client, args.input_directory, os.path.join(upload_root, str(i)),
+                    do_il, do_ri, counter
+                ) for i in range(args.num_analyses))
+            )
+            threads.close()
+            threads.join()
+
+            analyses = client.run(client.run_analyses(
+                analysis_settings, [loc for loc in input_locations if loc is not None], args.output_directory
+            ))
+            self.log_request_metrics(client.client)
+
+        for analysis in analyses:
+            counter['completed' if analysis['status'] == STATUS_SUCCESS else 'failed'] += 1
+
+    def run_shared_analysis(self, args):
+        """
+        Invokes model analysis of shared, uploaded inputs in the client - is
+        used as a worker function for threads.
+
+        :param args: a tuple containing (client, input_location, output_directory,
+            analysis_settings, poll_interval, counter, timings)
+        :type args: tuple
+        """
+        client, input_location, output_directory, analysis_settings, poll_interval, counter, timings = args
+
+        try:
+            timings.append(client.run_analysis_and_poll(
+                analysis_settings, input_location, output_directory,
+                analysis_poll_interval=poll_interval, delete_exposure=False))
+            counter['completed'] += 1
+        except Exception as e:
+            client._logger.exception("Model API test failed: {}".format(str(e)))
+            counter['failed'] += 1
+
+    def log_timings_summary(self, upload_time, timings, elapsed):
+        """
+        Logs the throughput of the completed analyses, and the median, 95th
+        percentile and maximum times of each stage of the analyses.
+
+        :param upload_time: The time taken to build and upload the inputs
+        :type upload_time: float
+
+        :param timings: The stage timings of the completed analyses (see
+            ``OasisAPIClient.run_analysis_and_poll``)
+        :type timings: list
+
+        :param elapsed: The total time taken
+        :type elapsed: float
+        """
+        self.logger.info('Inputs built and uploaded in {:.3f}s'.format(upload_time))
+        self.logger.info('Throughput: {} analyses completed in {:.3f}s ({:.3f} analyses/min)'.format(
+            len(timings), elapsed, 60 * len(timings) / elapsed if elapsed else 0
+        ))
+
+        for stage in ['submit', 'run', 'download']:
+            times = [t[stage] for t in timings]
+            if times:
+                self.logger.info('  {}: p50 {:.3f}s, p95 {:.3f}s, max {:.3f}s'.format(
+                    stage, np.percentile(times, 50), np.percentile(times, 95), max(times)
+                ))
+
+    def run_shared_analyses(self, client, args, analysis_settings, do_il, do_ri, counter):
+        """
+        Builds and uploads the inputs once, and invokes the model analyses of
+        the uploaded inputs concurrently - from one event loop with
+        ``--async-polling``, otherwise in a thread per analysis - then logs
+        a summary of the throughput and stage timings.
+        """
+        start = time.time()
+        with TemporaryDirectory() as upload_directory:
+            input_location = client.upload_inputs_from_directory(
+                args.input_directory, bin_directory=upload_directory,
+                do_il=do_il, do_ri=do_ri, do_build=True)
+        upload_time = time.time() - start
+
+        timings = []
+        if args.async_polling:
+            with self.get_async_client(args) as async_client:
+                analyses = async_client.run(async_client.run_analyses(
+                    analysis_settings, [input_location] * args.num_analyses, args.output_directory
+                ))
+                self.log_request_metrics(async_client.client)
+
+            for analysis in analyses:
+                counter['completed' if analysis['status'] == STATUS_SUCCESS else 'failed'] += 1
+                if analysis['status'] == STATUS_SUCCESS:
+                    timings.append(analysis['timings'])
+        else:
+            threads = ThreadPool(processes=args.num_analyses)
+            threads.map(
+                self.run_shared_analysis,
+                ((
+                    client, input_location, args.output_directory,
+                    analysis_settings, args.poll_interval, counter, timings
+                ) for i in range(args.num_analyses))
+            )
+            threads.close()
+            threads.join()
+
+            client.delete_exposure(input_location)
+            self.log_request_metrics(client)
+
+        self.log_timings_summary(upload_time, timings, time.time() - start)
+
     def action(self, args):
         """
         Runs the api checks for the model
@@ -125,7 +330,14 @@ class TestModelApiCmd(OasisBaseCommand):
         """
 
         # get client
-        client = OasisAPIClient(args.api_server_url, self.logger)
+        client = OasisAPIClient(
+            args.api_server_url,
+            self.logger,
+            stream_inputs=args.stream_inputs,
+            inputs_compression_level=args.inputs_compression_level,
+            inputs_compression_threads=args.inputs_compression_threads,
+            max_connections=args.max_connections
+        )
 
         # Do a server healthcheck
         if not client.health_check(args.health_check_attempts):
@@ -145,17 +357,23 @@ class TestModelApiCmd(OasisBaseCommand):
         self.logger.info('Running {} analyses'.format(args.num_analyses))
         counter = Counter()
 
-        threads = ThreadPool(processes=args.num_analyses)
-        threads.map(
-            self.run_analysis,
-            ((
-                client, args.input_directory, args.output_directory, 
-                analysis_settings, do_il, do_ri, counter
+        if args.upload_once:
+            self.run_shared_analyses(client, args, analysis_settings, do_il, do_ri, counter)
+        elif args.async_polling:
+            self.run_analyses_async(args, analysis_settings, do_il, do_ri, counter)
+        else:
+            threads = ThreadPool(processes=args.num_analyses)
+            threads.map(
+                self.run_analysis,
+                ((
+                    client, args.input_directory, args.output_directory,
+                    analysis_settings, do_il, do_ri, counter
                 ) for i in range(args.num_analyses))
-        )
+            )
 
-        threads.close()
-        threads.join()
+            threads.close()
+            threads.join()
+            self.log_request_metrics(client)
 
         # Summary of run results
         self.logger.info("Finished: {} completed, {} failed".format(counter['completed'], counter['failed']))
@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+
+__all__ = [
+    'COLUMN_MAPPING_FILE_EXTENSION',
+    'ColumnMapper',
+    'convert_xslt_to_column_mapping',
+    'is_column_mapping_file',
+    'load_column_mapping'
+]
+
+import ast
+import io
+import json
+import logging
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from lxml import etree
+
+from ..utils.exceptions import OasisException
+
+
+COLUMN_MAPPING_FILE_EXTENSION = '.json'
+
+_COLUMN_MAPPING_SOURCE_KEYS = ('source', 'value', 'expr',)
+_COLUMN_MAPPING_KEYS = ('name', 'map', 'default',) + _COLUMN_MAPPING_SOURCE_KEYS
+
+_XSL_NS = 'http://www.w3.org/1999/XSL/Transform'
+
+_XSLT_ATTR_EXISTS_RE = re.compile(r"^\$[\w.-]+/@([\w.-]+)$")
+_XSLT_ATTR_VALUE_RE = re.compile(r"^string\(\$[\w.-]+/@([\w.-]+)\)$")
+_XSLT_LITERAL_RE = re.compile(r"^(?:string\('([^']*)'\)|'([^']*)')$")
+_XSLT_VAR_TEST_RE = re.compile(r"^string\(boolean\(string\(\$([\w.-]+)\)\)\) != 'false'$")
+
+
+def is_column_mapping_file(fp):
+    """
+    Whether a transformation file is a JSON column mapping file (by its
+    extension), rather than an XSLT file.
+    """
+    return os.path.splitext(fp)[1].lower() == COLUMN_MAPPING_FILE_EXTENSION
+
+
+def _get_expr_names(expr):
+    try:
+        tree = ast.parse(expr, mode='eval')
+    except SyntaxError as e:
+        raise OasisException('Invalid column mapping expression "{}": {}'.format(expr, e))
+
+    return sorted(set(node.id for node in ast.walk(tree) if isinstance(node, ast.Name)))
+
+
+def load_column_mapping(mapping):
+    """
+    Loads and validates a column mapping - a dict, or the path of a JSON
+    file, with a ``columns`` list of output column definitions, in output
+    column order, e.g.::
+
+        {
+            "columns": [
+                {"name": "ACCNTNUM", "source": "ACCNTNUM", "default": "0"},
+                {"name": "ID", "source": "ROW_ID"},
+                {"name": "OCCTYPE", "source": "OCC", "map": {"RES": "RD", "COM": "CM"}},
+                {"name": "TIV", "expr": "WSCV1VAL + WSCV2VAL + WSCV3VAL", "default": "0"},
+                {"name": "COVERAGE", "value": "1"}
+            ]
+        }
+
+    Each output column has a ``name`` and exactly one of
+
+        * ``source`` - an input column to copy (and rename)
+        * ``value`` - a constant value
+        * ``expr`` - a numeric expression of input columns, evaluated with
+          ``pandas.eval`` (non-numeric input values are treated as missing)
+
+    and, optionally, a ``map`` of values to recode (values not in the map
+    are kept), and a ``default`` value for missing (empty) values. Input
+    columns not used by any output column are dropped.
+    """
+    if not isinstance(mapping, dict):
+        try:
+            with io.open(mapping, 'r', encoding='utf-8') as f:
+                mapping = json.load(f)
+        except (IOError, OSError, TypeError, ValueError) as e:
+            raise OasisException('Error loading the column mapping {}: {}'.format(mapping, e))
+
+    columns = mapping.get('columns') if isinstance(mapping, dict) else None
+    if not (isinstance(columns, list) and columns):
+        raise OasisException('The column mapping must have a non-empty "columns" list')
+
+    names = set()
+    for col in columns:
+        if not (isinstance(col, dict) and col.get('name')):
+            raise OasisException('Column mapping entries must have a "name": {}'.format(col))
+        if col['name'] in names:
+            raise OasisException('Duplicate column mapping output column "{}"'.format(col['name']))
+        names.add(col['name'])
+
+        invalid_keys = set(col) - set(_COLUMN_MAPPING_KEYS)
+        if invalid_keys:
+            raise OasisException('Invalid column mapping keys for column "{}": {}'.format(col['name'], sorted(invalid_keys)))
+        if len([k for k in _COLUMN_MAPPING_SOURCE_KEYS if k in col]) != 1:
+            raise OasisException(
+                'Column mapping column "{}" must have exactly one of {}'.format(col['name'], ', '.join(_COLUMN_MAPPING_SOURCE_KEYS))
+            )
+        if 'map' in col and not isinstance(col['map'], dict):
+            raise OasisException('The value map of column mapping column "{}" must be a dict'.format(col['name']))
+        if 'expr' in col:
+            _get_expr_names(col['expr'])
+
+    return mapping
+
+
+def convert_xslt_to_column_mapping(xslt_path):
+    """
+    Converts a simple XSLT transformation file, which only renames, selects,
+    defaults and sets constant columns - such as the record mapping
+    stylesheets generated by MapForce - to a column mapping (see
+    ``load_column_mapping``). An ``OasisException`` is raised if the
+    stylesheet has any other constructs.
+
+    The only difference of the mapping is that output columns copied from
+    input columns, without defaults, are always written - the XSLT
+    transformation drops such columns if they are missing in the first
+    record of the input.
+    """
+    try:
+        xslt = etree.parse(xslt_path)
+    except (IOError, OSError, etree.XMLSyntaxError) as e:
+        raise OasisException('Error parsing the XSLT file {}: {}'.format(xslt_path, e))
+
+    recs = xslt.getroot().findall('.//rec')
+    if len(recs) != 1:
+        raise OasisException('{} is not a simple record mapping XSLT file - expected one "rec" element'.format(xslt_path))
+
+    def xsl(el, name):
+        return el.tag == '{{{}}}{}'.format(_XSL_NS, name)
+
+    def xsl_children(el):
+        return [c for c in el if isinstance(c.tag, str)]
+
+    def unsupported(el):
+        return OasisException(
+            'Unsupported XSLT construct in {} (line {}): {}'.format(xslt_path, el.sourceline, etree.tostring(el).decode('utf-8').strip()[:200])
+        )
+
+    def value_of(el):
+        children = xsl_children(el)
+        if len(children) != 1 or not xsl(children[0], 'value-of'):
+            raise unsupported(el)
+        select = children[0].get('select', '')
+        m = _XSLT_ATTR_VALUE_RE.match(select)
+        if m:
+            return {'source': m.group(1)}
+        m = _XSLT_LITERAL_RE.match(select)
+        if m:
+            return {'value': m.group(1) if m.group(1) is not None else m.group(2)}
+        raise unsupported(children[0])
+
+    def var_source(test, el):
+        m = _XSLT_VAR_TEST_RE.match(test or '')
+        if not (m and m.group(1) in var_sources):
+            raise unsupported(el)
+        return var_sources[m.group(1)]
+
+    var_sources = {}
+    columns = []
+
+    for el in xsl_children(recs[0]):
+        if xsl(el, 'variable'):
+            # The variables are flags of whether input attributes exist
+            children = xsl_children(el)
+            m = _XSLT_ATTR_EXISTS_RE.match(children[0].get('test', '')) if len(children) == 1 and xsl(children[0], 'if') else None
+            if not (m and value_of(children[0]) == {'value': '1'}):
+                raise unsupported(el)
+            var_sources[el.get('name')] = m.group(1)
+        elif xsl(el, 'attribute'):
+            children = xsl_children(el)
+            if not children:
+                columns.append({'name': el.get('name'), 'value': el.text or ''})
+            elif len(children) == 1 and xsl(children[0], 'choose'):
+                # Copied input attribute, or a default value if it does not exist
+                choose = xsl_children(children[0])
+                if not (len(choose) == 2 and xsl(choose[0], 'when') and xsl(choose[1], 'otherwise')):
+                    raise unsupported(children[0])
+                source = var_source(choose[0].get('test'), choose[0])
+                if value_of(choose[0]) != {'source': source} or 'value' not in value_of(choose[1]):
+                    raise unsupported(children[0])
+                columns.append({'name': el.get('name'), 'source': source, 'default': value_of(choose[1])['value']})
+            else:
+                columns.append(dict(name=el.get('name'), **value_of(el)))
+        elif xsl(el, 'if'):
+            # Input attribute copied only if it exists
+            children = xsl_children(el)
+            source = var_source(el.get('test'), el)
+            if not (len(children) == 1 and xsl(children[0], 'attribute') and value_of(children[0]) == {'source': source}):
+                raise unsupported(el)
+            columns.append({'name': children[0].get('name'), 'source': source})
+        else:
+            raise unsupported(el)
+
+    return load_column_mapping({'columns': columns})
+
+
+class ColumnMapper(object):
+    def __init__(self, input_path, output_path, mapping, append_row_nums=False, chunk_size=100000, logger=None):
+        """
+        Transforms exposures/locations in CSV format using a column mapping
+        (see ``load_column_mapping``) - an alternative to the XSLT
+        transformations of ``csv_trans.Translator`` for transformations which
+        only rename, select, default, recode and compute columns, which are
+        executed as vectorized DataFrame operations on the file chunks.
+
+        :param input_path: Source exposures file path, which should be in CSV comma delimited format
+        :type input_path: str
+
+        :param output_path: File to write transform results
+        :type output_path: str
+
+        :param mapping: Column mapping JSON file path, or column mapping dict
+        :type mapping: str or dict
+
+        :param append_row_nums: Append line numbers to first column of output called `ROW_ID` [1 .. n] when n is the number of rows processed.
+        :type append_row_nums: boolean
+
+        :param chunk_size: Number of rows to read and transform at a time
+        :type chunk_size: int
+        """
+        self.logger = logger or logging.getLogger()
+        self.mapping = load_column_mapping(mapping)
+        self.fpath_input = input_path
+        self.fpath_output = output_path
+
+        self.row_nums = append_row_nums
+        self.row_limit = chunk_size
+
+    def __call__(self):
+        with io.open(self.fpath_output, 'w', encoding='utf-8', newline='') as f:
+            for i, df_out in enumerate(self.frames()):
+                df_out.to_csv(f, encoding='utf-8', header=(i == 0), index=False)
+
+            if not f.tell():
+                self.transform(pd.DataFrame(dtype=object)).to_csv(f, encoding='utf-8', header=True, index=False)
+
+    def frames(self, input_frames=None):
+        """
+        Generates the transformed chunks of the input, in order, as data
+        frames with the index of the input rows. The chunks are read from the
+        input file, or are taken from ``input_frames``, an iterable of data
+        frames of strings with a continuous index over the input rows (see
+        ``csv_trans.Translator.frames``).
+        """
+        if input_frames is None:
+            input_frames = pd.read_csv(self.fpath_input, chunksize=self.row_limit, dtype=object, encoding='utf-8')
+
+        for df_slice in input_frames:
+            yield self.transform(df_slice)
+
+    def eval_expr(self, expr, df):
+        values = {
+            name: pd.to_numeric(df[name], errors='coerce') if name in df else pd.Series(np.nan, index=df.index)
+            for name in _get_expr_names(expr)
+        }
+        try:
+            result = pd.eval(expr, local_dict=values, engine='python')
+        except Exception as e:
+            raise OasisException('Error evaluating the column mapping expression "{}": {}'.format(expr, e))
+
+        result = pd.Series(result, index=df.index) if np.ndim(result) == 0 else pd.Series(np.asarray(result), index=df.index)
+        result = result.replace([np.inf, -np.inf], np.nan)
+
+        values = result.astype(object).where(result.notnull(), np.nan)
+
+        # Write integral results without decimal points
+        non_null = result.dropna()
+        if result.dtype.kind == 'f' and len(non_null) and np.all(np.mod(non_null, 1) == 0):
+            values[result.notnull()] = non_null.astype(np.int64).astype(object)
+
+        return values
+
+    def transform(self, df):
+        """
+        Transforms a chunk of the input - a data frame of strings, with
+        missing values as nulls, as read by ``pandas.read_csv`` - returns
+        the output data frame.
+        """
+        df_out = pd.DataFrame(index=df.index)
+
+        if self.row_nums:
+            df_out['ROW_ID'] = df.index + 1
+
+        for col in self.mapping['columns']:
+            if 'value' in col:
+                values = pd.Series(col['value'], index=df.index, dtype=object)
+            elif 'expr' in col:
+                values = self.eval_expr(col['expr'], df)
+            elif col['source'] in df:
+                values = df[col['source']]
+            else:
+                values = pd.Series(np.nan, index=df.index, dtype=object)
+
+            if col.get('map'):
+                mapped = values.map(col['map'])
+                values = mapped.where(values.isin(list(col['map'])), values)
+
+            if 'default' in col:
+                values = values.where(values.notnull(), col['default'])
+
+            df_out[col['name']] = values
+
+        return df_out
@@ -4,11 +4,16 @@ __all__ = [
     'Translator'
 ]
 
+import io
+import itertools
 import json
 import logging
 import multiprocessing
 import os
 
+from collections import deque
+
+import billiard
 import pandas as pd
 
 from lxml import etree
@@ -18,9 +23,48 @@ from oasislmf.utils.concurrency import (
     multithread,
     Task,
 )
+from oasislmf.utils.exceptions import OasisException
+
+
+# Per worker process XSLT transform and XSD schema, compiled once by the
+# pool initializer rather than for every file slice
+_worker_transform = None
+_worker_schema = None
+
+
+def _init_worker(xslt_path, xsd_path):
+    global _worker_transform, _worker_schema
+
+    _worker_transform = etree.XSLT(etree.parse(xslt_path))
+    _worker_schema = etree.XMLSchema(etree.parse(xsd_path)) if xsd_path else None
+
+
+def _transform_slice(csv_header, csv_data):
+    """
+    Transforms a file slice in a worker process - returns the attribute names
+    of the first output record (or ``None`` if there are no output records),
+    and a frame of the output records, with columns for all the attributes
+    present in the records.
+    """
+    xml_output = _worker_transform(Translator.csv_to_xml(csv_header, csv_data))
+
+    if _worker_schema is not None:
+        valid = _worker_schema.validate(xml_output)
+        logger = logging.getLogger()
+        logger.debug(valid)
+        if not valid and logger.isEnabledFor(logging.DEBUG):
+            logger.error('Input failed to Validate')
+            logger.error(_worker_schema.error_log.last_error)
+
+    root = xml_output.getroot()
+    if root is None or not len(root):
+        return None, pd.DataFrame()
+
+    return root[0].keys(), pd.DataFrame([dict(rec.attrib) for rec in root])
+
 
 class Translator(object):
-    def __init__(self, input_path, output_path, xslt_path, xsd_path=None, append_row_nums=False, chunk_size=5000, logger=None):
+    def __init__(self, input_path, output_path, xslt_path, xsd_path=None, append_row_nums=False, chunk_size=5000, logger=None, num_processes=None):
         """
         Transforms exposures/locations in CSV format
         by converting a source file to XML and applying an XSLT transform
@@ -45,11 +89,25 @@ class Translator(object):
 
         :param chunk_size: Number of rows to process per multiprocess Task
         :type chunk_size: int
+
+        :param num_processes: Number of worker processes - if set, the file
+                              slices are transformed in a process pool, with
+                              the XSLT compiled once per worker, and at most
+                              two slices per worker in flight, and the results
+                              are written out in order as soon as they are
+                              available, otherwise the slices are transformed
+                              in batches of threads
+        :type num_processes: int
         """
+        if num_processes is not None and num_processes < 1:
+            raise OasisException('The number of transformation processes must be a positive integer: {}'.format(num_processes))
 
         self.logger = logger or logging.getLogger()
         self.xsd = (etree.parse(xsd_path) if xsd_path else None)
         self.xslt = etree.parse(xslt_path)
+        self.xsd_path = xsd_path
+        self.xslt_path = xslt_path
+        self.num_processes = num_processes
         self.fpath_input = input_path
         self.fpath_output = output_path
 
@@ -59,28 +117,116 @@ class Translator(object):
         self.row_header_out = None
 
     def __call__(self):
-        csv_reader = pd.read_csv(self.fpath_input, iterator=True, dtype=object, encoding='utf-8')
+        with io.open(self.fpath_output, 'w', encoding='utf-8', newline='') as f:
+            for i, df_out in enumerate(self.frames()):
+                df_out.to_csv(f, encoding='utf-8', header=(i == 0), index=False)
+
+    def frames(self, input_frames=None):
+        """
+        Generates the transformed file slices, in order, as data frames with
+        a continuous index over the output rows. The slices are read from the
+        input file, or are taken from ``input_frames``, an iterable of data
+        frames of strings with a continuous index over the input rows - e.g.
+        the transformed slices of another translator, converted by
+        ``utils.data.as_csv_strings`` - so that translators can be chained
+        without writing the intermediate files.
+        """
+        if input_frames is None:
+            input_frames = pd.read_csv(self.fpath_input, chunksize=self.row_limit, dtype=object, encoding='utf-8')
+
+        slices = self.next_file_slice(input_frames)
 
-        task_list = []
-        for chunk_id, (data, first_row, last_row) in enumerate(self.next_file_slice(csv_reader)):
-            task_list.append(Task(self.process_chunk, args=(data,first_row,last_row, chunk_id), key=chunk_id))
+        offset = 0
+        for df_out in (self.process_slices(slices) if self.num_processes else self.thread_slices(slices)):
+            df_out.index = pd.RangeIndex(offset, offset + len(df_out))
+            offset += len(df_out)
+            yield df_out
 
-        results = {}
+    def thread_slices(self, slices):
+        """
+        Transforms the file slices in batches of one slice per thread, and
+        generates the results of each batch in order before reading the next,
+        so that at most one batch of slices is held in memory at any one time.
+        """
         num_ps = multiprocessing.cpu_count()
-        for key, data in multithread(task_list, pool_size=num_ps):
-            results[key] = data
-
-        ## write output to disk
-        for i in range(0, len(results)):
-            if (i == 0):
-                self.write_file_header(results[i].columns.tolist())
-            results[i].to_csv(
-                self.fpath_output,
-                mode='a',
-                encoding='utf-8',
-                header=False,
-                index=False,
-            )
+        slices = enumerate(slices)
+
+        while True:
+            task_list = [
+                Task(self.process_chunk, args=(data, first_row, last_row, chunk_id), key=chunk_id)
+                for chunk_id, (data, first_row, last_row) in itertools.islice(slices, num_ps)
+            ]
+            if not task_list:
+                break
+
+            results = {}
+            for key, data in multithread(task_list, pool_size=min(num_ps, len(task_list))):
+                results[key] = data
+
+            for i in sorted(results):
+                yield results[i]
+
+    def process_slices(self, slices):
+        """
+        Transforms the file slices in a pool of ``num_processes`` worker
+        processes. New slices are read only while fewer than two slices per
+        worker are in flight, and the results are generated in order as soon
+        as the results of all the preceding slices have been generated, so
+        that memory use is bounded by the number of workers, not the size of
+        the file.
+        """
+        # Read the first slice before starting the workers, to set the input
+        # file header
+        first_slice = next(slices, None)
+        if first_slice is None:
+            return
+
+        max_pending = 2 * self.num_processes
+        pending = deque()
+
+        pool = billiard.Pool(self.num_processes, initializer=_init_worker, initargs=(self.xslt_path, self.xsd_path,))
+        try:
+            for data, first_row, last_row in itertools.chain([first_slice], slices):
+                pending.append((first_row, pool.apply_async(_transform_slice, args=(self.row_header_in, data,)),))
+                while pending and (len(pending) >= max_pending or pending[0][1].ready()):
+                    first_row, result = pending.popleft()
+                    df_out = self.get_slice_frame(first_row, *result.get())
+                    if df_out is not None:
+                        yield df_out
+
+            while pending:
+                first_row, result = pending.popleft()
+                df_out = self.get_slice_frame(first_row, *result.get())
+                if df_out is not None:
+                    yield df_out
+        except BaseException:
+            pool.terminate()
+            raise
+        else:
+            pool.close()
+        finally:
+            pool.join()
+
+    def get_slice_frame(self, row_first, row_header_out, df_out):
+        """
+        Returns the output data frame of a slice transformed by a worker
+        process - the output columns are those of the first output record of
+        the file, as in ``xml_to_csv`` (``None`` is returned for slices
+        without output records before the first output record).
+        """
+        if not self.row_header_out:
+            if row_header_out is None:
+                return
+            self.row_header_out = row_header_out
+
+        df_out = df_out.reindex(columns=self.row_header_out)
+
+        if self.row_nums:
+            start = row_first + 1
+            end = start + len(df_out)
+            df_out.insert(0, 'ROW_ID', pd.Series(range(start, end)))
+
+        return df_out
 
     def process_chunk(self, data, first_row_number, last_row_number, seq_id):
         xml_input_slice = self.csv_to_xml(
@@ -103,8 +249,8 @@ class Translator(object):
                  last_row_number    # Last Row in this slice
         )
 
-
-    def csv_to_xml(self, csv_header, csv_data):
+    @staticmethod
+    def csv_to_xml(csv_header, csv_data):
         root = etree.Element('root')
         for row in csv_data:
             rec = etree.SubElement(root, 'rec')
@@ -152,27 +298,15 @@ class Translator(object):
         return lxml_transform(xml_doc)
 
     def next_file_slice(self, file_reader):
-        while True:
-            try:
-                df_slice = file_reader.get_chunk(self.row_limit)
-                if(not self.row_header_in):
-                    self.row_header_in = df_slice.columns.values.tolist()
-                yield (
-                    df_slice.fillna("").values.astype("unicode").tolist(),
-                    df_slice.first_valid_index(),
-                    df_slice.last_valid_index()
-                )
-            except StopIteration:
-                self.logger.debug('End of input file')
-                break
-
-    def write_file_header(self, row_names):
-        pd.DataFrame(columns=row_names).to_csv(
-            self.fpath_output,
-            encoding='utf-8',
-            header=True,
-            index=False,
-        )
+        for df_slice in file_reader:
+            if not self.row_header_in:
+                self.row_header_in = df_slice.columns.values.tolist()
+            yield (
+                df_slice.fillna("").values.astype("unicode").tolist(),
+                df_slice.first_valid_index(),
+                df_slice.last_valid_index()
+            )
+        self.logger.debug('End of input file')
 
     def print_xml(self, etree_obj):
         self.logger.debug('___________________________________________')
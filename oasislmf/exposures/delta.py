@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+__all__ = [
+    'SOURCE_EXPOSURES_ACCOUNT_KEY_COLUMNS',
+    'SOURCE_EXPOSURES_KEY_COLUMNS',
+    'diff_source_row_hashes',
+    'get_source_row_hashes',
+    'read_source_row_hashes',
+    'write_source_row_hashes'
+]
+
+import io
+
+import numpy as np
+import pandas as pd
+
+from ..utils.exceptions import OasisException
+
+
+# The (lowercased) names of the source exposures columns identifying the
+# locations, in order of preference - the OED location number, and the
+# legacy location number
+SOURCE_EXPOSURES_KEY_COLUMNS = ('locnumber', 'locnum',)
+
+# The (lowercased) names of the source exposures columns identifying the
+# accounts of the locations, in order of preference - location numbers are
+# only unique within an account
+SOURCE_EXPOSURES_ACCOUNT_KEY_COLUMNS = ('accnumber', 'accntnum',)
+
+
+def get_source_row_hashes(source_df, key_cols=SOURCE_EXPOSURES_KEY_COLUMNS, account_key_cols=SOURCE_EXPOSURES_ACCOUNT_KEY_COLUMNS):
+    """
+    Gets the location keys and the content hashes of the rows of a source
+    exposures frame (of the strings in the file, as read with
+    ``na_filter=False``), in order. A location is keyed by its account
+    number, if the exposures have an account column, and its location
+    number. The header is included in the hash of each row, so that
+    renaming or reordering the columns changes the hashes of all the rows.
+
+    :param source_df: The source exposures frame
+    :type source_df: pandas.DataFrame
+
+    :param key_cols: The names of the location key columns, in order of
+                     preference - the first column present (case
+                     insensitively) is used
+    :type key_cols: tuple
+
+    :param account_key_cols: The names of the account key columns, in order
+                             of preference - the first column present (case
+                             insensitively) is used, if any
+    :type account_key_cols: tuple
+
+    :return: A frame with the ``account`` (empty if there is no account
+             column), the location ``key`` and the ``hash`` of each row
+    """
+    cols = {col.lower(): col for col in source_df.columns}
+    try:
+        key_col = next(cols[c] for c in key_cols if c in cols)
+    except StopIteration:
+        raise OasisException('No location key column (one of {}) found in the source exposures'.format(', '.join(key_cols)))
+
+    account_key_col = next((cols[c] for c in account_key_cols if c in cols), None)
+
+    df = source_df.astype(object)
+    df.insert(0, '__header__', ','.join(source_df.columns))
+
+    return pd.DataFrame({
+        'account': source_df[account_key_col].astype(object).values if account_key_col else '',
+        'key': source_df[key_col].astype(object).values,
+        'hash': pd.util.hash_pandas_object(df, index=False).values.astype(np.uint64)
+    }, columns=['account', 'key', 'hash'])
+
+
+def write_source_row_hashes(source_file_path, hashes_file_path):
+    """
+    Writes the account and location keys and row hashes of a source exposures file (see
+    ``get_source_row_hashes``) to a CSV file.
+
+    :return: The frame of the keys and the hashes
+    """
+    with io.open(source_file_path, 'r', encoding='utf-8') as f:
+        source_df = pd.read_csv(f, dtype=object, na_filter=False)
+
+    hashes_df = get_source_row_hashes(source_df)
+    hashes_df.to_csv(hashes_file_path, index=False, encoding='utf-8')
+
+    return hashes_df
+
+
+def read_source_row_hashes(hashes_file_path):
+    """
+    Reads a source exposures row hashes file written by
+    ``write_source_row_hashes``.
+    """
+    with io.open(hashes_file_path, 'r', encoding='utf-8') as f:
+        return pd.read_csv(f, dtype={'account': object, 'key': object, 'hash': np.uint64}, na_filter=False)
+
+
+def diff_source_row_hashes(previous_hashes_df, hashes_df):
+    """
+    Diffs the account and location keys and row hashes of the current source
+    exposures against those of the previous source exposures - the locations
+    which have the same keys and row hash in both are unchanged, the others are
+    added or changed (the locations only in the previous exposures are
+    removed). Locations are identified by their row numbers, which are the
+    ``ROW_ID`` values of the canonical exposures (and the location IDs of the
+    model exposures and the keys).
+
+    A diff is only possible if the (account, location) keys are unique in
+    both, and the first location is unchanged, as the columns of XSLT
+    transformation outputs are those of the output of the first row.
+
+    :param previous_hashes_df: The previous keys and hashes
+    :type previous_hashes_df: pandas.DataFrame
+
+    :param hashes_df: The current keys and hashes
+    :type hashes_df: pandas.DataFrame
+
+    :return: ``None`` if a diff is not possible, otherwise a pair of a frame of
+             the ``previous_id`` and current ``id`` of each unchanged
+             location, and an array of the current IDs of the added or
+             changed locations, both in current ID order
+    """
+    key_cols = ['account', 'key']
+
+    if hashes_df.duplicated(subset=key_cols).any() or previous_hashes_df.duplicated(subset=key_cols).any():
+        return
+
+    if not (
+        len(hashes_df) and len(previous_hashes_df) and
+        all(hashes_df[col].iloc[0] == previous_hashes_df[col].iloc[0] for col in key_cols + ['hash'])
+    ):
+        return
+
+    previous = pd.DataFrame({
+        'account': previous_hashes_df['account'].values,
+        'key': previous_hashes_df['key'].values,
+        'hash': previous_hashes_df['hash'].values,
+        'previous_id': np.arange(1, len(previous_hashes_df) + 1)
+    })
+    current = pd.DataFrame({
+        'account': hashes_df['account'].values,
+        'key': hashes_df['key'].values,
+        'hash': hashes_df['hash'].values,
+        'id': np.arange(1, len(hashes_df) + 1)
+    })
+
+    merged = pd.merge(current, previous, how='left', on=key_cols + ['hash'], sort=False)
+
+    unchanged = merged['previous_id'].notnull()
+    unchanged_df = pd.DataFrame({
+        'previous_id': merged['previous_id'][unchanged].astype(np.int64).values,
+        'id': merged['id'][unchanged].values
+    }, columns=['previous_id', 'id'])
+
+    return unchanged_df, merged['id'][~unchanged].values
@@ -5,7 +5,6 @@ __all__ = [
     'OasisExposuresManager'
 ]
 
-import copy
 import io
 import itertools
 import json
@@ -15,8 +14,16 @@ import os
 import shutil
 import six
 import sys
+import tempfile
+import threading
 import time
 
+from collections import (
+    deque,
+    OrderedDict,
+)
+
+import numpy as np
 import pandas as pd
 
 from interface import (
@@ -25,23 +32,52 @@ from interface import (
 )
 
 
-from ..keys.lookup import OasisLookupFactory
+from ..keys.lookup import (
+    KEYS_WRITER_BATCH_SIZE,
+    OasisLookupFactory,
+)
+from ..utils.data import (
+    as_csv_parsed,
+    as_csv_strings,
+)
 from ..utils.concurrency import (
-    multiprocess,
     multithread,
     Task,
 )
 from ..utils.exceptions import OasisException
 from ..utils.fm import (
     unified_canonical_fm_profile_by_level_and_term_group,
-    get_fm_terms_by_level_as_list,
-    get_policytc_ids,
+    get_fm_policytc_ids,
+    get_fm_terms_by_level_as_df,
 )
 from ..utils.metadata import OASIS_FM_LEVELS
+from ..utils.status import KEYS_STATUS_SUCCESS
 from ..utils.values import get_utctimestamp
+from ..model_execution.bin import (
+    create_binary_files,
+    write_binary_file,
+)
 from ..models import OasisModel
+from .. import __version__
+from .manifest import (
+    data_hash,
+    file_hash,
+    lookup_fingerprint,
+    OASIS_FILES_STAGES,
+    OASIS_FILES_STAGES_DEPENDENCIES,
+    OasisFilesManifest,
+)
 from .pipeline import OasisFilesPipeline
+from .csv_map import (
+    ColumnMapper,
+    is_column_mapping_file,
+)
 from .csv_trans import Translator
+from .delta import (
+    diff_source_row_hashes,
+    get_source_row_hashes,
+    read_source_row_hashes,
+)
 
 
 class OasisExposuresManagerInterface(Interface):  # pragma: no cover
@@ -205,6 +241,9 @@ class OasisExposuresManagerInterface(Interface):  # pragma: no cover
 
         :param keys_df: Keys
         :type keys_df: pandas.DataFrame
+
+        :return: GUL items data frame
+        :rtype: pandas.DataFrame
         """
         pass
 
@@ -229,6 +268,9 @@ class OasisExposuresManagerInterface(Interface):  # pragma: no cover
 
         :param fm_agg_profile: FM aggregation profile
         :param fm_agg_profile: dict
+
+        :return: FM items data frame
+        :rtype: pandas.DataFrame
         """
         pass
 
@@ -319,6 +361,28 @@ class OasisExposuresManagerInterface(Interface):  # pragma: no cover
         """
         pass
 
+    def write_oasis_files_in_chunks(self, oasis_model=None, chunk_size=None, **kwargs):
+        """
+        Writes the keys files and the full set of Oasis files, which includes
+        GUL files and possibly also the FM files (if ``fm`` is ``True``), for a
+        given ``oasis_model`` or set of keyword arguments, by streaming the
+        canonical and model exposures in location-contiguous chunks of
+        ``chunk_size`` locations through the keys lookup and the GUL and FM
+        items generation.
+
+        The required resources must be provided either via the model object
+        resources dict or the keyword arguments.
+
+        :param oasis_model: An Oasis model object
+        :type oasis_model: oasislmf.models.model.OasisModel
+
+        :param chunk_size: Number of locations per chunk
+        :type chunk_size: int
+
+        :param kwargs: Optional keyword arguments
+        """
+        pass
+
     def create_model(self, model_supplier_id, model_id, model_version, resources=None):
         """
         Creates an Oasis model object, with attached resources if a resources
@@ -426,6 +490,14 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
     def models(self):
         self._models.clear()
 
+    def _get_translator(self, input_file_path, output_file_path, transformation_file_path, validation_file_path, append_row_nums, chunk_size=None):
+        chunk_kwargs = {'chunk_size': chunk_size} if chunk_size else {}
+
+        if is_column_mapping_file(transformation_file_path):
+            return ColumnMapper(input_file_path, output_file_path, transformation_file_path, append_row_nums=append_row_nums, **chunk_kwargs)
+
+        return Translator(input_file_path, output_file_path, transformation_file_path, xsd_path=validation_file_path, append_row_nums=append_row_nums, **chunk_kwargs)
+
     def transform_source_to_canonical(self, oasis_model=None, source_type='exposures', **kwargs):
         """
         Transforms a canonical exposures/locations file for a given
@@ -439,6 +511,11 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
         otherwise they will be taken from the `oasis_model` resources dictionary
         if the model is supplied.
 
+        The transformation file can be an XSLT file, or a JSON column mapping
+        file (see ``csv_map.load_column_mapping``), which is applied with
+        vectorized DataFrame operations - validation files are only used with
+        XSLT files.
+
         :param oasis_model: An optional Oasis model object
         :type oasis_model: ``oasislmf.models.model.OasisModel``
 
@@ -480,7 +557,7 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
 
         output_file_path = os.path.abspath(kwargs['canonical_accounts_file_path']) if source_type == 'accounts' else os.path.abspath(kwargs['canonical_exposures_file_path'])
 
-        translator = Translator(input_file_path, output_file_path, transformation_file_path, xsd_path=validation_file_path, append_row_nums=True)
+        translator = self._get_translator(input_file_path, output_file_path, transformation_file_path, validation_file_path, True)
 
         translator()
 
@@ -502,6 +579,11 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
         otherwise they will be taken from the `oasis_model` resources dictionary
         if the model is supplied.
 
+        The transformation file can be an XSLT file, or a JSON column mapping
+        file (see ``csv_map.load_column_mapping``), which is applied with
+        vectorized DataFrame operations - validation files are only used with
+        XSLT files.
+
         :param oasis_model: The model to get keys for
         :type oasis_model: ``oasislmf.models.model.OasisModel``
 
@@ -531,7 +613,7 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
 
         output_file_path = os.path.abspath(kwargs.get('model_exposures_file_path'))
 
-        translator = Translator(input_file_path, output_file_path, transformation_file_path, xsd_path=validation_file_path, append_row_nums=False)
+        translator = self._get_translator(input_file_path, output_file_path, transformation_file_path, validation_file_path, False)
 
         translator()
 
@@ -540,6 +622,149 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
 
         return output_file_path
 
+    def transform_source_to_model(self, oasis_model=None, **kwargs):
+        """
+        Fused, in-memory alternative to ``transform_source_to_canonical`` and
+        ``transform_canonical_to_model`` - the source exposures are transformed
+        to canonical exposures, and the canonical exposures slices directly to
+        model exposures, in a single pass, without writing and re-reading the
+        canonical exposures file. If ``fm`` is set the source accounts are
+        also transformed to canonical accounts.
+
+        The transformation files and the validation files are taken from the
+        keyword arguments or the model resources, as for the other transform
+        methods.
+
+        :param oasis_model: The model to transform the exposures for
+        :type oasis_model: ``oasislmf.models.model.OasisModel``
+
+        :return: A triple of data frames ``(canexp_df, modexp_df, canacc_df)``
+                 of the canonical exposures, model exposures and (if ``fm``
+                 is set, otherwise ``None``) canonical accounts, with the
+                 values the transform methods would write to the files -
+                 these can be passed instead of the files to ``get_keys_data``,
+                 ``write_gul_files``, ``write_fm_files`` and
+                 ``write_oasis_files_in_chunks`` as the
+                 ``canonical_exposures_data``, ``model_exposures_data`` and
+                 ``canonical_accounts_data`` keyword arguments
+        """
+        kwargs = self._process_default_kwargs(oasis_model=oasis_model, **kwargs)
+
+        source_to_canonical = self._get_translator(
+            os.path.abspath(kwargs['source_exposures_file_path']),
+            None,
+            os.path.abspath(kwargs['source_to_canonical_exposures_transformation_file_path']),
+            kwargs.get('source_exposures_validation_file_path'),
+            True
+        )
+        canonical_to_model = self._get_translator(
+            None,
+            None,
+            os.path.abspath(kwargs['canonical_to_model_exposures_transformation_file_path']),
+            kwargs.get('canonical_exposures_validation_file_path'),
+            False
+        )
+
+        canexp_frames = []
+
+        def canonical_exposures_frames():
+            for df in source_to_canonical.frames():
+                canexp_frames.append(df)
+                yield as_csv_strings(df)
+
+        modexp_frames = list(canonical_to_model.frames(canonical_exposures_frames()))
+
+        canexp_df = pd.concat(canexp_frames, ignore_index=True) if canexp_frames else pd.DataFrame()
+        modexp_df = pd.concat(modexp_frames, ignore_index=True) if modexp_frames else pd.DataFrame()
+
+        canacc_df = None
+        if kwargs.get('fm'):
+            source_to_canonical = self._get_translator(
+                os.path.abspath(kwargs['source_accounts_file_path']),
+                None,
+                os.path.abspath(kwargs['source_to_canonical_accounts_transformation_file_path']),
+                kwargs.get('source_accounts_validation_file_path'),
+                True
+            )
+            canacc_frames = list(source_to_canonical.frames())
+            canacc_df = pd.concat(canacc_frames, ignore_index=True) if canacc_frames else pd.DataFrame()
+
+        return canexp_df, modexp_df, canacc_df
+
+    def transform_source_to_model_in_chunks(self, oasis_model=None, chunk_size=None, from_canonical=False, **kwargs):
+        """
+        Chunked alternative to ``transform_source_to_canonical`` and
+        ``transform_canonical_to_model`` - the source exposures are
+        transformed to canonical exposures, and the canonical exposures
+        slices directly to model exposures, in location-contiguous chunks of
+        ``chunk_size`` locations, and each chunk is appended to the canonical
+        and model exposures files as it is generated. If ``from_canonical`` is
+        set the canonical exposures are read in chunks from the canonical
+        exposures file, which is not rewritten, and only the model exposures
+        are transformed.
+
+        The transformation files and the validation files are taken from the
+        keyword arguments or the model resources, as for the other transform
+        methods.
+
+        :param oasis_model: The model to transform the exposures for
+        :type oasis_model: ``oasislmf.models.model.OasisModel``
+
+        :param chunk_size: Number of locations per chunk
+        :type chunk_size: int
+
+        :param from_canonical: Whether to transform the canonical exposures
+                               file rather than the source exposures file
+        :type from_canonical: bool
+
+        :return: A generator of pairs ``(canexp_df, modexp_df)`` of the
+                 canonical and model exposures of each chunk, with the
+                 values the transform methods would write to the files
+        """
+        kwargs = self._process_default_kwargs(oasis_model=oasis_model, **kwargs)
+
+        canonical_exposures_file_path = os.path.abspath(kwargs['canonical_exposures_file_path'])
+        model_exposures_file_path = os.path.abspath(kwargs['model_exposures_file_path'])
+
+        if from_canonical:
+            canexp_frames = pd.read_csv(canonical_exposures_file_path, chunksize=chunk_size, dtype=object, encoding='utf-8')
+        else:
+            canexp_frames = self._get_translator(
+                os.path.abspath(kwargs['source_exposures_file_path']),
+                None,
+                os.path.abspath(kwargs['source_to_canonical_exposures_transformation_file_path']),
+                kwargs.get('source_exposures_validation_file_path'),
+                True,
+                chunk_size=chunk_size
+            ).frames()
+
+        canonical_to_model = self._get_translator(
+            None,
+            None,
+            os.path.abspath(kwargs['canonical_to_model_exposures_transformation_file_path']),
+            kwargs.get('canonical_exposures_validation_file_path'),
+            False
+        )
+
+        # The canonical to model translator transforms the canonical
+        # exposures chunks one to one, but may read ahead of the model
+        # exposures chunks generated
+        canexp_chunks = deque()
+
+        def canonical_exposures_frames():
+            for df in canexp_frames:
+                canexp_chunks.append(df)
+                yield as_csv_strings(df)
+
+        for i, modexp_df in enumerate(canonical_to_model.frames(canonical_exposures_frames())):
+            canexp_df = canexp_chunks.popleft()
+
+            if not from_canonical:
+                canexp_df.to_csv(canonical_exposures_file_path, mode=('a' if i else 'w'), header=(not i), encoding='utf-8', index=False)
+            modexp_df.to_csv(model_exposures_file_path, mode=('a' if i else 'w'), header=(not i), encoding='utf-8', index=False)
+
+            yield canexp_df, modexp_df
+
     def load_canonical_exposures_profile(self, oasis_model=None, **kwargs):
         """
         Loads a JSON string or JSON file representation of the canonical
@@ -698,6 +923,307 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
 
         return keys_file_path, keys_errors_file_path
 
+    def get_keys_data(self, oasis_model=None, **kwargs):
+        """
+        Alternative to ``get_keys`` for model exposures in memory - the
+        ``model_exposures_data`` keyword argument, a data frame of the model
+        exposures file values (see ``transform_source_to_model``). Writes the
+        keys file and keys errors file as ``get_keys`` does, and also returns
+        the successful keys records, so that the keys file need not be read
+        back to generate the GUL items.
+
+        :param oasis_model: The model to get keys for
+        :type oasis_model: ``OasisModel``
+
+        :return: A triple of the keys file path, the keys errors file path,
+                 and a data frame of the keys file rows
+        """
+        kwargs = self._process_default_kwargs(oasis_model=oasis_model, **kwargs)
+
+        modexp_df = kwargs.get('model_exposures_data')
+        lookup = kwargs.get('lookup')
+        keys_file_path = kwargs.get('keys_file_path')
+        keys_errors_file_path = kwargs.get('keys_errors_file_path')
+
+        if modexp_df is None:
+            raise OasisException('No model exposures data provided')
+
+        try:
+            lookup.config
+        except AttributeError:
+            results = OasisLookupFactory.get_keys(
+                lookup=lookup,
+                model_exposures=as_csv_strings(modexp_df).to_csv(index=False),
+                success_only=(False if keys_errors_file_path else True)
+            )
+        else:
+            results = OasisLookupFactory.get_results(
+                lookup,
+                model_exposures=as_csv_parsed(modexp_df),
+                successes_only=(False if keys_errors_file_path else True)
+            )
+
+        try:
+            loc_id_col = lookup.loc_id_col.lower()
+        except AttributeError:
+            loc_id_col = 'id'
+
+        keys_cols = OrderedDict([
+            (loc_id_col, 'LocID'),
+            ('peril_id', 'PerilID'),
+            ('coverage_type', 'CoverageTypeID'),
+            ('area_peril_id', 'AreaPerilID'),
+            ('vulnerability_id', 'VulnerabilityID'),
+        ])
+
+        # Only the keys file columns of the successful records are kept, in
+        # frames of batches of records, so that the lookup results are not
+        # all held in memory
+        keys_batches = []
+        keys_batch = []
+
+        def collect_successes(results):
+            for r in results:
+                if r['status'] == KEYS_STATUS_SUCCESS:
+                    keys_batch.append([r.get(col) for col in keys_cols])
+                    if len(keys_batch) == KEYS_WRITER_BATCH_SIZE:
+                        keys_batches.append(pd.DataFrame(columns=list(keys_cols.values()), data=keys_batch, dtype=object))
+                        del keys_batch[:]
+                yield r
+
+        OasisLookupFactory.write_keys_files(
+            collect_successes(results),
+            os.path.abspath(keys_file_path),
+            errors_fp=(os.path.abspath(keys_errors_file_path) if keys_errors_file_path else None),
+            id_col=loc_id_col
+        )
+
+        keys_batches.append(pd.DataFrame(columns=list(keys_cols.values()), data=keys_batch, dtype=object))
+        keys_df = pd.concat(keys_batches, ignore_index=True)
+
+        if oasis_model:
+            oasis_model.resources['oasis_files_pipeline'].keys_file_path = keys_file_path
+            oasis_model.resources['oasis_files_pipeline'].keys_errors_file_path = keys_errors_file_path
+
+        return keys_file_path, keys_errors_file_path, keys_df
+
+    def write_exposures_delta(self, oasis_model=None, previous_files=None, **kwargs):
+        """
+        Delta alternative to ``transform_source_to_canonical``,
+        ``transform_canonical_to_model`` and ``get_keys`` for updated source
+        exposures - the source exposures are diffed by account and location number
+        against those of a previous run (see ``delta.diff_source_row_hashes``),
+        only the added or changed locations are transformed to canonical and
+        model exposures and looked up, and the results are spliced into the
+        previous canonical exposures, model exposures, keys and keys errors
+        files, with the locations renumbered as in a full regeneration. The
+        files written are identical to those a full regeneration writes, for
+        transformations which map each source row to one output row, and
+        lookups which return the keys of each location independently of the
+        other locations and in location order.
+
+        The location keys and row hashes of the source exposures are written
+        to the ``source_exposures_hashes_file_path`` file, for the diff of the
+        next run, whether or not a delta is possible.
+
+        :param oasis_model: The model to get keys for
+        :type oasis_model: ``OasisModel``
+
+        :param previous_files: The ``source_exposures_hashes``,
+                               ``canonical_exposures``, ``model_exposures``,
+                               ``keys`` and (if a keys errors file is to be
+                               written) ``keys_errors`` files of the previous
+                               run
+        :type previous_files: dict
+
+        :return: The paths of the canonical exposures, model exposures, keys
+                 and keys errors files, or ``None`` if a delta is not possible,
+                 in which case no files other than the row hashes file are
+                 written
+        """
+        kwargs = self._process_default_kwargs(oasis_model=oasis_model, **kwargs)
+
+        logger = kwargs.get('logger') or logging.getLogger()
+
+        lookup = kwargs.get('lookup')
+        canonical_exposures_file_path = kwargs.get('canonical_exposures_file_path')
+        model_exposures_file_path = kwargs.get('model_exposures_file_path')
+        keys_file_path = kwargs.get('keys_file_path')
+        keys_errors_file_path = kwargs.get('keys_errors_file_path')
+
+        def read_strings(fp):
+            with io.open(fp, 'r', encoding='utf-8') as f:
+                return pd.read_csv(f, dtype=object, na_filter=False)
+
+        def write_frame(df, fp):
+            with io.open(fp, 'w', encoding='utf-8', newline='') as f:
+                df.to_csv(f, encoding='utf-8', index=False)
+
+        previous_files = previous_files or {}
+        required_files = ['source_exposures_hashes', 'canonical_exposures', 'model_exposures', 'keys'] + (['keys_errors'] if keys_errors_file_path else [])
+        has_previous_files = all(previous_files.get(f) for f in required_files)
+
+        # The previous files are read before any files are written, as the
+        # file paths of this run may be those of the previous run
+        previous_hashes_df = read_source_row_hashes(previous_files['source_exposures_hashes']) if has_previous_files else None
+
+        srcexp_df = read_strings(kwargs['source_exposures_file_path'])
+        hashes_df = get_source_row_hashes(srcexp_df)
+        write_frame(hashes_df, kwargs['source_exposures_hashes_file_path'])
+
+        if not has_previous_files:
+            logger.info('\nNo previous files to diff the source exposures against')
+            return
+
+        diff = diff_source_row_hashes(previous_hashes_df, hashes_df)
+        if diff is None:
+            logger.info('\nThe (account, location) numbers are not unique, or the first location has changed - the source exposures cannot be diffed')
+            return
+
+        unchanged_df, changed_ids = diff
+        ids = pd.Series(unchanged_df['id'].values, index=unchanged_df['previous_id'].values)
+
+        num_previous = len(previous_hashes_df)
+        previous_canexp_df = read_strings(previous_files['canonical_exposures'])
+        previous_modexp_df = read_strings(previous_files['model_exposures'])
+        previous_keys_df = read_strings(previous_files['keys'])
+        previous_keys_errors_df = read_strings(previous_files['keys_errors']) if keys_errors_file_path else None
+
+        try:
+            loc_id_col = lookup.loc_id_col.lower()
+        except AttributeError:
+            loc_id_col = 'id'
+
+        modexp_id_col = next((col for col in previous_modexp_df.columns if col.lower() == loc_id_col), None)
+
+        def is_numbered(df, id_col):
+            return (
+                id_col in df and len(df) == num_previous and
+                (pd.to_numeric(df[id_col], errors='coerce').values == np.arange(1, num_previous + 1)).all()
+            )
+
+        if not (is_numbered(previous_canexp_df, 'ROW_ID') and is_numbered(previous_modexp_df, modexp_id_col)):
+            logger.info('\nThe previous canonical or model exposures are not one row per location - the source exposures cannot be diffed')
+            return
+
+        def get_canonical_to_model_translator(output_columns=None):
+            return seed_output_columns(self._get_translator(
+                None,
+                None,
+                os.path.abspath(kwargs['canonical_to_model_exposures_transformation_file_path']),
+                kwargs.get('canonical_exposures_validation_file_path'),
+                False
+            ), output_columns)
+
+        def seed_output_columns(translator, output_columns):
+            # XSLT translators take their output columns from the first
+            # output record, without the attributes of empty values, so the
+            # output columns of the changed locations are set to those of
+            # the previous files, which are those of the first location
+            if output_columns is not None and isinstance(translator, Translator):
+                translator.row_header_out = [col for col in output_columns if not (translator.row_nums and col == 'ROW_ID')]
+            return translator
+
+        # The model exposures columns with the location IDs - those whose
+        # values change with the canonical exposures row IDs, found by
+        # transforming the first location with two different row IDs -
+        # which must all be copies of the ID column to be renumbered
+        probe_df = as_csv_strings(previous_canexp_df.iloc[[0, 0]].reset_index(drop=True))
+        probe_df['ROW_ID'] = ['1', '2']
+        probe_df = pd.concat(list(get_canonical_to_model_translator().frames([probe_df])), ignore_index=True)
+        modexp_id_cols = [
+            col for col in probe_df.columns
+            if '{}'.format(probe_df[col].iloc[0]) != '{}'.format(probe_df[col].iloc[1])
+        ]
+
+        if not (
+            modexp_id_col in modexp_id_cols and
+            all(col in previous_modexp_df and previous_modexp_df[col].equals(previous_modexp_df[modexp_id_col]) for col in modexp_id_cols)
+        ):
+            logger.info('\nThe model exposures location IDs are not copies of the canonical exposures row IDs - the source exposures cannot be diffed')
+            return
+
+        logger.info(
+            '\n{} of {} locations added or changed, {} removed'.format(
+                len(changed_ids), len(hashes_df), num_previous - len(unchanged_df)
+            )
+        )
+
+        def splice(previous_df, id_col, changed_df, id_cols=None):
+            # Renumbers the rows of the unchanged locations, and adds the
+            # rows of the added or changed locations, in location order
+            previous_ids = previous_df[id_col].astype(np.int64)
+            unchanged = previous_ids.isin(ids.index).values
+
+            df = previous_df[unchanged].astype(object)
+            for col in (id_cols or [id_col]):
+                df[col] = ids.loc[previous_ids[unchanged].values].values
+
+            if changed_df is not None and len(changed_df):
+                df = pd.concat([df, changed_df.reindex(columns=previous_df.columns).astype(object)], ignore_index=True)
+
+            order = np.argsort(df[id_col].astype(np.int64).values, kind='mergesort')
+            return df.iloc[order].reset_index(drop=True)
+
+        canexp_df = modexp_df = keys_df = keys_errors_df = None
+
+        if len(changed_ids):
+            tmp_dir = tempfile.mkdtemp()
+            try:
+                changed_srcexp_fp = os.path.join(tmp_dir, 'srcexp.csv')
+                write_frame(srcexp_df.iloc[changed_ids - 1], changed_srcexp_fp)
+
+                source_to_canonical = seed_output_columns(self._get_translator(
+                    changed_srcexp_fp,
+                    None,
+                    os.path.abspath(kwargs['source_to_canonical_exposures_transformation_file_path']),
+                    kwargs.get('source_exposures_validation_file_path'),
+                    True
+                ), previous_canexp_df.columns.tolist())
+                canexp_frames = list(source_to_canonical.frames())
+                canexp_df = pd.concat(canexp_frames, ignore_index=True) if canexp_frames else pd.DataFrame()
+                if len(canexp_df) != len(changed_ids):
+                    logger.info('\nThe source to canonical exposures transformation is not one row per location - the source exposures cannot be diffed')
+                    return
+
+                canexp_df['ROW_ID'] = changed_ids
+                canexp_df = canexp_df.reindex(columns=previous_canexp_df.columns)
+
+                modexp_frames = list(get_canonical_to_model_translator(previous_modexp_df.columns.tolist()).frames([as_csv_strings(canexp_df)]))
+                modexp_df = pd.concat(modexp_frames, ignore_index=True) if modexp_frames else pd.DataFrame()
+                if len(modexp_df) != len(changed_ids):
+                    logger.info('\nThe canonical to model exposures transformation is not one row per location - the source exposures cannot be diffed')
+                    return
+
+                modexp_df = modexp_df.reindex(columns=previous_modexp_df.columns)
+
+                changed_keys_fp, changed_keys_errors_fp, _ = self.get_keys_data(
+                    lookup=lookup,
+                    model_exposures_data=modexp_df,
+                    keys_file_path=os.path.join(tmp_dir, 'keys.csv'),
+                    keys_errors_file_path=(os.path.join(tmp_dir, 'keys-errors.csv') if previous_keys_errors_df is not None else None)
+                )
+                keys_df = read_strings(changed_keys_fp)
+                keys_errors_df = read_strings(changed_keys_errors_fp) if changed_keys_errors_fp else None
+            finally:
+                shutil.rmtree(tmp_dir)
+
+        write_frame(splice(previous_canexp_df, 'ROW_ID', canexp_df), canonical_exposures_file_path)
+        write_frame(splice(previous_modexp_df, modexp_id_col, modexp_df, id_cols=modexp_id_cols), model_exposures_file_path)
+        write_frame(splice(previous_keys_df, 'LocID', keys_df), keys_file_path)
+
+        if keys_errors_file_path:
+            write_frame(splice(previous_keys_errors_df, 'LocID', keys_errors_df), keys_errors_file_path)
+
+        if oasis_model:
+            ofp = oasis_model.resources['oasis_files_pipeline']
+            ofp.canonical_exposures_file_path = canonical_exposures_file_path
+            ofp.model_exposures_file_path = model_exposures_file_path
+            ofp.keys_file_path = keys_file_path
+            ofp.keys_errors_file_path = keys_errors_file_path
+
+        return canonical_exposures_file_path, model_exposures_file_path, keys_file_path, keys_errors_file_path
+
     def _process_default_kwargs(self, oasis_model=None, **kwargs):
         if oasis_model:
             omr = oasis_model.resources
@@ -705,6 +1231,8 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
 
             kwargs.setdefault('fm', omr.get('fm') or kwargs.get('fm'))
 
+            kwargs.setdefault('chunk_size', omr.get('chunk_size'))
+
             kwargs.setdefault('logger', omr.get('logger') or logging.getLogger())
 
             kwargs.setdefault('oasis_files_path', omr.get('oasis_files_path'))
@@ -775,7 +1303,12 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
         keys_df
     ):
         """
-        Generates GUL items.
+        Generates GUL items as a typed data frame - the canonical exposures
+        and keys are joined, the TIV columns are melted into one row per
+        (location, peril, coverage type, TIV term) with a positive TIV, and
+        the item, coverage and group IDs and the FM term element names are
+        attached as whole-column operations. If no location has a positive
+        TIV for a coverage with keys the data frame is empty.
 
         :param canonical_exposures_profile: Canonical exposures profile
         :type canonical_exposures_profile: dict
@@ -785,6 +1318,9 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
 
         :param keys_df: Keys file data frame
         :type keys_df: pandas.DataFrame
+
+        :return: GUL items data frame
+        :rtype: pandas.DataFrame
         """
         canexp_df = canonical_exposures_df
 
@@ -802,7 +1338,7 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
 
         try:
             for df in [canexp_df, keys_df]:
-                if not df.columns.contains('index'):
+                if 'index' not in df.columns:
                     df['index'] = pd.Series(data=range(len(df)))
 
             if not str(canexp_df['row_id'].dtype).startswith('int'):
@@ -816,7 +1352,6 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
                     canexp_df.rename(columns=repl, inplace=True)
 
             merged_df = pd.merge(canexp_df, keys_df, left_on='row_id', right_on='locid').drop_duplicates()
-            merged_df['index'] = pd.Series(data=range(len(merged_df)), dtype=object)
 
             cov_level_id = fm_levels[0]
 
@@ -833,54 +1368,69 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
                 } for tiv_tgid in ufcp[cov_level_id]
             }
 
-
-            group_id = 0
-            prev_it_loc_id = -1
-            item_id = 0
-            zero_tiv_items = 0
-            positive_tiv_elements = lambda it: [t for t in tiv_terms if it.get(t['ProfileElementName'].lower()) and it[t['ProfileElementName'].lower()] > 0 and t['CoverageTypeID'] == it['coveragetypeid']] or [0]
-            
-            for it, ptiv in itertools.chain((it, ptiv) for _, it in merged_df.iterrows() for it, ptiv in itertools.product([it],positive_tiv_elements(it))):
-                if ptiv == 0:
-                    zero_tiv_items += 1
+            # Melt the TIV columns - for each TIV term collect the positions
+            # of the merged rows with a matching coverage type and a positive
+            # TIV, then order the (row, term) pairs by row and term position,
+            # which is the order in which the items were previously generated
+            # row by row
+            coverage_type_ids = merged_df['coveragetypeid'].values
+
+            item_rows = []
+            item_terms = []
+            item_tivs = []
+            for i, t in enumerate(tiv_terms):
+                tiv_elm = t['ProfileElementName'].lower()
+                if tiv_elm not in merged_df.columns:
                     continue
-
-                item_id += 1
-                if it['row_id'] != prev_it_loc_id:
-                    group_id += 1
-
-                tiv_elm = ptiv['ProfileElementName'].lower()
-                tiv = it[tiv_elm]
-                tiv_tgid = ptiv['FMTermGroupID']
-
-                yield {
-                    'item_id': item_id,
-                    'canexp_id': it['row_id'] - 1,
-                    'peril_id': it['perilid'],
-                    'coverage_type_id': it['coveragetypeid'],
-                    'coverage_id': item_id,
-                    'tiv_elm': tiv_elm,
-                    'tiv': tiv,
-                    'tiv_tgid': tiv_tgid,
-                    'ded_elm': fm_terms[tiv_tgid].get('deductible'),
-                    'ded_min_elm': fm_terms[tiv_tgid].get('deductiblemin'),
-                    'ded_max_elm': fm_terms[tiv_tgid].get('deductiblemax'),
-                    'lim_elm': fm_terms[tiv_tgid].get('limit'),
-                    'shr_elm': fm_terms[tiv_tgid].get('share'),
-                    'areaperil_id': it['areaperilid'],
-                    'vulnerability_id': it['vulnerabilityid'],
-                    'group_id': group_id,
-                    'summary_id': 1,
-                    'summaryset_id': 1
-                }
-                prev_it_loc_id = it['row_id']
-
-
+                tivs = merged_df[tiv_elm].astype(float).values
+                rows = np.where((tivs > 0) & (coverage_type_ids == t['CoverageTypeID']))[0]
+                item_rows.append(rows)
+                item_terms.append(np.full(len(rows), i, dtype=int))
+                item_tivs.append(tivs[rows])
+
+            item_rows = np.concatenate(item_rows) if item_rows else np.array([], dtype=int)
+            item_terms = np.concatenate(item_terms) if item_terms else np.array([], dtype=int)
+            item_tivs = np.concatenate(item_tivs) if item_tivs else np.array([], dtype=float)
+
+            order = np.lexsort((item_terms, item_rows))
+            item_rows, item_terms, item_tivs = item_rows[order], item_terms[order], item_tivs[order]
+
+            num_items = len(item_rows)
+            item_ids = np.arange(1, num_items + 1)
+
+            row_ids = merged_df['row_id'].values[item_rows].astype(int)
+            group_ids = np.cumsum(np.concatenate(([True], row_ids[1:] != row_ids[:-1])))[:num_items]
+
+            term_tgids = np.array([t['FMTermGroupID'] for t in tiv_terms], dtype=int)
+            term_elms = lambda term_type: np.array([fm_terms[t['FMTermGroupID']].get(term_type) for t in tiv_terms], dtype=object)[item_terms]
+
+            gul_items_df = pd.DataFrame(
+                data=OrderedDict([
+                    ('item_id', item_ids),
+                    ('canexp_id', row_ids - 1),
+                    ('peril_id', merged_df['perilid'].values[item_rows].astype(int)),
+                    ('coverage_type_id', coverage_type_ids[item_rows].astype(int)),
+                    ('coverage_id', item_ids),
+                    ('tiv_elm', np.array([t['ProfileElementName'].lower() for t in tiv_terms], dtype=object)[item_terms]),
+                    ('tiv', item_tivs),
+                    ('tiv_tgid', term_tgids[item_terms]),
+                    ('ded_elm', term_elms('deductible')),
+                    ('ded_min_elm', term_elms('deductiblemin')),
+                    ('ded_max_elm', term_elms('deductiblemax')),
+                    ('lim_elm', term_elms('limit')),
+                    ('shr_elm', term_elms('share')),
+                    ('areaperil_id', merged_df['areaperilid'].values[item_rows].astype(int)),
+                    ('vulnerability_id', merged_df['vulnerabilityid'].values[item_rows].astype(int)),
+                    ('group_id', group_ids),
+                    ('summary_id', np.ones(num_items, dtype=int)),
+                    ('summaryset_id', np.ones(num_items, dtype=int)),
+                    ('index', np.arange(num_items))
+                ])
+            )
         except (AttributeError, KeyError, IndexError, TypeError, ValueError) as e:
             raise OasisException(e)
-        else:
-            if zero_tiv_items == len(merged_df):
-                raise OasisException('All canonical exposure items have zero TIVs - please check the canonical exposures (loc.) file')
+
+        return gul_items_df
 
     def generate_fm_items(
         self,
@@ -911,6 +1461,9 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
 
         :param fm_agg_profile: FM aggregation profile
         :param fm_agg_profile: dict
+
+        :return: FM items data frame
+        :rtype: pandas.DataFrame
         """
         cep = canonical_exposures_profile
         cap = canonical_accounts_profile
@@ -920,7 +1473,7 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
         canacc_df = canonical_accounts_df
 
         for df in [canexp_df, gul_items_df, canacc_df]:
-            if not df.columns.contains('index'):
+            if 'index' not in df.columns:
                 df['index'] = pd.Series(data=range(len(df)))
 
         oed_acc_col_repl = [{'accnumber': 'accntnum'}, {'polnumber': 'policynum'}]
@@ -930,15 +1483,6 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
         cangul_df = pd.merge(canexp_df, gul_items_df, left_on='index', right_on='canexp_id')
         cangul_df['index'] = pd.Series(data=cangul_df.index)
 
-        keys = (
-            'item_id', 'gul_item_id', 'peril_id', 'coverage_type_id', 'coverage_id',
-            'canexp_id', 'canacc_id', 'policy_num', 'level_id', 'layer_id',
-            'agg_id', 'policytc_id', 'deductible', 'deductible_min',
-            'deductible_max', 'attachment', 'limit', 'share', 'calcrule_id', 'tiv_elm',
-            'tiv', 'tiv_tgid', 'ded_elm', 'ded_min_elm', 'ded_max_elm',
-            'lim_elm', 'shr_elm',
-        )
-
         try:
             ufcp = unified_canonical_fm_profile_by_level_and_term_group(profiles=(cep, cap,))
 
@@ -958,94 +1502,123 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
             fm_levels = tuple(ufcp.keys())
 
             cov_level_id = fm_levels[0]
-
-            coverage_level_preset_data = list(zip(
-                tuple(cangul_df.item_id.values),          # 1 - FM item ID
-                tuple(cangul_df.item_id.values),          # 2 - GUL item ID
-                tuple(cangul_df.peril_id.values),         # 3 - peril ID
-                tuple(cangul_df.coverage_type_id.values), # 4 - coverage type ID
-                tuple(cangul_df.coverage_id.values),      # 5 - coverage ID
-                tuple(cangul_df.canexp_id.values),        # 6 - can. exp. DF index
-                (-1,)*len(cangul_df),                     # 7 - can. acc. DF index
-                (-1,)*len(cangul_df),                     # 8 - can. acc. policy num.
-                (cov_level_id,)*len(cangul_df),           # 9 - coverage level ID
-                (1,)*len(cangul_df),                      # 10 - layer ID
-                (-1,)*len(cangul_df),                     # 11 - agg. ID
-                tuple(cangul_df.tiv_elm.values),          # 12 - TIV element
-                tuple(cangul_df.tiv.values),              # 13 -TIV value
-                tuple(cangul_df.tiv_tgid.values),         # 14 -TIV element profile term group ID
-                tuple(cangul_df.ded_elm.values),          # 15 -deductible element
-                tuple(cangul_df.ded_min_elm.values),      # 16 -deductible min. element
-                tuple(cangul_df.ded_max_elm.values),      # 17 -deductible max. element
-                tuple(cangul_df.lim_elm.values),          # 18 -limit element
-                tuple(cangul_df.shr_elm.values)           # 19 -share element
-            ))
-
-            get_canacc_item = lambda i: canacc_df[(canacc_df['accntnum'] == cangul_df[cangul_df['canexp_id']==coverage_level_preset_data[i][5]].iloc[0]['accntnum'])].iloc[0]
-
-            get_canacc_id = lambda i: int(get_canacc_item(i)['index'])
-
-            coverage_level_preset_items = {
-                i: {
-                    k:v for k, v in zip(
-                        keys,
-                        [i + 1, gul_item_id, peril_id, coverage_type_id, coverage_id, canexp_id, get_canacc_id(i), policy_num, level_id, layer_id, agg_id, -1, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 12, tiv_elm, tiv, tiv_tgid, ded_elm, ded_min_elm, ded_max_elm, lim_elm, shr_elm]
+            layer_level_id = max(fm_levels)
+
+            # Index the accounts once: the first account row of each account
+            # number (which the coverage level items are attached to), the rows
+            # (policies) of each account, and the layer ordinal of each policy
+            # within its account - for duplicate policy numbers in an account
+            # the ordinal of the first occurrence
+            acc_groups = canacc_df.groupby(canacc_df['accntnum'].values, sort=False)
+            acc_first_idx = acc_groups['index'].first()
+
+            acc_ords = acc_groups.cumcount()
+            acc_layer_ids = (
+                acc_ords.groupby([canacc_df['accntnum'].values, canacc_df['policynum'].fillna('').values], sort=False).transform('min') + 1
+            ).values
+
+            cov_canacc_ids = cangul_df['accntnum'].map(acc_first_idx)
+            if cov_canacc_ids.isnull().any():
+                raise OasisException(
+                    'Canonical accounts file is missing account numbers {} referenced in the canonical exposures file'.format(
+                        sorted(set(cangul_df[cov_canacc_ids.isnull()]['accntnum'].values))
                     )
-                } for i, (item_id, gul_item_id, peril_id, coverage_type_id, coverage_id, canexp_id, _, policy_num, level_id, layer_id, agg_id, tiv_elm, tiv, tiv_tgid, ded_elm, ded_min_elm, ded_max_elm, lim_elm, shr_elm) in enumerate(coverage_level_preset_data)
-            }
-
-            num_cov_items = len(coverage_level_preset_items)
-
-            preset_items = {
-                level_id: (coverage_level_preset_items if level_id == cov_level_id else copy.deepcopy(coverage_level_preset_items)) for level_id in fm_levels
-            }
-
-            for i, (level_id, item_id, it) in enumerate(itertools.chain((level_id, k, v) for level_id in fm_levels[1:] for k, v in preset_items[level_id].items())):
-                it['level_id'] = level_id
-                it['item_id'] = num_cov_items + i + 1
-                it['ded_elm'] = it['ded_min_elm'] = it['ded_max_elm'] = it['lim_elm'] = it['shr_elm'] = None
-
-            num_sub_layer_level_items = sum(len(preset_items[level_id]) for level_id in fm_levels[:-1])
-            layer_level = max(fm_levels)
-            layer_level_items = copy.deepcopy(preset_items[layer_level])
-            layer_level_min_idx = min(layer_level_items)
-
-            layer_id = lambda i: list(
-                canacc_df[canacc_df['accntnum'] == canacc_df.iloc[i]['accntnum']]['policynum'].values
-            ).index(canacc_df.iloc[i]['policynum']) + 1
-
-            for i, (canexp_id, canacc_id) in enumerate(
-                itertools.chain((canexp_id, canacc_id) for canexp_id in layer_level_items for canexp_id, canacc_id in itertools.product(
-                    [canexp_id],
-                    canacc_df[canacc_df['accntnum'] == canacc_df.iloc[layer_level_items[canexp_id]['canacc_id']]['accntnum']]['index'].values)
                 )
+
+            # The coverage level FM items - one per GUL item - as a table of
+            # typed columns, from which the items of the other levels are
+            # derived as row-wise repeats with a different level ID
+            num_cov_items = len(cangul_df)
+
+            cov_items_df = pd.DataFrame(OrderedDict([
+                ('item_id', np.arange(1, num_cov_items + 1)),
+                ('gul_item_id', cangul_df['item_id'].values.astype(int)),
+                ('peril_id', cangul_df['peril_id'].values),
+                ('coverage_type_id', cangul_df['coverage_type_id'].values.astype(int)),
+                ('coverage_id', cangul_df['coverage_id'].values.astype(int)),
+                ('canexp_id', cangul_df['canexp_id'].values.astype(int)),
+                ('canacc_id', cov_canacc_ids.values.astype(int)),
+                ('policy_num', None),
+                ('level_id', cov_level_id),
+                ('layer_id', 1),
+                ('agg_id', -1),
+                ('policytc_id', -1),
+                ('deductible', 0.0),
+                ('deductible_min', 0.0),
+                ('deductible_max', 0.0),
+                ('attachment', 0.0),
+                ('limit', 0.0),
+                ('share', 0.0),
+                ('calcrule_id', 12),
+                ('tiv_elm', cangul_df['tiv_elm'].values),
+                ('tiv', cangul_df['tiv'].values.astype(float)),
+                ('tiv_tgid', cangul_df['tiv_tgid'].values.astype(int)),
+                ('ded_elm', cangul_df['ded_elm'].values),
+                ('ded_min_elm', cangul_df['ded_min_elm'].values),
+                ('ded_max_elm', cangul_df['ded_max_elm'].values),
+                ('lim_elm', cangul_df['lim_elm'].values),
+                ('shr_elm', cangul_df['shr_elm'].values),
+            ]))
+
+            # The layer level has an item for every coverage item and policy
+            # of the item account, ordered by item and then by policy
+            layer_level_df = pd.merge(
+                pd.DataFrame({'accntnum': cangul_df['accntnum'].values, 'pos': np.arange(num_cov_items)}),
+                pd.DataFrame({
+                    'accntnum': canacc_df['accntnum'].values,
+                    'layer_canacc_id': canacc_df['index'].values.astype(int),
+                    'layer_id': acc_layer_ids.astype(int)
+                }),
+                on='accntnum'
+            ).sort_values(['pos', 'layer_canacc_id'], kind='mergesort')
+
+            # The levels below the layer level (none if the coverage level is
+            # the only level, in which case the layer level items are
+            # coverage items) have an item for every coverage item
+            sub_layer_levels = fm_levels[:-1]
+
+            fm_items_df = cov_items_df.iloc[
+                np.concatenate([np.tile(np.arange(num_cov_items), len(sub_layer_levels)), layer_level_df['pos'].values])
+            ].reset_index(drop=True)
+
+            fm_items_df['item_id'] = np.arange(1, len(fm_items_df) + 1)
+            fm_items_df['level_id'] = np.concatenate([
+                np.repeat(np.array(sub_layer_levels, dtype=int), num_cov_items),
+                np.full(len(layer_level_df), layer_level_id)
+            ])
+
+            layer_level_idx = fm_items_df.index[num_cov_items * len(sub_layer_levels):]
+            fm_items_df.loc[layer_level_idx, 'canacc_id'] = layer_level_df['layer_canacc_id'].values
+            fm_items_df.loc[layer_level_idx, 'layer_id'] = layer_level_df['layer_id'].values
+
+            if sub_layer_levels:
+                fm_items_df.loc[num_cov_items:, ['ded_elm', 'ded_min_elm', 'ded_max_elm', 'lim_elm', 'shr_elm']] = None
+
+            fm_items_df['policy_num'] = canacc_df['policynum'].values[fm_items_df['canacc_id'].values]
+
+            for src, f in set(
+                (v['src'].lower(), v['field'].lower()) for level_id in fm_levels for v in six.itervalues(fmap[level_id]['FMAggKey'])
             ):
-                it = copy.deepcopy(layer_level_items[canexp_id])
-                it['item_id'] = num_sub_layer_level_items + i + 1
-                it['layer_id'] = layer_id(canacc_id)
-                it['canacc_id'] = canacc_id
-                preset_items[layer_level][layer_level_min_idx + i] = it
-
-            for it in (it for c in itertools.chain(six.itervalues(preset_items[k]) for k in preset_items) for it in c):
-                it['policy_num'] = canacc_df.iloc[it['canacc_id']]['policynum']
-                lfmaggkey = fmap[it['level_id']]['FMAggKey']
-                for v in six.itervalues(lfmaggkey):
-                    src = v['src'].lower()
-                    if src in ['canexp', 'canacc']:
-                        f = v['field'].lower()
-                        it[f] = canexp_df.iloc[it['canexp_id']][f] if src == 'canexp' else canacc_df.iloc[it['canacc_id']][f]
-
-            concurrent_tasks = (
-                Task(get_fm_terms_by_level_as_list, args=(ufcp[level_id], fmap[level_id], preset_items[level_id], canexp_df.copy(deep=True), canacc_df.copy(deep=True),), key=level_id)
-                for level_id in fm_levels
-            )
-            num_ps = min(len(fm_levels), multiprocessing.cpu_count())
-            for it in multiprocess(concurrent_tasks, pool_size=num_ps):
-                yield it
+                if src in ['canexp', 'canacc']:
+                    src_df, src_id = (canexp_df, 'canexp_id') if src == 'canexp' else (canacc_df, 'canacc_id')
+                    fm_items_df[f] = src_df[f].values[fm_items_df[src_id].values]
+
+            # Calculate the terms level by level, and write them back into the
+            # items table by index
+            term_cols = [
+                'agg_id', 'deductible', 'deductible_min', 'deductible_max', 'attachment', 'limit', 'share', 'calcrule_id',
+                'ded_elm', 'ded_min_elm', 'ded_max_elm', 'lim_elm', 'shr_elm'
+            ]
+            fm_items_df['calcrule_id'] = fm_items_df['calcrule_id'].astype(float)
+            for level_id in fm_levels:
+                level_terms_df = get_fm_terms_by_level_as_df(ufcp[level_id], fmap[level_id], fm_items_df[fm_items_df['level_id'] == level_id], canexp_df, canacc_df)
+                fm_items_df.loc[level_terms_df.index, term_cols] = level_terms_df[term_cols]
         except (AttributeError, KeyError, IndexError, TypeError, ValueError) as e:
             raise OasisException(e)
 
-    def load_gul_items(self, canonical_exposures_profile, canonical_exposures_file_path, keys_file_path):
+        return fm_items_df
+
+    def load_gul_items(self, canonical_exposures_profile, canonical_exposures_file_path, keys_file_path, canonical_exposures_data=None, keys_data=None):
         """
         Loads GUL items generated by ``generate_gul_items`` into a static
         structure such as a pandas dataframe.
@@ -1058,12 +1631,29 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
 
         :param keys_file_path: Keys file path
         :type keys_file_path: str
+
+        :param canonical_exposures_data: Canonical exposures file values, to use
+                                         instead of reading the file (optional)
+        :type canonical_exposures_data: pandas.DataFrame
+
+        :param keys_data: Keys file values, to use instead of reading the file
+                          (optional)
+        :type keys_data: pandas.DataFrame
         """
         cep = canonical_exposures_profile
 
         try:
-            with io.open(canonical_exposures_file_path, 'r', encoding='utf-8') as cf, io.open(keys_file_path, 'r', encoding='utf-8') as kf:
-                canexp_df, keys_df = pd.read_csv(cf, float_precision='high'), pd.read_csv(kf, float_precision='high')
+            if canonical_exposures_data is not None:
+                canexp_df = as_csv_parsed(canonical_exposures_data)
+            else:
+                with io.open(canonical_exposures_file_path, 'r', encoding='utf-8') as cf:
+                    canexp_df = pd.read_csv(cf, float_precision='high')
+
+            if keys_data is not None:
+                keys_df = as_csv_parsed(keys_data)
+            else:
+                with io.open(keys_file_path, 'r', encoding='utf-8') as kf:
+                    keys_df = pd.read_csv(kf, float_precision='high')
 
             if len(canexp_df) == 0:
                 raise OasisException('No canonical exposure items found - please check the canonical exposures (loc) file')
@@ -1079,14 +1669,10 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
             keys_df.columns = keys_df.columns.str.lower()
             keys_df['index'] = pd.Series(data=keys_df.index, dtype=int)
 
-            gul_items_df = pd.DataFrame(data=[it for it in self.generate_gul_items(cep, canexp_df, keys_df)], dtype=object)
-            gul_items_df['index'] = pd.Series(data=gul_items_df.index, dtype=int)
+            gul_items_df = self.generate_gul_items(cep, canexp_df, keys_df)
 
-            for col in gul_items_df.columns:
-                if col.endswith('id'):
-                    gul_items_df[col] = gul_items_df[col].astype(int)
-                elif col == 'tiv':
-                    gul_items_df[col] = gul_items_df[col].astype(float)
+            if len(gul_items_df) == 0:
+                raise OasisException('All canonical exposure items have zero TIVs - please check the canonical exposures (loc.) file')
         except (IOError, MemoryError, OasisException, OSError, TypeError, ValueError) as e:
             raise OasisException(e)
             
@@ -1101,7 +1687,8 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
         canonical_accounts_profile,
         canonical_accounts_file_path,
         fm_agg_profile,
-        reduced=True
+        reduced=True,
+        canonical_accounts_data=None
     ):
         """
         Loads FM items generated by ``generate_fm_items`` into a static
@@ -1128,6 +1715,10 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
         :param reduced: Whether to generate only FM items with not all zero
                         values for limit, deductible and share. By default ``True``
         :param reduced: bool
+
+        :param canonical_accounts_data: Canonical accounts file values, to use
+                                        instead of reading the file (optional)
+        :type canonical_accounts_data: pandas.DataFrame
         """
         canexp_df = canonical_exposures_df
 
@@ -1137,8 +1728,11 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
         fmap = fm_agg_profile
 
         try:
-            with io.open(canonical_accounts_file_path, 'r', encoding='utf-8') as f:
-                canacc_df = pd.read_csv(f, float_precision='high')
+            if canonical_accounts_data is not None:
+                canacc_df = as_csv_parsed(canonical_accounts_data)
+            else:
+                with io.open(canonical_accounts_file_path, 'r', encoding='utf-8') as f:
+                    canacc_df = pd.read_csv(f, float_precision='high')
 
             if len(canacc_df) == 0:
                 raise OasisException('No canonical accounts items')
@@ -1147,32 +1741,22 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
             canacc_df.columns = canacc_df.columns.str.lower()
             canacc_df['index'] = pd.Series(data=canacc_df.index, dtype=int)
 
-            fm_items = [it for it in self.generate_fm_items(canexp_df, gul_items_df, cep, cap, canacc_df, fmap)]
-            fm_items.sort(key=lambda it: it['item_id'])
-
-            fm_items_df = pd.DataFrame(data=fm_items, dtype=object)
+            fm_items_df = self.generate_fm_items(canexp_df, gul_items_df, cep, cap, canacc_df, fmap)
+            fm_items_df = fm_items_df.sort_values('item_id').reset_index(drop=True)
             fm_items_df['index'] = pd.Series(data=fm_items_df.index, dtype=int)
 
             bookend_fm_levels = (fm_items_df['level_id'].min(), fm_items_df['level_id'].max(),)
 
             if reduced:
-                fm_items_df = fm_items_df[(fm_items_df['level_id'].isin(bookend_fm_levels)) | (fm_items_df['limit'] != 0) | (fm_items_df['deductible'] != 0) | (fm_items_df['deductible_min'] != 0) | (fm_items_df['deductible_max'] != 0) | (fm_items_df['share'] != 0)]
+                fm_items_df = fm_items_df[(fm_items_df['level_id'].isin(bookend_fm_levels)) | (fm_items_df['limit'] != 0) | (fm_items_df['deductible'] != 0) | (fm_items_df['deductible_min'] != 0) | (fm_items_df['deductible_max'] != 0) | (fm_items_df['share'] != 0)].reset_index(drop=True)
 
                 fm_items_df['index'] = range(len(fm_items_df))
 
                 fm_items_df['item_id'] = range(1, len(fm_items_df) + 1)
 
-                level_ids = [l for l in set(fm_items_df['level_id'])]
-
-                level_id = lambda i: level_ids.index(fm_items_df.iloc[i]['level_id']) + 1
-
-                fm_items_df['level_id'] = fm_items_df['index'].apply(level_id)
+                fm_items_df['level_id'] = pd.factorize(fm_items_df['level_id'], sort=True)[0] + 1
 
-            layer_level_id = fm_items_df['level_id'].max()
-
-            policytc_ids = get_policytc_ids(fm_items_df)
-            get_policytc_id = lambda i: [k for k in six.iterkeys(policytc_ids) if policytc_ids[k] == {k:fm_items_df.iloc[i][k] for k in ('limit', 'deductible', 'attachment', 'deductible_min', 'deductible_max', 'share', 'calcrule_id',)}][0]
-            fm_items_df['policytc_id'] = fm_items_df['index'].apply(lambda i: get_policytc_id(i))
+            fm_items_df['policytc_id'] = get_fm_policytc_ids(fm_items_df)
 
             for col in fm_items_df.columns:
                 if col.endswith('id'):
@@ -1184,92 +1768,102 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
 
         return fm_items_df, canacc_df
 
-
-    def write_items_file(self, gul_items_df, items_file_path):
+    def write_items_file(self, gul_items_df, items_file_path, binary_file_path=None):
         """
-        Writes an items file.
+        Writes an items file, and optionally its ktools binary file.
         """
         try:
+            cols = ['item_id', 'coverage_id', 'areaperil_id', 'vulnerability_id', 'group_id']
+
             gul_items_df.to_csv(
-                columns=['item_id', 'coverage_id', 'areaperil_id', 'vulnerability_id', 'group_id'],
+                columns=cols,
                 path_or_buf=items_file_path,
                 encoding='utf-8',
                 chunksize=1000,
                 index=False
             )
+
+            if binary_file_path:
+                write_binary_file(gul_items_df[cols], 'items', binary_file_path)
         except (IOError, OSError) as e:
             raise OasisException(e)
 
         return items_file_path
 
-    def write_coverages_file(self, gul_items_df, coverages_file_path):
+    def write_coverages_file(self, gul_items_df, coverages_file_path, binary_file_path=None):
         """
-        Writes a coverages file.
+        Writes a coverages file, and optionally its ktools binary file.
         """
         try:
+            cols = ['coverage_id', 'tiv']
+
             gul_items_df.to_csv(
-                columns=['coverage_id', 'tiv'],
+                columns=cols,
                 path_or_buf=coverages_file_path,
                 encoding='utf-8',
                 chunksize=1000,
                 index=False
             )
+
+            if binary_file_path:
+                write_binary_file(gul_items_df[cols], 'coverages', binary_file_path)
         except (IOError, OSError) as e:
             raise OasisException(e)
 
         return coverages_file_path
 
-    def write_gulsummaryxref_file(self, gul_items_df, gulsummaryxref_file_path):
+    def write_gulsummaryxref_file(self, gul_items_df, gulsummaryxref_file_path, binary_file_path=None):
         """
-        Writes a gulsummaryxref file.
+        Writes a gulsummaryxref file, and optionally its ktools binary file.
         """
         try:
+            cols = ['coverage_id', 'summary_id', 'summaryset_id']
+
             gul_items_df.to_csv(
-                columns=['coverage_id', 'summary_id', 'summaryset_id'],
+                columns=cols,
                 path_or_buf=gulsummaryxref_file_path,
                 encoding='utf-8',
                 chunksize=1000,
                 index=False
             )
+
+            if binary_file_path:
+                write_binary_file(gul_items_df[cols], 'gulsummaryxref', binary_file_path)
         except (IOError, OSError) as e:
             raise OasisException(e)
 
         return gulsummaryxref_file_path
 
-    def write_fm_policytc_file(self, fm_items_df, fm_policytc_file_path):
+    def write_fm_policytc_file(self, fm_items_df, fm_policytc_file_path, binary_file_path=None):
         """
-        Writes an FM policy T & C file.
+        Writes an FM policy T & C file, and optionally its ktools binary file.
         """
         try:
-            fm_policytc_df = pd.DataFrame(
-                columns=['layer_id', 'level_id', 'agg_id', 'policytc_id'],
-                data=[key[:4] for key, _ in fm_items_df.groupby(['layer_id', 'level_id', 'agg_id', 'policytc_id', 'limit', 'deductible', 'share'])],
-                dtype=object
-            )
+            cols = ['layer_id', 'level_id', 'agg_id', 'policytc_id']
+
+            fm_policytc_df = fm_items_df[cols].drop_duplicates().sort_values(cols)
             fm_policytc_df.to_csv(
                 path_or_buf=fm_policytc_file_path,
                 encoding='utf-8',
                 chunksize=1000,
                 index=False
             )
+
+            if binary_file_path:
+                write_binary_file(fm_policytc_df, 'fm_policytc', binary_file_path)
         except (IOError, OSError) as e:
             raise OasisException(e)
 
         return fm_policytc_file_path
 
-    def write_fm_profile_file(self, fm_items_df, fm_profile_file_path):
+    def write_fm_profile_file(self, fm_items_df, fm_profile_file_path, binary_file_path=None):
         """
-        Writes an FM profile file.
+        Writes an FM profile file, and optionally its ktools binary file.
         """
         try:
             cols = ['policytc_id', 'calcrule_id', 'limit', 'deductible', 'deductible_min', 'deductible_max', 'attachment', 'share']
 
-            fm_profile_df = fm_items_df[cols]
-
-            fm_profile_df = pd.DataFrame(
-                columns=cols,
-                data=[key for key, _ in fm_profile_df.groupby(cols)]
-            )
+            fm_profile_df = fm_items_df[cols].drop_duplicates(subset=['policytc_id']).sort_values('policytc_id').reset_index(drop=True)
 
             col_repl = [
                 {'deductible': 'deductible1'},
@@ -1288,21 +1882,26 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
 
             fm_profile_df['share2'] = fm_profile_df['share3'] = [0]*n
 
+            cols = ['policytc_id', 'calcrule_id', 'deductible1', 'deductible2', 'deductible3', 'attachment1', 'limit1', 'share1', 'share2', 'share3']
+
             fm_profile_df.to_csv(
-                columns=['policytc_id','calcrule_id','deductible1', 'deductible2', 'deductible3', 'attachment1', 'limit1', 'share1', 'share2', 'share3'],
+                columns=cols,
                 path_or_buf=fm_profile_file_path,
                 encoding='utf-8',
                 chunksize=1000,
                 index=False
             )
+
+            if binary_file_path:
+                write_binary_file(fm_profile_df[cols], 'fm_profile', binary_file_path)
         except (IOError, OSError) as e:
             raise OasisException(e)
 
         return fm_profile_file_path
 
-    def write_fm_programme_file(self, fm_items_df, fm_programme_file_path):
+    def write_fm_programme_file(self, fm_items_df, fm_programme_file_path, binary_file_path=None):
         """
-        Writes a FM programme file.
+        Writes a FM programme file, and optionally its ktools binary file.
         """
         try:
             fm_aggtree = {
@@ -1326,14 +1925,17 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
                 chunksize=1000,
                 index=False
             )
+
+            if binary_file_path:
+                write_binary_file(fm_programme_df, 'fm_programme', binary_file_path)
         except (IOError, OSError) as e:
             raise OasisException(e)
 
         return fm_programme_file_path
 
-    def write_fm_xref_file(self, fm_items_df, fm_xref_file_path):
+    def write_fm_xref_file(self, fm_items_df, fm_xref_file_path, binary_file_path=None):
         """
-        Writes a FM xref file.
+        Writes a FM xref file, and optionally its ktools binary file.
         """
         try:
             data = [
@@ -1348,14 +1950,17 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
                 chunksize=1000,
                 index=False
             )
+
+            if binary_file_path:
+                write_binary_file(fm_xref_df, 'fm_xref', binary_file_path)
         except (IOError, OSError) as e:
             raise OasisException(e)
 
         return fm_xref_file_path
 
-    def write_fmsummaryxref_file(self, fm_items_df, fmsummaryxref_file_path):
+    def write_fmsummaryxref_file(self, fm_items_df, fmsummaryxref_file_path, binary_file_path=None):
         """
-        Writes an FM summaryxref file.
+        Writes an FM summaryxref file, and optionally its ktools binary file.
         """
         try:
             data = [
@@ -1370,6 +1975,9 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
                 chunksize=1000,
                 index=False
             )
+
+            if binary_file_path:
+                write_binary_file(fmsummaryxref_df, 'fmsummaryxref', binary_file_path)
         except (IOError, OSError) as e:
             raise OasisException(e)
 
@@ -1382,6 +1990,10 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
             items.csv
             coverages.csv
             gulsummaryxref.csv
+
+        If ``binary_files_path`` is set the ktools binary files of the GUL
+        files are also written to it, directly from the data frames of the
+        files (see ``model_execution.bin.write_binary_file``).
         """
         kwargs = self._process_default_kwargs(oasis_model=oasis_model, **kwargs)
 
@@ -1393,7 +2005,13 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
         canonical_exposures_file_path = kwargs.get('canonical_exposures_file_path')
         keys_file_path = kwargs.get('keys_file_path')
         
-        gul_items_df, canexp_df = self.load_gul_items(canonical_exposures_profile, canonical_exposures_file_path, keys_file_path)
+        gul_items_df, canexp_df = self.load_gul_items(
+            canonical_exposures_profile,
+            canonical_exposures_file_path,
+            keys_file_path,
+            canonical_exposures_data=kwargs.get('canonical_exposures_data'),
+            keys_data=kwargs.get('keys_data')
+        )
 
         if oasis_model:
             omr['canonical_exposures_df'] = canexp_df
@@ -1408,9 +2026,14 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
             }
         )
 
+        binary_files_path = kwargs.get('binary_files_path')
+
         concurrent_tasks = (
-            Task(getattr(self, 'write_{}_file'.format(f)), args=(gul_items_df.copy(deep=True), gul_files[f],), key=f)
-            for f in gul_files
+            Task(
+                getattr(self, 'write_{}_file'.format(f)),
+                args=(gul_items_df.copy(deep=True), gul_files[f], os.path.join(binary_files_path, '{}.bin'.format(f)) if binary_files_path else None,),
+                key=f
+            ) for f in gul_files
         )
         num_ps = min(len(gul_files), multiprocessing.cpu_count())
         for _, _ in multithread(concurrent_tasks, pool_size=num_ps):
@@ -1427,6 +2050,10 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
             fm_programm.ecsv
             fm_xref.csv
             fm_summaryxref.csv
+
+        If ``binary_files_path`` is set the ktools binary files of the FM
+        files are also written to it, directly from the data frames of the
+        files (see ``model_execution.bin.write_binary_file``).
         """
         kwargs = self._process_default_kwargs(oasis_model=oasis_model, **kwargs)
 
@@ -1446,7 +2073,15 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
             canonical_accounts_file_path = kwargs.get('canonical_accounts_file_path')
             fm_agg_profile = kwargs.get('fm_agg_profile')
 
-        fm_items_df, canacc_df = self.load_fm_items(canexp_df, gul_items_df, canonical_exposures_profile, canonical_accounts_profile, canonical_accounts_file_path, fm_agg_profile)
+        fm_items_df, canacc_df = self.load_fm_items(
+            canexp_df,
+            gul_items_df,
+            canonical_exposures_profile,
+            canonical_accounts_profile,
+            canonical_accounts_file_path,
+            fm_agg_profile,
+            canonical_accounts_data=kwargs.get('canonical_accounts_data')
+        )
 
         if oasis_model:
             omr['canonical_accounts_df'] = canacc_df
@@ -1463,9 +2098,14 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
             }
         )
 
+        binary_files_path = kwargs.get('binary_files_path')
+
         concurrent_tasks = (
-            Task(getattr(self, 'write_{}_file'.format(f)), args=(fm_items_df.copy(deep=True), fm_files[f],), key=f)
-            for f in fm_files
+            Task(
+                getattr(self, 'write_{}_file'.format(f)),
+                args=(fm_items_df.copy(deep=True), fm_files[f], os.path.join(binary_files_path, '{}.bin'.format(f)) if binary_files_path else None,),
+                key=f
+            ) for f in fm_files
         )
         num_ps = min(len(fm_files), multiprocessing.cpu_count())
         n = len(fm_files)
@@ -1489,6 +2129,463 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
 
         return oasis_files
 
+    def write_oasis_files_in_chunks(self, oasis_model=None, chunk_size=None, transform_exposures=None, **kwargs):
+        """
+        Writes the keys files and the Oasis files - GUL + FM (if ``fm`` is
+        ``True``) - by streaming the canonical and model exposures through the
+        keys lookup and the GUL and FM items generation in location-contiguous
+        chunks of ``chunk_size`` locations, so that apart from the canonical
+        accounts only one chunk of locations, keys and items is held in memory
+        at any one time. If ``transform_exposures`` is set the exposures are
+        also transformed chunk by chunk (see
+        ``transform_source_to_model_in_chunks``) - from the source exposures
+        if it is ``'source'``, or from the canonical exposures file if it is
+        ``'canonical'`` - and the canonical and model exposures files are
+        written as the chunks are processed.
+
+        The items of each chunk are appended to the Oasis files with globally
+        consistent IDs - the item, coverage, group and policy T & C IDs, and
+        the aggregation IDs of the FM levels with a location or coverage field
+        in their aggregation key, are offset by the IDs of the previous chunks,
+        while the aggregation IDs of the other FM levels (e.g. account, layer),
+        whose groups can span chunks, are assigned by aggregation key, in the
+        order of the keys, as in the FM files written in full. The FM level
+        and aggregation IDs are renumbered, and the FM programme and xref
+        files written, once all the chunks are processed.
+
+        :param oasis_model: The Oasis model object
+        :type oasis_model: oasislmf.models.model.OasisModel
+
+        :param chunk_size: Number of locations per chunk
+        :type chunk_size: int
+
+        :param transform_exposures: Whether to transform the exposures in
+                                    chunks, from the ``'source'`` or the
+                                    ``'canonical'`` exposures
+        :type transform_exposures: str
+
+        :param kwargs: Keyword arguments
+        :type kwargs: dict
+
+        :return: A dictionary of Oasis files (GUL + FM (if FM option indicated))
+        """
+        kwargs = self._process_default_kwargs(oasis_model=oasis_model, **kwargs)
+
+        try:
+            chunk_size = int(chunk_size or kwargs.get('chunk_size') or 0)
+        except (TypeError, ValueError):
+            chunk_size = 0
+
+        if chunk_size < 1:
+            raise OasisException('A positive chunk size (no. of locations per chunk) is required')
+
+        fm = kwargs.get('fm')
+
+        lookup = kwargs.get('lookup')
+
+        if lookup is None:
+            raise OasisException('No keys lookup provided')
+
+        cep = kwargs.get('canonical_exposures_profile')
+        cap = kwargs.get('canonical_accounts_profile')
+        fmap = kwargs.get('fm_agg_profile')
+
+        canonical_exposures_file_path = kwargs.get('canonical_exposures_file_path')
+        canonical_accounts_file_path = kwargs.get('canonical_accounts_file_path')
+        model_exposures_file_path = kwargs.get('model_exposures_file_path')
+
+        keys_file_path = kwargs.get('keys_file_path')
+        keys_errors_file_path = kwargs.get('keys_errors_file_path')
+
+        if oasis_model:
+            ofp = oasis_model.resources['oasis_files_pipeline']
+            ofp.keys_file_path = keys_file_path
+            ofp.keys_errors_file_path = keys_errors_file_path
+
+        gul_files = (
+            ofp.gul_files if oasis_model
+            else {
+                'items': kwargs.get('items_file_path'),
+                'coverages': kwargs.get('coverages_file_path'),
+                'gulsummaryxref': kwargs.get('gulsummaryxref_file_path')
+            }
+        )
+
+        fm_files = (
+            ofp.fm_files if oasis_model
+            else {
+                'fm_policytc': kwargs.get('fm_policytc_file_path'),
+                'fm_profile': kwargs.get('fm_profile_file_path'),
+                'fm_programme': kwargs.get('fm_programme_file_path'),
+                'fm_xref': kwargs.get('fm_xref_file_path'),
+                'fmsummaryxref': kwargs.get('fmsummaryxref_file_path')
+            }
+        ) if fm else {}
+
+        try:
+            loc_id_col = lookup.loc_id_col.lower()
+        except AttributeError:
+            loc_id_col = 'id'
+
+        keys_cols = OrderedDict([
+            (loc_id_col, 'LocID'),
+            ('peril_id', 'PerilID'),
+            ('coverage_type', 'CoverageTypeID'),
+            ('area_peril_id', 'AreaPerilID'),
+            ('vulnerability_id', 'VulnerabilityID'),
+        ])
+        keys_errors_cols = OrderedDict([
+            (loc_id_col, 'LocID'),
+            ('peril_id', 'PerilID'),
+            ('coverage_type', 'CoverageTypeID'),
+            ('message', 'Message'),
+        ])
+
+        try:
+            lookup.config
+        except AttributeError:
+            get_keys = lambda modexp: OasisLookupFactory.get_keys(lookup=lookup, model_exposures=modexp, success_only=(False if keys_errors_file_path else True))
+        else:
+            get_keys = lambda modexp: OasisLookupFactory.get_results(lookup, model_exposures=modexp, successes_only=(False if keys_errors_file_path else True))
+
+        # If ``binary_files_path`` is set the rows appended to the Oasis
+        # files are also appended to their ktools binary files
+        binary_files_path = kwargs.get('binary_files_path')
+        binary_files = {
+            fp: (f, os.path.join(binary_files_path, '{}.bin'.format(f))) for f, fp in itertools.chain(six.iteritems(gul_files), six.iteritems(fm_files))
+        } if binary_files_path else {}
+
+        def write_csv(df, fp, cols=None, header=False):
+            df.to_csv(path_or_buf=fp, columns=cols, mode=('w' if header else 'a'), header=header, encoding='utf-8', chunksize=1000, index=False)
+
+            if fp in binary_files:
+                f, bin_fp = binary_files[fp]
+                with io.open(bin_fp, ('wb' if header else 'ab')) as bin_file:
+                    write_binary_file(df[cols] if cols else df, f, bin_file)
+
+        gul_cols = {
+            'items': ['item_id', 'coverage_id', 'areaperil_id', 'vulnerability_id', 'group_id'],
+            'coverages': ['coverage_id', 'tiv'],
+            'gulsummaryxref': ['coverage_id', 'summary_id', 'summaryset_id']
+        }
+        fm_profile_cols = ['policytc_id', 'calcrule_id', 'deductible1', 'deductible2', 'deductible3', 'attachment1', 'limit1', 'share1', 'share2', 'share3']
+        fm_policytc_cols = ['layer_id', 'level_id', 'agg_id', 'policytc_id']
+
+        tmp_dir = None
+
+        try:
+            write_csv(pd.DataFrame(columns=list(keys_cols.values())), keys_file_path, header=True)
+            if keys_errors_file_path:
+                write_csv(pd.DataFrame(columns=list(keys_errors_cols.values())), keys_errors_file_path, header=True)
+
+            for f in gul_files:
+                write_csv(pd.DataFrame(columns=gul_cols[f]), gul_files[f], header=True)
+
+            if fm:
+                ufcp = unified_canonical_fm_profile_by_level_and_term_group(profiles=(cep, cap,))
+
+                if not ufcp:
+                    raise OasisException(
+                        'Canonical loc. and/or acc. profiles are possibly missing FM term information: '
+                        'FM term definitions for TIV, limit, deductible and/or share.'
+                    )
+
+                if not fmap:
+                    raise OasisException(
+                        'FM aggregation profile is empty - this is required to perform aggregation'
+                    )
+
+                fm_levels = tuple(ufcp.keys())
+                bookend_fm_levels = (min(fm_levels), max(fm_levels),)
+
+                if kwargs.get('canonical_accounts_data') is not None:
+                    canacc_df = as_csv_parsed(kwargs['canonical_accounts_data'])
+                else:
+                    with io.open(canonical_accounts_file_path, 'r', encoding='utf-8') as f:
+                        canacc_df = pd.read_csv(f, float_precision='high')
+
+                if len(canacc_df) == 0:
+                    raise OasisException('No canonical accounts items')
+
+                canacc_df = canacc_df.where(canacc_df.notnull(), None)
+                canacc_df.columns = canacc_df.columns.str.lower()
+                canacc_df['index'] = pd.Series(data=canacc_df.index, dtype=int)
+
+                # The levels whose aggregation keys include a location, coverage
+                # or item field have groups local to a chunk, and their
+                # aggregation IDs are offset by those of the previous chunks -
+                # the groups of the other levels are kept in a registry of
+                # aggregation keys
+                agg_keys = {
+                    level_id: [v['field'].lower() for v in six.itervalues(fmap[level_id]['FMAggKey'])] for level_id in fm_levels
+                }
+                chunk_local_levels = set(
+                    level_id for level_id in fm_levels if set(agg_keys[level_id]) & set(['canexp_id', 'coverage_id', 'gul_item_id', 'item_id'])
+                )
+                agg_offsets = {level_id: 0 for level_id in chunk_local_levels}
+                agg_registries = {level_id: {} for level_id in fm_levels if level_id not in chunk_local_levels}
+                written_aggs = {level_id: set() for level_id in agg_registries}
+                written_policytc_keys = set()
+
+                # The policy T & C rows, with the original level IDs, and the
+                # aggregation IDs of each level are spooled to disk until the
+                # levels can be renumbered
+                tmp_dir = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(fm_files['fm_policytc'])))
+                tmp_fm_policytc_file_path = os.path.join(tmp_dir, 'fm_policytc.csv')
+                level_aggs_file_paths = {level_id: os.path.join(tmp_dir, 'level{}_aggs.bin'.format(level_id)) for level_id in fm_levels}
+
+                write_csv(pd.DataFrame(columns=fm_policytc_cols), tmp_fm_policytc_file_path, header=True)
+                write_csv(pd.DataFrame(columns=fm_profile_cols), fm_files['fm_profile'], header=True)
+
+                fm_levels_present = set()
+                layer_ids = set()
+
+                num_policytcs = 0
+
+            canexp_data, modexp_data = kwargs.get('canonical_exposures_data'), kwargs.get('model_exposures_data')
+
+            if transform_exposures:
+                exposures_chunks = (
+                    (as_csv_parsed(canexp_df), as_csv_strings(modexp_df)) for canexp_df, modexp_df in self.transform_source_to_model_in_chunks(
+                        oasis_model=oasis_model,
+                        **dict(kwargs, chunk_size=chunk_size, from_canonical=(transform_exposures == 'canonical'))
+                    )
+                )
+            elif canexp_data is not None and modexp_data is not None:
+                exposures_chunks = six.moves.zip_longest(
+                    (as_csv_parsed(canexp_data.iloc[i:i + chunk_size]) for i in range(0, len(canexp_data), chunk_size)),
+                    (as_csv_strings(modexp_data.iloc[i:i + chunk_size]) for i in range(0, len(modexp_data), chunk_size))
+                )
+            else:
+                exposures_chunks = six.moves.zip_longest(
+                    pd.read_csv(canonical_exposures_file_path, chunksize=chunk_size, float_precision='high'),
+                    pd.read_csv(model_exposures_file_path, chunksize=chunk_size, dtype=object, encoding='utf-8')
+                )
+
+            num_items = num_coverages = num_groups = 0
+
+            for canexp_df, modexp_df in exposures_chunks:
+                if canexp_df is None or modexp_df is None or len(modexp_df) != len(canexp_df):
+                    raise OasisException('The canonical and model exposures files have different numbers of locations')
+
+                keys = list(get_keys(modexp_df.to_csv(index=False)))
+                keys_df = pd.DataFrame(columns=list(keys_cols), data=[k for k in keys if k['status'] == KEYS_STATUS_SUCCESS]).rename(columns=keys_cols)
+
+                write_csv(keys_df, keys_file_path)
+                if keys_errors_file_path:
+                    write_csv(
+                        pd.DataFrame(columns=list(keys_errors_cols), data=[k for k in keys if k['status'] != KEYS_STATUS_SUCCESS]).rename(columns=keys_errors_cols),
+                        keys_errors_file_path
+                    )
+
+                # Process the chunk as a portfolio in its own right, with row
+                # IDs local to the chunk
+                canexp_df = canexp_df.where(canexp_df.notnull(), None)
+                canexp_df.columns = canexp_df.columns.str.lower()
+
+                num_locs = len(canexp_df)
+                local_row_ids = pd.Series(data=np.arange(1, num_locs + 1), index=canexp_df['row_id'].values.astype(int))
+
+                canexp_df['row_id'] = local_row_ids.values
+                canexp_df['index'] = range(num_locs)
+
+                keys_df = keys_df.where(keys_df.notnull(), None)
+                keys_df.columns = keys_df.columns.str.lower()
+                keys_df['locid'] = keys_df['locid'].astype(int).map(local_row_ids)
+                keys_df = keys_df[keys_df['locid'].notnull()].reset_index(drop=True)
+
+                if len(keys_df) == 0:
+                    continue
+
+                gul_items_df = self.generate_gul_items(cep, canexp_df, keys_df)
+
+                if len(gul_items_df) == 0:
+                    continue
+
+                if fm:
+                    fm_items_df = self.generate_fm_items(canexp_df, gul_items_df, cep, cap, canacc_df, fmap)
+
+                gul_items_df['item_id'] += num_items
+                gul_items_df['coverage_id'] += num_coverages
+                gul_items_df['group_id'] += num_groups
+
+                num_items, num_coverages, num_groups = (gul_items_df[col].max() for col in ['item_id', 'coverage_id', 'group_id'])
+
+                for f in gul_files:
+                    write_csv(gul_items_df, gul_files[f], cols=gul_cols[f])
+
+                if not fm:
+                    continue
+
+                fm_items_df = fm_items_df.sort_values('item_id').reset_index(drop=True)
+
+                level_ids = fm_items_df['level_id'].values.astype(int)
+                agg_ids = fm_items_df['agg_id'].values.astype(int)
+
+                for level_id in fm_levels:
+                    level_idx = np.where(level_ids == level_id)[0]
+                    if len(level_idx) == 0:
+                        continue
+
+                    if level_id in chunk_local_levels:
+                        level_agg_ids = agg_ids[level_idx]
+                        agg_ids[level_idx] = level_agg_ids + agg_offsets[level_id]
+                        agg_offsets[level_id] += level_agg_ids.max()
+                        continue
+
+                    level_aggs_df = fm_items_df.iloc[level_idx][agg_keys[level_id] + ['agg_id']].drop_duplicates('agg_id').sort_values('agg_id')
+                    registry = agg_registries[level_id]
+                    global_agg_ids = np.zeros(level_aggs_df['agg_id'].max() + 1, dtype=int)
+                    global_agg_ids[level_aggs_df['agg_id'].values.astype(int)] = [
+                        registry.setdefault(key, len(registry) + 1) for key in zip(*(
+                            level_aggs_df[f].astype(object).where(level_aggs_df[f].notnull(), None).values for f in agg_keys[level_id]
+                        ))
+                    ]
+                    agg_ids[level_idx] = global_agg_ids[agg_ids[level_idx]]
+
+                fm_items_df['agg_id'] = agg_ids
+
+                fm_items_df = fm_items_df[(fm_items_df['level_id'].isin(bookend_fm_levels)) | (fm_items_df['limit'] != 0) | (fm_items_df['deductible'] != 0) | (fm_items_df['deductible_min'] != 0) | (fm_items_df['deductible_max'] != 0) | (fm_items_df['share'] != 0)].reset_index(drop=True)
+
+                fm_items_df['policytc_id'] = get_fm_policytc_ids(fm_items_df) + num_policytcs
+                num_policytcs = fm_items_df['policytc_id'].max()
+
+                for col in fm_items_df.columns:
+                    if col.endswith('id'):
+                        fm_items_df[col] = fm_items_df[col].astype(int)
+                    elif col in ('tiv', 'limit', 'deductible', 'deductible_min', 'deductible_max', 'share',):
+                        fm_items_df[col] = fm_items_df[col].astype(float)
+
+                # The policy T & C rows of the levels with groups spanning
+                # chunks are written only for the first chunk of the group
+                fm_policytc_df = fm_items_df[fm_policytc_cols].drop_duplicates().sort_values(fm_policytc_cols)
+                is_new = np.ones(len(fm_policytc_df), dtype=bool)
+                for i, key in enumerate(fm_policytc_df[['layer_id', 'level_id', 'agg_id']].itertuples(index=False, name=None)):
+                    if key[1] in agg_registries:
+                        is_new[i] = key not in written_policytc_keys
+                        written_policytc_keys.add(key)
+                write_csv(fm_policytc_df[is_new], tmp_fm_policytc_file_path)
+
+                cols = ['policytc_id', 'calcrule_id', 'deductible', 'deductible_min', 'deductible_max', 'attachment', 'limit', 'share']
+                fm_profile_df = fm_items_df[cols].drop_duplicates().sort_values(cols).rename(columns={
+                    'deductible': 'deductible1',
+                    'deductible_min': 'deductible2',
+                    'deductible_max': 'deductible3',
+                    'attachment': 'attachment1',
+                    'limit': 'limit1',
+                    'share': 'share1'
+                })
+                fm_profile_df['share2'] = fm_profile_df['share3'] = 0
+                write_csv(fm_profile_df, fm_files['fm_profile'], cols=fm_profile_cols)
+
+                for level_id, level_agg_ids in fm_items_df.groupby('level_id')['agg_id']:
+                    level_agg_ids = np.unique(level_agg_ids.values)
+                    if level_id in written_aggs:
+                        level_agg_ids = np.array([a for a in level_agg_ids if a not in written_aggs[level_id]], dtype=int)
+                        written_aggs[level_id].update(level_agg_ids)
+                    with io.open(level_aggs_file_paths[level_id], 'ab') as f:
+                        level_agg_ids.astype(np.int64).tofile(f)
+
+                fm_levels_present.update(fm_items_df['level_id'].unique())
+                layer_ids.update(fm_items_df['layer_id'].unique())
+
+            if num_items == 0:
+                raise OasisException('No GUL items generated - please check the canonical exposures (loc.) file and the keys lookup')
+
+            if not fm:
+                return gul_files
+
+            # Renumber the levels present consecutively, as the levels of the
+            # items of all the chunks - the aggregation IDs of the levels with
+            # groups local to the chunks are written in increasing order, and
+            # are memory-mapped rather than loaded
+            levels = sorted(fm_levels_present)
+            level_map = {level_id: i + 1 for i, level_id in enumerate(levels)}
+
+            # Renumber the aggregation IDs of the levels with groups spanning
+            # chunks in the order of their aggregation keys (null key values
+            # last), as the items are sorted by aggregation key in the FM
+            # files written in full, rather than in the order the keys first
+            # appeared in the chunks
+            agg_id_maps = {}
+            for level_id, registry in six.iteritems(agg_registries):
+                sorted_keys = sorted(registry, key=lambda key: tuple((v is None, v) for v in key))
+                agg_id_maps[level_id] = np.zeros(len(registry) + 1, dtype=np.int64)
+                agg_id_maps[level_id][[registry[key] for key in sorted_keys]] = np.arange(1, len(registry) + 1)
+
+            write_csv(pd.DataFrame(columns=fm_policytc_cols), fm_files['fm_policytc'], header=True)
+            for fm_policytc_df in pd.read_csv(tmp_fm_policytc_file_path, chunksize=chunk_size):
+                for level_id, agg_id_map in six.iteritems(agg_id_maps):
+                    level_idx = (fm_policytc_df['level_id'] == level_id).values
+                    fm_policytc_df.loc[level_idx, 'agg_id'] = agg_id_map[fm_policytc_df.loc[level_idx, 'agg_id'].values]
+                fm_policytc_df['level_id'] = fm_policytc_df['level_id'].map(level_map)
+                write_csv(fm_policytc_df, fm_files['fm_policytc'])
+
+            fm_aggtree = {
+                level_map[level_id]: (
+                    np.memmap(level_aggs_file_paths[level_id], dtype=np.int64, mode='r') if level_id in chunk_local_levels
+                    else np.unique(agg_id_maps[level_id][np.fromfile(level_aggs_file_paths[level_id], dtype=np.int64)])
+                ) for level_id in levels
+            }
+            fm_aggtree[0] = fm_aggtree[1]
+            tree_levels = sorted(fm_aggtree.keys())
+
+            write_csv(pd.DataFrame(columns=['from_agg_id', 'level_id', 'to_agg_id']), fm_files['fm_programme'], header=True)
+            for first, second in zip(tree_levels, tree_levels[1:]):
+                from_aggs, to_aggs = fm_aggtree[first], fm_aggtree[second]
+                one_to_one = len(from_aggs) == len(to_aggs) and len(from_aggs) > 1
+                for i in range(0, len(from_aggs), chunk_size):
+                    from_agg_ids = np.asarray(from_aggs[i:i + chunk_size])
+                    write_csv(
+                        pd.DataFrame(OrderedDict([
+                            ('from_agg_id', from_agg_ids),
+                            ('level_id', second),
+                            ('to_agg_id', np.asarray(to_aggs[i:i + chunk_size]) if one_to_one else to_aggs[0])
+                        ]), dtype=int),
+                        fm_files['fm_programme']
+                    )
+
+            # The xref outputs are the product of the union of the aggregation
+            # IDs of all the levels with the layer IDs, which is built block by
+            # block of aggregation IDs
+            layer_ids = np.array(sorted(layer_ids), dtype=int)
+            num_layers = len(layer_ids)
+            max_agg_id = max(int(aggs[-1]) for aggs in fm_aggtree.values())
+
+            write_csv(pd.DataFrame(columns=['output', 'agg_id', 'layer_id']), fm_files['fm_xref'], header=True)
+            write_csv(pd.DataFrame(columns=['output', 'summary_id', 'summaryset_id']), fm_files['fmsummaryxref'], header=True)
+            num_outputs = 0
+            for lo in range(1, max_agg_id + 1, chunk_size):
+                hi = lo + chunk_size
+                block_agg_ids = np.unique(np.concatenate([
+                    np.asarray(aggs[np.searchsorted(aggs, lo):np.searchsorted(aggs, hi)]) for level_id, aggs in six.iteritems(fm_aggtree) if level_id > 0
+                ]))
+                if len(block_agg_ids) == 0:
+                    continue
+                outputs = np.arange(num_outputs + 1, num_outputs + len(block_agg_ids) * num_layers + 1)
+                num_outputs = outputs[-1]
+                write_csv(
+                    pd.DataFrame(OrderedDict([
+                        ('output', outputs),
+                        ('agg_id', np.repeat(block_agg_ids, num_layers)),
+                        ('layer_id', np.tile(layer_ids, len(block_agg_ids)))
+                    ]), dtype=int),
+                    fm_files['fm_xref']
+                )
+                write_csv(
+                    pd.DataFrame(OrderedDict([('output', outputs), ('summary_id', 1), ('summaryset_id', 1)]), dtype=int),
+                    fm_files['fmsummaryxref']
+                )
+        except (IOError, MemoryError, OasisException, OSError, TypeError, ValueError) as e:
+            raise OasisException(e)
+        finally:
+            if tmp_dir:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        oasis_files = {k: v for k, v in itertools.chain(gul_files.items(), fm_files.items())}
+
+        return oasis_files
+
     def clear_oasis_files_pipeline(self, oasis_model, **kwargs):
         """
         Clears the files pipeline for the given Oasis model object.
@@ -1513,9 +2610,40 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
         :param oasis_model: The Oasis model object
         :type oasis_model: oasislmf.models.model.OasisModel
 
-        :param kwargs: Keyword arguments
+        :param kwargs: Keyword arguments - if ``chunk_size`` is set the keys
+                       and Oasis files, and the canonical and model exposures
+                       files (if they are not up to date and ``fused`` is not
+                       set), are written by ``write_oasis_files_in_chunks``,
+                       in chunks of ``chunk_size`` locations; if ``fused`` is
+                       set the
+                       source files are transformed to the canonical and
+                       model exposures (and canonical accounts) in memory
+                       (see ``transform_source_to_model``), which are passed
+                       directly to the keys lookup and the items generation,
+                       and the canonical and model files are only written,
+                       in a background thread, if
+                       ``write_intermediate_files`` is also set; if
+                       ``force`` is set all the files are regenerated (see
+                       below); if ``delta`` is set the canonical exposures,
+                       model exposures and keys files are regenerated only
+                       for the locations added or changed since the previous
+                       run in the Oasis files directory (see
+                       ``write_exposures_delta``), if the source exposures
+                       are the only changed inputs; if ``binary_files_path``
+                       is set the ktools binary files of the Oasis files are
+                       also written to it - directly from the data frames of
+                       the files, if they are generated, or converted from
+                       the reused files otherwise
         :type kwargs: dict
 
+        The generation is incremental - the stages (the canonical files,
+        the model exposures file, the keys files and the Oasis files) and the
+        content hashes of their inputs and outputs are recorded in a manifest
+        in the Oasis files directory (see ``OasisFilesManifest``), and the
+        outputs of a previous run in the directory are reused for the stages
+        whose inputs (including the outputs of the stages they depend on)
+        are unchanged, and whose outputs are unchanged.
+
         :return: A dictionary of Oasis files (GUL + FM (if FM option indicated))
         """
         kwargs = self._process_default_kwargs(oasis_model=oasis_model, **kwargs)
@@ -1591,23 +2719,98 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
 
         utcnow = get_utctimestamp(fmt='%Y%m%d%H%M%S')
 
-        canonical_exposures_file_path = os.path.join(oasis_files_path, 'canexp-{}.csv'.format(utcnow))
-        canonical_accounts_file_path = os.path.join(oasis_files_path, 'canacc-{}.csv'.format(utcnow))
+        file_paths = {
+            'canonical_exposures': os.path.join(oasis_files_path, 'canexp-{}.csv'.format(utcnow)),
+            'canonical_accounts': os.path.join(oasis_files_path, 'canacc-{}.csv'.format(utcnow)),
+            'source_exposures_hashes': os.path.join(oasis_files_path, 'srcexp-hashes-{}.csv'.format(utcnow)),
+            'model_exposures': os.path.join(oasis_files_path, 'modexp-{}.csv'.format(utcnow)),
+            'keys': os.path.join(oasis_files_path, 'oasiskeys-{}.csv'.format(utcnow)),
+            'keys_errors': os.path.join(oasis_files_path, 'oasiskeys-errors-{}.csv'.format(utcnow)),
+            'items': os.path.join(oasis_files_path, 'items.csv'),
+            'coverages': os.path.join(oasis_files_path, 'coverages.csv'),
+            'gulsummaryxref': os.path.join(oasis_files_path, 'gulsummaryxref.csv'),
+            'fm_policytc': os.path.join(oasis_files_path, 'fm_policytc.csv'),
+            'fm_profile': os.path.join(oasis_files_path, 'fm_profile.csv'),
+            'fm_programme': os.path.join(oasis_files_path, 'fm_programme.csv'),
+            'fm_xref': os.path.join(oasis_files_path, 'fm_xref.csv'),
+            'fmsummaryxref': os.path.join(oasis_files_path, 'fmsummaryxref.csv')
+        }
+
+        chunk_size = kwargs.get('chunk_size')
+        fused = kwargs.get('fused')
+        write_intermediate_files = kwargs.get('write_intermediate_files')
+        force = kwargs.get('force')
+        delta = kwargs.get('delta')
+
+        if delta and (fused or chunk_size):
+            raise OasisException('The delta option cannot be used with the fused or chunk size options')
+
+        # Work out which stages need to be run, from the manifest of the
+        # previous run (if any) in the Oasis files directory - the outputs of
+        # up to date stages are reused
+        manifest = OasisFilesManifest(oasis_files_path)
+        stage_inputs, stage_keys = self._get_oasis_files_stages_inputs_and_keys(**dict(
+            kwargs,
+            fm=fm,
+            source_exposures_file_path=source_exposures_file_path,
+            source_accounts_file_path=source_accounts_file_path,
+            canonical_exposures_profile=canonical_exposures_profile,
+            canonical_accounts_profile=canonical_accounts_profile,
+            fm_agg_profile=fm_agg_profile
+        ))
+        up_to_date = {
+            stage: not force and manifest.is_up_to_date(stage, stage_keys[stage])
+            for stage in OASIS_FILES_STAGES
+        }
+        stages_to_run = self._get_oasis_files_stages_to_run(up_to_date, chunked=bool(chunk_size), fused=bool(fused))
+
+        # In delta mode the previous canonical, model and keys files are
+        # diffed against if their stages differ from those of this run only
+        # in the source files
+        previous_files = None
+        if delta and 'canonical' in stages_to_run:
+            delta_stages_ignored_inputs = {
+                'canonical': ('source_exposures', 'source_accounts',),
+                'model': ('canonical_stage',),
+                'keys': ('model_stage',),
+            }
+            if all(
+                manifest.has_outputs(stage) and all(
+                    manifest.get_inputs(stage).get(name) == value
+                    for name, value in six.iteritems(stage_inputs[stage]) if name not in ignored_inputs
+                )
+                for stage, ignored_inputs in six.iteritems(delta_stages_ignored_inputs)
+            ):
+                previous_files = dict(itertools.chain(*(six.iteritems(manifest.get_outputs(stage)) for stage in delta_stages_ignored_inputs)))
+
+        for stage in OASIS_FILES_STAGES:
+            if stage in stages_to_run:
+                manifest.invalidate(stage)
+            elif up_to_date[stage]:
+                logger.info('\nReusing the {} files {} - their inputs are unchanged'.format(stage, ', '.join(sorted(manifest.get_outputs(stage).values()))))
+                file_paths.update(manifest.get_outputs(stage))
+
+        if not stages_to_run:
+            logger.info('\nThe Oasis files are up to date')
+
+        canonical_exposures_file_path = file_paths['canonical_exposures']
+        canonical_accounts_file_path = file_paths['canonical_accounts']
+        source_exposures_hashes_file_path = file_paths['source_exposures_hashes']
 
-        model_exposures_file_path = os.path.join(oasis_files_path, 'modexp-{}.csv'.format(utcnow))
+        model_exposures_file_path = file_paths['model_exposures']
 
-        keys_file_path = os.path.join(oasis_files_path, 'oasiskeys-{}.csv'.format(utcnow))
-        keys_errors_file_path = os.path.join(oasis_files_path, 'oasiskeys-errors-{}.csv'.format(utcnow))
+        keys_file_path = file_paths['keys']
+        keys_errors_file_path = file_paths['keys_errors']
 
-        items_file_path = os.path.join(oasis_files_path, 'items.csv')
-        coverages_file_path = os.path.join(oasis_files_path, 'coverages.csv')
-        gulsummaryxref_file_path = os.path.join(oasis_files_path, 'gulsummaryxref.csv')
+        items_file_path = file_paths['items']
+        coverages_file_path = file_paths['coverages']
+        gulsummaryxref_file_path = file_paths['gulsummaryxref']
 
-        fm_policytc_file_path = os.path.join(oasis_files_path, 'fm_policytc.csv')
-        fm_profile_file_path = os.path.join(oasis_files_path, 'fm_profile.csv')
-        fm_programme_file_path=os.path.join(oasis_files_path, 'fm_programme.csv')
-        fm_xref_file_path = os.path.join(oasis_files_path, 'fm_xref.csv')
-        fmsummaryxref_file_path = os.path.join(oasis_files_path, 'fmsummaryxref.csv')
+        fm_policytc_file_path = file_paths['fm_policytc']
+        fm_profile_file_path = file_paths['fm_profile']
+        fm_programme_file_path = file_paths['fm_programme']
+        fm_xref_file_path = file_paths['fm_xref']
+        fmsummaryxref_file_path = file_paths['fmsummaryxref']
 
         if oasis_model:
             ofp.source_exposures_file_path = source_exposures_file_path
@@ -1634,10 +2837,12 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
         kwargs = self._process_default_kwargs(
             oasis_model=oasis_model,
             fm=fm,
+            chunk_size=chunk_size,
             source_exposures_file_path=source_exposures_file_path,
             source_accounts_file_path=source_accounts_file_path,
             canonical_exposures_file_path=canonical_exposures_file_path,
             canonical_accounts_file_path=canonical_accounts_file_path,
+            source_exposures_hashes_file_path=source_exposures_hashes_file_path,
             model_exposures_file_path=model_exposures_file_path,
             keys_file_path=keys_file_path,
             keys_errors_file_path=keys_errors_file_path,
@@ -1648,36 +2853,247 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
             fm_profile_file_path=fm_profile_file_path,
             fm_programme_file_path=fm_programme_file_path,
             fm_xref_file_path=fm_xref_file_path,
-            fmsummaryxref_file_path=fmsummaryxref_file_path
+            fmsummaryxref_file_path=fmsummaryxref_file_path,
+            binary_files_path=kwargs.get('binary_files_path')
         )
 
-        logger.info('\nWriting canonical exposures file {canonical_exposures_file_path}'.format(**kwargs))
-        self.transform_source_to_canonical(oasis_model=oasis_model, **kwargs)
+        stage_outputs = {
+            'canonical': ['canonical_exposures'] + (['canonical_accounts'] if fm else []) + (['source_exposures_hashes'] if delta else []),
+            'model': ['model_exposures'],
+            'keys': ['keys', 'keys_errors'],
+            'oasis': ['items', 'coverages', 'gulsummaryxref'] + (
+                ['fm_policytc', 'fm_profile', 'fm_programme', 'fm_xref', 'fmsummaryxref'] if fm else []
+            )
+        }
+        stages_run = [s for s in OASIS_FILES_STAGES if s in stages_to_run]
 
-        if fm:
-            logger.info('\nWriting canonical accounts file {canonical_accounts_file_path}'.format(**kwargs))
-            self.transform_source_to_canonical(oasis_model=oasis_model, source_type='accounts', **kwargs)
+        if kwargs.get('binary_files_path') and not os.path.exists(kwargs['binary_files_path']):
+            os.makedirs(kwargs['binary_files_path'])
 
-        logger.info('\nWriting model exposures file {model_exposures_file_path}'.format(**kwargs))
-        self.transform_canonical_to_model(oasis_model=oasis_model, **kwargs)
+        wait_for_intermediate_files = None
 
-        logger.info('\nWriting keys file {keys_file_path} and keys errors file {keys_errors_file_path}'.format(**kwargs))
+        delta_files = None
+        if delta and 'canonical' in stages_to_run:
+            logger.info('\nWriting canonical exposures, model exposures and keys files for the added or changed source exposures')
+            delta_files = self.write_exposures_delta(oasis_model=oasis_model, previous_files=previous_files, **kwargs)
 
-        self.get_keys(oasis_model=oasis_model, **kwargs)
+            if not delta_files:
+                logger.info('\nRegenerating the canonical exposures, model exposures and keys files for all the source exposures')
 
-        logger.info('\nWriting GUL files')
-        gul_files = self.write_gul_files(oasis_model=oasis_model, **kwargs)
+        if delta_files:
+            if fm:
+                logger.info('\nWriting canonical accounts file {canonical_accounts_file_path}'.format(**kwargs))
+                self.transform_source_to_canonical(oasis_model=oasis_model, source_type='accounts', **kwargs)
+        elif fused and 'canonical' in stages_to_run:
+            logger.info('\nTransforming the source files to canonical and model exposures (and canonical accounts) in memory')
+            canexp_df, modexp_df, canacc_df = self.transform_source_to_model(oasis_model=oasis_model, **kwargs)
 
-        if not fm:
-            return gul_files
+            if write_intermediate_files:
+                intermediate_files = [(canexp_df, canonical_exposures_file_path), (modexp_df, model_exposures_file_path)]
+                if fm:
+                    intermediate_files.append((canacc_df, canonical_accounts_file_path))
 
-        logger.info('\nWriting FM files')
-        fm_files = self.write_fm_files(oasis_model=oasis_model, **kwargs)
+                logger.info('\nWriting intermediate files {} in the background'.format(', '.join(fp for _, fp in intermediate_files)))
+                wait_for_intermediate_files = self._write_files_in_background(intermediate_files)
+            else:
+                stages_run = [s for s in stages_run if s not in ('canonical', 'model')]
+                if oasis_model:
+                    ofp.canonical_exposures_file_path = ofp.canonical_accounts_file_path = ofp.model_exposures_file_path = None
+
+            kwargs.update(canonical_exposures_data=canexp_df, model_exposures_data=modexp_df, canonical_accounts_data=canacc_df)
+        else:
+            if 'canonical' in stages_to_run:
+                if not chunk_size:
+                    logger.info('\nWriting canonical exposures file {canonical_exposures_file_path}'.format(**kwargs))
+                    self.transform_source_to_canonical(oasis_model=oasis_model, **kwargs)
+
+                if fm:
+                    logger.info('\nWriting canonical accounts file {canonical_accounts_file_path}'.format(**kwargs))
+                    self.transform_source_to_canonical(oasis_model=oasis_model, source_type='accounts', **kwargs)
+
+            # In chunked mode the exposures are transformed chunk by chunk
+            # with the keys and Oasis files generation
+            if 'model' in stages_to_run:
+                if chunk_size:
+                    kwargs['transform_exposures'] = 'source' if 'canonical' in stages_to_run else 'canonical'
+                else:
+                    logger.info('\nWriting model exposures file {model_exposures_file_path}'.format(**kwargs))
+                    self.transform_canonical_to_model(oasis_model=oasis_model, **kwargs)
+
+        if chunk_size and 'oasis' in stages_to_run:
+            chunk_files = (
+                (['canonical exposures file {canonical_exposures_file_path}'] if kwargs.get('transform_exposures') == 'source' else []) +
+                (['model exposures file {model_exposures_file_path}'] if kwargs.get('transform_exposures') else []) +
+                ['keys file {keys_file_path}', 'keys errors file {keys_errors_file_path}']
+            )
+            logger.info('\nWriting {} and Oasis files in chunks of {} locations'.format(', '.join(f.format(**kwargs) for f in chunk_files), chunk_size))
+            oasis_files = self.write_oasis_files_in_chunks(oasis_model=oasis_model, **kwargs)
+
+            oasis_files = ofp.oasis_files if (oasis_model and fm) else oasis_files
+        else:
+            if 'keys' in stages_to_run and not delta_files:
+                logger.info('\nWriting keys file {keys_file_path} and keys errors file {keys_errors_file_path}'.format(**kwargs))
+
+                if kwargs.get('model_exposures_data') is not None:
+                    _, _, kwargs['keys_data'] = self.get_keys_data(oasis_model=oasis_model, **kwargs)
+                else:
+                    self.get_keys(oasis_model=oasis_model, **kwargs)
 
-        oasis_files = ofp.oasis_files if oasis_model else {k:v for k, v in itertools.chain(gul_files.items(), fm_files.items())}
+            if 'oasis' in stages_to_run:
+                logger.info('\nWriting GUL files')
+                oasis_files = gul_files = self.write_gul_files(oasis_model=oasis_model, **kwargs)
+
+                if fm:
+                    logger.info('\nWriting FM files')
+                    fm_files = self.write_fm_files(oasis_model=oasis_model, **kwargs)
+
+                    oasis_files = ofp.oasis_files if oasis_model else {k: v for k, v in itertools.chain(gul_files.items(), fm_files.items())}
+            else:
+                oasis_files = {name: file_paths[name] for name in stage_outputs['oasis']}
+
+                if kwargs.get('binary_files_path'):
+                    logger.info('\nConverting the reused Oasis files to ktools binary files in {binary_files_path}'.format(**kwargs))
+                    create_binary_files(oasis_files_path, kwargs['binary_files_path'], do_il=fm, native=True, logger=logger)
+
+        if wait_for_intermediate_files:
+            wait_for_intermediate_files()
+
+        for stage in stages_run:
+            manifest.record(
+                stage,
+                stage_keys[stage],
+                stage_inputs[stage],
+                {name: file_paths[name] for name in stage_outputs[stage]}
+            )
 
         return oasis_files
 
+    def _get_oasis_files_stages_inputs_and_keys(
+        self,
+        fm=False,
+        source_exposures_file_path=None,
+        source_accounts_file_path=None,
+        canonical_exposures_profile=None,
+        canonical_accounts_profile=None,
+        fm_agg_profile=None,
+        **kwargs
+    ):
+        """
+        Gets the inputs of the stages of the Oasis files generation - the
+        content hashes of the source files, the transformation and
+        validation files, the profiles and the keys lookup (see
+        ``manifest.lookup_fingerprint``), and the chunk size and fused mode
+        of the Oasis files generation - and the keys of the stages. The
+        inputs of each stage include the keys of the stages it depends on,
+        so that a change of input invalidates all the stages downstream of
+        it.
+
+        :return: A pair of dicts of the inputs and the keys of the stages
+        """
+        inputs = OrderedDict()
+
+        inputs['canonical'] = {
+            'oasislmf_version': __version__,
+            'fm': bool(fm),
+            'source_exposures': file_hash(source_exposures_file_path),
+            'source_exposures_validation': file_hash(kwargs.get('source_exposures_validation_file_path')),
+            'source_to_canonical_exposures_transformation': file_hash(kwargs.get('source_to_canonical_exposures_transformation_file_path')),
+        }
+        if fm:
+            inputs['canonical'].update({
+                'source_accounts': file_hash(source_accounts_file_path),
+                'source_accounts_validation': file_hash(kwargs.get('source_accounts_validation_file_path')),
+                'source_to_canonical_accounts_transformation': file_hash(kwargs.get('source_to_canonical_accounts_transformation_file_path')),
+            })
+
+        inputs['model'] = {
+            'canonical_exposures_validation': file_hash(kwargs.get('canonical_exposures_validation_file_path')),
+            'canonical_to_model_exposures_transformation': file_hash(kwargs.get('canonical_to_model_exposures_transformation_file_path')),
+        }
+
+        lookup = kwargs.get('lookup')
+        inputs['keys'] = {
+            'lookup': lookup_fingerprint(lookup, lookup_config_fp=kwargs.get('lookup_config_fp')) if lookup else None,
+        }
+
+        inputs['oasis'] = {
+            'fm': bool(fm),
+            'chunk_size': kwargs.get('chunk_size'),
+            'fused': bool(kwargs.get('fused')),
+            'canonical_exposures_profile': data_hash(canonical_exposures_profile),
+            'canonical_accounts_profile': data_hash(canonical_accounts_profile) if fm else None,
+            'fm_agg_profile': data_hash(fm_agg_profile) if fm else None,
+        }
+
+        keys = {}
+        for stage in inputs:
+            for dependency in OASIS_FILES_STAGES_DEPENDENCIES[stage]:
+                inputs[stage]['{}_stage'.format(dependency)] = keys[dependency]
+            keys[stage] = data_hash(inputs[stage])
+
+        return dict(inputs), keys
+
+    def _get_oasis_files_stages_to_run(self, up_to_date, chunked=False, fused=False):
+        """
+        Gets the stages of the Oasis files generation which need to be run -
+        the stages of the keys and Oasis files which are not up to date, and
+        the stages they depend on which are not up to date. In chunked mode
+        the keys and Oasis files are generated together, and in fused mode
+        the canonical and model exposures are generated together.
+
+        :param up_to_date: Whether each stage is up to date (see
+            ``OasisFilesManifest.is_up_to_date``)
+        :type up_to_date: dict
+
+        :return: The set of stages to run
+        """
+        coupled = ([('keys', 'oasis')] if chunked else []) + ([('canonical', 'model')] if fused else [])
+
+        required = {'keys', 'oasis'}
+        stages_to_run = set()
+
+        while True:
+            num_stages_to_run = len(stages_to_run)
+
+            for stage in reversed(OASIS_FILES_STAGES):
+                if stage in required and not up_to_date[stage]:
+                    stages_to_run.add(stage)
+                    required.update(OASIS_FILES_STAGES_DEPENDENCIES[stage])
+
+            for stages in coupled:
+                if stages_to_run.intersection(stages):
+                    stages_to_run.update(stages)
+                    required.update(itertools.chain(*(OASIS_FILES_STAGES_DEPENDENCIES[stage] for stage in stages)))
+
+            if len(stages_to_run) == num_stages_to_run:
+                return stages_to_run
+
+    def _write_files_in_background(self, frames_file_paths):
+        """
+        Writes a sequence of ``(data frame, file path)`` pairs to CSV files in
+        a background thread - returns a function which waits for the files to
+        be written, and raises an ``OasisException`` if any writes failed.
+        """
+        errors = []
+
+        def write_files():
+            for df, fp in frames_file_paths:
+                try:
+                    df.to_csv(fp, index=False, encoding='utf-8')
+                except (IOError, OSError, ValueError) as e:
+                    errors.append('{}: {}'.format(fp, e))
+
+        thread = threading.Thread(target=write_files)
+        thread.daemon = True
+        thread.start()
+
+        def wait():
+            thread.join()
+            if errors:
+                raise OasisException('Error writing intermediate files - {}'.format('; '.join(errors)))
+
+        return wait
+
     def create_model(self, model_supplier_id, model_id, model_version, resources=None):
         model = OasisModel(
             model_supplier_id,
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+
+__all__ = [
+    'MANIFEST_FILE_NAME',
+    'OASIS_FILES_STAGES',
+    'OASIS_FILES_STAGES_DEPENDENCIES',
+    'OasisFilesManifest',
+    'data_hash',
+    'directory_fingerprint',
+    'file_hash',
+    'lookup_fingerprint'
+]
+
+import hashlib
+import inspect
+import io
+import json
+import os
+
+import six
+
+from ..utils.binfile import replacing_file
+from ..utils.exceptions import OasisException
+
+
+MANIFEST_FILE_NAME = '.oasis_files_manifest.json'
+
+# The stages of the Oasis files generation, in order, and the stages each
+# depends on (whose outputs are its inputs)
+OASIS_FILES_STAGES = ('canonical', 'model', 'keys', 'oasis')
+
+OASIS_FILES_STAGES_DEPENDENCIES = {
+    'canonical': (),
+    'model': ('canonical',),
+    'keys': ('model',),
+    'oasis': ('canonical', 'keys'),
+}
+
+_HASH_BLOCK_SIZE = 2 ** 20
+
+
+def _hash_string(s):
+    return hashlib.sha256(s.encode('utf-8')).hexdigest()
+
+
+def _canonical(obj):
+    """
+    Converts an object to a JSON serialisable form with an unambiguous
+    representation - dicts with string keys (dict keys can be ints, e.g.
+    in FM aggregation profiles), and tuples as lists.
+    """
+    if isinstance(obj, dict):
+        return {six.text_type(k): _canonical(v) for k, v in six.iteritems(obj)}
+    elif isinstance(obj, (list, tuple)):
+        return [_canonical(v) for v in obj]
+
+    return obj
+
+
+def data_hash(obj):
+    """
+    Gets the content hash of a JSON serialisable object (e.g. a profile or a
+    lookup config), independent of the order of dict keys.
+    """
+    return _hash_string(json.dumps(_canonical(obj), sort_keys=True, default=six.text_type))
+
+
+def file_hash(fp):
+    """
+    Gets the content hash of a file, or ``None`` if no file path is given.
+    """
+    if not fp:
+        return None
+
+    h = hashlib.sha256()
+    try:
+        with io.open(fp, 'rb') as f:
+            for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b''):
+                h.update(block)
+    except (IOError, OSError) as e:
+        raise OasisException('Error hashing file {}: {}'.format(fp, e))
+
+    return h.hexdigest()
+
+
+def directory_fingerprint(dp):
+    """
+    Gets a fingerprint of the files in a directory (tree) - a hash of their
+    relative paths, sizes and modification times, rather than their
+    contents, as model data directories can be very large - or ``None`` if
+    no directory path is given.
+    """
+    if not dp:
+        return None
+
+    entries = []
+    for root, dirs, files in os.walk(dp):
+        dirs.sort()
+        for fn in sorted(files):
+            fp = os.path.join(root, fn)
+            st = os.stat(fp)
+            entries.append([os.path.relpath(fp, dp), st.st_size, st.st_mtime])
+
+    return data_hash(entries)
+
+
+def lookup_fingerprint(lookup, lookup_config_fp=None):
+    """
+    Gets a fingerprint of a keys lookup - of its class and class source
+    file, its config (if any) and its keys data directory, and of the
+    lookup config file (if any).
+    """
+    cls = lookup.__class__
+    parts = {'class': '{}.{}'.format(cls.__module__, cls.__name__)}
+
+    try:
+        parts['source'] = file_hash(inspect.getsourcefile(cls))
+    except (TypeError, OasisException):
+        pass
+
+    config = getattr(lookup, 'config', None)
+    if isinstance(config, dict):
+        parts['config'] = data_hash(config)
+        keys_data_path = config.get('keys_data_path')
+        parts['keys_data'] = directory_fingerprint(keys_data_path) if keys_data_path and os.path.isdir(keys_data_path) else None
+
+    keys_data_directory = getattr(lookup, 'keys_data_directory', None)
+    if keys_data_directory and os.path.isdir(keys_data_directory):
+        parts['keys_data_directory'] = directory_fingerprint(keys_data_directory)
+
+    for attr in ('supplier', 'model_name', 'model_version'):
+        if getattr(lookup, attr, None) is not None:
+            parts[attr] = six.text_type(getattr(lookup, attr))
+
+    parts['lookup_config'] = file_hash(lookup_config_fp)
+
+    return data_hash(parts)
+
+
+class OasisFilesManifest(object):
+    """
+    A manifest of the stages of the Oasis files generation in an Oasis files
+    directory, stored as a JSON file in the directory - for each stage, the
+    content hashes of its inputs, the stage key (a hash of the inputs, which
+    include the keys of the stages it depends on), and the paths (relative
+    to the directory) and content hashes of its outputs.
+
+    A stage is up to date if its key is unchanged and its outputs exist with
+    unchanged contents, in which case its outputs can be reused instead of
+    being regenerated.
+    """
+    def __init__(self, oasis_files_path):
+        self.oasis_files_path = oasis_files_path
+        self.manifest_file_path = os.path.join(oasis_files_path, MANIFEST_FILE_NAME)
+
+        self.stages = {}
+        if os.path.exists(self.manifest_file_path):
+            try:
+                with io.open(self.manifest_file_path, 'r', encoding='utf-8') as f:
+                    self.stages = json.load(f).get('stages') or {}
+            except (IOError, OSError, ValueError, AttributeError):
+                # An unreadable manifest only means nothing can be reused
+                self.stages = {}
+
+    def __repr__(self):
+        return '{}: {}'.format(self.__class__, self.manifest_file_path)
+
+    def save(self):
+        """
+        Writes the manifest file (via a temporary file which replaces it, so
+        that an interrupted write does not leave a corrupt or missing
+        manifest).
+        """
+        with replacing_file(self.manifest_file_path) as f:
+            f.write(six.text_type(json.dumps({'stages': self.stages}, indent=4, sort_keys=True)).encode('utf-8'))
+
+    def stage_key(self, inputs):
+        """
+        Gets the key of a stage with the given inputs - a dict of input
+        names and content hashes (or other JSON serialisable values).
+        """
+        return data_hash(inputs)
+
+    def get_outputs(self, stage):
+        """
+        Gets the absolute paths of the recorded outputs of a stage, as a dict
+        of output names and paths.
+        """
+        outputs = (self.stages.get(stage) or {}).get('outputs') or {}
+        return {name: os.path.join(self.oasis_files_path, output['path']) for name, output in six.iteritems(outputs)}
+
+    def get_inputs(self, stage):
+        """
+        Gets the recorded inputs of a stage, as a dict of input names and
+        content hashes (or other values).
+        """
+        return (self.stages.get(stage) or {}).get('inputs') or {}
+
+    def has_outputs(self, stage):
+        """
+        Whether a stage has been recorded, and its outputs exist with the
+        recorded contents.
+        """
+        entry = self.stages.get(stage)
+        if not entry or not entry.get('outputs'):
+            return False
+
+        for name, fp in six.iteritems(self.get_outputs(stage)):
+            if not os.path.isfile(fp) or file_hash(fp) != entry['outputs'][name]['hash']:
+                return False
+
+        return True
+
+    def is_up_to_date(self, stage, key):
+        """
+        Whether a stage has been recorded with the given key, and its outputs
+        exist with the recorded contents.
+        """
+        return (self.stages.get(stage) or {}).get('key') == key and self.has_outputs(stage)
+
+    def invalidate(self, stage):
+        """
+        Removes the record of a stage, e.g. before the stage is run, so that
+        the outputs of an interrupted run are never reused.
+        """
+        if self.stages.pop(stage, None) is not None:
+            self.save()
+
+    def record(self, stage, key, inputs, outputs):
+        """
+        Records a completed stage - its key, its inputs and its outputs, a
+        dict of output names and paths (in the Oasis files directory). If any
+        output does not exist the stage is not recorded.
+        """
+        if not outputs or not all(fp and os.path.isfile(fp) for fp in outputs.values()):
+            self.invalidate(stage)
+            return
+
+        self.stages[stage] = {
+            'key': key,
+            'inputs': inputs,
+            'outputs': {
+                name: {'path': os.path.relpath(fp, self.oasis_files_path), 'hash': file_hash(fp)}
+                for name, fp in six.iteritems(outputs)
+            }
+        }
+        self.save()
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals, absolute_import
+
+__all__ = [
+    'DEFAULT_KEYS_CACHE_COORDS_PRECISION',
+    'DEFAULT_KEYS_CACHE_MAX_SIZE',
+    'OasisLookupCache'
+]
+
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import time
+
+from six.moves import cPickle as cpickle
+
+from ..utils.exceptions import OasisException
+
+
+DEFAULT_KEYS_CACHE_COORDS_PRECISION = 6
+DEFAULT_KEYS_CACHE_MAX_SIZE = 5 * 10**6
+
+
+class OasisLookupCache(object):
+    """
+    Persistent, size-bounded cache of keys lookup results, stored in an
+    SQLite database file.
+
+    Cache entries are for locations - the keys are digests of the lookup
+    namespace (a hash of the lookup config, which includes the peril IDs and
+    coverage types, and the model version - see
+    ``OasisLookup.cache_namespace``), the location lon/lat rounded to
+    ``coords_precision`` decimal places and the location vulnerability key
+    column values, and the values are the ``(status, message, area peril ID,
+    vulnerability ID)`` tuples of the (peril ID, coverage type) items of the
+    location. Locations whose coordinates round to the same values are
+    assumed to be in the same peril areas, so the precision should be well
+    below the size of the peril areas.
+
+    When the cache has more than ``max_size`` entries the least recently used
+    entries are evicted. The numbers of cache hits and misses are counted in
+    the ``hits`` and ``misses`` attributes.
+
+    The cache does not detect changes to the keys data files (peril areas
+    and vulnerabilities) - it must be cleared (see ``clear``) if these change
+    without a change of the lookup config or the model version.
+    """
+
+    _batch_size = 500
+
+    def __init__(self, fp, max_size=DEFAULT_KEYS_CACHE_MAX_SIZE, coords_precision=DEFAULT_KEYS_CACHE_COORDS_PRECISION):
+        try:
+            self.max_size = int(max_size)
+            self.coords_precision = int(coords_precision)
+        except (TypeError, ValueError) as e:
+            raise OasisException('Invalid keys lookup cache settings: {}'.format(e))
+
+        if self.max_size < 1:
+            raise OasisException('The keys lookup cache size must be a positive integer: {}'.format(self.max_size))
+
+        self.fp = os.path.abspath(fp)
+        self.hits = 0
+        self.misses = 0
+
+        try:
+            self._conn = sqlite3.connect(self.fp)
+            with self._conn:
+                self._conn.execute(
+                    'CREATE TABLE IF NOT EXISTS results (key BLOB PRIMARY KEY, value BLOB NOT NULL, last_used REAL NOT NULL)'
+                )
+                self._conn.execute('CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)')
+        except sqlite3.Error as e:
+            raise OasisException('Error opening the keys lookup cache {}: {}'.format(self.fp, e))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self._conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def close(self):
+        self._conn.close()
+
+    def clear(self):
+        with self._conn:
+            self._conn.execute('DELETE FROM results')
+
+    @property
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self)}
+
+    def get_key(self, namespace, x, y, key_values):
+        """
+        Returns the cache key for a location, or ``None`` if the location
+        coordinates are not finite numbers - such locations are not cached.
+        """
+        try:
+            x, y = float(x), float(y)
+        except (TypeError, ValueError):
+            return
+        if math.isnan(x) or math.isnan(y) or math.isinf(x) or math.isinf(y):
+            return
+
+        key = json.dumps(
+            [namespace, round(x, self.coords_precision), round(y, self.coords_precision), list(key_values)],
+            default=lambda v: v.item() if hasattr(v, 'item') else str(v)
+        )
+
+        return hashlib.sha1(key.encode('utf-8')).digest()
+
+    def get_many(self, keys):
+        """
+        Returns a dict of the cached values for those of the given keys which
+        are in the cache, and marks them as recently used.
+        """
+        keys = list(set(keys))
+        values = {}
+
+        try:
+            with self._conn:
+                now = time.time()
+                for i in range(0, len(keys), self._batch_size):
+                    batch = keys[i:i + self._batch_size]
+                    params = ','.join('?' * len(batch))
+                    for key, value in self._conn.execute('SELECT key, value FROM results WHERE key IN ({})'.format(params), batch):
+                        values[bytes(key)] = cpickle.loads(bytes(value))
+                    self._conn.execute('UPDATE results SET last_used = ? WHERE key IN ({})'.format(params), [now] + batch)
+        except sqlite3.Error as e:
+            raise OasisException('Error reading the keys lookup cache {}: {}'.format(self.fp, e))
+
+        return values
+
+    def put_many(self, items):
+        """
+        Adds or replaces the cached values for a sequence of ``(key, value)``
+        pairs, then evicts the least recently used entries over the cache
+        size.
+        """
+        now = time.time()
+        rows = [(key, cpickle.dumps(value, protocol=2), now) for key, value in items]
+
+        try:
+            with self._conn:
+                self._conn.executemany('INSERT OR REPLACE INTO results (key, value, last_used) VALUES (?, ?, ?)', rows)
+                excess = len(self) - self.max_size
+                if excess > 0:
+                    self._conn.execute(
+                        'DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY last_used LIMIT ?)',
+                        (excess,)
+                    )
+        except sqlite3.Error as e:
+            raise OasisException('Error writing to the keys lookup cache {}: {}'.format(self.fp, e))
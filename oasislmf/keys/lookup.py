@@ -13,6 +13,7 @@ __all__ = [
 
 import builtins
 import csv
+import hashlib
 import imp
 import importlib
 import io
@@ -24,8 +25,13 @@ import sys
 import types
 import uuid
 
-from collections import OrderedDict
+from collections import (
+    deque,
+    OrderedDict,
+)
 
+import billiard
+import numpy as np
 import pandas as pd
 import six
 
@@ -43,12 +49,16 @@ from rtree.core import RTreeError
 
 import six
 
+from .cache import OasisLookupCache
 from ..utils.data import get_dataframe
 from ..utils.exceptions import OasisException
 from ..utils.log import oasis_log
 from ..utils.peril import (
     DEFAULT_RTREE_INDEX_PROPS,
+    get_bounds_containment,
+    PerilAreasGrid,
     PerilAreasIndex,
+    PERIL_AREAS_GRID_EXTENSION,
 )
 from ..utils.status import (
     KEYS_STATUS_FAIL,
@@ -56,10 +66,128 @@ from ..utils.status import (
     KEYS_STATUS_SUCCESS,
 )
 from ..utils.values import is_string
+from ..utils.vulnerability import VulnerabilitiesIndex
 
 
 UNKNOWN_ID = -1
 
+# Number of records buffered by the keys file writers between writes
+KEYS_WRITER_BATCH_SIZE = 10000
+
+# Per-process lookup instance used by the worker processes of a parallel
+# ``OasisLookupFactory.get_results`` call - set by the pool initializer
+_worker_lookup = None
+
+
+def _init_lookup_worker(lookup_cls, lookup_kwargs):
+    """
+    Pool initializer for parallel lookups - creates the worker process
+    lookup instance, which loads the peril areas index and vulnerabilities
+    once per process rather than once per partition.
+    """
+    global _worker_lookup
+    _worker_lookup = lookup_cls(**lookup_kwargs)
+
+
+def _lookup_partition(locs_df):
+    """
+    Runs the worker process lookup on a partition (data frame) of locations
+    and returns the list of results, in location order.
+    """
+    return list(_worker_lookup.bulk_lookup(locs_df))
+
+
+def _get_loc_rows(locs_df):
+    """
+    Generates the rows of a locations data frame as dicts - the row values
+    have the same types as the values of the row series generated by
+    ``iterrows``, but the dicts are much cheaper to create.
+    """
+    cols = list(locs_df.columns)
+    return (dict(zip(cols, vals)) for vals in locs_df.values)
+
+
+def _get_oasis_keys_heading_row(id_col='id'):
+    return OrderedDict([
+        (id_col, 'LocID'),
+        ('peril_id', 'PerilID'),
+        ('coverage_type', 'CoverageTypeID'),
+        ('area_peril_id', 'AreaPerilID'),
+        ('vulnerability_id', 'VulnerabilityID'),
+    ])
+
+
+def _get_oasis_keys_errors_heading_row(id_col='id'):
+    return OrderedDict([
+        (id_col, 'LocID'),
+        ('peril_id', 'PerilID'),
+        ('coverage_type', 'CoverageTypeID'),
+        ('message', 'Message'),
+    ])
+
+
+class _KeysFileWriter(object):
+    """
+    Incremental writer of keys records to an Oasis keys (or keys errors) CSV
+    file, with the given heading row, or to a JSON keys file - records are
+    buffered and written in batches of ``batch_size`` records, so that the
+    memory used does not depend on the number of records. For CSV files
+    only the values of the heading row columns are buffered, so the other
+    record fields (e.g. the peril area bounds and coordinates) are dropped
+    as each record is written.
+
+    The files are the same as those written with ``pandas`` and ``json``
+    from lists of all the records by the original (non-incremental) keys
+    file writers.
+    """
+
+    def __init__(self, fp, format='oasis', heading_row=None, batch_size=KEYS_WRITER_BATCH_SIZE):
+        self.fp = fp
+        self.format = format
+        self.count = 0
+        self._batch_size = batch_size
+        self._buffer = []
+
+        if format == 'oasis':
+            self._file = io.open(fp, 'w', encoding='utf-8', newline='')
+            self._cols = list(heading_row)
+            self._writer = csv.writer(self._file, lineterminator='\n')
+            self._writer.writerow(list(heading_row.values()))
+        else:
+            self._file = io.open(fp, 'w', encoding='utf-8')
+            self._file.write('[')
+
+    def write(self, record):
+        if self.format == 'oasis':
+            self._buffer.append([
+                '' if v is None or (isinstance(v, float) and v != v) else v
+                for v in (record.get(col) for col in self._cols)
+            ])
+        else:
+            self._buffer.append(record)
+
+        self.count += 1
+
+        if len(self._buffer) >= self._batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.format == 'oasis':
+            self._writer.writerows(self._buffer)
+        else:
+            for i, record in enumerate(self._buffer):
+                lines = json.dumps(record, sort_keys=True, indent=4, ensure_ascii=False).split('\n')
+                self._file.write('{}\n{}'.format(',' if (self.count - len(self._buffer) + i) else '', '\n'.join('    ' + l for l in lines)))
+
+        self._buffer = []
+
+    def close(self):
+        self.flush()
+        if self.format != 'oasis':
+            self._file.write('\n]' if self.count else ']')
+        self._file.close()
+
+
 def as_path(value, name, preexists=True):
     """
     Processes the path and returns the absolute path.
@@ -338,59 +466,98 @@ class OasisLookupFactory(object):
         """
         Writes an Oasis keys file from an iterable of keys records.
         """
-        heading_row = OrderedDict([
-            (id_col, 'LocID'),
-            ('peril_id', 'PerilID'),
-            ('coverage_type', 'CoverageTypeID'),
-            ('area_peril_id', 'AreaPerilID'),
-            ('vulnerability_id', 'VulnerabilityID'),
-        ])
-
-        pd.DataFrame(
-            columns=heading_row.keys(),
-            data=[heading_row] + records,
-        ).to_csv(
-            output_file_path,
-            index=False,
-            encoding='utf-8',
-            header=False,
-        )
+        writer = _KeysFileWriter(output_file_path, heading_row=_get_oasis_keys_heading_row(id_col))
+        try:
+            for record in records:
+                writer.write(record)
+        finally:
+            writer.close()
 
-        return output_file_path, len(records)
+        return output_file_path, writer.count
 
     @classmethod
     def write_oasis_keys_errors_file(cls, records, output_file_path, id_col='id'):
         """
         Writes an Oasis keys errors file from an iterable of keys records.
         """
-        heading_row = OrderedDict([
-            (id_col, 'LocID'),
-            ('peril_id', 'PerilID'),
-            ('coverage_type', 'CoverageTypeID'),
-            ('message', 'Message'),
-        ])
-
-        pd.DataFrame(
-            columns=heading_row.keys(),
-            data=[heading_row] + records,
-        ).to_csv(
-            output_file_path,
-            index=False,
-            encoding='utf-8',
-            header=False,
-        )
+        writer = _KeysFileWriter(output_file_path, heading_row=_get_oasis_keys_errors_heading_row(id_col))
+        try:
+            for record in records:
+                writer.write(record)
+        finally:
+            writer.close()
 
-        return output_file_path, len(records)
+        return output_file_path, writer.count
 
     @classmethod
     def write_json_keys_file(cls, records, output_file_path):
         """
         Writes the keys records as a simple list to file.
         """
-        with io.open(output_file_path, 'w', encoding='utf-8') as f:
-            f.write(u'{}'.format(json.dumps(records, sort_keys=True, indent=4, ensure_ascii=False)))
+        writer = _KeysFileWriter(output_file_path, format='json')
+        try:
+            for record in records:
+                writer.write(record)
+        finally:
+            writer.close()
 
-            return output_file_path, len(records)
+        return output_file_path, writer.count
+
+    @classmethod
+    def write_keys_files(
+        cls,
+        records,
+        successes_fp,
+        errors_fp=None,
+        format='oasis',
+        id_col='id',
+        batch_size=KEYS_WRITER_BATCH_SIZE
+    ):
+        """
+        Writes a keys file, and optionally a keys errors file, from an
+        iterable of keys records, e.g. a lookup results generator - records
+        with a successful lookup status are written to the keys file, and the
+        other records to the keys errors file, or are skipped if there is no
+        keys errors file. The format of the files can be Oasis keys files
+        (``oasis``) or JSON lists of the records (``json``).
+
+        The records are consumed incrementally and both files are written as
+        the records are generated, in batches of ``batch_size`` records, so
+        that the memory used does not depend on the number of records. If
+        the records generator raises an exception the files are removed.
+
+        Returns a pair ``(p, n)`` of the keys file path and the number of
+        records written to it if there is no keys errors file, otherwise a
+        quadruple ``(p1, n1, p2, n2)`` which also has the keys errors file
+        path and the number of records written to it.
+        """
+        if format == 'oasis':
+            successes_writer = _KeysFileWriter(successes_fp, heading_row=_get_oasis_keys_heading_row(id_col), batch_size=batch_size)
+            errors_writer = _KeysFileWriter(errors_fp, heading_row=_get_oasis_keys_errors_heading_row(id_col), batch_size=batch_size) if errors_fp else None
+        elif format == 'json':
+            successes_writer = _KeysFileWriter(successes_fp, format='json', batch_size=batch_size)
+            errors_writer = _KeysFileWriter(errors_fp, format='json', batch_size=batch_size) if errors_fp else None
+        else:
+            raise OasisException("Unrecognised keys file output format - valid formats are 'oasis' or 'json'")
+
+        writers = [w for w in (successes_writer, errors_writer) if w]
+        written = False
+        try:
+            for r in records:
+                if r['status'] == KEYS_STATUS_SUCCESS:
+                    successes_writer.write(r)
+                elif errors_writer:
+                    errors_writer.write(r)
+            written = True
+        finally:
+            for w in writers:
+                w.close()
+                if not written:
+                    os.remove(w.fp)
+
+        if errors_writer:
+            return successes_fp, successes_writer.count, errors_fp, errors_writer.count
+        return successes_fp, successes_writer.count
 
     @classmethod
     def create(
@@ -483,6 +650,8 @@ class OasisLookupFactory(object):
         model_exposures=None,
         model_exposures_fp=None,
         successes_only=False,
+        num_processes=None,
+        cache=None,
         **kwargs
     ):
         """
@@ -494,8 +663,20 @@ class OasisLookupFactory(object):
         The optional keyword argument ``success_only`` indicates whether only
         results with successful lookup status should be returned (default),
         or all results.
+
+        The optional keyword argument ``num_processes`` sets the number of
+        worker processes over which the locations are partitioned for the
+        lookup - if not set it is taken from the ``num_processes`` key of the
+        lookup config, if present, otherwise the lookup is serial. The
+        results are generated in the same order as for a serial lookup.
+
+        The optional keyword argument ``cache`` sets a persistent lookup
+        results cache (``OasisLookupCache``) for combined lookups - if not set
+        a cache is opened if the lookup config has a ``keys_cache`` section
+        (see ``get_cache``). Only locations which are not in the cache are
+        looked up, and their results are added to the cache.
         """
-        if not (model_exposures or model_exposures_fp):
+        if not (model_exposures_fp or (model_exposures is not None and len(model_exposures))):
             raise OasisException('No model exposures data or file path provided')
 
         peril_config = lookup.config.get('peril')
@@ -508,7 +689,8 @@ class OasisLookupFactory(object):
         src_type = 'csv'
 
         kwargs = {
-            'src_data': model_exposures,
+            'src_buf': model_exposures if isinstance(model_exposures, six.string_types) else None,
+            'src_data': model_exposures if not isinstance(model_exposures, six.string_types) else None,
             'src_fp': _model_exposures_fp,
             'src_type': 'csv',
             'non_na_cols': tuple(loc_config.get('non_na_cols') or ()),
@@ -519,15 +701,151 @@ class OasisLookupFactory(object):
 
         model_exposures_df =  get_dataframe(**kwargs)
 
-        locations = (loc for _, loc in model_exposures_df.iterrows())
+        if num_processes is None:
+            num_processes = lookup.config.get('num_processes')
+        num_processes = int(num_processes or 1)
 
-        for result in lookup.bulk_lookup(locations):
-            if successes_only:
-                if result['status'].lower() == KEYS_STATUS_SUCCESS:
-                    yield result
+        if num_processes < 1:
+            raise OasisException('The number of lookup processes must be a positive integer: {}'.format(num_processes))
+
+        _cache = cache if cache is not None else cls.get_cache(lookup)
+
+        try:
+            if _cache is not None:
+                results = cls._get_results_with_cache(lookup, model_exposures_df, num_processes, _cache)
             else:
+                results = cls._get_results(lookup, model_exposures_df, num_processes)
+
+            for result in results:
+                if successes_only:
+                    if result['status'].lower() == KEYS_STATUS_SUCCESS:
+                        yield result
+                else:
+                    yield result
+        finally:
+            if cache is None and _cache is not None:
+                _cache.close()
+
+    @classmethod
+    def _get_results(cls, lookup, model_exposures_df, num_processes):
+        if num_processes > 1 and len(model_exposures_df) > 1:
+            return cls._get_results_in_parallel(lookup, model_exposures_df, num_processes)
+        return lookup.bulk_lookup(model_exposures_df)
+
+    @classmethod
+    def get_cache(cls, lookup):
+        """
+        Opens the lookup results cache set in the ``keys_cache`` section of
+        the lookup config, with the keys ``file_path`` (the SQLite database
+        file path, relative to the lookup config directory if not absolute),
+        and optionally ``max_size`` and ``coords_precision`` (see
+        ``OasisLookupCache``) - returns ``None`` if there is no such section.
+        """
+        cache_config = lookup.config.get('keys_cache')
+        if not cache_config:
+            return
+
+        cache_fp = cache_config.get('file_path')
+        if not cache_fp:
+            raise OasisException('No keys cache file path set in the keys_cache section of the lookup config')
+        if not os.path.isabs(cache_fp):
+            cache_fp = os.path.abspath(os.path.join(lookup.config_dir, cache_fp))
+
+        return OasisLookupCache(
+            cache_fp,
+            **{k: cache_config[k] for k in ('max_size', 'coords_precision') if cache_config.get(k) is not None}
+        )
+
+    @classmethod
+    def _get_results_with_cache(cls, lookup, model_exposures_df, num_processes, cache):
+        """
+        Generates the lookup results for a model exposures data frame using a
+        lookup results cache - locations in the cache are not looked up, and
+        the other locations are looked up (serially or in parallel) as a
+        single data frame. The results order is the same as for an uncached
+        lookup.
+        """
+        if not isinstance(lookup, OasisLookup):
+            raise OasisException('A keys lookup cache can only be used with combined peril and vulnerability lookups')
+
+        perils_covs = tuple(itertools.product(lookup.peril_ids, lookup.coverage_types))
+        namespace = lookup.cache_namespace
+        x_col, y_col = lookup.peril_lookup.loc_coords_x_col, lookup.peril_lookup.loc_coords_y_col
+        key_cols = lookup.vulnerability_lookup.key_cols
+
+        locs = list(_get_loc_rows(model_exposures_df))
+        keys = [
+            cache.get_key(namespace, loc.get(x_col), loc.get(y_col), tuple(loc.get(col) for col in key_cols) + (loc.get('coverage'),))
+            for loc in locs
+        ]
+
+        cached = cache.get_many(k for k in keys if k is not None)
+        hits = np.array([k in cached for k in keys], dtype=bool)
+
+        cache.hits += int(hits.sum())
+        cache.misses += len(hits) - int(hits.sum())
+
+        misses_df = model_exposures_df.iloc[np.flatnonzero(~hits)]
+        misses = cls._get_results(lookup, misses_df, num_processes) if len(misses_df) else iter(())
+
+        # Locations with failed lookups are not cached, as the failure
+        # messages can depend on the exact coordinates
+        new = []
+        for loc, key, hit in zip(locs, keys, hits):
+            if hit:
+                for (peril_id, coverage_type), item in zip(perils_covs, cached[key]):
+                    yield lookup.get_cached_result(loc, peril_id, coverage_type, *item)
+                continue
+
+            results = [next(misses) for _ in perils_covs]
+            if key is not None and all(r['status'] != KEYS_STATUS_FAIL for r in results):
+                new.append((key, tuple((r['status'], r['message'], r[lookup.peril_area_id_key], r[lookup.vulnerability_id_key]) for r in results)))
+            for result in results:
                 yield result
 
+        cache.put_many(new)
+
+    @classmethod
+    def _get_results_in_parallel(cls, lookup, model_exposures_df, num_processes):
+        """
+        Generates the lookup results for a model exposures data frame by
+        splitting it into contiguous partitions which are looked up in a pool
+        of ``num_processes`` worker processes, each of which creates its own
+        instance of the lookup class from the lookup config. At most
+        ``2 * num_processes`` partitions are in flight at any time, and
+        partition results are generated in partition order as they complete,
+        so the overall results order is the same as for a serial lookup.
+        """
+        lookup_kwargs = {'config': lookup.config, 'config_dir': lookup.config_dir}
+        loc_id_col = getattr(lookup, 'loc_id_col', None)
+        if loc_id_col:
+            lookup_kwargs['loc_id_col'] = loc_id_col
+
+        num_partitions = min(len(model_exposures_df), 4 * num_processes)
+        bounds = [(len(model_exposures_df) * i) // num_partitions for i in range(num_partitions + 1)]
+        partitions = (model_exposures_df.iloc[i:j] for i, j in zip(bounds[:-1], bounds[1:]))
+
+        max_pending = 2 * num_processes
+        pending = deque()
+
+        pool = billiard.Pool(num_processes, initializer=_init_lookup_worker, initargs=(type(lookup), lookup_kwargs,))
+        try:
+            for partition in partitions:
+                pending.append(pool.apply_async(_lookup_partition, args=(partition,)))
+                while pending and (len(pending) >= max_pending or pending[0].ready()):
+                    for result in pending.popleft().get():
+                        yield result
+            while pending:
+                for result in pending.popleft().get():
+                    yield result
+        except BaseException:
+            pool.terminate()
+            raise
+        else:
+            pool.close()
+        finally:
+            pool.join()
+
     @classmethod
     def save_keys(
         cls,
@@ -577,27 +895,13 @@ class OasisLookupFactory(object):
             success_only=(True if not keys_errors_file_path else False)
         )
 
-        successes = []
-        nonsuccesses = []
-        for k in keys:
-            successes.append(k) if k['status'] == KEYS_STATUS_SUCCESS else nonsuccesses.append(k)
-
-        if keys_format == 'json':
-            if _keys_error_file_path:
-                fp1, n1 = cls.write_json_keys_file(successes, _keys_file_path)
-                fp2, n2 = cls.write_json_keys_file(nonsuccesses, _keys_errors_file_path)
-
-                return fp1, n1, fp2, n2
-            return cls.write_json_keys_file(successes, _keys_file_path)
-        elif keys_format == 'oasis':
-            if _keys_errors_file_path:
-                fp1, n1 = cls.write_oasis_keys_file(successes, _keys_file_path, id_col=keys_id_col)
-                fp2, n2 = cls.write_oasis_keys_errors_file(nonsuccesses, _keys_errors_file_path, id_col=keys_id_col)
-
-                return fp1, n1, fp2, n2
-            return cls.write_oasis_keys_file(successes, _keys_file_path, id_col=keys_id_col)
-        else:
-            raise OasisException("Unrecognised keys file output format - valid formats are 'oasis' or 'json'")
+        return cls.write_keys_files(
+            keys,
+            _keys_file_path,
+            errors_fp=_keys_errors_file_path,
+            format=keys_format,
+            id_col=keys_id_col
+        )
 
     @classmethod
     def save_results(
@@ -607,7 +911,9 @@ class OasisLookupFactory(object):
         errors_fp=None,
         model_exposures=None,
         model_exposures_fp=None,
-        format='oasis'
+        format='oasis',
+        num_processes=None,
+        cache=None
     ):
         """
         Writes a keys file, and optionally a keys error file, for the keys
@@ -632,8 +938,14 @@ class OasisLookupFactory(object):
         file path, ``n1`` is the number of "successful" keys records written to
         the keys file, ``p2`` is the keys errors file path and ``n2`` is the
         number of "unsuccessful" keys records written to keys errors file.
+
+        The optional keyword argument ``num_processes`` is passed through to
+        ``get_results`` for lookups created from a lookup config, to run the
+        lookup in parallel - it has no effect on old-style lookups, and
+        similarly the optional keyword argument ``cache``, a lookup results
+        cache (``OasisLookupCache``).
         """
-        if not (model_exposures or model_exposures_fp):
+        if not (model_exposures_fp or (model_exposures is not None and len(model_exposures))):
             raise OasisException('No model exposures data or file path provided')
 
         mfp = as_path(model_exposures_fp, 'model_exposures_fp', preexists=False)
@@ -657,36 +969,24 @@ class OasisLookupFactory(object):
                 lookup,
                 model_exposures=model_exposures,
                 model_exposures_fp=mfp,
-                successes_only=(False if efp else True)
+                successes_only=(False if efp else True),
+                num_processes=num_processes,
+                cache=cache
             )
 
-        successes = []
-        nonsuccesses = []
-        for r in results:
-            successes.append(r) if r['status'] == KEYS_STATUS_SUCCESS else nonsuccesses.append(r)
-
-        if format == 'json':
-            if efp:
-                fp1, n1 = cls.write_json_keys_file(successes, sfp)
-                fp2, n2 = cls.write_json_keys_file(nonsuccesses, efp)
-                return fp1, n1, fp2, n2
-            return cls.write_json_keys_file(successes, sfp)
-        elif format == 'oasis':
-            loc_id_col = None
-            try:
-                loc_id_col = lookup.loc_id_col
-            except AttributeError:
-                loc_id_col = 'id'
-            else:
-                loc_id_col = loc_id_col.lower()
-            if efp:
-                fp1, n1 = cls.write_oasis_keys_file(successes, sfp, id_col=loc_id_col)
-                fp2, n2 = cls.write_oasis_keys_errors_file(nonsuccesses, efp, id_col=loc_id_col)
-                return fp1, n1, fp2, n2
-            return cls.write_oasis_keys_file(successes, sfp, id_col=loc_id_col)
-        else:
+        if format not in ('oasis', 'json'):
             raise OasisException("Unrecognised lookup file output format - valid formats are 'oasis' or 'json'")
 
+        loc_id_col = None
+        try:
+            loc_id_col = lookup.loc_id_col
+        except AttributeError:
+            loc_id_col = 'id'
+        else:
+            loc_id_col = loc_id_col.lower()
+
+        return cls.write_keys_files(results, sfp, errors_fp=efp, format=format, id_col=loc_id_col)
+
 
 class OasisLookup(OasisBaseLookup):
     """
@@ -741,16 +1041,84 @@ class OasisLookup(OasisBaseLookup):
 
     def lookup(self, loc, peril_id, coverage_type):
 
-        loc_id_col = self.loc_id_col
-        loc_id = loc.get(loc_id_col) or int(uuid.UUID(bytes=os.urandom(16)).hex[:16], 16)
+        loc_id = loc.get(self.loc_id_col) or int(uuid.UUID(bytes=os.urandom(16)).hex[:16], 16)
 
         plookup = self.peril_lookup.lookup(loc, peril_id, coverage_type)
 
+        vlookup = self.vulnerability_lookup.lookup(loc, peril_id, coverage_type)
+
+        return self._combine_lookups(loc_id, peril_id, coverage_type, plookup, vlookup)
+
+    @oasis_log()
+    def bulk_lookup(self, locs, **kwargs):
+        """
+        Bulk lookup - for a data frame of locations the peril area and
+        vulnerability lookups are done in bulk by the peril and vulnerability
+        lookups (see ``OasisPerilLookup.bulk_lookup`` and
+        ``OasisVulnerabilityLookup.bulk_lookup``) and combined location by
+        location, otherwise the locations are looked up one by one. The results, and
+        their order, are the same as for the item by item lookup.
+        """
+        if not isinstance(locs, pd.DataFrame):
+            for result in super(self.__class__, self).bulk_lookup(locs, **kwargs):
+                yield result
+            return
+
+        plookups = self.peril_lookup.bulk_lookup(locs)
+        vlookups = self.vulnerability_lookup.bulk_lookup(locs)
+        perils_covs = tuple(itertools.product(self.peril_ids, self.coverage_types))
+
+        for loc in _get_loc_rows(locs):
+            loc_id = loc.get(self.loc_id_col) or int(uuid.UUID(bytes=os.urandom(16)).hex[:16], 16)
+            for peril_id, coverage_type in perils_covs:
+                plookup = next(plookups)
+                vlookup = next(vlookups)
+                yield self._combine_lookups(loc_id, peril_id, coverage_type, plookup, vlookup)
+
+    @property
+    def cache_namespace(self):
+        """
+        Namespace of the lookup in a lookup results cache - a hash of the
+        model version and the lookup config (apart from the cache and the
+        number of processes settings).
+        """
+        config = {k: v for k, v in six.iteritems(self.config) if k not in ('keys_cache', 'num_processes',)}
+        return '{}:{}'.format(
+            json.dumps(self.config.get('model'), sort_keys=True, default=str),
+            hashlib.sha1(json.dumps(config, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+        )
+
+    def get_cached_result(self, loc, peril_id, coverage_type, status, message, paid, vlnid):
+        """
+        Returns the result for a location item from the cached status,
+        message, area peril ID and vulnerability ID of the item - the same as
+        the result of the lookup of the item.
+        """
+        loc_id = loc.get(self.loc_id_col) or int(uuid.UUID(bytes=os.urandom(16)).hex[:16], 16)
+
+        vulnerability_lookup = self.vulnerability_lookup
+
+        plookup = {'status': status, 'message': message, 'peril_area_id': paid}
+        vlookup = vulnerability_lookup._lookup_result(
+            loc_id, peril_id, coverage_type, status, vlnid, message,
+            vulnerability_lookup._get_loc_key_col_values(loc, peril_id, coverage_type)
+        )
+
+        result = self._combine_lookups(loc_id, peril_id, coverage_type, plookup, vlookup)
+        result['message'] = message
+
+        return result
+
+    def _combine_lookups(self, loc_id, peril_id, coverage_type, plookup, vlookup):
+        """
+        Combines the peril and vulnerability lookup results for a location
+        item into a single result.
+        """
+        loc_id_col = self.loc_id_col
+
         past = plookup['status']
         pamsg = plookup['message']
         paid = plookup['peril_area_id']
-        
-        vlookup = self.vulnerability_lookup.lookup(loc, peril_id, coverage_type)
 
         vlnst = vlookup['status']
         vlnmsg = vlookup['message']
@@ -852,6 +1220,10 @@ class OasisPerilLookup(OasisBaseLookup):
                     self.peril_areas_index = PerilAreasIndex(fp=index_fp)
                     self.peril_areas_index_props = self.peril_areas_index.properties.as_dict()
 
+                    grid_fp = '{}.{}'.format(index_fp, PERIL_AREAS_GRID_EXTENSION)
+                    if os.path.exists(grid_fp):
+                        self._grid = PerilAreasGrid.load(grid_fp)
+
             self.peril_areas_boundary = box(*self.peril_areas_index.bounds, ccw=False)
 
             _centroid = self.peril_areas_boundary.centroid
@@ -892,19 +1264,7 @@ class OasisPerilLookup(OasisBaseLookup):
         x = loc.get(loc_x_col)
         y = loc.get(loc_y_col)
 
-        _lookup = lambda loc_id, x, y, st, perid, covtype, paid, pabnds, pacoords, msg: {
-            loc_id_col: loc_id,
-            loc_x_col: x,
-            loc_y_col: y,
-            'peril_id': perid,
-            'coverage_type': covtype,
-            'status': st,
-            'peril_area_id': paid,
-            'area_peril_id': paid,
-            'area_bounds': pabnds,
-            'area_coordinates': pacoords,
-            'message': msg
-        }
+        _lookup = self._lookup_result
 
         try:
             x = float(x)
@@ -925,30 +1285,34 @@ class OasisPerilLookup(OasisBaseLookup):
         pacoords = None
         point = x, y
 
-        try:
-            results = list(idx.intersection(point, objects='raw'))
+        area_arrays = getattr(idx, 'area_arrays', None)
 
+        def _match(query):
+            # With a columnar store of the areas the query results are area
+            # positions, which are filtered without fetching any areas
+            if area_arrays is not None:
+                results = list(query(point))
+                if not results:
+                    raise IndexError
+                i = area_arrays.find(results, peril_id, coverage_type)
+                return area_arrays[i][2:] if i is not None else (None, None, None)
+
+            results = list(query(point, objects='raw'))
             if not results:
                 raise IndexError
-
             for _perid, _covtype, _paid, _pabnds, _pacoords in results:
                 if (peril_id, coverage_type) == (_perid, _covtype):
-                    paid, pabnds, pacoords = _paid, _pabnds, _pacoords
-                    break
+                    return _paid, _pabnds, _pacoords
+            return None, None, None
+
+        try:
+            paid, pabnds, pacoords = _match(idx.intersection)
 
             if paid == None:
                 raise IndexError
         except IndexError:
             try:
-                results = list(idx.nearest(point, objects='raw'))
-
-                if not results:
-                    raise IndexError
-
-                for _perid, _covtype, _paid, _pabnds, _pacoords in results:
-                    if (peril_id, coverage_type) == (_perid, _covtype):
-                        paid, pabnds, pacoords = _paid, _pabnds, _pacoords
-                        break
+                paid, pabnds, pacoords = _match(idx.nearest)
 
                 if paid == None:
                     msg = 'No intersecting or nearest peril area found for peril ID {} and coverage type {}'.format(peril_id, coverage_type)
@@ -978,6 +1342,223 @@ class OasisPerilLookup(OasisBaseLookup):
 
         return _lookup(loc_id, x, y, st, peril_id, coverage_type, paid, pabnds, pacoords, msg)
 
+    def _lookup_result(self, loc_id, x, y, st, perid, covtype, paid, pabnds, pacoords, msg):
+        return {
+            self.loc_id_col: loc_id,
+            self.loc_coords_x_col: x,
+            self.loc_coords_y_col: y,
+            'peril_id': perid,
+            'coverage_type': covtype,
+            'status': st,
+            'peril_area_id': paid,
+            'area_peril_id': paid,
+            'area_bounds': pabnds,
+            'area_coordinates': pacoords,
+            'message': msg
+        }
+
+    @property
+    def peril_areas_bounds(self):
+        """
+        Peril area index entries and bounds arrays for bulk lookups - a pair
+        ``(entries, bounds)`` where ``entries`` is the sequence of all the
+        ``(peril ID, coverage type, peril area ID, bounds, coordinates)``
+        peril areas of the index, and ``bounds`` is a dict keyed by ``(peril
+        ID, coverage type)`` of triples of the positions of the entries for
+        the key in ``entries``, the array of their peril area IDs and the
+        array of their bounds. The pair is ``None`` if the lookup has no index
+        or the index entries do not have this form.
+
+        For indexes with a columnar store of the peril areas (see
+        ``PerilAreasIndex.area_arrays``) ``entries`` is the store, and the
+        arrays are sliced from its columns, otherwise ``entries`` is the list
+        of the raw index entries. Loaded when first accessed.
+        """
+        try:
+            return self._peril_areas_bounds
+        except AttributeError:
+            pass
+
+        self._peril_areas_bounds = None
+
+        idx = getattr(self, 'peril_areas_index', None)
+        if idx is None:
+            return None
+
+        area_arrays = getattr(idx, 'area_arrays', None)
+        if area_arrays is not None:
+            keys = np.column_stack((area_arrays.peril_ids, area_arrays.coverage_types))
+            unique_keys, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+            inverse = inverse.reshape(-1)
+            bounds = OrderedDict()
+            for k in np.argsort(first, kind='mergesort'):
+                pos = np.flatnonzero(inverse == k)
+                bounds[tuple(unique_keys[k].tolist())] = (pos, area_arrays.area_peril_ids[pos], area_arrays.bounds[pos])
+            self._peril_areas_bounds = area_arrays, bounds
+            return self._peril_areas_bounds
+
+        entries = list(idx.intersection(idx.bounds, objects='raw'))
+        if not all(isinstance(e, tuple) and len(e) == 5 for e in entries):
+            return None
+
+        positions = OrderedDict()
+        for i, (peril_id, coverage_type, _, _, _) in enumerate(entries):
+            positions.setdefault((peril_id, coverage_type), []).append(i)
+
+        self._peril_areas_bounds = entries, OrderedDict(
+            (
+                k,
+                (
+                    np.array(pos, dtype=np.int64),
+                    np.array([entries[i][2] for i in pos], dtype=object),
+                    np.array([entries[i][3] for i in pos], dtype=np.float64).reshape(-1, 4)
+                )
+            ) for k, pos in six.iteritems(positions)
+        )
+
+        return self._peril_areas_bounds
+
+    @property
+    def peril_areas_grid(self):
+        """
+        Regular grid index of the peril areas for bulk lookups - a pair
+        ``(grid, positions)`` where ``grid`` is a ``PerilAreasGrid`` and
+        ``positions`` is a dict keyed by ``(peril ID, coverage type)`` of the
+        positions of the grid areas in the index entries (see
+        ``peril_areas_bounds``). The pair is ``None`` if there is no grid.
+
+        The grid is either loaded from the grid index file written with the
+        Rtree file index (see ``PerilAreasIndex.create_from_peril_areas_file``),
+        or created from the index entries using the grid spec with the key
+        ``grid`` in the peril config. Only (peril ID, coverage type) pairs for
+        which the grid has the same areas as the index are used.
+        """
+        try:
+            return self._peril_areas_grid
+        except AttributeError:
+            pass
+
+        self._peril_areas_grid = None
+
+        peril_areas_bounds = self.peril_areas_bounds
+        if not peril_areas_bounds:
+            return None
+
+        entries, bounds = peril_areas_bounds
+
+        grid = getattr(self, '_grid', None)
+        grid_spec = (self.config.get('peril') or {}).get('grid')
+        if not grid and grid_spec:
+            grid = PerilAreasGrid.create(
+                ((k[0], k[1], area_id, tuple(b)) for k, (_, area_ids, area_bounds) in six.iteritems(bounds) for area_id, b in zip(area_ids.tolist(), area_bounds.tolist())),
+                spec=grid_spec
+            )
+        if not grid:
+            return None
+
+        positions = {}
+        for key in grid.keys():
+            if key not in bounds:
+                continue
+            entry_positions, entry_area_ids, entry_bounds = bounds[key]
+            entry_ids = dict(zip(entry_area_ids.tolist(), range(len(entry_positions))))
+            if not (len(entry_ids) == len(entry_positions) == len(grid.area_ids(*key))):
+                continue
+            try:
+                key_positions = np.array([entry_ids[area_id] for area_id in grid.area_ids(*key).tolist()], dtype=np.int64)
+            except KeyError:
+                continue
+            if np.array_equal(entry_bounds[key_positions], grid.area_bounds(*key)):
+                positions[key] = entry_positions[key_positions]
+
+        if positions:
+            self._peril_areas_grid = grid, positions
+
+        return self._peril_areas_grid
+
+    @oasis_log()
+    def bulk_lookup(self, locs, **kwargs):
+        """
+        Bulk area peril lookup for a data frame of locations - the locations
+        are matched to the peril areas with a single bulk query per (peril ID,
+        coverage type) pair of the peril area bounds (see
+        ``get_bounds_containment``), which is the same containment test as
+        the index intersection query of the item by item lookup. If the peril
+        areas form a regular grid (see ``peril_areas_grid``) the query only
+        searches the grid cells around each location.
+
+        Location items with valid coordinates which are contained in exactly
+        one peril area for the peril ID and coverage type are resolved from
+        the bulk query, as are items with valid coordinates for peril ID and
+        coverage type pairs which have no peril areas. All other items - items with invalid coordinates,
+        items requiring the nearest peril area and the global areas boundary
+        distance check, and items contained in several areas, for which the
+        result depends on the index ordering - are looked up item by item.
+        The results, and their order, are the same as for the item by item
+        lookup.
+
+        Other types of location collections are looked up item by item.
+        """
+        peril_areas_bounds = self.peril_areas_bounds
+
+        if not (isinstance(locs, pd.DataFrame) and peril_areas_bounds):
+            for result in super(self.__class__, self).bulk_lookup(locs, **kwargs):
+                yield result
+            return
+
+        entries, bounds = peril_areas_bounds
+        grid, grid_positions = self.peril_areas_grid or (None, {})
+
+        loc_id_col = self.loc_id_col
+        loc_x_col = self.loc_coords_x_col
+        loc_y_col = self.loc_coords_y_col
+        loc_x_bounds = self.loc_coords_x_bounds
+        loc_y_bounds = self.loc_coords_y_bounds
+
+        num_locs = len(locs)
+        xs = pd.to_numeric(locs[loc_x_col], errors='coerce').values.astype(np.float64) if loc_x_col in locs else np.full(num_locs, np.nan)
+        ys = pd.to_numeric(locs[loc_y_col], errors='coerce').values.astype(np.float64) if loc_y_col in locs else np.full(num_locs, np.nan)
+
+        with np.errstate(invalid='ignore'):
+            valid = (loc_x_bounds[0] <= xs) & (xs <= loc_x_bounds[1]) & (loc_y_bounds[0] <= ys) & (ys <= loc_y_bounds[1])
+        valid_xs, valid_ys = xs[valid], ys[valid]
+
+        perils_covs = tuple(itertools.product(self.peril_ids, self.coverage_types))
+
+        # Entry positions of the matching peril areas of the items, with -1
+        # for items to be looked up one by one, and -2 for items without any
+        # peril areas for the peril ID and coverage type
+        matches = []
+        for peril_id, coverage_type in perils_covs:
+            match = np.full(num_locs, -1, dtype=np.int64)
+            if (peril_id, coverage_type) in grid_positions:
+                counts, positions = grid.get_bounds_containment(valid_xs, valid_ys, peril_id, coverage_type)
+                match[valid] = np.where(counts == 1, grid_positions[(peril_id, coverage_type)][positions], -1)
+            elif (peril_id, coverage_type) in bounds:
+                entry_positions, _, entry_bounds = bounds[(peril_id, coverage_type)]
+                counts, positions = get_bounds_containment(valid_xs, valid_ys, entry_bounds)
+                match[valid] = np.where(counts == 1, entry_positions[positions], -1)
+            elif entries:
+                match[valid] = -2
+            matches.append(match)
+
+        _lookup = self._lookup_result
+
+        for i, loc in enumerate(_get_loc_rows(locs)):
+            for j, (peril_id, coverage_type) in enumerate(perils_covs):
+                k = matches[j][i]
+                if k == -1:
+                    yield self.lookup(loc, peril_id, coverage_type)
+                    continue
+                loc_id = loc.get(loc_id_col) or int(uuid.UUID(bytes=os.urandom(16)).hex[:16], 16)
+                if k == -2:
+                    msg = 'No intersecting or nearest peril area found for peril ID {} and coverage type {}'.format(peril_id, coverage_type)
+                    yield _lookup(loc_id, float(xs[i]), float(ys[i]), KEYS_STATUS_NOMATCH, peril_id, coverage_type, None, None, None, msg)
+                    continue
+                _, _, paid, pabnds, pacoords = entries[k]
+                msg = 'Successful peril area lookup: {}'.format(paid)
+                yield _lookup(loc_id, float(xs[i]), float(ys[i]), KEYS_STATUS_SUCCESS, peril_id, coverage_type, paid, pabnds, pacoords, msg)
+
 
 class OasisVulnerabilityLookup(OasisBaseLookup):
     """
@@ -1054,6 +1635,21 @@ class OasisVulnerabilityLookup(OasisBaseLookup):
         if vulnerabilities:
             return col_dtypes, key_cols, vuln_id_col, _vuln_dict(enumerate(vulnerabilities), key_cols)
 
+        index_fp = vuln_config.get('index_file_path')
+        if index_fp:
+            if not os.path.isabs(index_fp):
+                index_fp = os.path.abspath(os.path.join(self.config_dir, index_fp))
+            self.config['vulnerability']['index_file_path'] = index_fp
+
+            if os.path.exists(index_fp):
+                index = VulnerabilitiesIndex.load(index_fp)
+                if index.key_cols != key_cols:
+                    raise OasisException(
+                        'The key columns {} of the vulnerabilities index {} do not match the '
+                        'key columns {} in the lookup config'.format(index.key_cols, index_fp, key_cols)
+                    )
+                return col_dtypes, key_cols, vuln_id_col, index
+
         src_fp = vuln_config.get('file_path')
 
         if not src_fp:
@@ -1088,6 +1684,20 @@ class OasisVulnerabilityLookup(OasisBaseLookup):
             sort_ascending=sort_ascending
         )
 
+        # Integer keys and vulnerability IDs are stored in a (compact)
+        # vulnerabilities index rather than a dict - this is also written to
+        # file, if an index file path is set, and loaded as a memory map
+        if all(col_dtypes.get(col) == int for col in key_cols + (vuln_id_col,)):
+            index = VulnerabilitiesIndex.create_from_dataframe(vuln_df, key_cols, vuln_id_col)
+            if index_fp:
+                index = VulnerabilitiesIndex.load(index.save(index_fp))
+            return col_dtypes, key_cols, vuln_id_col, index
+        elif index_fp:
+            raise OasisException(
+                'A vulnerabilities index requires the key columns and the vulnerability '
+                'ID column to have integer data types in the lookup config'
+            )
+
         return col_dtypes, key_cols, vuln_id_col, _vuln_dict((v for _, v in vuln_df.iterrows()), key_cols, vuln_id_col)
 
     def lookup(self, loc, peril_id, coverage_type):
@@ -1102,29 +1712,11 @@ class OasisVulnerabilityLookup(OasisBaseLookup):
         col_dtypes = self.col_dtypes
         vuln_id_col = self.vuln_id_col
 
-        loc_key_col_values = OrderedDict({
-            key_col: loc.get(key_col) for key_col in key_cols
-        })
+        loc_key_col_values = self._get_loc_key_col_values(loc, peril_id, coverage_type)
 
-        if not loc_key_col_values['peril_id']:
-            loc_key_col_values['peril_id'] = peril_id
-
-        if not loc_key_col_values['coverage_type']:
-            loc_key_col_values['coverage_type'] = loc.get('coverage') or coverage_type
-
-        _lookup = lambda loc_id, vlnperid, vlncovtype, vlnst, vlnid, vlnmsg: {
-            k:v for k, v in itertools.chain(
-                (
-                    (loc_id_col, loc_id),
-                    ('peril_id', vlnperid),
-                    ('coverage_type', vlncovtype),
-                    ('status', vlnst),
-                    ('vulnerability_id', vlnid),
-                    ('message', vlnmsg)
-                ),
-                six.iteritems(loc_key_col_values)
-            )
-        }
+        _lookup = lambda loc_id, vlnperid, vlncovtype, vlnst, vlnid, vlnmsg: self._lookup_result(
+            loc_id, vlnperid, vlncovtype, vlnst, vlnid, vlnmsg, loc_key_col_values
+        )
 
         try:
             for key_col in key_cols:
@@ -1153,3 +1745,115 @@ class OasisVulnerabilityLookup(OasisBaseLookup):
             vlnmsg = 'Successful vulnerability lookup: {}'.format(vlnid)
 
         return _lookup(loc_id, vlnperid, vlncovtype, vlnst, vlnid, vlnmsg)
+
+    def _get_loc_key_col_values(self, loc, peril_id, coverage_type):
+        """
+        Returns the vulnerability key column values of a location item - the
+        peril ID and coverage type default to those of the item.
+        """
+        loc_key_col_values = OrderedDict({
+            key_col: loc.get(key_col) for key_col in self.key_cols
+        })
+
+        if not loc_key_col_values['peril_id']:
+            loc_key_col_values['peril_id'] = peril_id
+
+        if not loc_key_col_values['coverage_type']:
+            loc_key_col_values['coverage_type'] = loc.get('coverage') or coverage_type
+
+        return loc_key_col_values
+
+    def _lookup_result(self, loc_id, vlnperid, vlncovtype, vlnst, vlnid, vlnmsg, loc_key_col_values):
+        return {
+            k: v for k, v in itertools.chain(
+                (
+                    (self.loc_id_col, loc_id),
+                    ('peril_id', vlnperid),
+                    ('coverage_type', vlncovtype),
+                    ('status', vlnst),
+                    ('vulnerability_id', vlnid),
+                    ('message', vlnmsg)
+                ),
+                six.iteritems(loc_key_col_values)
+            )
+        }
+
+    @oasis_log()
+    def bulk_lookup(self, locs, **kwargs):
+        """
+        Bulk vulnerability lookup for a data frame of locations - if the
+        vulnerabilities are stored in a ``VulnerabilitiesIndex`` the
+        vulnerability IDs are looked up in a single vectorized batch per
+        (peril ID, coverage type) pair. Location items whose key column
+        values are in non-numeric columns, or are infinite, are looked up
+        item by item, as are all items if the vulnerabilities are a dict or
+        the locations are not a data frame. The results, and their order,
+        are the same as for the item by item lookup.
+        """
+        vulnerabilities = getattr(self, 'vulnerabilities', None)
+        key_cols = getattr(self, 'key_cols', ())
+
+        if not (
+            isinstance(locs, pd.DataFrame) and isinstance(vulnerabilities, VulnerabilitiesIndex) and
+            'peril_id' in key_cols and 'coverage_type' in key_cols
+        ):
+            for result in super(self.__class__, self).bulk_lookup(locs, **kwargs):
+                yield result
+            return
+
+        num_locs = len(locs)
+        missing = np.iinfo(np.int64).min
+
+        # Key column values as floats - NaN for null values, which fail the
+        # key value type check, and missing columns, whose values are null
+        key_col_values = {}
+        item_by_item = np.zeros(num_locs, dtype=bool)
+        for col in key_cols:
+            if col not in locs:
+                key_col_values[col] = np.full(num_locs, np.nan)
+            elif locs[col].dtype.kind in 'biuf':
+                key_col_values[col] = locs[col].values.astype(np.float64)
+                item_by_item |= np.abs(key_col_values[col]) > 2**53
+            else:
+                key_col_values[col] = np.full(num_locs, np.nan)
+                item_by_item[:] = True
+
+        perils_covs = tuple(itertools.product(self.peril_ids, self.coverage_types))
+
+        vuln_ids = []
+        for peril_id, coverage_type in perils_covs:
+            values = dict(key_col_values)
+            peril_ids = values['peril_id']
+            values['peril_id'] = np.where((peril_ids == 0) | ('peril_id' not in locs), peril_id, peril_ids)
+            cov_types = values['coverage_type']
+            no_cov_type = (cov_types == 0) | ('coverage_type' not in locs)
+            values['coverage_type'] = np.where(no_cov_type, coverage_type, cov_types)
+            cov_item_by_item = item_by_item | (no_cov_type & ('coverage' in locs))
+
+            ids = vulnerabilities.get_vulnerability_ids([values[col] for col in key_cols], missing=missing)
+            invalid = np.zeros(num_locs, dtype=bool)
+            for col in key_cols:
+                invalid |= np.isnan(values[col])
+            vuln_ids.append((np.where(cov_item_by_item, None, np.where(invalid, KEYS_STATUS_FAIL, None)), ids.tolist(), cov_item_by_item))
+
+        loc_id_col = self.loc_id_col
+
+        for i, loc in enumerate(_get_loc_rows(locs)):
+            for (peril_id, coverage_type), (statuses, ids, cov_item_by_item) in zip(perils_covs, vuln_ids):
+                if cov_item_by_item[i]:
+                    yield self.lookup(loc, peril_id, coverage_type)
+                    continue
+
+                loc_id = loc.get(loc_id_col) or int(uuid.UUID(bytes=os.urandom(16)).hex[:16], 16)
+
+                loc_key_col_values = self._get_loc_key_col_values(loc, peril_id, coverage_type)
+
+                if statuses[i] == KEYS_STATUS_FAIL:
+                    vlnst, vlnid, vlnmsg = KEYS_STATUS_FAIL, None, 'Vulnerability lookup: invalid key column value(s) for location'
+                elif ids[i] == missing:
+                    vlnst, vlnid, vlnmsg = KEYS_STATUS_NOMATCH, None, 'No vulnerability match'
+                else:
+                    vlnst, vlnid = KEYS_STATUS_SUCCESS, ids[i]
+                    vlnmsg = 'Successful vulnerability lookup: {}'.format(vlnid)
+
+                yield self._lookup_result(loc_id, peril_id, coverage_type, vlnst, vlnid, vlnmsg, loc_key_col_values)
@@ -8,27 +8,45 @@
 from __future__ import print_function
 
 import glob
+import io
 import logging
 import tarfile
+import tempfile
+import time
+import zlib
+from collections import deque
 from itertools import chain
+from multiprocessing.pool import ThreadPool
 
+import numpy as np
+import pandas as pd
 import shutilwhich
 import six
+from billiard import cpu_count
 from pathlib2 import Path
 from six import itervalues
 
 __all__ = [
     'create_binary_files',
     'prepare_model_run_directory',
-    'prepare_model_run_inputs'
+    'prepare_model_run_inputs',
+    'write_binary_file',
+    'write_binary_tar'
 ]
 
 import os
 import shutil
 import subprocess
 
+from ..utils.concurrency import (
+    multithread,
+    Task,
+)
 from ..utils.exceptions import OasisException
-from .files import TAR_FILE, INPUT_FILES, GUL_INPUT_FILES, IL_INPUT_FILES
+from .files import TAR_FILE, INPUT_FILES, INPUT_FILES_BIN_FORMATS, GUL_INPUT_FILES, IL_INPUT_FILES
+
+
+BIN_WRITER_CHUNK_SIZE = 10 ** 6
 
 
 def prepare_model_run_directory(
@@ -199,10 +217,16 @@ def _check_each_inputs_directory(directory_to_check, do_il=False, check_binaries
                 raise OasisException("Binary file already exists: {}".format(file_path))
 
 
-def create_binary_files(csv_directory, bin_directory, do_il=False, do_ri=False):
+def create_binary_files(csv_directory, bin_directory, do_il=False, do_ri=False, native=False, num_workers=None, logger=None, exclude_files=None):
     """
     Create the binary files.
 
+    The conversions of all the input files, of the main directory and of any
+    reinsurance ``RI_<n>`` directories, are run concurrently in a pool of
+    ``num_workers`` threads - each conversion runs in a conversion tool
+    process, or writes the binary file natively (see ``write_binary_file``).
+    The time of each conversion is logged.
+
     :param csv_directory: the directory containing the CSV files
     :type csv_directory: str
 
@@ -215,23 +239,48 @@ def create_binary_files(csv_directory, bin_directory, do_il=False, do_ri=False):
     :param do_ri: whether to create the binaries required for reinsurance calculations
     :type do_ri: bool
 
-    :raises OasisException: If one of the conversions fails
+    :param native: whether to write the binary files with ``write_binary_file``
+                   rather than the ktools conversion tools
+    :type native: bool
+
+    :param num_workers: the maximum number of concurrent conversions - by
+                        default the number of CPUs
+    :type num_workers: int
+
+    :param logger: logger for the conversion times (optional)
+    :type logger: logging.Logger
+
+    :param exclude_files: names of the input files of the main directory
+                          (e.g. ``items``) not to convert - e.g. those whose
+                          binary files the Oasis files pipeline has already
+                          written from its data frames (see
+                          ``OasisExposuresManager.start_oasis_files_pipeline``)
+    :type exclude_files: list
+
+    :raises OasisException: If one of the conversions fails - all the
+                            failures are reported, with the standard error
+                            output of the conversion tools
     """
     csvdir = os.path.abspath(csv_directory)
     bindir = os.path.abspath(bin_directory)
 
     do_il = do_il or do_ri
 
-    _create_set_of_binary_files(csvdir, bindir, do_il)
+    conversions = _get_set_of_binary_file_conversions(csvdir, bindir, do_il, exclude_files=exclude_files)
 
     if do_ri:
         for ri_csvdir in glob.glob('{}{}RI_[0-9]*'.format(csvdir, os.sep)):
-            _create_set_of_binary_files(
-                ri_csvdir, os.path.join(bindir, os.path.basename(ri_csvdir)), do_il=True)
+            conversions.extend(_get_set_of_binary_file_conversions(
+                ri_csvdir, os.path.join(bindir, os.path.basename(ri_csvdir)), do_il=True))
+
+    _run_binary_file_conversions(conversions, native=native, num_workers=num_workers, logger=logger)
+
 
-def _create_set_of_binary_files(csv_directory, bin_directory, do_il=False):
+def _get_set_of_binary_file_conversions(csv_directory, bin_directory, do_il=False, exclude_files=None):
     """
-    Create a set of binary files.
+    Get the conversions - triples of the input file, the CSV file path and
+    the binary file path - of a set of binary files, other than those of the
+    excluded input files.
     """
     if not os.path.exists(bin_directory):
         os.mkdir(bin_directory)
@@ -241,19 +290,168 @@ def _create_set_of_binary_files(csv_directory, bin_directory, do_il=False):
     else:
         input_files = (f for f in itervalues(INPUT_FILES) if f['type'] != 'il')
 
+    conversions = []
+
     for input_file in input_files:
-        conversion_tool = input_file['conversion_tool']
         input_file_path = os.path.join(csv_directory, '{}.csv'.format(input_file['name']))
-        if not os.path.exists(input_file_path):
+        if not os.path.exists(input_file_path) or input_file['name'] in (exclude_files or ()):
             continue
 
         output_file_path = os.path.join(bin_directory, '{}.bin'.format(input_file['name']))
-        cmd_str = "{} < {} > {}".format(conversion_tool, input_file_path, output_file_path)
 
+        conversions.append((input_file, input_file_path, output_file_path,))
+
+    return conversions
+
+
+def _run_binary_file_conversions(conversions, native=False, num_workers=None, logger=None):
+    """
+    Run binary file conversions concurrently, and log the conversion times.
+    """
+    logger = logger or logging.getLogger()
+
+    if not conversions:
+        return
+
+    if num_workers is not None and num_workers < 1:
+        raise OasisException('The number of binary conversion workers must be a positive integer: {}'.format(num_workers))
+
+    tasks = (
+        Task(_run_binary_file_conversion, args=(input_file, input_file_path, output_file_path, native,), key=output_file_path)
+        for input_file, input_file_path, output_file_path in conversions
+    )
+
+    pool_size = min(num_workers or cpu_count(), len(conversions))
+
+    errors = []
+
+    for output_file_path, result in multithread(tasks, pool_size=pool_size):
+        if result['error']:
+            errors.append('{}: {}'.format(output_file_path, result['error']))
+        else:
+            logger.info('Created binary file {} ({:.3f}s)'.format(output_file_path, result['elapsed']))
+
+    if errors:
+        raise OasisException('Failed to create binary files - {}'.format('; '.join(sorted(errors))))
+
+
+def _run_binary_file_conversion(input_file, input_file_path, output_file_path, native=False):
+    """
+    Run a binary file conversion - returns a dict of the conversion time
+    (``elapsed``) and any error (``error``) - the errors are returned, rather
+    than raised, so that all the concurrent conversions are completed and
+    their errors reported.
+    """
+    start = time.time()
+
+    try:
+        if native:
+            _convert_input_file(input_file_path, output_file_path, input_file['name'])
+        else:
+            _convert_input_file_with_tool(input_file['conversion_tool'], input_file_path, output_file_path)
+    except Exception as e:
+        return {'elapsed': time.time() - start, 'error': str(e) or repr(e)}
+
+    return {'elapsed': time.time() - start, 'error': None}
+
+
+def _convert_input_file_with_tool(conversion_tool, input_file_path, output_file_path):
+    """
+    Converts an input CSV file to a binary file with a ktools conversion tool,
+    capturing the tool's standard error output.
+    """
+    cmd_str = "{} < {} > {}".format(conversion_tool, input_file_path, output_file_path)
+
+    with tempfile.TemporaryFile() as stderr:
         try:
-            subprocess.check_call(cmd_str, stderr=subprocess.STDOUT, shell=True)
+            subprocess.check_call(cmd_str, stderr=stderr, shell=True)
         except subprocess.CalledProcessError as e:
-            raise OasisException(e)
+            stderr.seek(0)
+            stderr_output = stderr.read().decode('utf-8', 'replace').strip()
+            raise OasisException('{} - {}'.format(e, stderr_output) if stderr_output else e)
+
+
+def _convert_input_file(input_file_path, output_file_path, input_file_name):
+    """
+    Converts an input CSV file to a binary file with ``write_binary_file``,
+    in chunks. The header row is skipped and the columns are taken in order,
+    as the conversion tools do, and float values are parsed exactly.
+    """
+    try:
+        chunks = pd.read_csv(input_file_path, chunksize=BIN_WRITER_CHUNK_SIZE, float_precision='round_trip')
+    except pd.errors.EmptyDataError:
+        chunks = []
+    except (IOError, OSError, ValueError) as e:
+        raise OasisException('Error reading input file {}: {}'.format(input_file_path, e))
+
+    try:
+        with io.open(output_file_path, 'wb') as f:
+            for chunk in chunks:
+                write_binary_file(chunk, input_file_name, f)
+    except (IOError, OSError, ValueError) as e:
+        raise OasisException('Error converting input file {}: {}'.format(input_file_path, e))
+
+
+def write_binary_file(data, input_file_name, bin_file):
+    """
+    Writes the ktools binary file of an input file directly from a data frame
+    of its rows, byte-identical to the output of the ktools conversion tool of
+    the file for a CSV file of the rows - without writing and converting a CSV
+    file. The data frame columns are taken in the order of the input file
+    columns, whatever their names, as the conversion tools do, e.g. for
+    ``items`` ``item_id``, ``coverage_id``, ``areaperil_id``,
+    ``vulnerability_id``, ``group_id``. The binary layouts are defined in
+    ``files.INPUT_FILES_BIN_FORMATS``.
+
+    :param data: input file rows
+    :type data: pandas.DataFrame
+
+    :param input_file_name: input file name (without extension), e.g. ``items``
+    :type input_file_name: str
+
+    :param bin_file: binary file path, or binary file object to append the records to
+    :type bin_file: str or file
+
+    :raises OasisException: If the input file has no binary format, or the
+                            data has missing columns or invalid values
+    """
+    try:
+        bin_format = INPUT_FILES_BIN_FORMATS[input_file_name]
+    except KeyError:
+        raise OasisException('No binary format defined for input file {}'.format(input_file_name))
+
+    csv_columns = bin_format['csv_columns']
+    if len(data.columns) < len(csv_columns):
+        raise OasisException(
+            'The {} data has {} columns - expected {} ({})'.format(input_file_name, len(data.columns), len(csv_columns), ', '.join(csv_columns))
+        )
+
+    records = np.empty(len(data), dtype=bin_format['bin_fields'])
+
+    for field, dtype in bin_format['bin_fields']:
+        try:
+            values = pd.to_numeric(data.iloc[:, csv_columns.index(field)])
+        except (TypeError, ValueError) as e:
+            raise OasisException('Invalid {} values in the {} data: {}'.format(field, input_file_name, e))
+
+        if values.isnull().any():
+            raise OasisException('Missing {} values in the {} data'.format(field, input_file_name))
+
+        values = values.values
+        if np.dtype(dtype).kind in 'iu':
+            # The conversion tools read the integer fields as C ints, so any
+            # fractional parts are truncated, and -1 area peril IDs are
+            # written as the maximum unsigned int
+            records[field] = (np.trunc(values) if values.dtype.kind == 'f' else values).astype(np.int64).astype(dtype)
+        else:
+            records[field] = values.astype(np.float64).astype(dtype)
+
+    if isinstance(bin_file, six.string_types):
+        with io.open(bin_file, 'wb') as f:
+            f.write(records.tobytes())
+    else:
+        bin_file.write(records.tobytes())
+
 
 def check_binary_tar_file(tar_file_path, check_il=False):
     """
@@ -285,23 +483,116 @@ def check_binary_tar_file(tar_file_path, check_il=False):
     return True
 
 
-def create_binary_tar_file(directory):
+class _GzipWriter(object):
+    """
+    Binary file-like object which gzip compresses the data written to it to
+    a file object. With more than one thread the data is compressed in
+    blocks of ``block_size`` bytes concurrently (``zlib`` releases the GIL),
+    as separate gzip members, which are written in order - a multi-member
+    gzip stream is a valid gzip stream, which ``gzip`` and ``tarfile`` read
+    transparently, as ``pigz`` output is.
+    """
+    def __init__(self, fileobj, compression_level=9, num_threads=1, block_size=2 ** 20):
+        self.fileobj = fileobj
+        self.compression_level = compression_level
+        self.block_size = block_size
+        self.buffer = []
+        self.buffer_size = 0
+
+        if num_threads > 1:
+            self.pool = ThreadPool(num_threads)
+            self.max_pending = 2 * num_threads
+            self.pending = deque()
+        else:
+            self.pool = None
+            self.compressor = self._get_compressor()
+
+    def _get_compressor(self):
+        return zlib.compressobj(self.compression_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def _compress_block(self, block):
+        compressor = self._get_compressor()
+        return compressor.compress(block) + compressor.flush()
+
+    def _submit_buffer(self):
+        block, self.buffer, self.buffer_size = b''.join(self.buffer), [], 0
+        self.pending.append(self.pool.apply_async(self._compress_block, (block,)))
+
+        while len(self.pending) > self.max_pending:
+            self.fileobj.write(self.pending.popleft().get())
+
+    def write(self, data):
+        if not self.pool:
+            self.fileobj.write(self.compressor.compress(data))
+            return
+
+        self.buffer.append(data)
+        self.buffer_size += len(data)
+        if self.buffer_size >= self.block_size:
+            self._submit_buffer()
+
+    def close(self):
+        if not self.pool:
+            self.fileobj.write(self.compressor.flush())
+            return
+
+        try:
+            if self.buffer_size or not self.pending:
+                self._submit_buffer()
+            while self.pending:
+                self.fileobj.write(self.pending.popleft().get())
+        finally:
+            self.pool.terminate()
+
+
+def write_binary_tar(directory, fileobj, compression_level=9, num_threads=1):
+    """
+    Writes a gzipped tar of the binaries in a directory, and in any
+    reinsurance subdirectories, as a stream to a binary file object - e.g. a
+    file, or a pipe to an upload (see
+    ``OasisAPIClient.upload_inputs_from_directory``).
+
+    :param directory: Path containing the binaries
+    :type directory: str
+
+    :param fileobj: Binary file object to write the tar to
+    :type fileobj: file
+
+    :param compression_level: gzip compression level, from 0 (no
+                              compression - the fastest, for fast local
+                              networks) to 9 (the default)
+    :type compression_level: int
+
+    :param num_threads: Number of threads to compress with
+    :type num_threads: int
+    """
+    if compression_level not in range(10):
+        raise OasisException('Invalid gzip compression level {} - valid levels are 0 to 9'.format(compression_level))
+
+    gz = _GzipWriter(fileobj, compression_level=compression_level, num_threads=max(num_threads or 1, 1))
+    try:
+        with tarfile.open(fileobj=gz, mode='w|') as tar:
+            for f in chain(glob.glob(os.path.join(directory, '*.bin')), glob.glob(os.path.join(directory, '*', '*.bin'))):
+                tar.add(f, arcname=os.path.relpath(f, directory))
+    finally:
+        gz.close()
+
+
+def create_binary_tar_file(directory, compression_level=9, num_threads=1):
     """
     Package the binaries in a gzipped tar.
     
     :param directory: Path containing the binaries
-    :type tar_file_path: str    
-    """
-    original_cwd = os.getcwd()
-    os.chdir(directory)
+    :type directory: str
 
-    with tarfile.open(TAR_FILE, "w:gz") as tar:
-        for f in glob.glob('*.bin'):
-            tar.add(f)
-        for f in glob.glob('*{}*.bin'.format(os.sep)):
-            tar.add(f)
+    :param compression_level: gzip compression level, from 0 (no compression) to 9 (the default)
+    :type compression_level: int
 
-    os.chdir(original_cwd)
+    :param num_threads: Number of threads to compress with
+    :type num_threads: int
+    """
+    with io.open(os.path.join(directory, TAR_FILE), 'wb') as f:
+        write_binary_tar(directory, f, compression_level=compression_level, num_threads=num_threads)
 
 
 def check_conversion_tools(do_il=False):
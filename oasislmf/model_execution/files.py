@@ -17,6 +17,52 @@ GUL_INPUT_FILES = {k: v for k, v in six.iteritems(INPUT_FILES) if v['type'] == '
 IL_INPUT_FILES = {k: v for k, v in six.iteritems(INPUT_FILES) if v['type'] == 'il'}
 OPTIONAL_INPUT_FILES = {k: v for k, v in six.iteritems(INPUT_FILES) if v['type'] == 'optional'}
 
+# The ktools binary layouts of the input files, as written by the conversion
+# tools - ``csv_columns`` are the input file columns, in order, and
+# ``bin_fields`` the (little-endian) binary record fields, in order; the
+# coverages binary file only has the TIVs, in coverage ID order
+INPUT_FILES_BIN_FORMATS = {
+    'items': {
+        'csv_columns': ['item_id', 'coverage_id', 'areaperil_id', 'vulnerability_id', 'group_id'],
+        'bin_fields': [('item_id', '<i4'), ('coverage_id', '<i4'), ('areaperil_id', '<u4'), ('vulnerability_id', '<i4'), ('group_id', '<i4')]
+    },
+    'coverages': {
+        'csv_columns': ['coverage_id', 'tiv'],
+        'bin_fields': [('tiv', '<f4')]
+    },
+    'gulsummaryxref': {
+        'csv_columns': ['coverage_id', 'summary_id', 'summaryset_id'],
+        'bin_fields': [('coverage_id', '<i4'), ('summary_id', '<i4'), ('summaryset_id', '<i4')]
+    },
+    'events': {
+        'csv_columns': ['event_id'],
+        'bin_fields': [('event_id', '<i4')]
+    },
+    'fm_policytc': {
+        'csv_columns': ['layer_id', 'level_id', 'agg_id', 'policytc_id'],
+        'bin_fields': [('level_id', '<i4'), ('agg_id', '<i4'), ('layer_id', '<i4'), ('policytc_id', '<i4')]
+    },
+    'fm_profile': {
+        'csv_columns': ['policytc_id', 'calcrule_id', 'deductible1', 'deductible2', 'deductible3', 'attachment1', 'limit1', 'share1', 'share2', 'share3'],
+        'bin_fields': [
+            ('policytc_id', '<i4'), ('calcrule_id', '<i4'), ('deductible1', '<f4'), ('deductible2', '<f4'), ('deductible3', '<f4'),
+            ('attachment1', '<f4'), ('limit1', '<f4'), ('share1', '<f4'), ('share2', '<f4'), ('share3', '<f4')
+        ]
+    },
+    'fm_programme': {
+        'csv_columns': ['from_agg_id', 'level_id', 'to_agg_id'],
+        'bin_fields': [('from_agg_id', '<i4'), ('level_id', '<i4'), ('to_agg_id', '<i4')]
+    },
+    'fm_xref': {
+        'csv_columns': ['output', 'agg_id', 'layer_id'],
+        'bin_fields': [('output', '<i4'), ('agg_id', '<i4'), ('layer_id', '<i4')]
+    },
+    'fmsummaryxref': {
+        'csv_columns': ['output', 'summary_id', 'summaryset_id'],
+        'bin_fields': [('output', '<i4'), ('summary_id', '<i4'), ('summaryset_id', '<i4')]
+    }
+}
+
 TAR_FILE = 'inputs.tar.gz'
 
 GENERAL_SETTINGS_FILE = "general_settings.csv"
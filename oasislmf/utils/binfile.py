@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+__all__ = [
+    'read_binary_file_header',
+    'replacing_file',
+    'write_binary_file_header'
+]
+
+import contextlib
+import io
+import json
+import os
+import struct
+
+import six
+
+from .exceptions import OasisException
+
+
+def write_binary_file_header(f, magic, header):
+    """
+    Writes the header of a binary array file - the magic bytes, the length of
+    the JSON header as a little-endian 8-byte unsigned integer, and the JSON
+    header, padded with spaces so that the arrays which follow it are 8-byte
+    aligned (if the magic bytes are 8 bytes long).
+
+    :param f: The file, open for writing in binary mode
+    :type f: file
+
+    :param magic: The magic bytes identifying the file type
+    :type magic: bytes
+
+    :param header: The header
+    :type header: dict
+    """
+    header = json.dumps(header).encode('utf-8')
+    header += b' ' * (-len(header) % 8)
+
+    f.write(magic)
+    f.write(struct.pack('<Q', len(header)))
+    f.write(header)
+
+
+def read_binary_file_header(f, magic, file_type):
+    """
+    Reads the header of a binary array file written with
+    ``write_binary_file_header``.
+
+    :param f: The file, open for reading in binary mode
+    :type f: file
+
+    :param magic: The expected magic bytes
+    :type magic: bytes
+
+    :param file_type: The name of the file type, for the error message if
+                      the magic bytes do not match
+    :type file_type: str
+
+    :return: The header and the offset of the arrays in the file
+    :rtype: tuple
+    """
+    if f.read(len(magic)) != magic:
+        raise OasisException('{} is not a {} file'.format(f.name, file_type))
+
+    header_len = struct.unpack('<Q', f.read(8))[0]
+    header = json.loads(f.read(header_len).decode('utf-8'))
+
+    return header, len(magic) + 8 + header_len
+
+
+@contextlib.contextmanager
+def replacing_file(fp):
+    """
+    Context manager for writing a file atomically - a temporary file in the
+    same directory is opened for writing in binary mode, and if the block
+    completes it replaces any existing file, otherwise it is removed. So
+    processes which have memory mapped the existing file never see a
+    partially written file.
+
+    :param fp: The file path
+    :type fp: str
+    """
+    tmp_fp = '{}.{}.tmp'.format(fp, os.getpid())
+    try:
+        with io.open(tmp_fp, 'wb') as f:
+            yield f
+        os.rename(tmp_fp, fp) if six.PY2 else os.replace(tmp_fp, fp)
+    except BaseException:
+        if os.path.exists(tmp_fp):
+            os.remove(tmp_fp)
+        raise
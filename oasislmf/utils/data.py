@@ -1,17 +1,81 @@
 # -*- coding: utf-8 -*-
 
 __all__ = [
+    'CSV_NA_VALUES',
+    'as_csv_parsed',
+    'as_csv_strings',
     'get_dataframe'
 ]
 
 import builtins
 
+import numpy as np
 import pandas as pd
 
 import six
 
 from .exceptions import OasisException
 
+
+# The strings which ``pandas.read_csv`` reads as missing values by default
+CSV_NA_VALUES = frozenset([
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', 'N/A', 'NA', 'NULL', 'NaN', 'n/a', 'nan', 'null'
+])
+
+_CSV_BOOL_VALUES = {'True': True, 'TRUE': True, 'true': True, 'False': False, 'FALSE': False, 'false': False}
+
+
+def as_csv_strings(df):
+    """
+    Returns a copy of a data frame with the values converted to the strings
+    that ``pandas.read_csv`` would read, with ``dtype=object``, from a CSV
+    file written from the frame by ``DataFrame.to_csv`` - missing values, and
+    strings which ``read_csv`` reads as missing values (e.g. empty strings,
+    ``'NA'``, ``'NULL'``), are nulls.
+
+    This is for passing data frames between processing steps in memory with
+    the same values as if they had been written to and read from files.
+    """
+    strs = pd.DataFrame(index=df.index)
+
+    for i, col in enumerate(df.columns):
+        values = df.iloc[:, i]
+        if values.dtype == object:
+            values = values.where(values.isnull(), values.astype(six.text_type))
+        else:
+            values = values.astype(six.text_type).where(values.notnull(), np.nan).astype(object)
+        strs[col] = values.where(~values.isin(list(CSV_NA_VALUES)), np.nan)
+
+    return strs
+
+
+def as_csv_parsed(df):
+    """
+    Returns a copy of a data frame with the values converted to the values,
+    of the column types, that ``pandas.read_csv`` would read, with the
+    default type inference and ``float_precision='high'``, from a CSV file
+    written from the frame by ``DataFrame.to_csv`` - columns of integers are
+    integer columns, columns of numbers, with or without missing values,
+    are float columns, columns of booleans are boolean columns (object
+    columns if they have missing values), and other columns are columns of
+    strings, with nulls for missing values (see ``as_csv_strings``).
+    """
+    parsed = as_csv_strings(df)
+
+    for col in parsed.columns:
+        values = parsed[col]
+        try:
+            parsed[col] = pd.to_numeric(values)
+        except (TypeError, ValueError):
+            non_null = values.dropna()
+            if len(non_null) and non_null.isin(list(_CSV_BOOL_VALUES)).all():
+                values = values.map(_CSV_BOOL_VALUES)
+                parsed[col] = values.astype(bool) if len(non_null) == len(values) else values.where(values.notnull(), np.nan)
+
+    return parsed
+
+
 def get_dataframe(
     src_fp=None,
     src_type='csv',
@@ -25,6 +89,13 @@ def get_dataframe(
     sort_col=None,
     sort_ascending=None
 ):
+    """
+    Loads a data frame from a CSV or JSON file, or a string buffer of such a
+    file, or from a list of records or a data frame - records are loaded with
+    ``dtype=object``, and a data frame is copied with its column types, so
+    that a frame parsed in memory (see ``as_csv_parsed``) is loaded as if it
+    had been read from a file.
+    """
     if not (src_fp or src_buf or src_data is not None):
         raise OasisException(
             'A CSV or JSON file path or a string buffer of such a file or an '
@@ -41,8 +112,10 @@ def get_dataframe(
         df = pd.read_json(src_fp, precise_float=(True if float_precision == 'high' else False))
     elif src_buf and src_type == 'json':
         df = pd.read_json(io.StringIO(src_buf), precise_float=(True if float_precision == 'high' else False))
-    elif src_data and (isinstance(src_data, list) or isinstance(src_data, pd.DataFrame)):
+    elif isinstance(src_data, list):
         df = pd.DataFrame(data=src_data, dtype=object)
+    elif isinstance(src_data, pd.DataFrame):
+        df = src_data.copy()
 
     if lowercase_cols:
         df.columns = df.columns.str.lower()
@@ -2,11 +2,15 @@
 
 __all__ = [
     'get_coverage_level_fm_terms',
+    'get_fm_terms_by_level_as_df',
+    'get_fm_policytc_ids',
     'get_fm_terms_by_level_as_list',
     'get_layer_calcrule_id', 
+    'get_layer_calcrule_ids',
     'get_layer_level_fm_terms',
     'get_policytc_ids',
     'get_sub_layer_calcrule_id',
+    'get_sub_layer_calcrule_ids',
     'get_sub_layer_non_coverage_level_fm_terms',
     'unified_canonical_fm_profile_by_level',
     'unified_canonical_fm_profile_by_level_and_term_group'
@@ -17,6 +21,7 @@ import itertools
 import json
 import six
 
+import numpy as np
 import pandas as pd
 
 from .exceptions import OasisException
@@ -176,40 +181,163 @@ def get_sub_layer_non_coverage_level_fm_terms(level_unified_canonical_profile, l
         yield it
 
 
+def get_fm_terms_by_level_as_df(level_unified_canonical_profile, level_fm_agg_profile, level_fm_items_df, canexp_df, canacc_df):
+    """
+    Columnar equivalent of the level FM terms generators
+    (``get_coverage_level_fm_terms``, ``get_sub_layer_non_coverage_level_fm_terms``
+    and ``get_layer_level_fm_terms``) for a data frame of FM items of a single
+    level. The source canonical exposure/account row of each item is resolved
+    with a single join, and the percentage-of-TIV conversions, calc. rule IDs
+    and aggregation IDs are computed as array expressions.
+
+    Returns a copy of the level FM items frame sorted by the level aggregation
+    key, with the terms, calc. rule IDs and aggregation IDs set, as the
+    generators do. The index of the level FM items frame is preserved.
+    """
+    lufcp = level_unified_canonical_profile
+
+    lfmap = level_fm_agg_profile
+
+    li_df = level_fm_items_df
+
+    level_id = li_df['level_id'].iloc[0]
+
+    cov_level_id = OASIS_FM_LEVELS['coverage']['id']
+    layer_level_id = OASIS_FM_LEVELS['layer']['id']
+
+    if not (level_id == cov_level_id or level_id in range(OASIS_FM_LEVELS['combined']['id'], layer_level_id + 1)):
+        raise OasisException('Invalid FM level ID {} for generating FM terms - expected to be in the range {}...{}'.format(level_id, cov_level_id, layer_level_id))
+
+    agg_key = [v['field'].lower() for v in six.itervalues(lfmap['FMAggKey'])]
+
+    li_df = li_df.sort_values(agg_key, kind='mergesort')
+
+    # The items are sorted by the aggregation key, so the aggregation IDs are
+    # the running count of the key changes (null keys are equal to each other)
+    agg_key_df = li_df[agg_key]
+    prev_agg_key_df = agg_key_df.shift()
+    agg_key_changes = ((agg_key_df != prev_agg_key_df) & ~(agg_key_df.isnull() & prev_agg_key_df.isnull())).any(axis=1).values
+    agg_key_changes[0] = True
+    li_df['agg_id'] = np.cumsum(agg_key_changes)
+
+    get_elm = lambda term_type: lufcp[1][term_type]['ProfileElementName'].lower() if lufcp[1].get(term_type) else None
+
+    if level_id != cov_level_id:
+        li_df['ded_elm'] = get_elm('deductible')
+        li_df['lim_elm'] = get_elm('limit')
+        if level_id == layer_level_id:
+            li_df['shr_elm'] = get_elm('share')
+        else:
+            li_df['ded_min_elm'] = get_elm('deductiblemin')
+            li_df['ded_max_elm'] = get_elm('deductiblemax')
+
+    can_df = pd.merge(canexp_df, canacc_df, left_on='accntnum', right_on='accntnum')
+
+    src_key = ['row_id_x', 'row_id_y', 'policynum']
+
+    term_elms = set(
+        elm for col in ('ded_elm', 'ded_min_elm', 'ded_max_elm', 'lim_elm', 'shr_elm') for elm in li_df[col].unique()
+        if elm in can_df.columns and elm not in src_key
+    )
+
+    can_df = can_df[src_key + sorted(term_elms)].drop_duplicates(subset=src_key)
+    for col in ('row_id_x', 'row_id_y'):
+        can_df[col] = can_df[col].astype(int)
+
+    src_df = pd.merge(
+        pd.DataFrame({
+            'row_id_x': li_df['canexp_id'].values.astype(int) + 1,
+            'row_id_y': li_df['canacc_id'].values.astype(int) + 1,
+            'policynum': li_df['policy_num'].values
+        }),
+        can_df,
+        how='left',
+        on=src_key,
+        indicator=True
+    )
+
+    if (src_df['_merge'] != 'both').any():
+        raise OasisException(
+            'Canonical exposure and account source rows not found for the FM items with (canexp_id, canacc_id, policy_num) in {}'.format(
+                sorted(set(zip(src_df[src_df['_merge'] != 'both']['row_id_x'] - 1, src_df[src_df['_merge'] != 'both']['row_id_y'] - 1, src_df[src_df['_merge'] != 'both']['policynum'])))
+            )
+        )
+
+    def term_values(elm_col):
+        vals = np.zeros(len(li_df))
+        elms = li_df[elm_col].values
+        for elm in term_elms.intersection(elms):
+            mask = elms == elm
+            vals[mask] = src_df[elm].fillna(0).values.astype(float)[mask]
+        return np.nan_to_num(vals)
+
+    tiv = li_df['tiv'].values.astype(float)
+
+    pc_tiv = lambda vals: np.where(vals >= 1, vals, tiv * vals)
+
+    if level_id == layer_level_id:
+        li_df['deductible'] = li_df['attachment'] = term_values('ded_elm')
+        li_df['deductible_min'] = li_df['deductible_max'] = 0.0
+        li_df['limit'] = term_values('lim_elm')
+        li_df['share'] = term_values('shr_elm')
+        li_df['calcrule_id'] = get_layer_calcrule_ids(li_df['attachment'].values, li_df['limit'].values, li_df['share'].values)
+    else:
+        li_df['deductible'] = pc_tiv(term_values('ded_elm'))
+        li_df['deductible_min'] = pc_tiv(term_values('ded_min_elm'))
+        li_df['deductible_max'] = pc_tiv(term_values('ded_max_elm'))
+        li_df['limit'] = pc_tiv(term_values('lim_elm'))
+        if level_id == cov_level_id:
+            li_df['share'] = term_values('shr_elm')
+        li_df['calcrule_id'] = get_sub_layer_calcrule_ids(li_df['deductible'].values, li_df['deductible_min'].values, li_df['deductible_max'].values, li_df['limit'].values)
+
+    return li_df
+
+
 def get_fm_terms_by_level_as_list(level_unified_canonical_profile, level_fm_agg_profile, level_fm_items, canexp_df, canacc_df):
 
-    level_id = level_fm_items[0]['level_id']
+    level_fm_items_df = pd.DataFrame(data=[it for it in six.itervalues(level_fm_items)])
+
+    return get_fm_terms_by_level_as_df(level_unified_canonical_profile, level_fm_agg_profile, level_fm_items_df, canexp_df, canacc_df).to_dict('records')
+
+
+def get_fm_policytc_ids(fm_items_df):
+    """
+    Returns the policytc ID of every FM item, as a series aligned with the FM
+    items frame. Items with the same FM terms (limit, deductible, min. and max.
+    deductible, attachment, share and calc. rule ID) share a policytc ID, and
+    the IDs are numbered in order of the first appearance of the terms.
+    """
+    terms = ['limit', 'deductible', 'deductible_min', 'deductible_max', 'attachment', 'share', 'calcrule_id']
+
+    terms_df = fm_items_df[terms].astype(float)
+
+    # Factorizing each term (nulls get their own code), and then the pairs of
+    # the codes of the terms so far with the codes of the next term, numbers
+    # the combinations of the terms in order of first appearance
+    codes = pd.factorize(terms_df[terms[0]])[0] + 1
+    for t in terms[1:]:
+        t_codes = pd.factorize(terms_df[t])[0] + 1
+        codes = pd.factorize(codes * (t_codes.max() + 1) + t_codes)[0] + 1
+
+    return pd.Series(codes, index=fm_items_df.index)
 
-    if level_id == OASIS_FM_LEVELS['coverage']['id']:
-        return [it for it in get_coverage_level_fm_terms(level_unified_canonical_profile, level_fm_agg_profile, level_fm_items, canexp_df, canacc_df)]
-    elif level_id in range(OASIS_FM_LEVELS['combined']['id'], OASIS_FM_LEVELS['layer']['id']):
-        return [it for it in get_sub_layer_non_coverage_level_fm_terms(level_unified_canonical_profile, level_fm_agg_profile, level_fm_items, canexp_df, canacc_df)]
-    elif level_id == OASIS_FM_LEVELS['layer']['id']:
-        return [it for it in get_layer_level_fm_terms(level_unified_canonical_profile, level_fm_agg_profile, level_fm_items, canexp_df, canacc_df)]
 
 def get_policytc_ids(fm_items_df):
+    """
+    Returns the FM terms of every policytc ID of the FM items (see
+    ``get_fm_policytc_ids``), as a dict keyed by policytc ID.
+    """
+    terms = ['limit', 'deductible', 'deductible_min', 'deductible_max', 'attachment', 'share', 'calcrule_id']
 
-    columns = [
-        col for col in fm_items_df.columns if not col in ('limit', 'deductible', 'deductible_min', 'deductible_max', 'attachment', 'share', 'calcrule_id',)
-    ]
+    policytc_df = fm_items_df[terms].copy()
+    policytc_df['policytc_id'] = get_fm_policytc_ids(fm_items_df)
+    policytc_df = policytc_df.drop_duplicates(subset=['policytc_id'])
 
-    policytc_df = fm_items_df.drop(columns, axis=1).drop_duplicates()
-    
-    for col in policytc_df.columns:
+    for col in terms:
         policytc_df[col] = policytc_df[col].astype(float) if col != 'calcrule_id' else policytc_df[col].astype(int)
 
-    policytc_df['index'] = range(1, len(policytc_df) + 1)
-
     policytc_ids = {
-        i: {
-            'limit': policytc_df.iloc[i - 1]['limit'],
-            'deductible': policytc_df.iloc[i - 1]['deductible'],
-            'deductible_min': policytc_df.iloc[i - 1]['deductible_min'],
-            'deductible_max': policytc_df.iloc[i - 1]['deductible_max'],
-            'attachment': policytc_df.iloc[i - 1]['attachment'],
-            'share': policytc_df.iloc[i - 1]['share'],
-            'calcrule_id': int(policytc_df.iloc[i - 1]['calcrule_id'])
-        } for i in policytc_df['index']
+        it['policytc_id']: {k: it[k] for k in terms} for it in policytc_df.to_dict('records')
     }
 
     return policytc_ids
@@ -221,6 +349,16 @@ def get_layer_calcrule_id(att=0, lim=9999999999, shr=1):
         return 2
 
 
+def get_layer_calcrule_ids(att, lim, shr):
+    """
+    Array version of ``get_layer_calcrule_id`` - items with no matching calc.
+    rule get a ``NaN`` calc. rule ID.
+    """
+    att, lim, shr = (np.asarray(a, dtype=float) for a in (att, lim, shr))
+
+    return np.where((att > 0) | (lim > 0) | (shr > 0), 2, np.nan)
+
+
 def get_sub_layer_calcrule_id(ded, ded_min, ded_max, lim, ded_code=0, lim_code=0):
 
     if ded == ded_code == ded_min == ded_max == lim == lim_code == 0:
@@ -257,6 +395,39 @@ def get_sub_layer_calcrule_id(ded, ded_min, ded_max, lim, ded_code=0, lim_code=0
         return 21
 
 
+def get_sub_layer_calcrule_ids(ded, ded_min, ded_max, lim, ded_code=0, lim_code=0):
+    """
+    Array version of ``get_sub_layer_calcrule_id`` - items with no matching
+    calc. rule get a ``NaN`` calc. rule ID.
+    """
+    ded, ded_min, ded_max, lim, ded_code, lim_code = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (ded, ded_min, ded_max, lim, ded_code, lim_code)))
+
+    ded_zero = (ded == 0) & (ded_code == 0)
+    ded_min_max_zero = (ded_min == 0) & (ded_max == 0)
+    lim_zero = (lim == 0) & (lim_code == 0)
+
+    conds_and_ids = [
+        (ded_zero & ded_min_max_zero & lim_zero, 12),
+        ((ded > 0) & (ded_code == 0) & ded_min_max_zero & (lim > 0) & (lim_code == 0), 1),
+        ((ded > 0) & (ded_code == 2) & ded_min_max_zero & (lim > 0) & (lim_code == 0), 4),
+        ((ded > 0) & (ded_code == 1) & ded_min_max_zero & (lim > 0) & (lim_code == 1), 5),
+        ((ded > 0) & (ded_code == 2) & ded_min_max_zero & lim_zero, 6),
+        (ded_zero & (ded_min == 0) & (ded_max > 0) & (lim > 0) & (lim_code == 0), 7),
+        (ded_zero & (ded_min > 0) & (ded_max == 0) & (lim > 0) & (lim_code == 0), 8),
+        (ded_zero & (ded_min == 0) & (ded_max > 0) & lim_zero, 10),
+        (ded_zero & (ded_min > 0) & (ded_max == 0) & lim_zero, 11),
+        ((ded > 0) & (ded_code == 0) & ded_min_max_zero & lim_zero, 12),
+        (ded_zero & (ded_min > 0) & (ded_max > 0) & lim_zero, 13),
+        (ded_zero & ded_min_max_zero & (lim > 0) & (lim_code == 0), 14),
+        (ded_zero & ded_min_max_zero & (lim > 0) & (lim_code == 1), 15),
+        ((ded > 0) & (ded_code == 1) & ded_min_max_zero & lim_zero, 16),
+        ((ded > 0) & (ded_code == 1) & (ded_min > 0) & (ded_max > 0) & lim_zero, 19),
+        ((ded > 0) & (ded_code == 2) & (ded_min > 0) & (ded_max > 0) & lim_zero, 21),
+    ]
+
+    return np.select([c for c, _ in conds_and_ids], [i for _, i in conds_and_ids], default=np.nan)
+
+
 def unified_canonical_fm_profile_by_level(profiles=[], profile_paths=[]):
 
     if not (profiles or profile_paths):
@@ -3,11 +3,17 @@
 __all__ = [
     'DEFAULT_RTREE_INDEX_PROPS',
     'generate_index_entries',
+    'get_bounds_containment',
     'get_peril_areas',
     'get_peril_areas_index',
     'get_rtree_index',
     'PerilArea',
+    'PERIL_AREAS_ARRAYS_EXTENSION',
+    'PERIL_AREAS_ARRAYS_MAGIC',
+    'PerilAreasArrays',
+    'PerilAreasGrid',
     'PerilAreasIndex',
+    'PERIL_AREAS_GRID_EXTENSION',
     'PERIL_ID_FLOOD',
     'PERIL_ID_QUAKE',
     'PERIL_ID_SURGE',
@@ -17,14 +23,18 @@ __all__ = [
 import builtins
 import copy
 import io
+import itertools
 import json
+import numbers
 import os
 import re
+import struct
 import types
 import uuid
 
 from collections import OrderedDict
 
+import numpy as np
 import rtree
 
 from rtree.index import (
@@ -50,6 +60,11 @@ import six
 
 from six.moves import cPickle as cpickle
 
+from .binfile import (
+    read_binary_file_header,
+    replacing_file,
+    write_binary_file_header,
+)
 from .exceptions import OasisException
 from .data import get_dataframe
 
@@ -59,6 +74,10 @@ PERIL_ID_SURGE = 2
 PERIL_ID_QUAKE = 3
 PERIL_ID_FLOOD = 4
 
+PERIL_AREAS_ARRAYS_EXTENSION = 'areas'
+PERIL_AREAS_ARRAYS_MAGIC = b'OASISPAA'
+PERIL_AREAS_GRID_EXTENSION = 'grid'
+
 DEFAULT_RTREE_INDEX_PROPS = {
     'buffering_capacity': 10,
     'custom_storage_callbacks': None,
@@ -96,6 +115,97 @@ def generate_index_entries(items, objects=None):
             yield key, poly_bounds, None
 
 
+def get_bounds_containment(xs, ys, bounds, max_cells_per_area=16):
+    """
+    Bulk point-in-bounds query for arrays of point x and y coordinates and an
+    array of area bounds ``(minx, miny, maxx, maxy)`` - returns a pair of
+    arrays ``(counts, positions)``, where ``counts[i]`` is the number of areas
+    whose (closed) bounds contain point ``i``, and ``positions[i]`` is the
+    position in ``bounds`` of one of these areas, or -1 if there are none.
+
+    Candidate areas for the points are found by bucketing the areas and the
+    points in a regular grid whose cell size is the median area size. Areas
+    spanning more than ``max_cells_per_area`` grid cells are tested directly
+    against all the points.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 4)
+
+    counts = np.zeros(len(xs), dtype=np.int64)
+    positions = np.full(len(xs), -1, dtype=np.int64)
+
+    if not (len(xs) and len(bounds)):
+        return counts, positions
+
+    minx, miny, maxx, maxy = bounds.T
+    x0, y0 = minx.min(), miny.min()
+
+    # The cells are at least 1/(16 n) of the extent of the areas, so that
+    # the cell numbers of very small or degenerate areas do not overflow
+    max_cells = 16 * len(bounds)
+
+    cell_w = np.median(maxx - minx)
+    if not cell_w > 0:
+        cell_w = (maxx.max() - x0) / np.sqrt(len(bounds))
+    cell_w = max(cell_w, (maxx.max() - x0) / max_cells) or 1.0
+    cell_h = np.median(maxy - miny)
+    if not cell_h > 0:
+        cell_h = (maxy.max() - y0) / np.sqrt(len(bounds))
+    cell_h = max(cell_h, (maxy.max() - y0) / max_cells) or 1.0
+
+    ix0 = np.floor((minx - x0) / cell_w).astype(np.int64)
+    ix1 = np.floor((maxx - x0) / cell_w).astype(np.int64)
+    iy0 = np.floor((miny - y0) / cell_h).astype(np.int64)
+    iy1 = np.floor((maxy - y0) / cell_h).astype(np.int64)
+    nx, ny = ix1.max() + 1, iy1.max() + 1
+
+    widths = ix1 - ix0 + 1
+    spans = widths * (iy1 - iy0 + 1)
+
+    def contained(pts, areas):
+        return (minx[areas] <= xs[pts]) & (xs[pts] <= maxx[areas]) & (miny[areas] <= ys[pts]) & (ys[pts] <= maxy[areas])
+
+    all_pts = np.arange(len(xs))
+    for area in np.flatnonzero(spans > max_cells_per_area):
+        pts = all_pts[contained(all_pts, area)]
+        counts[pts] += 1
+        positions[pts] = area
+
+    areas = np.flatnonzero(spans <= max_cells_per_area)
+    if not len(areas):
+        return counts, positions
+
+    # Expand the areas into the grid cells they overlap, keyed by cell number
+    reps = spans[areas]
+    area_cells = np.repeat(areas, reps)
+    offsets = np.arange(reps.sum()) - np.repeat(np.cumsum(reps) - reps, reps)
+    cell_keys = (ix0[area_cells] + offsets % widths[area_cells]) * ny + (iy0[area_cells] + offsets // widths[area_cells])
+    order = np.argsort(cell_keys, kind='mergesort')
+    cell_keys, area_cells = cell_keys[order], area_cells[order]
+
+    # Match the points to the candidate areas in their cells
+    pix = np.floor((xs - x0) / cell_w)
+    piy = np.floor((ys - y0) / cell_h)
+    in_grid = (pix >= 0) & (pix < nx) & (piy >= 0) & (piy < ny)
+    pts = all_pts[in_grid]
+    pt_keys = pix[in_grid].astype(np.int64) * ny + piy[in_grid].astype(np.int64)
+
+    lo = np.searchsorted(cell_keys, pt_keys, side='left')
+    num_candidates = np.searchsorted(cell_keys, pt_keys, side='right') - lo
+    pts = np.repeat(pts, num_candidates)
+    candidates = area_cells[
+        np.repeat(lo, num_candidates) + np.arange(num_candidates.sum()) - np.repeat(np.cumsum(num_candidates) - num_candidates, num_candidates)
+    ]
+
+    is_contained = contained(pts, candidates)
+    pts, candidates = pts[is_contained], candidates[is_contained]
+    counts += np.bincount(pts, minlength=len(xs))
+    positions[pts] = candidates
+
+    return counts, positions
+
+
 def get_peril_areas(areas):
     for peril_id, coverage_type, peril_area_id, coordinates, other_props in areas:
         yield PerilArea(coordinates, peril_id=peril_id, coverage_type=coverage_type, peril_area_id=peril_area_id, **other_props)
@@ -181,6 +291,357 @@ class PerilArea(Polygon):
         return self._id
 
 
+class PerilAreasArrays(object):
+    """
+    Columnar store of peril areas for Rtree file indexes whose entry IDs are
+    the positions of the areas in the store, rather than entries with
+    pickled ``(peril ID, coverage type, area peril ID, bounds, coordinates)``
+    objects.
+
+    The peril IDs, coverage types and area peril IDs are fixed-width integer
+    arrays, so index query results can be filtered by peril ID and coverage
+    type without unpickling anything, and the bounds are a float array. The
+    polygon coordinates of all the areas are a single ragged array of (x, y)
+    pairs, with an array of the offsets of the coordinates of each area, and
+    the coordinates of an area are only read when the area is fetched.
+
+    The store is written to a binary file (the magic bytes
+    ``PERIL_AREAS_ARRAYS_MAGIC``, the length of a JSON header as a
+    little-endian 8-byte unsigned integer, the JSON header with the number
+    of areas and of coordinates, and the arrays as little-endian 8-byte
+    integers or floats) which is loaded as read-only memory maps, so that
+    the pages are shared by all the processes using the index.
+    """
+
+    _arrays = (
+        ('peril_ids', '<i8', 1),
+        ('coverage_types', '<i8', 1),
+        ('area_peril_ids', '<i8', 1),
+        ('bounds', '<f8', 4),
+        ('coords_offsets', '<i8', 1),
+        ('coords', '<f8', 2),
+    )
+
+    def __init__(self, peril_ids, coverage_types, area_peril_ids, bounds, coords_offsets, coords):
+        self.peril_ids = peril_ids
+        self.coverage_types = coverage_types
+        self.area_peril_ids = area_peril_ids
+        self.bounds = bounds
+        self.coords_offsets = coords_offsets
+        self.coords = coords
+
+    def __len__(self):
+        return len(self.peril_ids)
+
+    def __getitem__(self, i):
+        """
+        Returns the area at position ``i`` as a ``(peril ID, coverage type,
+        area peril ID, bounds, coordinates)`` tuple, as stored in the objects
+        of Rtree indexes without a columnar store.
+        """
+        start, end = self.coords_offsets[i], self.coords_offsets[i + 1]
+        return (
+            int(self.peril_ids[i]),
+            int(self.coverage_types[i]),
+            int(self.area_peril_ids[i]),
+            tuple(self.bounds[i].tolist()),
+            tuple(tuple(c) for c in self.coords[start:end].tolist())
+        )
+
+    def find(self, positions, peril_id, coverage_type):
+        """
+        Returns the first of the given area positions (e.g. the IDs returned
+        by an index query) whose area has the given peril ID and coverage
+        type, or ``None`` if there is none.
+        """
+        positions = np.fromiter(positions, dtype=np.int64)
+        matches = np.flatnonzero((self.peril_ids[positions] == peril_id) & (self.coverage_types[positions] == coverage_type))
+        return int(positions[matches[0]]) if len(matches) else None
+
+    @classmethod
+    def create(cls, peril_areas):
+        """
+        Creates a store from a sequence of peril areas - objects with
+        ``peril_id``, ``coverage_type``, ``id``, ``bounds`` and
+        ``coordinates`` attributes, such as ``PerilArea`` objects.
+        """
+        peril_areas = list(peril_areas)
+
+        for pa in peril_areas:
+            if not all(isinstance(v, numbers.Integral) and not isinstance(v, bool) for v in (pa.peril_id, pa.coverage_type, pa.id)):
+                raise OasisException(
+                    'Invalid peril areas for a columnar store: non-integer peril ID, coverage type or area peril ID for area {}'.format(pa.id)
+                )
+
+        try:
+            peril_ids = np.array([pa.peril_id for pa in peril_areas], dtype=np.int64)
+            coverage_types = np.array([pa.coverage_type for pa in peril_areas], dtype=np.int64)
+            area_peril_ids = np.array([pa.id for pa in peril_areas], dtype=np.int64)
+            bounds = np.array([tuple(pa.bounds) for pa in peril_areas], dtype=np.float64).reshape(-1, 4)
+            num_coords = np.array([len(pa.coordinates) for pa in peril_areas], dtype=np.int64)
+            coords = np.array([c for pa in peril_areas for c in pa.coordinates], dtype=np.float64).reshape(-1, 2)
+        except (TypeError, ValueError, OverflowError) as e:
+            raise OasisException('Invalid peril areas for a columnar store: {}'.format(e))
+
+        coords_offsets = np.zeros(len(peril_areas) + 1, dtype=np.int64)
+        np.cumsum(num_coords, out=coords_offsets[1:])
+
+        return cls(peril_ids, coverage_types, area_peril_ids, bounds, coords_offsets, coords)
+
+    def save(self, fp):
+        """
+        Writes the store to a binary file - the file is first written to a
+        temporary file in the same directory, which then replaces any
+        existing file.
+        """
+        try:
+            with replacing_file(fp) as f:
+                write_binary_file_header(f, PERIL_AREAS_ARRAYS_MAGIC, {'size': len(self), 'num_coords': len(self.coords)})
+                for name, dtype, _ in self._arrays:
+                    f.write(np.asarray(getattr(self, name), dtype=dtype).tobytes())
+        except (IOError, OSError) as e:
+            raise OasisException(e)
+
+        return fp
+
+    @classmethod
+    def load(cls, fp):
+        """
+        Loads a store from a file written by ``save``, as memory maps.
+        """
+        try:
+            with io.open(fp, 'rb') as f:
+                header, offset = read_binary_file_header(f, PERIL_AREAS_ARRAYS_MAGIC, 'peril areas arrays')
+
+            lengths = {
+                'peril_ids': header['size'], 'coverage_types': header['size'], 'area_peril_ids': header['size'],
+                'bounds': header['size'], 'coords_offsets': header['size'] + 1, 'coords': header['num_coords']
+            }
+
+            arrays = {}
+            for name, dtype, width in cls._arrays:
+                shape = (lengths[name], width) if width > 1 else (lengths[name],)
+                arrays[name] = (
+                    np.memmap(fp, dtype=dtype, mode='r', offset=offset, shape=shape).view(np.ndarray) if lengths[name]
+                    else np.zeros(shape, dtype=dtype)
+                )
+                offset += 8 * width * lengths[name]
+        except (IOError, OSError, KeyError, ValueError, struct.error) as e:
+            raise OasisException(e)
+
+        return cls(**arrays)
+
+
+class PerilAreasGrid(object):
+    """
+    Compact index of peril areas which lie in the cells of a regular lon/lat
+    grid, at most one area per cell for each (peril ID, coverage type) pair.
+
+    The grid is defined by the coordinates of its origin (the lower left
+    corner), its cell width and height, and its number of columns and rows.
+    For each (peril ID, coverage type) pair the index stores the IDs and
+    bounds of the areas, and the position of the area of each grid cell in
+    these (-1 for cells without an area), so that the cells containing an
+    array of points are found with O(1) arithmetic per point.
+    """
+
+    def __init__(self, x_origin, y_origin, cell_width, cell_height, num_cols, num_rows, areas=None):
+        self.x_origin = float(x_origin)
+        self.y_origin = float(y_origin)
+        self.cell_width = float(cell_width)
+        self.cell_height = float(cell_height)
+        self.num_cols = int(num_cols)
+        self.num_rows = int(num_rows)
+
+        # (peril ID, coverage type) keyed dict of triples of arrays of the
+        # area positions of the cells, the area IDs and the area bounds
+        self._areas = areas or OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._areas
+
+    def keys(self):
+        return list(six.iterkeys(self._areas))
+
+    def area_ids(self, peril_id, coverage_type):
+        return self._areas[(peril_id, coverage_type)][1]
+
+    def area_bounds(self, peril_id, coverage_type):
+        return self._areas[(peril_id, coverage_type)][2]
+
+    @classmethod
+    def create(cls, areas, spec=None, tolerance=1e-6, max_cells_per_area=16):
+        """
+        Creates a grid index for a sequence of peril areas given as
+        ``(peril ID, coverage type, area peril ID, bounds)`` tuples.
+
+        If a grid ``spec`` dict is given, with the keys ``x_origin``,
+        ``y_origin``, ``cell_width`` and ``cell_height``, the areas are
+        assigned to the cells of this grid, and an ``OasisException`` is
+        raised if they do not fit it. Otherwise the grid is detected from the
+        area bounds, and ``None`` is returned if the areas do not form a
+        regular grid.
+
+        Areas fit a grid if each area lies within a single cell, up to a
+        ``tolerance`` fraction of the cell size, and no two areas with the
+        same peril ID and coverage type are in the same cell. The grid must
+        also have at most ``max_cells_per_area`` cells per area, so that the
+        index remains compact.
+        """
+        areas = list(areas)
+        if not areas:
+            if spec:
+                raise OasisException('No peril areas to create the grid index from')
+            return
+
+        keys = np.array([(peril_id, coverage_type) for peril_id, coverage_type, _, _ in areas], dtype=np.int64)
+        ids = np.array([area_id for _, _, area_id, _ in areas], dtype=np.int64)
+        bounds = np.array([tuple(b) for _, _, _, b in areas], dtype=np.float64).reshape(-1, 4)
+        minx, miny, maxx, maxy = bounds.T
+
+        def fail(msg):
+            if spec:
+                raise OasisException('The peril areas do not fit the declared grid: {}'.format(msg))
+
+        if spec:
+            try:
+                x0, y0 = float(spec['x_origin']), float(spec['y_origin'])
+                dx, dy = float(spec['cell_width']), float(spec['cell_height'])
+            except (KeyError, TypeError, ValueError) as e:
+                raise OasisException('Invalid peril areas grid spec {}: {}'.format(spec, e))
+            if not (dx > 0 and dy > 0):
+                raise OasisException('Invalid peril areas grid spec {}: the cell width and height must be positive'.format(spec))
+        else:
+            x0, y0 = minx.min(), miny.min()
+            dx, dy = cls._get_spacing(minx, maxx - minx, tolerance), cls._get_spacing(miny, maxy - miny, tolerance)
+            if not (dx and dy):
+                return
+
+        cols = np.floor(((minx + maxx) / 2 - x0) / dx).astype(np.int64)
+        rows = np.floor(((miny + maxy) / 2 - y0) / dy).astype(np.int64)
+
+        tol_x, tol_y = tolerance * dx, tolerance * dy
+        if not (
+            (cols >= 0).all() and (rows >= 0).all() and
+            (minx >= x0 + cols * dx - tol_x).all() and (maxx <= x0 + (cols + 1) * dx + tol_x).all() and
+            (miny >= y0 + rows * dy - tol_y).all() and (maxy <= y0 + (rows + 1) * dy + tol_y).all()
+        ):
+            return fail('not all areas lie within a single grid cell')
+
+        num_cols, num_rows = cols.max() + 1, rows.max() + 1
+        if num_cols * num_rows > max_cells_per_area * len(areas):
+            return fail('the grid has more than {} cells per area'.format(max_cells_per_area))
+
+        cells = cols * num_rows + rows
+
+        grid_areas = OrderedDict()
+        for key in sorted(set(map(tuple, keys.tolist()))):
+            key_areas = np.flatnonzero((keys[:, 0] == key[0]) & (keys[:, 1] == key[1]))
+            key_cells = cells[key_areas]
+            if len(np.unique(key_cells)) < len(key_cells):
+                return fail('several areas with peril ID {} and coverage type {} are in the same grid cell'.format(*key))
+            area_positions = np.full(num_cols * num_rows, -1, dtype=np.int32)
+            area_positions[key_cells] = np.arange(len(key_areas), dtype=np.int32)
+            grid_areas[key] = (area_positions, ids[key_areas], bounds[key_areas])
+
+        return cls(x0, y0, dx, dy, num_cols, num_rows, areas=grid_areas)
+
+    @staticmethod
+    def _get_spacing(mins, sizes, tolerance):
+        """
+        Returns the grid spacing of a set of area lower bounds (and sizes)
+        along an axis, or ``None`` if the lower bounds are not regularly
+        spaced.
+        """
+        starts = np.unique(mins)
+        if len(starts) == 1:
+            return sizes.max() or None
+
+        extent = starts[-1] - starts[0]
+        num_steps = int(round(extent / np.diff(starts).min()))
+        spacing = extent / num_steps
+
+        steps = (starts - starts[0]) / spacing
+        if np.abs(steps - np.round(steps)).max() > tolerance:
+            return
+
+        return spacing
+
+    def get_bounds_containment(self, xs, ys, peril_id, coverage_type):
+        """
+        Bulk point-in-bounds query for the areas of the grid with the given
+        peril ID and coverage type - the same as ``get_bounds_containment``
+        with the area bounds of the grid, but only the cells around the cell
+        of each point are searched.
+        """
+        area_positions, _, bounds = self._areas[(peril_id, coverage_type)]
+
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+
+        counts = np.zeros(len(xs), dtype=np.int64)
+        positions = np.full(len(xs), -1, dtype=np.int64)
+
+        cols = np.floor((xs - self.x_origin) / self.cell_width)
+        rows = np.floor((ys - self.y_origin) / self.cell_height)
+
+        # The areas only overlap their cells' neighbours by the grid tolerance
+        for dc, dr in itertools.product((-1, 0, 1), (-1, 0, 1)):
+            c, r = cols + dc, rows + dr
+            pts = np.flatnonzero((c >= 0) & (c < self.num_cols) & (r >= 0) & (r < self.num_rows))
+            areas = area_positions[c[pts].astype(np.int64) * self.num_rows + r[pts].astype(np.int64)]
+            pts, areas = pts[areas >= 0], areas[areas >= 0]
+            is_contained = (
+                (bounds[areas, 0] <= xs[pts]) & (xs[pts] <= bounds[areas, 2]) &
+                (bounds[areas, 1] <= ys[pts]) & (ys[pts] <= bounds[areas, 3])
+            )
+            pts, areas = pts[is_contained], areas[is_contained]
+            counts[pts] += 1
+            positions[pts] = areas
+
+        return counts, positions
+
+    def save(self, fp):
+        """
+        Writes the grid index to a (NumPy ``.npz``) file - the file is first
+        written to a temporary file in the same directory, which then replaces
+        any existing file.
+        """
+        arrays = {
+            'spec': np.array([self.x_origin, self.y_origin, self.cell_width, self.cell_height, self.num_cols, self.num_rows], dtype=np.float64),
+            'keys': np.array(self.keys(), dtype=np.int64).reshape(-1, 2)
+        }
+        for i, (area_positions, ids, bounds) in enumerate(six.itervalues(self._areas)):
+            arrays['area_positions_{}'.format(i)] = area_positions
+            arrays['ids_{}'.format(i)] = ids
+            arrays['bounds_{}'.format(i)] = bounds
+
+        try:
+            with replacing_file(fp) as f:
+                np.savez(f, **arrays)
+        except (IOError, OSError) as e:
+            raise OasisException(e)
+
+        return fp
+
+    @classmethod
+    def load(cls, fp):
+        """
+        Loads a grid index from a file written by ``save``.
+        """
+        try:
+            with np.load(fp) as arrays:
+                x0, y0, dx, dy, num_cols, num_rows = arrays['spec'].tolist()
+                areas = OrderedDict(
+                    (tuple(key), (arrays['area_positions_{}'.format(i)], arrays['ids_{}'.format(i)], arrays['bounds_{}'.format(i)]))
+                    for i, key in enumerate(arrays['keys'].tolist())
+                )
+        except (IOError, OSError, KeyError, ValueError) as e:
+            raise OasisException(e)
+
+        return cls(x0, y0, dx, dy, num_cols, num_rows, areas=areas)
+
+
 class PerilAreasIndex(RTreeIndex):
 
     def __init__(self, *args, **kwargs):
@@ -211,6 +672,10 @@ class PerilAreasIndex(RTreeIndex):
                     kwargs['properties'] = RTreeIndexProperty(**props)
 
                 super(self.__class__, self).__init__(_idx_fp, *args, **kwargs)
+
+                arrays_fp = '{}.{}'.format(_idx_fp, PERIL_AREAS_ARRAYS_EXTENSION)
+                if os.path.exists(arrays_fp):
+                    self._area_arrays = PerilAreasArrays.load(arrays_fp)
             else:
                 self._peril_areas = OrderedDict({
                     pa.id:pa for pa in (peril_areas if peril_areas else self._get_peril_areas(areas))
@@ -249,6 +714,15 @@ class PerilAreasIndex(RTreeIndex):
     def peril_areas(self):
         return self._peril_areas
 
+    @property
+    def area_arrays(self):
+        """
+        Columnar store of the peril areas of a file index written with one
+        (see ``save``), whose entry IDs are the positions of the areas in the
+        store - ``None`` for indexes with pickled area objects.
+        """
+        return getattr(self, '_area_arrays', None)
+
     @property
     def stream(self):
         if self._peril_areas:
@@ -272,8 +746,20 @@ class PerilAreasIndex(RTreeIndex):
         area_reg_poly_radius=0.00166,
         static_props={},
         index_fp=None,
-        index_props=copy.deepcopy(DEFAULT_RTREE_INDEX_PROPS)
+        index_props=copy.deepcopy(DEFAULT_RTREE_INDEX_PROPS),
+        grid_spec=None,
+        detect_grid=True
     ):
+        """
+        Creates and writes an Rtree file index of the peril areas in a peril
+        areas (area peril) file, and returns the index file path.
+
+        If the peril areas form a regular grid - given by the ``grid_spec``
+        dict (see ``PerilAreasGrid.create``), or detected from the areas if
+        ``detect_grid`` is set - a grid index of the areas is also written to
+        the file with the index file path and the extension
+        ``PERIL_AREAS_GRID_EXTENSION``, for fast bulk lookups.
+        """
         if not src_fp:
             raise OasisException(
                 'An areas source CSV or JSON file path must be provided'
@@ -334,6 +820,19 @@ class PerilAreasIndex(RTreeIndex):
         if not os.path.isabs(_index_fp):
             _index_fp = os.path.abspath(_index_fp)
 
+        grid_fp = '{}.{}'.format(_index_fp, PERIL_AREAS_GRID_EXTENSION)
+        if os.path.exists(grid_fp):
+            os.remove(grid_fp)
+
+        if grid_spec or detect_grid:
+            peril_areas = list(peril_areas)
+            grid = PerilAreasGrid.create(
+                ((pa.peril_id, pa.coverage_type, pa.id, pa.bounds) for pa in peril_areas),
+                spec=grid_spec
+            )
+            if grid:
+                grid.save(grid_fp)
+
         try:
             return cls().save(
                 _index_fp,
@@ -347,8 +846,21 @@ class PerilAreasIndex(RTreeIndex):
         self,
         index_fp,
         peril_areas=None,
-        index_props=DEFAULT_RTREE_INDEX_PROPS
+        index_props=DEFAULT_RTREE_INDEX_PROPS,
+        area_arrays=True
     ):
+        """
+        Writes an Rtree file index of peril areas, and returns the index file
+        path.
+
+        By default the areas are written to a columnar store (see
+        ``PerilAreasArrays``) in the file with the index file path and the
+        extension ``PERIL_AREAS_ARRAYS_EXTENSION``, and the index entry IDs
+        are the positions of the areas in the store. Otherwise, or if the
+        area IDs are not integers, each index entry stores a pickled
+        ``(peril ID, coverage type, area peril ID, bounds, coordinates)``
+        tuple.
+        """
         _index_fp = index_fp
 
         if not os.path.isabs(_index_fp):
@@ -357,6 +869,10 @@ class PerilAreasIndex(RTreeIndex):
         if os.path.exists(_index_fp):
             os.remove(_index_fp)
 
+        arrays_fp = '{}.{}'.format(_index_fp, PERIL_AREAS_ARRAYS_EXTENSION)
+        if os.path.exists(arrays_fp):
+            os.remove(arrays_fp)
+
         class myindex(RTreeIndex):
             def __init__(self, *args, **kwargs):
                 self.protocol = (2 if six.sys.version_info[0] < 3 else cpickle.HIGHEST_PROTOCOL)
@@ -388,8 +904,21 @@ class PerilAreasIndex(RTreeIndex):
             elif (isinstance(peril_areas, dict)):
                 peril_areas_seq = six.itervalues(peril_areas)
 
-            for pa in peril_areas_seq:
-                index.insert(pa.id, pa.bounds, obj=(pa.peril_id, pa.coverage_type, pa.id, pa.bounds, pa.coordinates))
+            arrays = None
+            if area_arrays:
+                peril_areas_seq = list(peril_areas_seq)
+                try:
+                    arrays = PerilAreasArrays.create(peril_areas_seq)
+                except OasisException:
+                    arrays = None
+
+            if arrays is not None:
+                for i, pa in enumerate(peril_areas_seq):
+                    index.insert(i, pa.bounds)
+                arrays.save(arrays_fp)
+            else:
+                for pa in peril_areas_seq:
+                    index.insert(pa.id, pa.bounds, obj=(pa.peril_id, pa.coverage_type, pa.id, pa.bounds, pa.coordinates))
 
             index.close()
         except (IOError, OSError, RTreeError) as e:
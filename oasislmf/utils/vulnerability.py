@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+
+__all__ = [
+    'VULNERABILITIES_INDEX_MAGIC',
+    'VulnerabilitiesIndex'
+]
+
+import io
+import numbers
+import struct
+
+import numpy as np
+
+from .binfile import (
+    read_binary_file_header,
+    replacing_file,
+    write_binary_file_header,
+)
+from .exceptions import OasisException
+
+
+VULNERABILITIES_INDEX_MAGIC = b'OASISVLN'
+
+
+class VulnerabilitiesIndex(object):
+    """
+    Compact index of vulnerability IDs keyed by tuples of integer key column
+    values (e.g. peril ID, coverage type, occupancy code), which can replace
+    the dict of vulnerabilities of the vulnerability lookup.
+
+    The key tuples are packed into single 64-bit integers (a mixed radix
+    encoding of the key values relative to their minimum values), which are
+    stored sorted, with the vulnerability IDs, in two NumPy arrays, so that
+    lookups are binary searches, and batches of lookups are vectorized. The
+    index can be written to a binary file which is loaded as memory maps,
+    so that the index pages are shared by all the processes using the file.
+
+    The file consists of the magic bytes ``VULNERABILITIES_INDEX_MAGIC``,
+    the length of a JSON header (a little-endian 8-byte unsigned integer),
+    the JSON header with the key columns, the minimum key values, the key
+    value ranges and the size of the index, and then the packed keys and the
+    vulnerability IDs as little-endian 8-byte integers.
+    """
+
+    def __init__(self, key_cols, key_mins, key_ranges, keys, vulnerability_ids):
+        self._key_cols = tuple(key_cols)
+        self._key_mins = tuple(int(m) for m in key_mins)
+        self._key_ranges = tuple(int(r) for r in key_ranges)
+
+        multipliers = []
+        multiplier = 1
+        for key_range in reversed(self._key_ranges):
+            multipliers.insert(0, multiplier)
+            multiplier *= key_range
+        if multiplier > np.iinfo(np.int64).max:
+            raise OasisException('The vulnerability key value ranges are too large to pack the keys into 64-bit integers')
+        self._multipliers = tuple(multipliers)
+
+        self._keys = keys
+        self._vulnerability_ids = vulnerability_ids
+
+    def __len__(self):
+        return len(self._keys)
+
+    @property
+    def key_cols(self):
+        return self._key_cols
+
+    @classmethod
+    def create(cls, key_cols, key_values, vulnerability_ids):
+        """
+        Creates an index from a sequence of arrays of the values of the key
+        columns and an array of the corresponding vulnerability IDs - the
+        values must be integers. If a key occurs more than once, the last
+        vulnerability ID for the key is used.
+        """
+        try:
+            key_values = [np.asarray(values).astype(np.int64) for values in key_values]
+            vulnerability_ids = np.asarray(vulnerability_ids).astype(np.int64)
+        except (OverflowError, TypeError, ValueError) as e:
+            raise OasisException('Invalid vulnerability key or ID values: {}'.format(e))
+
+        if len(key_values) != len(key_cols):
+            raise OasisException('The number of key value arrays does not match the number of key columns')
+
+        key_mins = [int(values.min()) if len(values) else 0 for values in key_values]
+        key_ranges = [int(values.max()) - m + 1 if len(values) else 1 for values, m in zip(key_values, key_mins)]
+
+        index = cls(key_cols, key_mins, key_ranges, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+
+        keys = index._pack(key_values)
+
+        # Stable sort, so that the last of any duplicate keys is kept
+        order = np.argsort(keys, kind='mergesort')
+        keys, vulnerability_ids = keys[order], vulnerability_ids[order]
+        last = np.ones(len(keys), dtype=bool)
+        last[:-1] = keys[1:] != keys[:-1]
+
+        index._keys, index._vulnerability_ids = keys[last], vulnerability_ids[last]
+
+        return index
+
+    @classmethod
+    def create_from_dataframe(cls, vulns_df, key_cols, vulnerability_id_col):
+        """
+        Creates an index from a vulnerabilities data frame with the given key
+        and vulnerability ID columns.
+        """
+        return cls.create(
+            key_cols,
+            [vulns_df[col].values for col in key_cols],
+            vulns_df[vulnerability_id_col].values
+        )
+
+    def _pack(self, key_values):
+        keys = np.zeros(len(key_values[0]) if key_values else 0, dtype=np.int64)
+        for values, key_min, multiplier in zip(key_values, self._key_mins, self._multipliers):
+            keys += (values - key_min) * multiplier
+        return keys
+
+    def get_vulnerability_ids(self, key_values, missing=-1):
+        """
+        Vectorized lookup of the vulnerability IDs of a batch of keys, given
+        as a sequence of arrays of the values of the key columns - returns an
+        array of the IDs, with ``missing`` for keys which are not in the
+        index. Non-integer key values do not match any keys.
+        """
+        key_values = [np.asarray(values, dtype=np.float64) for values in key_values]
+        size = len(key_values[0]) if key_values else 0
+
+        found = np.ones(size, dtype=bool)
+        for values, key_min, key_range in zip(key_values, self._key_mins, self._key_ranges):
+            with np.errstate(invalid='ignore'):
+                found &= (values == np.floor(values)) & (values >= key_min) & (values < key_min + key_range)
+
+        vulnerability_ids = np.full(size, missing, dtype=np.int64)
+        if not (found.any() and len(self._keys)):
+            return vulnerability_ids
+
+        keys = self._pack([values[found].astype(np.int64) for values in key_values])
+        positions = np.minimum(np.searchsorted(self._keys, keys), len(self._keys) - 1)
+        matched = self._keys[positions] == keys
+
+        found_positions = np.flatnonzero(found)
+        vulnerability_ids[found_positions[matched]] = self._vulnerability_ids[positions[matched]]
+
+        return vulnerability_ids
+
+    def __getitem__(self, key):
+        """
+        Returns the vulnerability ID for a key - a tuple of key column values,
+        or a single value for single column keys - like a dict keyed by key
+        value tuples, i.e. the key values match numerically equal integers,
+        and a ``KeyError`` is raised if there is no match.
+        """
+        key_values = key if isinstance(key, tuple) else (key,)
+        if len(key_values) != len(self._key_cols):
+            raise KeyError(key)
+
+        packed = 0
+        for value, key_min, key_range, multiplier in zip(key_values, self._key_mins, self._key_ranges, self._multipliers):
+            if isinstance(value, numbers.Integral):
+                value = int(value)
+            elif isinstance(value, numbers.Real) and float(value).is_integer():
+                value = int(value)
+            else:
+                raise KeyError(key)
+            if not (key_min <= value < key_min + key_range):
+                raise KeyError(key)
+            packed += (value - key_min) * multiplier
+
+        position = int(np.searchsorted(self._keys, packed))
+        if position == len(self._keys) or self._keys[position] != packed:
+            raise KeyError(key)
+
+        return int(self._vulnerability_ids[position])
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def save(self, fp):
+        """
+        Writes the index to a binary file - the file is first written to a
+        temporary file in the same directory, which then replaces any
+        existing file.
+        """
+        header = {
+            'key_cols': list(self._key_cols),
+            'key_mins': list(self._key_mins),
+            'key_ranges': list(self._key_ranges),
+            'size': len(self._keys)
+        }
+
+        try:
+            with replacing_file(fp) as f:
+                write_binary_file_header(f, VULNERABILITIES_INDEX_MAGIC, header)
+                f.write(np.asarray(self._keys, dtype='<i8').tobytes())
+                f.write(np.asarray(self._vulnerability_ids, dtype='<i8').tobytes())
+        except (IOError, OSError) as e:
+            raise OasisException(e)
+
+        return fp
+
+    @classmethod
+    def load(cls, fp):
+        """
+        Loads an index from a file written by ``save`` - the keys and
+        vulnerability IDs arrays are read-only memory maps of the file.
+        """
+        try:
+            with io.open(fp, 'rb') as f:
+                header, offset = read_binary_file_header(f, VULNERABILITIES_INDEX_MAGIC, 'vulnerabilities index')
+
+            size = header['size']
+            if size:
+                keys = np.memmap(fp, dtype='<i8', mode='r', offset=offset, shape=(size,))
+                vulnerability_ids = np.memmap(fp, dtype='<i8', mode='r', offset=offset + 8 * size, shape=(size,))
+            else:
+                keys = vulnerability_ids = np.zeros(0, dtype=np.int64)
+        except (IOError, OSError, KeyError, ValueError, struct.error) as e:
+            raise OasisException(e)
+
+        return cls(header['key_cols'], header['key_mins'], header['key_ranges'], keys, vulnerability_ids)
@@ -0,0 +1,175 @@
+from __future__ import unicode_literals
+
+import io
+import json
+import os
+import threading
+from collections import Counter
+from unittest import TestCase
+
+import pytest
+import six
+
+# The async client is Python 3 only
+if six.PY2:
+    pytest.skip('the async client requires Python 3', allow_module_level=True)
+
+sleep = pytest.importorskip('asyncio').sleep
+
+from backports.tempfile import TemporaryDirectory
+from hypothesis import given, settings
+from hypothesis.strategies import integers
+from mock import patch, Mock
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from six.moves.socketserver import ThreadingMixIn
+
+from oasislmf.api_client.async_client import AsyncOasisAPIClient
+from oasislmf.utils.exceptions import OasisException
+from oasislmf.utils.status import STATUS_FAILURE, STATUS_PENDING, STATUS_SUCCESS
+
+
+class StubApiRequestHandler(BaseHTTPRequestHandler):
+    """
+    A stub of the analysis endpoints of the api server - analyses of input
+    locations starting with ``fail`` fail, those starting with ``reject``
+    are not started, the others complete after ``server.num_pending_polls``
+    status checks.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def send_body(self, status, body, content_type='application/json'):
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode('utf-8')
+
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        input_location = self.path.split('/')[-1]
+
+        if input_location.startswith('reject'):
+            return self.send_body(400, {})
+
+        with self.server.lock:
+            self.server.num_submitted += 1
+            location = '{}-{}'.format(input_location, self.server.num_submitted)
+
+        self.send_body(200, {'location': location})
+
+    def do_GET(self):
+        if self.path.startswith('/analysis_status/'):
+            location = self.path.split('/')[-1]
+            with self.server.lock:
+                self.server.status_checks[location] += 1
+                self.server.status_check_ports.add(self.client_address[1])
+                num_checks = self.server.status_checks[location]
+
+            if location.startswith('fail'):
+                return self.send_body(200, {'status': STATUS_FAILURE, 'message': 'boom'})
+            elif num_checks <= self.server.num_pending_polls:
+                return self.send_body(200, {'status': STATUS_PENDING})
+            else:
+                return self.send_body(200, {'status': STATUS_SUCCESS, 'outputs_location': 'outputs-' + location})
+        elif self.path.startswith('/outputs/'):
+            return self.send_body(200, self.path.encode('utf-8'), content_type='application/octet-stream')
+
+        self.send_body(404, {})
+
+    def do_DELETE(self):
+        with self.server.lock:
+            self.server.deleted.append(self.path)
+        self.send_body(200, {})
+
+
+class StubApiServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, num_pending_polls=0):
+        HTTPServer.__init__(self, ('127.0.0.1', 0), StubApiRequestHandler)
+        self.num_pending_polls = num_pending_polls
+        self.num_submitted = 0
+        self.status_checks = Counter()
+        self.status_check_ports = set()
+        self.deleted = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}'.format(self.server_address[1])
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever).start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+
+
+class AsyncOasisAPIClientRunAnalyses(TestCase):
+    def run_analyses(self, server, input_locations, outputs_directory, **kwargs):
+        kwargs.setdefault('poll_interval', 0.01)
+        with AsyncOasisAPIClient(server.url, **kwargs) as client:
+            return client.run(client.run_analyses({'analysis_settings': {}}, input_locations, outputs_directory))
+
+    @given(num_analyses=integers(min_value=1, max_value=30), num_pending_polls=integers(min_value=0, max_value=3))
+    @settings(max_examples=5, deadline=None)
+    def test_analyses_complete___outputs_are_downloaded_and_resources_are_deleted(self, num_analyses, num_pending_polls):
+        input_locations = ['input-{}'.format(i) for i in range(num_analyses)]
+
+        with StubApiServer(num_pending_polls=num_pending_polls) as server, TemporaryDirectory() as d:
+            analyses = self.run_analyses(server, input_locations, d, max_connections=4)
+
+            self.assertEqual(input_locations, [a['input_location'] for a in analyses])
+            for analysis in analyses:
+                self.assertEqual(STATUS_SUCCESS, analysis['status'])
+                self.assertIsNone(analysis['error'])
+                self.assertEqual(num_pending_polls + 1, analysis['num_status_checks'])
+                with io.open(analysis['outputs_file'], 'rb') as f:
+                    self.assertEqual('/outputs/' + analysis['outputs_location'], f.read().decode('utf-8'))
+
+            self.assertEqual(num_analyses, len(os.listdir(d)))
+            self.assertEqual(2 * num_analyses, len(server.deleted))
+            self.assertLessEqual(len(server.status_check_ports), 4)
+
+    def test_input_location_is_shared___inputs_are_deleted_once_all_analyses_are_complete(self):
+        with StubApiServer(num_pending_polls=1) as server, TemporaryDirectory() as d:
+            analyses = self.run_analyses(server, ['input'] * 5, d)
+
+            self.assertEqual([STATUS_SUCCESS] * 5, [a['status'] for a in analyses])
+            self.assertEqual(['/exposure/input'], [path for path in server.deleted if path.startswith('/exposure/')])
+            self.assertEqual(5, len([path for path in server.deleted if path.startswith('/outputs/')]))
+            self.assertEqual('/exposure/input', server.deleted[-1])
+            for analysis in analyses:
+                self.assertEqual(['download', 'run', 'submit'], sorted(analysis['timings']))
+
+    def test_analyses_fail_or_are_not_started___errors_are_returned_and_other_analyses_complete(self):
+        with StubApiServer(num_pending_polls=2) as server, TemporaryDirectory() as d:
+            analyses = self.run_analyses(server, ['fail-0', 'input-1', 'reject-2', 'input-3'], d)
+
+            self.assertEqual([STATUS_FAILURE, STATUS_SUCCESS, STATUS_FAILURE, STATUS_SUCCESS], [a['status'] for a in analyses])
+            self.assertEqual('Analysis failed: boom', analyses[0]['error'])
+            self.assertIsNone(analyses[2]['analysis_status_location'])
+            self.assertEqual(2, len(os.listdir(d)))
+
+    def test_analyses_are_pending___poll_interval_is_increased_up_to_the_maximum(self):
+        with StubApiServer(num_pending_polls=5) as server, TemporaryDirectory() as d:
+            with AsyncOasisAPIClient(server.url, poll_interval=0.01, max_poll_interval=0.04, poll_backoff=2) as client, \
+                    patch('oasislmf.api_client.async_client.asyncio.sleep', Mock(side_effect=sleep)) as sleep_mock:
+                client.run(client.run_analyses({}, ['input-0'], d))
+
+            sleeps = [args[0] for args, _ in sleep_mock.call_args_list]
+            self.assertEqual(5, len(sleeps))
+            for expected, delay in zip([0.01, 0.02, 0.04, 0.04, 0.04], sleeps):
+                self.assertAlmostEqual(expected, delay, delta=0.005)
+
+    def test_max_connections_is_less_than_one___oasis_exception_is_raised(self):
+        with self.assertRaises(OasisException):
+            AsyncOasisAPIClient('http://localhost:8001', max_connections=0)
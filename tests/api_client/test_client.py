@@ -1,22 +1,28 @@
 from __future__ import unicode_literals
 
+import hashlib
 import json
 import os
 import io
 import string
+import tarfile
+import threading
+import time
 from random import choice
 from tempfile import NamedTemporaryFile
 from backports.tempfile import TemporaryDirectory
 from unittest import TestCase
 
 import responses
-from hypothesis import given
+from hypothesis import given, settings
 from hypothesis.strategies import integers
 from mock import patch, Mock
 from pathlib2 import Path
-from requests import RequestException
+from requests import RequestException, Timeout
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from six.moves.socketserver import ThreadingMixIn
 
-from oasislmf.api_client.client import OasisAPIClient
+from oasislmf.api_client.client import OasisAPIClient, RetryPolicy
 from oasislmf.model_execution.files import TAR_FILE
 from oasislmf.utils.exceptions import OasisException
 from oasislmf.utils.status import STATUS_FAILURE, STATUS_PENDING, STATUS_SUCCESS
@@ -25,16 +31,16 @@ from oasislmf.utils.status import STATUS_FAILURE, STATUS_PENDING, STATUS_SUCCESS
 class ClientHealthCheck(TestCase):
     @given(integers(min_value=1, max_value=5))
     def test_heath_check_raise_an_exception_on_each_call___result_is_false(self, max_attempts):
-        with patch('requests.get', Mock(side_effect=RequestException())) as get_mock:
+        with patch('requests.Session.request', Mock(side_effect=RequestException())) as request_mock:
             client = OasisAPIClient('http://localhost:8001')
 
             result = client.health_check(max_attempts, retry_delay=0)
 
             self.assertFalse(result)
-            self.assertEqual(max_attempts, get_mock.call_count)
-            call_urls = [args[0] for args in get_mock.call_args_list]
+            self.assertEqual(max_attempts, request_mock.call_count)
+            call_urls = [args[0] for args in request_mock.call_args_list]
             self.assertEqual(
-                [('http://localhost:8001/healthcheck',) for i in range(max_attempts)],
+                [('GET', 'http://localhost:8001/healthcheck',) for i in range(max_attempts)],
                 call_urls,
             )
 
@@ -54,6 +60,18 @@ class ClientHealthCheck(TestCase):
                 [call.request.url for call in rsps.calls],
             )
 
+    def test_heath_check_returns_non_error_non_200_then_200___check_is_retried_and_result_is_true(self):
+        with responses.RequestsMock() as rsps:
+            rsps.add(responses.GET, 'http://localhost:8001/healthcheck', status=204)
+            rsps.add(responses.GET, 'http://localhost:8001/healthcheck', status=200)
+
+            client = OasisAPIClient('http://localhost:8001')
+
+            result = client.health_check(2, retry_delay=0)
+
+            self.assertTrue(result)
+            self.assertEqual(2, len(rsps.calls))
+
     def test_heath_check_returns_200___result_is_true(self):
         with responses.RequestsMock() as rsps:
             rsps.add(responses.GET, 'http://localhost:8001/healthcheck', status=200)
@@ -67,6 +85,96 @@ class ClientHealthCheck(TestCase):
             self.assertEqual('http://localhost:8001/healthcheck', rsps.calls[0].request.url)
 
 
+class ClientRetryPolicies(TestCase):
+    def test_invalid_call_type___exception_is_raised(self):
+        with self.assertRaises(OasisException):
+            OasisAPIClient('http://localhost:8001', retry_policies={'foo': RetryPolicy()})
+
+    @given(integers(min_value=0, max_value=4), integers(min_value=0, max_value=4))
+    def test_server_errors___call_is_retried_with_backoff_up_to_the_maximum_retries(self, num_errors, max_retries):
+        client = OasisAPIClient('http://localhost:8001', retry_policies={'status': RetryPolicy(max_retries=max_retries, backoff=1, max_backoff=4)})
+
+        with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps, \
+                patch('oasislmf.api_client.client.time.sleep') as sleep_mock:
+            for i in range(num_errors):
+                rsps.add(responses.GET, 'http://localhost:8001/analysis_status/foo', status=503)
+            rsps.add(responses.GET, 'http://localhost:8001/analysis_status/foo', status=200, body=json.dumps({'status': STATUS_PENDING}).encode())
+
+            if num_errors > max_retries:
+                with self.assertRaises(OasisException):
+                    client.get_analysis_status('foo')
+            else:
+                self.assertEqual((STATUS_PENDING, ''), client.get_analysis_status('foo'))
+
+            num_retries = min(num_errors, max_retries)
+            self.assertEqual(num_retries + 1, len(rsps.calls))
+            self.assertEqual([min(2 ** i, 4) for i in range(num_retries)], [args[0] for args, _ in sleep_mock.call_args_list])
+
+    def test_requests_are_made___client_timeouts_are_used(self):
+        with patch('requests.Session.request', Mock(return_value=Mock(status_code=200, ok=True))) as request_mock:
+            OasisAPIClient('http://localhost:8001', connect_timeout=5, read_timeout=30).delete_resource('foo')
+
+            self.assertEqual((5, 30), request_mock.call_args[1]['timeout'])
+
+    def test_call_times_out___call_is_retried(self):
+        with patch('requests.Session.request', Mock(side_effect=[Timeout(), Mock(status_code=200, ok=True)])) as request_mock, \
+                patch('oasislmf.api_client.client.time.sleep'):
+            client = OasisAPIClient('http://localhost:8001', Mock())
+
+            client.delete_resource('foo')
+
+            self.assertEqual(2, request_mock.call_count)
+            client._logger.warning.assert_called_once()
+
+    def test_analysis_submission_connection_error___call_is_not_retried(self):
+        with patch('requests.Session.request', Mock(side_effect=RequestException())) as request_mock:
+            client = OasisAPIClient('http://localhost:8001')
+
+            with self.assertRaises(RequestException):
+                client.run_analysis({}, 'foo')
+
+            self.assertEqual(1, request_mock.call_count)
+
+    def test_upload_server_error___inputs_tar_is_reposted(self):
+        with TemporaryDirectory() as d, responses.RequestsMock() as rsps, patch('oasislmf.api_client.client.time.sleep'):
+            with io.open(os.path.join(d, TAR_FILE), 'wb') as f:
+                f.write(b'inputs')
+
+            rsps.add(responses.POST, url='http://localhost:8001/exposure', status=502)
+            rsps.add(responses.POST, url='http://localhost:8001/exposure', body=json.dumps({'exposures': [{'location': 'exposure_location'}]}).encode())
+
+            client = OasisAPIClient('http://localhost:8001')
+
+            self.assertEqual('exposure_location', client.upload_inputs_from_directory(d))
+            self.assertEqual(2, len(rsps.calls))
+
+            bodies = [call.request.body if isinstance(call.request.body, bytes) else call.request.body.read() for call in rsps.calls]
+            self.assertEqual(bodies[0], bodies[1])
+            self.assertIn(b'inputs', bodies[1])
+
+    def test_requests_are_made___latencies_are_recorded_per_endpoint(self):
+        client = OasisAPIClient('http://localhost:8001', retry_policies={'status': RetryPolicy(backoff=0)})
+
+        with responses.RequestsMock() as rsps:
+            rsps.add(responses.GET, 'http://localhost:8001/analysis_status/foo', status=503)
+            rsps.add(responses.GET, 'http://localhost:8001/analysis_status/foo', status=200, body=json.dumps({'status': STATUS_PENDING}).encode())
+            rsps.add(responses.DELETE, 'http://localhost:8001/outputs/foo', status=200)
+
+            client.get_analysis_status('foo')
+            client.delete_outputs('foo')
+
+        metrics = client.get_request_metrics()
+
+        self.assertEqual(['DELETE /outputs', 'GET /analysis_status'], sorted(metrics))
+        self.assertEqual(2, metrics['GET /analysis_status']['count'])
+        self.assertEqual(1, metrics['GET /analysis_status']['errors'])
+        self.assertEqual(1, metrics['DELETE /outputs']['count'])
+        self.assertEqual(0, metrics['DELETE /outputs']['errors'])
+        for endpoint_metrics in metrics.values():
+            self.assertLessEqual(endpoint_metrics['mean_time'], endpoint_metrics['max_time'])
+            self.assertAlmostEqual(endpoint_metrics['mean_time'] * endpoint_metrics['count'], endpoint_metrics['total_time'])
+
+
 class RunAnalysis(TestCase):
     def test_request_response_is_not_ok___exception_is_raised(self):
         client = OasisAPIClient('http://localhost:8001')
@@ -139,6 +247,17 @@ class RunAnalysisAndPoll(TestCase):
             client.delete_exposure.assert_called_once_with(self.input_location)
             client.delete_outputs.assert_called_once_with(self.analysis_output_location)
 
+    def test_exposure_is_shared___exposure_is_not_deleted_and_stage_timings_are_returned(self):
+        with patch('oasislmf.api_client.client.time.sleep'):
+            client = self.get_mocked_client()
+
+            timings = client.run_analysis_and_poll(self.analysis_settings, self.input_location, self.output_location, delete_exposure=False)
+
+            client.delete_exposure.assert_not_called()
+            client.delete_outputs.assert_called_once_with(self.analysis_output_location)
+            self.assertEqual(['download', 'run', 'submit'], sorted(timings))
+            self.assertTrue(all(t >= 0 for t in timings.values()))
+
 
 class GetAnalysisStatus(TestCase):
     def test_request_is_not_ok___exception_is_raised(self):
@@ -290,6 +409,165 @@ class DownloadResource(TestCase):
             self.assertEqual(expected_content, dld_content)
 
 
+class RangeRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves ``server.content``, with support for ``Range`` requests, and drops
+    the connection half way through the first ``server.num_failures`` ``GET``
+    responses (after stalling for ``server.stall`` seconds, if set).
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def send_content_headers(self):
+        content = self.server.content
+        start, end = 0, len(content)
+
+        range_header = self.headers.get('Range')
+        if range_header and self.server.accept_ranges:
+            first, last = range_header.split('=')[1].split('-')
+            start, end = int(first), int(last) + 1 if last else len(content)
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes {}-{}/{}'.format(start, end - 1, len(content)))
+        else:
+            self.send_response(200)
+
+        if self.server.accept_ranges:
+            self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Content-Length', str(end - start))
+        self.end_headers()
+
+        return content[start:end]
+
+    def do_HEAD(self):
+        self.send_content_headers()
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.ranges.append(self.headers.get('Range'))
+            fail = self.server.num_failures > 0
+            self.server.num_failures -= 1
+
+        if self.server.error_status:
+            self.send_error(self.server.error_status)
+            return
+
+        body = self.send_content_headers()
+        if fail:
+            self.wfile.write(body[:len(body) // 2])
+            if self.server.stall:
+                self.wfile.flush()
+                time.sleep(self.server.stall)
+            self.close_connection = True
+        else:
+            self.wfile.write(body)
+
+
+class RangeServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, content, num_failures=0, accept_ranges=True, error_status=None, stall=None):
+        HTTPServer.__init__(self, ('127.0.0.1', 0), RangeRequestHandler)
+        self.content = content
+        self.num_failures = num_failures
+        self.accept_ranges = accept_ranges
+        self.error_status = error_status
+        self.stall = stall
+        self.ranges = []
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever).start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+
+
+class DownloadResourceResumable(TestCase):
+    def setUp(self):
+        self.content = os.urandom(100000)
+        self.d = TemporaryDirectory()
+        self.local_filename = os.path.join(self.d.name, 'foo')
+
+    def tearDown(self):
+        self.d.cleanup()
+
+    def client(self, server, max_retries=5, **kwargs):
+        client = OasisAPIClient(
+            'http://127.0.0.1:{}'.format(server.server_address[1]),
+            retry_policies={'download': RetryPolicy(max_retries=max_retries, backoff=0)},
+            **kwargs
+        )
+        client.DOWNLOAD_CHUCK_SIZE_IN_BYTES = 1024
+        return client
+
+    def downloaded_content(self):
+        with io.open(self.local_filename, 'rb') as f:
+            return f.read()
+
+    def test_connection_is_dropped___download_is_resumed_where_it_failed(self):
+        with RangeServer(self.content, num_failures=2) as server:
+            self.client(server).download_resource('foo', self.local_filename)
+
+        self.assertEqual(self.content, self.downloaded_content())
+        self.assertEqual(3, len(server.ranges))
+        self.assertIsNone(server.ranges[0])
+        resumed_from = [int(r.split('=')[1].split('-')[0]) for r in server.ranges[1:]]
+        self.assertTrue(0 < resumed_from[0] < resumed_from[1] < len(self.content))
+        self.assertFalse(os.path.exists(self.local_filename + '.part'))
+
+    def test_response_stalls___read_times_out_and_download_is_resumed_where_it_failed(self):
+        start = time.time()
+        with RangeServer(self.content, num_failures=1, stall=5) as server:
+            self.client(server, read_timeout=0.1).download_resource('foo', self.local_filename)
+
+        self.assertLess(time.time() - start, 5)
+        self.assertEqual(self.content, self.downloaded_content())
+        self.assertEqual(2, len(server.ranges))
+        self.assertTrue(0 < int(server.ranges[1].split('=')[1].split('-')[0]) < len(self.content))
+
+    def test_server_does_not_support_ranges___download_is_restarted(self):
+        with RangeServer(self.content, num_failures=1, accept_ranges=False) as server:
+            self.client(server).download_resource('foo', self.local_filename)
+
+        self.assertEqual(self.content, self.downloaded_content())
+        self.assertEqual(2, len(server.ranges))
+
+    @given(integers(min_value=2, max_value=8))
+    @settings(max_examples=5, deadline=None)
+    def test_download_in_parts___file_is_created_with_correct_content(self, num_parts):
+        with RangeServer(self.content, num_failures=1) as server:
+            self.client(server).download_resource('foo', self.local_filename, num_parts=num_parts, checksum=hashlib.sha256(self.content).hexdigest())
+
+        self.assertEqual(self.content, self.downloaded_content())
+        self.assertEqual(num_parts + 1, len(server.ranges))
+        os.remove(self.local_filename)
+
+    def test_server_errors_exhaust_retries___exception_is_raised_and_file_is_not_created(self):
+        with RangeServer(self.content, error_status=503) as server:
+            client = self.client(server, max_retries=2)
+
+            with patch('oasislmf.api_client.client.time.sleep') as sleep_mock:
+                with self.assertRaises(OasisException):
+                    client.download_resource('foo', self.local_filename)
+
+        self.assertEqual(3, len(server.ranges))
+        self.assertEqual(2, sleep_mock.call_count)
+        self.assertFalse(os.path.exists(self.local_filename))
+        self.assertFalse(os.path.exists(self.local_filename + '.part'))
+
+    def test_checksum_does_not_match___exception_is_raised_and_file_is_not_created(self):
+        with RangeServer(self.content) as server:
+            with self.assertRaises(OasisException):
+                self.client(server).download_resource('foo', self.local_filename, checksum=hashlib.sha256(b'bar').hexdigest())
+
+        self.assertFalse(os.path.exists(self.local_filename))
+        self.assertFalse(os.path.exists(self.local_filename + '.part'))
+
+
 class DownloadOutputs(TestCase):
     def test_download_resource_is_called_with_the_correct_parameters(self):
         client = OasisAPIClient('http://localhost:8001')
@@ -310,7 +588,7 @@ class DownloadExposures(TestCase):
         client.download_resource.assert_called_once_with('/exposure/foo', 'local_filename')
 
 
-def fake_build_tar_fn(d):
+def fake_build_tar_fn(d, **kwargs):
     with io.open(os.path.join(d, TAR_FILE), 'wb') as f:
         f.write(''.join(choice(string.ascii_letters) for i in range(100)).encode())
 
@@ -349,7 +627,7 @@ class UploadInputsFromDirectory(TestCase):
             check_mock.assert_called_once_with(d, do_il=False, do_ri=False)
             check_tools_mock.assert_called_once_with(do_il=False)
             create_bin_mock.assert_called_once_with(d, d, do_il=False, do_ri=False)
-            create_tar_mock.assert_called_once_with(d)
+            create_tar_mock.assert_called_once_with(d, compression_level=9, num_threads=1)
 
     @patch('oasislmf.api_client.client.create_binary_tar_file')
     @patch('oasislmf.api_client.client.create_binary_files')
@@ -367,7 +645,7 @@ class UploadInputsFromDirectory(TestCase):
             check_mock.assert_called_once_with(d, do_il=True, do_ri=False)
             check_tools_mock.assert_called_once_with(do_il=True)
             create_bin_mock.assert_called_once_with(d, d, do_il=True, do_ri=False)
-            create_tar_mock.assert_called_once_with(d)
+            create_tar_mock.assert_called_once_with(d, compression_level=9, num_threads=1)
 
     @patch('oasislmf.api_client.client.create_binary_tar_file')
     @patch('oasislmf.api_client.client.create_binary_files')
@@ -388,7 +666,7 @@ class UploadInputsFromDirectory(TestCase):
             check_mock.assert_called_once_with(d, do_il=False, do_ri=False)
             check_tools_mock.assert_called_once_with(do_il=False)
             create_bin_mock.assert_called_once_with(d, bin_dir, do_il=False, do_ri=False)
-            create_tar_mock.assert_called_once_with(bin_dir)
+            create_tar_mock.assert_called_once_with(bin_dir, compression_level=9, num_threads=1)
 
     def test_tar_file_exists___correct_file_is_posted(self):
         with TemporaryDirectory() as d, responses.RequestsMock() as rsps:
@@ -452,6 +730,49 @@ class UploadInputsFromDirectory(TestCase):
             with self.assertRaises(OasisException):
                 client.upload_inputs_from_directory(d)
 
+    def streamed_tar_members(self, request):
+        boundary = request.headers['Content-Type'].split('boundary=')[1].encode()
+        body = b''.join(request.body)
+
+        self.assertTrue(body.startswith(b'--' + boundary + b'\r\n'))
+        self.assertIn(b'filename="inputs.tar.gz"', body)
+        self.assertTrue(body.endswith(b'\r\n--' + boundary + b'--\r\n'))
+
+        tar_data = body[body.index(b'\r\n\r\n') + 4:-len(b'\r\n--' + boundary + b'--\r\n')]
+        with tarfile.open(fileobj=io.BytesIO(tar_data), mode='r:gz') as tar:
+            return {m.name: tar.extractfile(m).read() for m in tar.getmembers()}
+
+    @given(integers(min_value=0, max_value=9), integers(min_value=1, max_value=3))
+    def test_stream_is_true___tar_of_bin_files_is_packaged_into_the_request_body(self, compression_level, compression_threads):
+        with TemporaryDirectory() as d, responses.RequestsMock() as rsps:
+            os.mkdir(os.path.join(d, 'RI_1'))
+            bin_files = {'items.bin': os.urandom(1000), os.path.join('RI_1', 'coverages.bin'): b'coverages' * 1000}
+            for name, data in bin_files.items():
+                with io.open(os.path.join(d, name), 'wb') as f:
+                    f.write(data)
+
+            rsps.add(responses.POST, url='http://localhost:8001/exposure', body=json.dumps({'exposures': [{'location': 'exposure_location'}]}).encode())
+
+            client = OasisAPIClient('http://localhost:8001', inputs_compression_level=compression_level, inputs_compression_threads=compression_threads)
+            client.UPLOAD_CHUNK_SIZE_IN_BYTES = 100
+            result = client.upload_inputs_from_directory(d, stream=True)
+
+            self.assertEqual('exposure_location', result)
+            self.assertFalse(os.path.exists(os.path.join(d, TAR_FILE)))
+            self.assertEqual(bin_files, self.streamed_tar_members(rsps.calls[0].request))
+
+    def test_stream_is_true_and_packaging_fails___oasis_exception_is_raised(self):
+        with TemporaryDirectory() as d, responses.RequestsMock() as rsps:
+            Path(os.path.join(d, 'items.bin')).touch()
+
+            rsps.add(responses.POST, url='http://localhost:8001/exposure', body=json.dumps({'exposures': [{'location': 'exposure_location'}]}).encode())
+
+            client = OasisAPIClient('http://localhost:8001', stream_inputs=True, inputs_compression_level=10)
+            client.upload_inputs_from_directory(d)
+
+            with self.assertRaises(OasisException):
+                b''.join(rsps.calls[0].request.body)
+
     @patch('oasislmf.api_client.client.cleanup_bin_directory')
     def test_do_clean_is_false___clean_bin_directory_is_not_called(self, clean_mock):
         with TemporaryDirectory() as d, responses.RequestsMock() as rsps:
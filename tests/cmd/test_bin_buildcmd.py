@@ -96,7 +96,7 @@ class BuildCmdRun(TestCase):
             self.assertEqual(0, res)
             check_conv_mock.assert_called_once_with(do_il=False)
             check_ins_mock.assert_called_once_with(src, do_il=False, check_binaries=False)
-            create_bin_mock.assert_called_once_with(src, src, do_il=False)
+            create_bin_mock.assert_called_once_with(src, src, do_il=False, native=False, num_workers=None, logger=cmd.logger)
             create_tar_mock.assert_called_once_with(src)
 
     @patch('oasislmf.cmd.bin.check_conversion_tools')
@@ -112,7 +112,7 @@ class BuildCmdRun(TestCase):
             self.assertEqual(0, res)
             check_conv_mock.assert_called_once_with(do_il=False)
             check_ins_mock.assert_called_once_with(src, do_il=False, check_binaries=False)
-            create_bin_mock.assert_called_once_with(src, dst, do_il=False)
+            create_bin_mock.assert_called_once_with(src, dst, do_il=False, native=False, num_workers=None, logger=cmd.logger)
             create_tar_mock.assert_called_once_with(dst)
 
     @patch('oasislmf.cmd.bin.check_conversion_tools')
@@ -128,7 +128,7 @@ class BuildCmdRun(TestCase):
             self.assertEqual(0, res)
             check_conv_mock.assert_called_once_with(do_il=False)
             check_ins_mock.assert_called_once_with(src, do_il=False, check_binaries=False)
-            create_bin_mock.assert_called_once_with(src, src, do_il=False)
+            create_bin_mock.assert_called_once_with(src, src, do_il=False, native=False, num_workers=None, logger=cmd.logger)
             create_tar_mock.assert_not_called()
 
     @patch('oasislmf.cmd.bin.check_conversion_tools')
@@ -144,5 +144,21 @@ class BuildCmdRun(TestCase):
             self.assertEqual(0, res)
             check_conv_mock.assert_called_once_with(do_il=True)
             check_ins_mock.assert_called_once_with(src, do_il=True, check_binaries=False)
-            create_bin_mock.assert_called_once_with(src, src, do_il=True)
+            create_bin_mock.assert_called_once_with(src, src, do_il=True, native=False, num_workers=None, logger=cmd.logger)
+            create_tar_mock.assert_not_called()
+
+    @patch('oasislmf.cmd.bin.check_conversion_tools')
+    @patch('oasislmf.cmd.bin.check_inputs_directory')
+    @patch('oasislmf.cmd.bin.create_binary_files')
+    @patch('oasislmf.cmd.bin.create_binary_tar_file')
+    def test_native_is_true___files_are_written_natively_without_checking_conversion_tools(self, create_tar_mock, create_bin_mock, check_ins_mock, check_conv_mock):
+        with TemporaryDirectory() as src:
+            cmd = get_command(src_dir=src, extras={'native': ''})
+
+            res = cmd.run()
+
+            self.assertEqual(0, res)
+            check_conv_mock.assert_not_called()
+            check_ins_mock.assert_called_once_with(src, do_il=False, check_binaries=False)
+            create_bin_mock.assert_called_once_with(src, src, do_il=False, native=True, num_workers=None, logger=cmd.logger)
             create_tar_mock.assert_not_called()
@@ -0,0 +1,99 @@
+from unittest import TestCase
+
+import io
+import json
+import os
+
+import six
+from backports.tempfile import TemporaryDirectory
+from mock import Mock, patch
+
+from oasislmf.cmd import RootCmd
+from oasislmf.exposures.manager import OasisExposuresManager
+from tests.data import canonical_exposures_profile
+
+
+def get_command(model_run_dir_path, inputs_dir, extras=None):
+    kwargs = {
+        'model-run-dir-path': model_run_dir_path,
+        'lookup-config-file-path': os.path.join(inputs_dir, 'lookup.json'),
+        'source-exposures-file-path': os.path.join(inputs_dir, 'source.csv'),
+        'canonical-exposures-profile-json-path': os.path.join(inputs_dir, 'profile.json'),
+        'source-to-canonical-exposures-transformation-file-path': os.path.join(inputs_dir, 'source_to_canonical.xslt'),
+        'canonical-to-model-exposures-transformation-file-path': os.path.join(inputs_dir, 'canonical_to_model.xslt'),
+    }
+    kwargs.update(extras or {})
+    kwargs_str = ' '.join('--{} {}'.format(k, v) for k, v in six.iteritems(kwargs))
+
+    return RootCmd(argv='model run {}'.format(kwargs_str).split())
+
+
+def write_output(*names):
+    def fn(**kwargs):
+        for name in names:
+            with io.open(kwargs['{}_file_path'.format(name)], 'w', encoding='utf-8') as f:
+                f.write('{}\n'.format(name))
+        return {name: kwargs['{}_file_path'.format(name)] for name in names}
+    return Mock(side_effect=fn)
+
+
+class FakeLookup(object):
+    config = {'peril': 'WTC'}
+
+
+class RunCmdRun(TestCase):
+
+    def setUp(self):
+        self.stage_mocks = (
+            write_output('canonical_exposures'),
+            write_output('model_exposures'),
+            write_output('keys', 'keys_errors'),
+            write_output('items', 'coverages', 'gulsummaryxref'),
+        )
+
+    def write_inputs(self, inputs_dir):
+        for fn, content in [
+            ('lookup.json', '{}'),
+            ('source.csv', 'LocNumber\n1\n'),
+            ('profile.json', json.dumps(canonical_exposures_profile)),
+            ('source_to_canonical.xslt', '<xsl/>'),
+            ('canonical_to_model.xslt', '<xsl/>'),
+        ]:
+            with io.open(os.path.join(inputs_dir, fn), 'w', encoding='utf-8') as f:
+                f.write(six.text_type(content))
+
+    def run_command(self, model_run_dir_path, inputs_dir, extras=None):
+        model_info = {'supplier_id': 'Supplier', 'model_id': 'Model', 'model_version': '1'}
+
+        for m in self.stage_mocks:
+            m.reset_mock()
+
+        with patch('oasislmf.cmd.model.OasisLookupFactory.create', Mock(return_value=(model_info, FakeLookup()))), \
+                patch('oasislmf.cmd.model.GenerateLossesCmd.action', Mock()), \
+                patch.object(OasisExposuresManager, 'transform_source_to_canonical', self.stage_mocks[0]), \
+                patch.object(OasisExposuresManager, 'transform_canonical_to_model', self.stage_mocks[1]), \
+                patch.object(OasisExposuresManager, 'get_keys', self.stage_mocks[2]), \
+                patch.object(OasisExposuresManager, 'write_gul_files', self.stage_mocks[3]):
+            res = get_command(model_run_dir_path, inputs_dir, extras=extras).run()
+
+        self.assertEqual(0, res)
+
+        return tuple(m.call_count for m in self.stage_mocks)
+
+    def test_model_run_dir_is_reused___recorded_stages_are_reused_unless_forced(self):
+        with TemporaryDirectory() as model_run_dir_path, TemporaryDirectory() as inputs_dir:
+            self.write_inputs(inputs_dir)
+
+            self.assertEqual((1, 1, 1, 1), self.run_command(model_run_dir_path, inputs_dir))
+
+            self.assertEqual((0, 0, 0, 0), self.run_command(model_run_dir_path, inputs_dir))
+
+            self.assertEqual((1, 1, 1, 1), self.run_command(model_run_dir_path, inputs_dir, extras={'force': ''}))
+
+    def test_native_bin_writer___binary_files_are_written_to_the_model_run_inputs_directory(self):
+        with TemporaryDirectory() as model_run_dir_path, TemporaryDirectory() as inputs_dir:
+            self.write_inputs(inputs_dir)
+
+            self.assertEqual((1, 1, 1, 1), self.run_command(model_run_dir_path, inputs_dir, extras={'native-bin-writer': ''}))
+
+            self.assertEqual(os.path.join(model_run_dir_path, 'input'), self.stage_mocks[3].call_args[1]['binary_files_path'])
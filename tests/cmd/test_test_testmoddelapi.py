@@ -7,6 +7,7 @@ import os
 
 import shutil
 import six
+import pytest
 from hypothesis import (
     given,
     HealthCheck,
@@ -21,6 +22,7 @@ from oasislmf.api_client.client import OasisAPIClient
 from oasislmf.cmd import RootCmd
 from oasislmf.cmd.test import TestModelApiCmd
 from oasislmf.utils.exceptions import OasisException
+from oasislmf.utils.status import STATUS_SUCCESS
 
 
 class TestModelApiCmdLoadAnalysisSettingsJson(TestCase):
@@ -349,3 +351,65 @@ class TestModelApiCmdRun(TestCase):
             self.assertEqual(fn.__name__, 'run_analysis')
             self.assertIsInstance(fn.__self__, TestModelApiCmd)
             self.assertEqual(args, [(ANY, cmd.args.input_directory, cmd.args.output_directory, settings, do_il, do_ri, ANY)] * num_analyses)
+
+    def test_async_polling_is_set_on_python_2___oasis_exception_is_raised(self):
+        with patch('oasislmf.cmd.test.six.PY2', True):
+            with self.assertRaises(OasisException):
+                TestModelApiCmd().get_async_client(Mock())
+
+    @pytest.mark.skipif(six.PY2, reason='the async client requires Python 3')
+    @given(integers(min_value=1, max_value=5), integers(min_value=1, max_value=3))
+    def test_async_polling_is_set___analyses_of_the_uploaded_inputs_are_run_from_the_async_client(self, num_analyses, max_connections):
+        uploaded = ['location-{}'.format(i) for i in range(num_analyses)]
+
+        with patch('oasislmf.api_client.client.OasisAPIClient.health_check', Mock(return_value=True)), \
+                patch('oasislmf.cmd.test.TestModelApiCmd.load_analysis_settings_json', Mock(return_value=({}, False, False))), \
+                patch('oasislmf.cmd.test.TestModelApiCmd.upload_inputs', Mock(side_effect=lambda args: 'location-' + os.path.basename(args[2]))) as upload_inputs_mock, \
+                patch('oasislmf.api_client.async_client.AsyncOasisAPIClient.run_analyses', Mock(return_value='coro')) as run_analyses_mock, \
+                patch('oasislmf.api_client.async_client.AsyncOasisAPIClient.run', Mock(return_value=[{'status': STATUS_SUCCESS}] * num_analyses)):
+            cmd = self.get_command(
+                analysis_directory=self.directory,
+                extras={'num-analyses': num_analyses, 'max-connections': max_connections, 'async-polling': ''}
+            )
+            cmd._logger = Mock()
+
+            res = cmd.run()
+
+            self.assertEqual(0, res)
+            self.assertEqual(num_analyses, upload_inputs_mock.call_count)
+            run_analyses_mock.assert_called_once_with({}, uploaded, cmd.args.output_directory)
+
+    @given(integers(min_value=1, max_value=5))
+    def test_upload_once_is_set___inputs_are_uploaded_once_and_shared_by_the_analyses(self, num_analyses):
+        timings = {'submit': 0.1, 'run': 1.0, 'download': 0.2}
+
+        with patch('oasislmf.api_client.client.OasisAPIClient.health_check', Mock(return_value=True)), \
+                patch('oasislmf.cmd.test.TestModelApiCmd.load_analysis_settings_json', Mock(return_value=({}, True, False))), \
+                patch('oasislmf.api_client.client.OasisAPIClient.upload_inputs_from_directory', Mock(return_value='location')) as upload_mock, \
+                patch('oasislmf.api_client.client.OasisAPIClient.run_analysis_and_poll', Mock(return_value=timings)) as run_mock, \
+                patch('oasislmf.api_client.client.OasisAPIClient.delete_exposure') as delete_exposure_mock, \
+                patch('oasislmf.cmd.test.TestModelApiCmd.log_timings_summary') as summary_mock:
+            cmd = self.get_command(analysis_directory=self.directory, extras={'num-analyses': num_analyses, 'poll-interval': 2, 'upload-once': ''})
+
+            res = cmd.run()
+
+            self.assertEqual(0, res)
+            upload_mock.assert_called_once_with(cmd.args.input_directory, bin_directory=ANY, do_il=True, do_ri=False, do_build=True)
+            self.assertEqual(
+                [(({}, 'location', cmd.args.output_directory), {'analysis_poll_interval': 2, 'delete_exposure': False})] * num_analyses,
+                run_mock.call_args_list
+            )
+            delete_exposure_mock.assert_called_once_with('location')
+            summary_mock.assert_called_once_with(ANY, [timings] * num_analyses, ANY)
+
+
+class TestModelApiCmdLogTimingsSummary(TestCase):
+    def test_stage_percentiles_are_logged(self):
+        cmd = TestModelApiCmd()
+        cmd._logger = Mock()
+
+        cmd.log_timings_summary(5, [{'submit': i, 'run': 10 * i, 'download': 100 * i} for i in range(1, 101)], 60)
+
+        cmd.logger.info.assert_any_call('Throughput: 100 analyses completed in 60.000s (100.000 analyses/min)')
+        cmd.logger.info.assert_any_call('  submit: p50 50.500s, p95 95.050s, max 100.000s')
+        cmd.logger.info.assert_any_call('  download: p50 5050.000s, p95 9505.000s, max 10000.000s')
@@ -0,0 +1,133 @@
+import filecmp
+import io
+import json
+import os
+import unittest
+
+import pandas as pd
+
+from backports.tempfile import TemporaryDirectory
+from hypothesis import (
+    given,
+    HealthCheck,
+    settings,
+)
+from hypothesis.strategies import integers
+from pathlib2 import Path
+
+from oasislmf.exposures.csv_map import (
+    ColumnMapper,
+    convert_xslt_to_column_mapping,
+    is_column_mapping_file,
+    load_column_mapping,
+)
+from oasislmf.utils.exceptions import OasisException
+
+data_dir = str(Path(__file__).parent.joinpath('csv_trans_data'))
+input_data_dir = str(Path(data_dir, 'input'))
+expected_data_dir = str(Path(data_dir, 'expected'))
+
+
+class ColumnMapperConvertedXslt(unittest.TestCase):
+    @given(chunk_size=integers(min_value=1, max_value=10))
+    @settings(max_examples=10, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    def test_source_to_canonical(self, chunk_size):
+        with TemporaryDirectory() as d:
+            output_file = os.path.join(d, 'canonical.csv')
+
+            mapping = convert_xslt_to_column_mapping(os.path.join(input_data_dir, 'source_to_canonical.xslt'))
+            ColumnMapper(
+                os.path.join(input_data_dir, 'source.csv'),
+                output_file,
+                mapping,
+                chunk_size=chunk_size,
+                append_row_nums=True
+            )()
+
+            self.assertTrue(filecmp.cmp(output_file, os.path.join(expected_data_dir, 'canonical.csv'), shallow=False))
+
+    @given(chunk_size=integers(min_value=1, max_value=10))
+    @settings(max_examples=10, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    def test_canonical_to_model_with_mapping_file(self, chunk_size):
+        with TemporaryDirectory() as d:
+            mapping_file = os.path.join(d, 'canonical_to_model.json')
+            with io.open(mapping_file, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(convert_xslt_to_column_mapping(os.path.join(input_data_dir, 'canonical_to_model.xslt'))))
+            self.assertTrue(is_column_mapping_file(mapping_file))
+
+            output_file = os.path.join(d, 'model.csv')
+            ColumnMapper(
+                os.path.join(input_data_dir, 'canonical.csv'),
+                output_file,
+                mapping_file,
+                chunk_size=chunk_size
+            )()
+
+            self.assertTrue(filecmp.cmp(output_file, os.path.join(expected_data_dir, 'model.csv'), shallow=False))
+
+    def test_xslt_with_unsupported_constructs___oasis_exception_is_raised(self):
+        with TemporaryDirectory() as d:
+            xslt_file = os.path.join(d, 'trans.xslt')
+            with io.open(xslt_file, 'w', encoding='utf-8') as f:
+                f.write(
+                    '<xsl:stylesheet version="1.0" xmlns:xsl="http://www.w3.org/1999/XSL/Transform">'
+                    '<xsl:template match="/"><root><xsl:for-each select="root/rec"><rec>'
+                    '<xsl:attribute name="A"><xsl:value-of select="concat(@A, @B)"/></xsl:attribute>'
+                    '</rec></xsl:for-each></root></xsl:template></xsl:stylesheet>'
+                )
+
+            with self.assertRaises(OasisException):
+                convert_xslt_to_column_mapping(xslt_file)
+
+
+class ColumnMapperTransform(unittest.TestCase):
+    def transform(self, columns, data, append_row_nums=False):
+        with TemporaryDirectory() as d:
+            input_file = os.path.join(d, 'input.csv')
+            output_file = os.path.join(d, 'output.csv')
+            pd.DataFrame(data).to_csv(input_file, index=False)
+
+            ColumnMapper(input_file, output_file, {'columns': columns}, append_row_nums=append_row_nums, chunk_size=2)()
+
+            with io.open(output_file, 'r', encoding='utf-8') as f:
+                return f.read()
+
+    def test_columns_are_renamed_selected_recoded_and_defaulted(self):
+        output = self.transform(
+            [
+                {'name': 'ID', 'source': 'LOC'},
+                {'name': 'OCC', 'source': 'OCCUPANCY', 'map': {'RES': 'RD', 'COM': 'CM'}, 'default': 'XX'},
+                {'name': 'CLASS', 'value': 'R'},
+                {'name': 'MISSING', 'source': 'NOT_IN_INPUT'},
+            ],
+            {'LOC': ['a', 'b', 'c'], 'OCCUPANCY': ['RES', 'IND', None], 'UNUSED': [1, 2, 3]},
+            append_row_nums=True
+        )
+
+        self.assertEqual(output, 'ROW_ID,ID,OCC,CLASS,MISSING\n1,a,RD,R,\n2,b,IND,R,\n3,c,XX,R,\n')
+
+    def test_expressions_are_evaluated_on_numeric_values(self):
+        output = self.transform(
+            [
+                {'name': 'TIV', 'expr': 'V1 + V2', 'default': '0'},
+                {'name': 'HALF', 'expr': 'V1 / 2'},
+            ],
+            {'V1': ['100', '3', 'x'], 'V2': ['20', '4', '1']}
+        )
+
+        self.assertEqual(output, 'TIV,HALF\n120,50.0\n7,1.5\n0,\n')
+
+    def test_invalid_mappings___oasis_exception_is_raised(self):
+        for mapping in [
+            {},
+            {'columns': []},
+            {'columns': [{'source': 'A'}]},
+            {'columns': [{'name': 'A', 'source': 'A', 'value': '1'}]},
+            {'columns': [{'name': 'A'}]},
+            {'columns': [{'name': 'A', 'source': 'A'}, {'name': 'A', 'source': 'B'}]},
+            {'columns': [{'name': 'A', 'source': 'A', 'map': ['a']}]},
+            {'columns': [{'name': 'A', 'source': 'A', 'rename': 'B'}]},
+            {'columns': [{'name': 'A', 'expr': 'B +'}]},
+        ]:
+            with self.assertRaises(OasisException):
+                load_column_mapping(mapping)
@@ -57,3 +57,40 @@ class CsvTrans(unittest.TestCase):
             )
             translator()
             self.assertTrue(filecmp.cmp(output_file, os.path.join(expected_data_dir, 'model.csv')))
+
+    @given(chunk_size=integers(min_value=1, max_value=10), num_processes=integers(min_value=1, max_value=3))
+    @settings(max_examples=10, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    def test_source_to_canonical_with_process_pool(self, chunk_size, num_processes):
+        with TemporaryDirectory() as d:
+            output_file = os.path.join(d, 'canonical.csv')
+
+            translator = Translator(
+                os.path.join(input_data_dir, 'source.csv'),
+                output_file,
+                os.path.join(input_data_dir, 'source_to_canonical.xslt'),
+                os.path.join(input_data_dir, 'source_to_canonical.xsd'),
+                chunk_size=chunk_size,
+                append_row_nums=True,
+                num_processes=num_processes
+            )
+            translator()
+
+            diff = unified_diff(output_file, os.path.join(expected_data_dir, 'canonical.csv'), as_string=True)
+            self.assertEqual(0, len(diff), diff)
+
+    @given(chunk_size=integers(min_value=1, max_value=10), num_processes=integers(min_value=1, max_value=3))
+    @settings(max_examples=10, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    def test_canonical_to_model_with_process_pool(self, chunk_size, num_processes):
+        with TemporaryDirectory() as d:
+            output_file = os.path.join(d, 'model.csv')
+
+            translator = Translator(
+                os.path.join(input_data_dir, 'canonical.csv'),
+                output_file,
+                os.path.join(input_data_dir, 'canonical_to_model.xslt'),
+                os.path.join(input_data_dir, 'canonical_to_model.xsd'),
+                chunk_size=chunk_size,
+                num_processes=num_processes
+            )
+            translator()
+            self.assertTrue(filecmp.cmp(output_file, os.path.join(expected_data_dir, 'model.csv')))
@@ -0,0 +1,122 @@
+from __future__ import unicode_literals
+
+import os
+
+from unittest import TestCase
+
+import pandas as pd
+
+from backports.tempfile import TemporaryDirectory
+from hypothesis import given
+from hypothesis.strategies import (
+    integers,
+    lists,
+    permutations,
+)
+
+from oasislmf.exposures.delta import (
+    diff_source_row_hashes,
+    get_source_row_hashes,
+    read_source_row_hashes,
+    write_source_row_hashes,
+)
+from oasislmf.utils.exceptions import OasisException
+
+
+def source_df(rows, columns=('LocNumber', 'TIV')):
+    return pd.DataFrame([[str(v) for v in r] for r in rows], columns=list(columns), dtype=object)
+
+
+class GetSourceRowHashes(TestCase):
+    def test_no_key_column___oasis_exception_is_raised(self):
+        with self.assertRaises(OasisException):
+            get_source_row_hashes(source_df([[1, 2]], columns=('Loc', 'TIV')))
+
+    def test_legacy_key_column___keys_are_the_location_numbers(self):
+        hashes_df = get_source_row_hashes(source_df([[1, 2], [3, 4]], columns=('LOCNUM', 'TIV')))
+
+        self.assertEqual(['1', '3'], hashes_df['key'].tolist())
+
+    def test_no_account_column___accounts_are_empty(self):
+        hashes_df = get_source_row_hashes(source_df([[1, 2], [3, 4]]))
+
+        self.assertEqual(['', ''], hashes_df['account'].tolist())
+
+    def test_account_column___keys_are_the_account_and_location_numbers(self):
+        hashes_df = get_source_row_hashes(source_df([['A1', 1, 2], ['A2', 1, 4]], columns=('AccNumber', 'LocNumber', 'TIV')))
+
+        self.assertEqual([('A1', '1'), ('A2', '1')], list(zip(hashes_df['account'], hashes_df['key'])))
+
+    def test_columns_are_renamed___hashes_are_changed(self):
+        hashes = get_source_row_hashes(source_df([[1, 2]]))['hash']
+        renamed_hashes = get_source_row_hashes(source_df([[1, 2]], columns=('LocNumber', 'TIV1')))['hash']
+
+        self.assertNotEqual(hashes[0], renamed_hashes[0])
+
+    def test_hashes_file_is_written_and_read___hashes_are_unchanged(self):
+        with TemporaryDirectory() as d:
+            source_fp = os.path.join(d, 'source.csv')
+            source_df([[1, 2], ['L2', ''], ['NA', 'x']]).to_csv(source_fp, index=False)
+
+            hashes_df = write_source_row_hashes(source_fp, os.path.join(d, 'hashes.csv'))
+
+            self.assertTrue(hashes_df.equals(read_source_row_hashes(os.path.join(d, 'hashes.csv'))))
+            self.assertEqual(['1', 'L2', 'NA'], hashes_df['key'].tolist())
+
+    def test_hashes_file_with_accounts_is_written_and_read___hashes_are_unchanged(self):
+        with TemporaryDirectory() as d:
+            source_fp = os.path.join(d, 'source.csv')
+            source_df([['A1', 1, 2], ['A2', 1, '']], columns=('AccNumber', 'LocNumber', 'TIV')).to_csv(source_fp, index=False)
+
+            hashes_df = write_source_row_hashes(source_fp, os.path.join(d, 'hashes.csv'))
+
+            self.assertTrue(hashes_df.equals(read_source_row_hashes(os.path.join(d, 'hashes.csv'))))
+
+
+class DiffSourceRowHashes(TestCase):
+    @given(
+        tivs=lists(integers(min_value=0, max_value=3), min_size=2, max_size=10),
+        new_tivs=lists(integers(min_value=0, max_value=3), min_size=2, max_size=10),
+        order=permutations(range(1, 10))
+    )
+    def test_locations_are_changed_reordered_added_or_removed___unchanged_locations_are_mapped(self, tivs, new_tivs, order):
+        rows = [[i, tiv] for i, tiv in enumerate(tivs)]
+        new_rows = [rows[0]] + [[i, tiv] for i, tiv in zip([i for i in order if i < len(new_tivs)], new_tivs[1:])]
+
+        unchanged_df, changed_ids = diff_source_row_hashes(get_source_row_hashes(source_df(rows)), get_source_row_hashes(source_df(new_rows)))
+
+        for previous_id, new_id in zip(unchanged_df['previous_id'], unchanged_df['id']):
+            self.assertEqual(rows[previous_id - 1], new_rows[new_id - 1])
+
+        self.assertEqual(len(new_rows), len(unchanged_df) + len(changed_ids))
+        for new_id in changed_ids:
+            self.assertNotIn(new_rows[new_id - 1], rows)
+
+    def test_first_location_is_changed___none_is_returned(self):
+        previous_hashes_df = get_source_row_hashes(source_df([[1, 2], [2, 3]]))
+        hashes_df = get_source_row_hashes(source_df([[1, 3], [2, 3]]))
+
+        self.assertIsNone(diff_source_row_hashes(previous_hashes_df, hashes_df))
+
+    def test_location_numbers_are_unique_within_accounts___locations_are_mapped_by_account(self):
+        columns = ('AccNumber', 'LocNumber', 'TIV')
+        previous_hashes_df = get_source_row_hashes(source_df([['A1', 1, 2], ['A1', 2, 3], ['A2', 1, 4]], columns=columns))
+        hashes_df = get_source_row_hashes(source_df([['A1', 1, 2], ['A2', 1, 4], ['A2', 2, 3]], columns=columns))
+
+        unchanged_df, changed_ids = diff_source_row_hashes(previous_hashes_df, hashes_df)
+
+        self.assertEqual([(1, 1), (3, 2)], list(zip(unchanged_df['previous_id'], unchanged_df['id'])))
+        self.assertEqual([3], changed_ids.tolist())
+
+    def test_location_numbers_are_not_unique___none_is_returned(self):
+        previous_hashes_df = get_source_row_hashes(source_df([[1, 2], [2, 3]]))
+        hashes_df = get_source_row_hashes(source_df([[1, 2], [2, 3], [2, 4]]))
+
+        self.assertIsNone(diff_source_row_hashes(previous_hashes_df, hashes_df))
+
+    def test_location_numbers_are_not_unique_within_an_account___none_is_returned(self):
+        columns = ('AccNumber', 'LocNumber', 'TIV')
+        previous_hashes_df = get_source_row_hashes(source_df([['A1', 1, 2], ['A2', 1, 3]], columns=columns))
+        hashes_df = get_source_row_hashes(source_df([['A1', 1, 2], ['A2', 1, 3], ['A2', 1, 4]], columns=columns))
+
+        self.assertIsNone(diff_source_row_hashes(previous_hashes_df, hashes_df))
@@ -0,0 +1,155 @@
+from __future__ import unicode_literals
+
+import io
+import json
+import os
+
+from unittest import TestCase
+
+from backports.tempfile import TemporaryDirectory
+from hypothesis import given
+from hypothesis.strategies import (
+    dictionaries,
+    integers,
+    text,
+)
+
+from oasislmf.exposures.manifest import (
+    data_hash,
+    directory_fingerprint,
+    file_hash,
+    lookup_fingerprint,
+    MANIFEST_FILE_NAME,
+    OasisFilesManifest,
+)
+from oasislmf.utils.exceptions import OasisException
+
+
+def write_file(fp, content):
+    with io.open(fp, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return fp
+
+
+class FakeLookup(object):
+    def __init__(self, config=None):
+        self.config = config
+
+
+class DataHash(TestCase):
+    @given(dictionaries(text(min_size=1), integers(), min_size=2))
+    def test_dict_keys_are_reordered___hash_is_unchanged(self, d):
+        self.assertEqual(data_hash(d), data_hash(dict(reversed(list(d.items())))))
+
+    def test_dict_values_are_changed___hash_is_changed(self):
+        self.assertNotEqual(data_hash({'a': 1}), data_hash({'a': 2}))
+
+    def test_int_and_string_dict_keys___hash_is_the_same(self):
+        self.assertEqual(data_hash({1: {'a': (1, 2)}}), data_hash({'1': {'a': [1, 2]}}))
+
+
+class FileHash(TestCase):
+    def test_no_file_path___none_is_returned(self):
+        self.assertIsNone(file_hash(None))
+
+    def test_missing_file___oasis_exception_is_raised(self):
+        with TemporaryDirectory() as d:
+            with self.assertRaises(OasisException):
+                file_hash(os.path.join(d, 'missing.csv'))
+
+    def test_file_contents_are_changed___hash_is_changed(self):
+        with TemporaryDirectory() as d:
+            fp = write_file(os.path.join(d, 'f.csv'), 'a,b\n1,2\n')
+            h = file_hash(fp)
+            self.assertEqual(h, file_hash(fp))
+
+            write_file(fp, 'a,b\n1,3\n')
+            self.assertNotEqual(h, file_hash(fp))
+
+
+class LookupFingerprint(TestCase):
+    def test_lookup_config_or_keys_data_are_changed___fingerprint_is_changed(self):
+        with TemporaryDirectory() as d:
+            keys_data_path = os.path.join(d, 'keys_data')
+            os.mkdir(keys_data_path)
+            write_file(os.path.join(keys_data_path, 'areas.csv'), '1,2\n')
+
+            config = {'keys_data_path': keys_data_path, 'peril': 'WTC'}
+            fingerprint = lookup_fingerprint(FakeLookup(config))
+            self.assertEqual(fingerprint, lookup_fingerprint(FakeLookup(dict(config))))
+
+            self.assertNotEqual(fingerprint, lookup_fingerprint(FakeLookup(dict(config, peril='WSS'))))
+
+            write_file(os.path.join(keys_data_path, 'areas.csv'), '1,2\n3,4\n')
+            self.assertNotEqual(fingerprint, lookup_fingerprint(FakeLookup(config)))
+            self.assertNotEqual(directory_fingerprint(keys_data_path), directory_fingerprint(d))
+
+
+class OasisFilesManifestStages(TestCase):
+    def test_stage_is_recorded___stage_is_up_to_date_and_persisted(self):
+        with TemporaryDirectory() as d:
+            fp = write_file(os.path.join(d, 'items.csv'), 'item_id\n1\n')
+
+            manifest = OasisFilesManifest(d)
+            key = manifest.stage_key({'source': 'abc'})
+            self.assertFalse(manifest.is_up_to_date('oasis', key))
+
+            manifest.record('oasis', key, {'source': 'abc'}, {'items': fp})
+
+            manifest = OasisFilesManifest(d)
+            self.assertTrue(manifest.is_up_to_date('oasis', key))
+            self.assertFalse(manifest.is_up_to_date('oasis', manifest.stage_key({'source': 'abd'})))
+            self.assertEqual({'items': fp}, manifest.get_outputs('oasis'))
+
+            with io.open(os.path.join(d, MANIFEST_FILE_NAME), 'r', encoding='utf-8') as f:
+                self.assertEqual('items.csv', json.load(f)['stages']['oasis']['outputs']['items']['path'])
+
+    def test_output_is_changed_or_removed___stage_is_not_up_to_date(self):
+        with TemporaryDirectory() as d:
+            fp = write_file(os.path.join(d, 'items.csv'), 'item_id\n1\n')
+
+            manifest = OasisFilesManifest(d)
+            manifest.record('oasis', 'k', {}, {'items': fp})
+
+            write_file(fp, 'item_id\n2\n')
+            self.assertFalse(manifest.is_up_to_date('oasis', 'k'))
+
+            os.remove(fp)
+            self.assertFalse(manifest.is_up_to_date('oasis', 'k'))
+
+    def test_output_is_missing___stage_is_not_recorded(self):
+        with TemporaryDirectory() as d:
+            manifest = OasisFilesManifest(d)
+            manifest.record('keys', 'k', {}, {'keys': os.path.join(d, 'keys.csv')})
+
+            self.assertNotIn('keys', OasisFilesManifest(d).stages)
+
+    def test_stage_is_invalidated___stage_is_not_up_to_date(self):
+        with TemporaryDirectory() as d:
+            fp = write_file(os.path.join(d, 'keys.csv'), 'id\n1\n')
+
+            manifest = OasisFilesManifest(d)
+            manifest.record('keys', 'k', {}, {'keys': fp})
+            manifest.invalidate('keys')
+
+            self.assertFalse(OasisFilesManifest(d).is_up_to_date('keys', 'k'))
+
+    def test_manifest_file_is_corrupt___no_stages_are_loaded(self):
+        with TemporaryDirectory() as d:
+            write_file(os.path.join(d, MANIFEST_FILE_NAME), '{"stages": ')
+
+            self.assertEqual({}, OasisFilesManifest(d).stages)
+
+    def test_manifest_write_fails___previous_manifest_is_kept_and_no_temporary_file_is_left(self):
+        with TemporaryDirectory() as d:
+            fp = write_file(os.path.join(d, 'keys.csv'), 'id\n1\n')
+
+            manifest = OasisFilesManifest(d)
+            manifest.record('keys', 'k', {}, {'keys': fp})
+
+            with self.assertRaises(TypeError):
+                manifest.record('oasis', 'k', {'lookup': object()}, {'items': fp})
+
+            self.assertEqual([MANIFEST_FILE_NAME, 'keys.csv'], sorted(os.listdir(d)))
+            self.assertTrue(OasisFilesManifest(d).is_up_to_date('keys', 'k'))
+            self.assertNotIn('oasis', OasisFilesManifest(d).stages)
@@ -30,14 +30,17 @@ from hypothesis.strategies import (
     floats,
     just,
     lists,
+    sampled_from,
     text,
     tuples,
 )
 from mock import patch, Mock
 
 from oasislmf.exposures.manager import OasisExposuresManager
+from oasislmf.exposures.manifest import OasisFilesManifest
 from oasislmf.models.model import OasisModel
 from oasislmf.exposures.pipeline import OasisFilesPipeline
+from oasislmf.model_execution.bin import create_binary_files
 
 from oasislmf.utils.exceptions import OasisException
 from oasislmf.utils.fm import (
@@ -843,6 +846,37 @@ class TransformCanonicalToModel(TestCase):
             )
             trans_call_mock.assert_called_once_with()
 
+    @given(
+        canonical_exposures_file_path=text(min_size=1, alphabet=string.ascii_letters),
+        canonical_to_model_exposures_transformation_file_path=text(min_size=1, alphabet=string.ascii_letters),
+        model_exposures_file_path=text(min_size=1, alphabet=string.ascii_letters)
+    )
+    def test_transformation_file_is_a_column_mapping_file___column_mapper_is_used(
+            self,
+            canonical_exposures_file_path,
+            canonical_to_model_exposures_transformation_file_path,
+            model_exposures_file_path):
+
+        mapping_file_path = '{}.json'.format(canonical_to_model_exposures_transformation_file_path)
+
+        mapper_call_mock = Mock()
+        with patch('oasislmf.exposures.manager.Translator') as trans_mock, \
+                patch('oasislmf.exposures.manager.ColumnMapper', Mock(return_value=mapper_call_mock)) as mapper_mock:
+            OasisExposuresManager().transform_canonical_to_model(
+                canonical_exposures_file_path=canonical_exposures_file_path,
+                canonical_to_model_exposures_transformation_file_path=mapping_file_path,
+                model_exposures_file_path=model_exposures_file_path,
+            )
+
+            trans_mock.assert_not_called()
+            mapper_mock.assert_called_once_with(
+                os.path.abspath(canonical_exposures_file_path),
+                os.path.abspath(model_exposures_file_path),
+                os.path.abspath(mapping_file_path),
+                append_row_nums=False
+            )
+            mapper_call_mock.assert_called_once_with()
+
 
 class GetKeys(TestCase):
     def create_model(
@@ -2035,6 +2069,119 @@ class LoadFmItems(TestCase):
             shr = can_it.get(shr_elm) or 0.0
             self.assertEqual(it['share'], shr)
 
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        exposures=canonical_exposures_data(
+            from_account_nums=just('A1'),
+            from_tivs1=just(100),
+            from_tivs2=just(0),
+            from_tivs3=just(0),
+            from_tivs4=just(0),
+            from_limits1=just(1),
+            from_limits2=just(0),
+            from_limits3=just(0),
+            from_limits4=just(0),
+            from_deductibles1=just(1),
+            from_deductibles2=just(0),
+            from_deductibles3=just(0),
+            from_deductibles4=just(0),
+            size=10
+        ),
+        accounts=canonical_accounts_data(
+            from_account_nums=just('A1'),
+            from_policy_nums=just('A1P1'),
+            from_policy_types=just(1),
+            from_layer_deductibles=just(1),
+            from_account_deductibles=just(1),
+            from_account_min_deductibles=just(0),
+            from_account_max_deductibles=just(0),
+            from_account_limits=just(1),
+            from_layer_limits=just(1),
+            size=2
+        ),
+        guls=gul_items_data(
+            from_peril_ids=just(OASIS_PERILS['wind']['id']),
+            from_coverage_type_ids=just(OASIS_COVERAGE_TYPES['buildings']['id']),
+            from_tiv_elements=just('wscv1val'),
+            from_tivs=just(100),
+            from_tiv_tgids=just(1),
+            from_limit_elements=just('wscv1limit'),
+            from_deductible_elements=just('wscv1ded'),
+            from_min_deductible_elements=just(None),
+            from_max_deductible_elements=just(None),
+            from_share_elements=just(None),
+            size=10
+        )
+    )
+    def test_exposure_with_one_coverage_type_and_fm_terms_only_at_the_coverage_level_with_one_account_and_two_top_level_layers_per_account___coverage_items_are_layer_level_items(
+        self,
+        exposures,
+        accounts,
+        guls
+    ):
+        cep = copy.deepcopy(self.exposures_profile)
+        cap = copy.deepcopy(self.accounts_profile)
+        fmap = copy.deepcopy(self.fm_agg_profile)
+
+        for _k, _v in six.iteritems(copy.deepcopy(cep)):
+            if _v.get('FMLevel') not in [None, 1]:
+                for __k in _v:
+                    if 'FM' in __k:
+                        cep[_k].pop(__k)
+
+        for _k, _v in six.iteritems(copy.deepcopy(cap)):
+            for __k in _v:
+                if 'FM' in __k:
+                    cap[_k].pop(__k)
+
+        ufcp = unified_canonical_fm_profile_by_level_and_term_group(profiles=[cep, cap])
+        self.assertEqual(list(ufcp.keys()), [1])
+
+        for it in exposures:
+            it['cond1name'] = 0
+
+        accounts[1]['policynum'] = 'A1P2'
+
+        canexp_df, gul_items_df = (pd.DataFrame(data=its, dtype=object) for its in [exposures, guls])
+
+        for df in [canexp_df, gul_items_df]:
+            df = df.where(df.notnull(), None)
+            df.columns = df.columns.str.lower()
+
+        canexp_df['index'] = pd.Series(data=canexp_df.index, dtype=int)
+
+        gul_items_df['index'] = pd.Series(data=gul_items_df.index, dtype=int)
+        gul_items_df['canexp_id'] = gul_items_df['canexp_id'].astype(int)
+
+        with NamedTemporaryFile('w') as accounts_file:
+            write_canonical_files(canonical_accounts=accounts, canonical_accounts_file_path=accounts_file.name)
+
+            fm_items = list(OasisExposuresManager().load_fm_items(
+                canexp_df,
+                gul_items_df,
+                cep,
+                cap,
+                accounts_file.name,
+                fmap,
+                reduced=False
+            )[0].T.to_dict().values())
+
+        self.assertEqual(len(fm_items), len(guls) * len(accounts))
+
+        self.assertEqual(sorted(it['item_id'] for it in fm_items), list(range(1, len(fm_items) + 1)))
+
+        for i, it in enumerate(sorted(fm_items, key=lambda it: it['item_id'])):
+            gul_it = guls[i // len(accounts)]
+
+            self.assertEqual(it['level_id'], 1)
+            self.assertEqual(it['gul_item_id'], gul_it['item_id'])
+            self.assertEqual(it['canexp_id'], gul_it['canexp_id'])
+            self.assertEqual(it['layer_id'], i % len(accounts) + 1)
+
+            self.assertEqual(it['ded_elm'], gul_it['ded_elm'])
+            self.assertEqual(it['lim_elm'], gul_it['lim_elm'])
+
+
 class FMAcceptanceTests(TestCase):
 
     def setUp(self):
@@ -2780,4 +2927,875 @@ class StartOasisFilesPipeline(TestCase):
         pass
 
     def test_start_oasis_files_pipeline_with_kwargs_fm_all_resources_provided__all_gul_and_fm_files_generated(self):
-        pass
\ No newline at end of file
+        pass
+
+
+class IncrementalOasisFilesGeneration(TestCase):
+
+    def setUp(self):
+        self.manager = OasisExposuresManager()
+
+        def write_output(*names):
+            def fn(**kwargs):
+                for name in names:
+                    with io.open(kwargs['{}_file_path'.format(name)], 'w', encoding='utf-8') as f:
+                        f.write('{}\n'.format(name))
+                return {name: kwargs['{}_file_path'.format(name)] for name in names}
+            return Mock(side_effect=fn)
+
+        self.manager.transform_source_to_canonical = write_output('canonical_exposures')
+        self.manager.transform_canonical_to_model = write_output('model_exposures')
+        self.manager.get_keys = write_output('keys', 'keys_errors')
+        self.manager.write_gul_files = write_output('items', 'coverages', 'gulsummaryxref')
+
+    def run_pipeline(self, oasis_files_path, source_exposures_file_path, lookup, **kwargs):
+        return self.manager.start_oasis_files_pipeline(
+            oasis_files_path=oasis_files_path,
+            source_exposures_file_path=source_exposures_file_path,
+            canonical_exposures_profile=canonical_exposures_profile,
+            lookup=lookup,
+            **kwargs
+        )
+
+    def stage_calls(self):
+        stage_mocks = (
+            self.manager.transform_source_to_canonical,
+            self.manager.transform_canonical_to_model,
+            self.manager.get_keys,
+            self.manager.write_gul_files
+        )
+        calls = tuple(m.call_count for m in stage_mocks)
+        for m in stage_mocks:
+            m.reset_mock()
+        return calls
+
+    def test_inputs_are_unchanged___files_are_reused(self):
+        with TemporaryDirectory() as oasis_files_path, TemporaryDirectory() as d:
+            source_exposures_file_path = os.path.join(d, 'source.csv')
+            with io.open(source_exposures_file_path, 'w', encoding='utf-8') as f:
+                f.write('LocNumber\n1\n')
+
+            first_files = self.run_pipeline(oasis_files_path, source_exposures_file_path, FakeKeysLookup())
+            self.assertEqual((1, 1, 1, 1), self.stage_calls())
+
+            second_files = self.run_pipeline(oasis_files_path, source_exposures_file_path, FakeKeysLookup())
+            self.assertEqual((0, 0, 0, 0), self.stage_calls())
+            self.assertEqual(first_files, second_files)
+
+            self.run_pipeline(oasis_files_path, source_exposures_file_path, FakeKeysLookup(), force=True)
+            self.assertEqual((1, 1, 1, 1), self.stage_calls())
+
+    def test_lookup_is_changed___only_keys_and_oasis_files_are_regenerated(self):
+        class OtherFakeKeysLookup(FakeKeysLookup):
+            pass
+
+        with TemporaryDirectory() as oasis_files_path, TemporaryDirectory() as d:
+            source_exposures_file_path = os.path.join(d, 'source.csv')
+            with io.open(source_exposures_file_path, 'w', encoding='utf-8') as f:
+                f.write('LocNumber\n1\n')
+
+            self.run_pipeline(oasis_files_path, source_exposures_file_path, FakeKeysLookup())
+            self.stage_calls()
+
+            self.run_pipeline(oasis_files_path, source_exposures_file_path, OtherFakeKeysLookup())
+            self.assertEqual((0, 0, 1, 1), self.stage_calls())
+
+    def test_source_file_or_outputs_are_changed___dependent_files_are_regenerated(self):
+        with TemporaryDirectory() as oasis_files_path, TemporaryDirectory() as d:
+            source_exposures_file_path = os.path.join(d, 'source.csv')
+            with io.open(source_exposures_file_path, 'w', encoding='utf-8') as f:
+                f.write('LocNumber\n1\n')
+
+            self.run_pipeline(oasis_files_path, source_exposures_file_path, FakeKeysLookup())
+            self.stage_calls()
+
+            with io.open(source_exposures_file_path, 'w', encoding='utf-8') as f:
+                f.write('LocNumber\n2\n')
+
+            oasis_files = self.run_pipeline(oasis_files_path, source_exposures_file_path, FakeKeysLookup())
+            self.assertEqual((1, 1, 1, 1), self.stage_calls())
+
+            os.remove(oasis_files['items'])
+
+            self.run_pipeline(oasis_files_path, source_exposures_file_path, FakeKeysLookup())
+            self.assertEqual((0, 0, 0, 1), self.stage_calls())
+
+    def test_delta_and_source_file_is_changed___exposures_delta_is_written_from_the_previous_files(self):
+        def write_exposures_delta(previous_files=None, **kwargs):
+            with io.open(kwargs['source_exposures_hashes_file_path'], 'w', encoding='utf-8') as f:
+                f.write('key,hash\n')
+            if not previous_files:
+                return
+            for name in ['canonical_exposures', 'model_exposures', 'keys', 'keys_errors']:
+                with io.open(kwargs['{}_file_path'.format(name)], 'w', encoding='utf-8') as f:
+                    f.write('{} delta\n'.format(name))
+            return tuple(kwargs['{}_file_path'.format(name)] for name in ['canonical_exposures', 'model_exposures', 'keys', 'keys_errors'])
+
+        self.manager.write_exposures_delta = Mock(side_effect=write_exposures_delta)
+
+        with TemporaryDirectory() as oasis_files_path, TemporaryDirectory() as d:
+            source_exposures_file_path = os.path.join(d, 'source.csv')
+            with io.open(source_exposures_file_path, 'w', encoding='utf-8') as f:
+                f.write('LocNumber\n1\n')
+
+            self.run_pipeline(oasis_files_path, source_exposures_file_path, FakeKeysLookup(), delta=True)
+            self.assertEqual((1, 1, 1, 1), self.stage_calls())
+            self.assertIsNone(self.manager.write_exposures_delta.call_args[1]['previous_files'])
+
+            with io.open(source_exposures_file_path, 'w', encoding='utf-8') as f:
+                f.write('LocNumber\n1\n2\n')
+
+            self.run_pipeline(oasis_files_path, source_exposures_file_path, FakeKeysLookup(), delta=True)
+            self.assertEqual((0, 0, 0, 1), self.stage_calls())
+            self.assertEqual(
+                ['canonical_exposures', 'keys', 'keys_errors', 'model_exposures', 'source_exposures_hashes'],
+                sorted(self.manager.write_exposures_delta.call_args[1]['previous_files'])
+            )
+
+            self.run_pipeline(oasis_files_path, source_exposures_file_path, FakeKeysLookup(), delta=True)
+            self.assertEqual((0, 0, 0, 0), self.stage_calls())
+            self.assertEqual(2, self.manager.write_exposures_delta.call_count)
+
+    def test_chunk_size_is_changed___keys_and_oasis_files_are_regenerated(self):
+        def write_oasis_files_in_chunks(**kwargs):
+            names = ['keys', 'keys_errors', 'items', 'coverages', 'gulsummaryxref']
+            for name in names:
+                with io.open(kwargs['{}_file_path'.format(name)], 'w', encoding='utf-8') as f:
+                    f.write('{}\n'.format(name))
+            return {name: kwargs['{}_file_path'.format(name)] for name in names[2:]}
+
+        self.manager.write_oasis_files_in_chunks = Mock(side_effect=write_oasis_files_in_chunks)
+
+        with TemporaryDirectory() as oasis_files_path, TemporaryDirectory() as d:
+            source_exposures_file_path = os.path.join(d, 'source.csv')
+            with io.open(source_exposures_file_path, 'w', encoding='utf-8') as f:
+                f.write('LocNumber\n1\n')
+
+            self.run_pipeline(oasis_files_path, source_exposures_file_path, FakeKeysLookup())
+            self.stage_calls()
+
+            for chunk_size, num_chunked_runs in [(10, 1), (10, 1), (5, 2)]:
+                self.run_pipeline(oasis_files_path, source_exposures_file_path, FakeKeysLookup(), chunk_size=chunk_size)
+                self.assertEqual((0, 0, 0, 0), self.stage_calls())
+                self.assertEqual(num_chunked_runs, self.manager.write_oasis_files_in_chunks.call_count)
+
+    def test_fused_mode_is_changed___oasis_files_are_regenerated(self):
+        with TemporaryDirectory() as oasis_files_path, TemporaryDirectory() as d:
+            source_exposures_file_path = os.path.join(d, 'source.csv')
+            with io.open(source_exposures_file_path, 'w', encoding='utf-8') as f:
+                f.write('LocNumber\n1\n')
+
+            self.run_pipeline(oasis_files_path, source_exposures_file_path, FakeKeysLookup())
+            self.stage_calls()
+
+            self.run_pipeline(oasis_files_path, source_exposures_file_path, FakeKeysLookup(), fused=True)
+            self.assertEqual((0, 0, 0, 1), self.stage_calls())
+
+    def test_delta_and_fused___oasis_exception_is_raised(self):
+        with TemporaryDirectory() as oasis_files_path, TemporaryDirectory() as d:
+            source_exposures_file_path = os.path.join(d, 'source.csv')
+            with io.open(source_exposures_file_path, 'w', encoding='utf-8') as f:
+                f.write('LocNumber\n1\n')
+
+            with self.assertRaises(OasisException):
+                self.run_pipeline(oasis_files_path, source_exposures_file_path, FakeKeysLookup(), delta=True, fused=True)
+
+
+class FakeKeysLookup(object):
+    """
+    Keys lookup returning a successful buildings coverage keys record for
+    each location.
+    """
+    def process_locations(self, loc_df):
+        for loc_id in loc_df['row_id']:
+            yield {
+                'id': int(loc_id),
+                'peril_id': OASIS_PERILS['wind']['id'],
+                'coverage_type': OASIS_COVERAGE_TYPES['buildings']['id'],
+                'area_peril_id': int(loc_id),
+                'vulnerability_id': 1,
+                'status': OASIS_KEYS_STATUS['success']['id'],
+                'message': ''
+            }
+
+
+class FailingFakeKeysLookup(FakeKeysLookup):
+    """
+    Keys lookup failing for the locations with odd location numbers, and
+    returning a successful buildings coverage keys record for the others.
+    """
+    def process_locations(self, loc_df):
+        for loc_id, loc_num in zip(loc_df['row_id'], loc_df['locnum']):
+            if int(loc_num) % 2:
+                yield {
+                    'id': int(loc_id),
+                    'peril_id': OASIS_PERILS['wind']['id'],
+                    'coverage_type': OASIS_COVERAGE_TYPES['buildings']['id'],
+                    'status': OASIS_KEYS_STATUS['fail']['id'],
+                    'message': 'No area peril, for location {}'.format(loc_num)
+                }
+            else:
+                yield {
+                    'id': int(loc_id),
+                    'peril_id': OASIS_PERILS['wind']['id'],
+                    'coverage_type': OASIS_COVERAGE_TYPES['buildings']['id'],
+                    'area_peril_id': int(loc_num),
+                    'vulnerability_id': 1,
+                    'status': OASIS_KEYS_STATUS['success']['id'],
+                    'message': ''
+                }
+
+
+def write_source_files(exposures, accounts, source_dir):
+    """
+    Writes source exposures and accounts files with the columns of the
+    canonical exposures and accounts, and column mapping transformation
+    files which transform them to the canonical files, and the canonical
+    exposures to model exposures with the row IDs and location numbers -
+    returns the paths of the files as model resources.
+    """
+    def write_transformation(fp, columns):
+        with io.open(fp, 'w', encoding='utf-8') as f:
+            f.write(six.text_type(json.dumps({'columns': [{'name': name, 'source': source} for name, source in columns]})))
+
+    write_canonical_files(exposures, os.path.join(source_dir, 'canexp.csv'), accounts, os.path.join(source_dir, 'canacc.csv'))
+
+    resources = {}
+    for source_type in ['exposures', 'accounts']:
+        canonical_df = pd.read_csv(os.path.join(source_dir, 'can{}.csv'.format(source_type[:3])), dtype=object, na_filter=False)
+        source_df = canonical_df.drop('ROW_ID', axis=1) if 'ROW_ID' in canonical_df.columns else canonical_df
+
+        resources['source_{}_file_path'.format(source_type)] = os.path.join(source_dir, 'source_{}.csv'.format(source_type))
+        source_df.to_csv(resources['source_{}_file_path'.format(source_type)], index=False)
+
+        resources['source_to_canonical_{}_transformation_file_path'.format(source_type)] = os.path.join(source_dir, 'source_to_canonical_{}.json'.format(source_type))
+        write_transformation(resources['source_to_canonical_{}_transformation_file_path'.format(source_type)], [(col, col) for col in source_df.columns])
+
+    resources['canonical_to_model_exposures_transformation_file_path'] = os.path.join(source_dir, 'canonical_to_model.json')
+    write_transformation(resources['canonical_to_model_exposures_transformation_file_path'], [('ROW_ID', 'ROW_ID'), ('ID', 'ROW_ID'), ('LOCNUM', 'LOCNUM')])
+
+    return resources
+
+
+class WriteExposuresDelta(TestCase):
+
+    def setUp(self):
+        self.manager = OasisExposuresManager()
+        self.exposures_profile = canonical_exposures_profile
+
+    def write_files(self, target_dir, source_exposures_file_path, source_to_canonical_fp, canonical_to_model_fp, previous_files=None):
+        files = {
+            f: os.path.join(target_dir, '{}.csv'.format(f))
+            for f in ['source_exposures_hashes', 'canonical_exposures', 'model_exposures', 'keys', 'keys_errors']
+        }
+        kwargs = dict(
+            lookup=FailingFakeKeysLookup(),
+            source_exposures_file_path=source_exposures_file_path,
+            source_to_canonical_exposures_transformation_file_path=source_to_canonical_fp,
+            canonical_to_model_exposures_transformation_file_path=canonical_to_model_fp,
+            **{'{}_file_path'.format(f): fp for f, fp in six.iteritems(files)}
+        )
+
+        if previous_files:
+            return self.manager.write_exposures_delta(previous_files=previous_files, **kwargs), files
+
+        self.manager.transform_source_to_canonical(**kwargs)
+        self.manager.transform_canonical_to_model(**kwargs)
+        self.manager.get_keys(**kwargs)
+        self.manager.write_exposures_delta(**kwargs)
+
+        return None, files
+
+    def write_gul_files(self, files, target_dir):
+        return self.manager.write_gul_files(
+            canonical_exposures_profile=self.exposures_profile,
+            canonical_exposures_file_path=files['canonical_exposures'],
+            keys_file_path=files['keys'],
+            **{'{}_file_path'.format(f): os.path.join(target_dir, '{}.csv'.format(f)) for f in ['items', 'coverages', 'gulsummaryxref']}
+        )
+
+    @settings(max_examples=10, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        exposures=canonical_exposures_data(
+            from_tivs1=floats(min_value=1.0, max_value=10**6),
+            min_size=2,
+            max_size=10
+        ),
+        changes=lists(sampled_from(['keep', 'change', 'remove']), min_size=9, max_size=9),
+        num_added=integers(min_value=0, max_value=3)
+    )
+    def test_locations_are_changed_added_or_removed___files_are_identical_to_those_regenerated_in_full(self, exposures, changes, num_added):
+        with TemporaryDirectory() as d:
+            write_canonical_files(exposures, os.path.join(d, 'canexp.csv'))
+            source_df = pd.read_csv(os.path.join(d, 'canexp.csv'), dtype=object, na_filter=False).drop('ROW_ID', axis=1)
+
+            source_to_canonical_fp = os.path.join(d, 'source_to_canonical.json')
+            with io.open(source_to_canonical_fp, 'w', encoding='utf-8') as f:
+                f.write(six.text_type(json.dumps({'columns': [{'name': col, 'source': col} for col in source_df.columns]})))
+
+            canonical_to_model_fp = os.path.join(d, 'canonical_to_model.json')
+            with io.open(canonical_to_model_fp, 'w', encoding='utf-8') as f:
+                f.write(six.text_type(json.dumps({'columns': [
+                    {'name': 'ROW_ID', 'source': 'ROW_ID'},
+                    {'name': 'ID', 'source': 'ROW_ID'},
+                    {'name': 'LOCNUM', 'source': 'LOCNUM'},
+                    {'name': 'LATITUDE', 'source': 'LATITUDE'}
+                ]})))
+
+            previous_source_fp = os.path.join(d, 'previous_source.csv')
+            source_df.to_csv(previous_source_fp, index=False)
+
+            # The first location is kept, the others are kept, changed or
+            # removed, and new locations are added after the first
+            rows = [source_df.iloc[0]]
+            for i in range(num_added):
+                row = source_df.iloc[0].copy()
+                row['LOCNUM'] = str(10**13 + i)
+                rows.append(row)
+            for change, (_, row) in zip(changes, source_df.iloc[1:].iterrows()):
+                if change == 'change':
+                    row = row.copy()
+                    row['WSCV1VAL'] = str(float(row['WSCV1VAL']) + 1)
+                if change != 'remove':
+                    rows.append(row)
+
+            source_fp = os.path.join(d, 'source.csv')
+            pd.DataFrame(rows, columns=source_df.columns).to_csv(source_fp, index=False)
+
+            for target_dir in ['previous', 'delta', 'full']:
+                os.mkdir(os.path.join(d, target_dir))
+
+            _, previous_files = self.write_files(os.path.join(d, 'previous'), previous_source_fp, source_to_canonical_fp, canonical_to_model_fp)
+            delta_result, delta_files = self.write_files(os.path.join(d, 'delta'), source_fp, source_to_canonical_fp, canonical_to_model_fp, previous_files=previous_files)
+            _, full_files = self.write_files(os.path.join(d, 'full'), source_fp, source_to_canonical_fp, canonical_to_model_fp)
+
+            self.assertIsNotNone(delta_result)
+            for f in ['source_exposures_hashes', 'canonical_exposures', 'model_exposures', 'keys', 'keys_errors']:
+                self.assertEqual(io.open(full_files[f]).read(), io.open(delta_files[f]).read())
+
+            if len(pd.read_csv(full_files['keys'])):
+                delta_gul_files = self.write_gul_files(delta_files, os.path.join(d, 'delta'))
+                full_gul_files = self.write_gul_files(full_files, os.path.join(d, 'full'))
+                for f in ['items', 'coverages', 'gulsummaryxref']:
+                    self.assertEqual(io.open(full_gul_files[f]).read(), io.open(delta_gul_files[f]).read())
+
+    def test_xslt_transformations_and_first_changed_location_has_an_empty_field___files_are_identical_to_those_regenerated_in_full(self):
+        copy_xslt = (
+            '<xsl:stylesheet version="1.0" xmlns:xsl="http://www.w3.org/1999/XSL/Transform">'
+            '<xsl:template match="/root"><root><xsl:apply-templates select="rec"/></root></xsl:template>'
+            '<xsl:template match="rec"><rec {}><xsl:copy-of select="@*"/></rec></xsl:template>'
+            '</xsl:stylesheet>'
+        )
+
+        with TemporaryDirectory() as d:
+            source_to_canonical_fp = os.path.join(d, 'source_to_canonical.xslt')
+            canonical_to_model_fp = os.path.join(d, 'canonical_to_model.xslt')
+            for fp, attrs in [(source_to_canonical_fp, ''), (canonical_to_model_fp, 'ID="{@ROW_ID}"')]:
+                with io.open(fp, 'w', encoding='utf-8') as f:
+                    f.write(six.text_type(copy_xslt.format(attrs)))
+
+            columns = ['LOCNUM', 'WSCV1VAL', 'OCCSCHEME']
+            previous_source_fp = os.path.join(d, 'previous_source.csv')
+            pd.DataFrame([['2', '10', 'ATC'], ['4', '20', 'ATC'], ['6', '30', 'ATC']], columns=columns).to_csv(previous_source_fp, index=False)
+            source_fp = os.path.join(d, 'source.csv')
+            pd.DataFrame([['2', '10', 'ATC'], ['4', '21', ''], ['6', '31', 'ISO']], columns=columns).to_csv(source_fp, index=False)
+
+            for target_dir in ['previous', 'delta', 'full']:
+                os.mkdir(os.path.join(d, target_dir))
+
+            _, previous_files = self.write_files(os.path.join(d, 'previous'), previous_source_fp, source_to_canonical_fp, canonical_to_model_fp)
+            delta_result, delta_files = self.write_files(os.path.join(d, 'delta'), source_fp, source_to_canonical_fp, canonical_to_model_fp, previous_files=previous_files)
+            _, full_files = self.write_files(os.path.join(d, 'full'), source_fp, source_to_canonical_fp, canonical_to_model_fp)
+
+            self.assertIsNotNone(delta_result)
+            self.assertEqual(['ATC', '', 'ISO'], pd.read_csv(delta_files['model_exposures'], dtype=object, na_filter=False)['OCCSCHEME'].tolist())
+            for f in ['canonical_exposures', 'model_exposures', 'keys', 'keys_errors']:
+                self.assertEqual(io.open(full_files[f]).read(), io.open(delta_files[f]).read())
+
+    def test_no_previous_files___no_delta_is_written_and_hashes_file_is_written(self):
+        with TemporaryDirectory() as d:
+            source_fp = os.path.join(d, 'source.csv')
+            pd.DataFrame({'LOCNUM': ['1', '2'], 'WSCV1VAL': ['1', '2']}).to_csv(source_fp, index=False)
+
+            result = self.manager.write_exposures_delta(
+                lookup=FailingFakeKeysLookup(),
+                source_exposures_file_path=source_fp,
+                source_exposures_hashes_file_path=os.path.join(d, 'hashes.csv'),
+                canonical_exposures_file_path=os.path.join(d, 'canexp.csv')
+            )
+
+            self.assertIsNone(result)
+            self.assertTrue(os.path.exists(os.path.join(d, 'hashes.csv')))
+            self.assertFalse(os.path.exists(os.path.join(d, 'canexp.csv')))
+
+
+class WriteOasisFilesInChunks(TestCase):
+
+    def setUp(self):
+        self.manager = OasisExposuresManager()
+        self.exposures_profile = canonical_exposures_profile
+        self.accounts_profile = canonical_accounts_profile
+        self.fm_agg_profile = oed_fm_agg_profile
+
+    def test_no_chunk_size__oasis_exception_is_raised(self):
+        with self.assertRaises(OasisException):
+            self.manager.write_oasis_files_in_chunks(lookup=FakeKeysLookup())
+
+    def test_non_positive_chunk_size__oasis_exception_is_raised(self):
+        with self.assertRaises(OasisException):
+            self.manager.write_oasis_files_in_chunks(chunk_size=-1, lookup=FakeKeysLookup())
+
+    def write_files_in_chunks_and_in_full(self, exposures, accounts, chunk_size, chunks_dir, full_dir):
+        cep = self.exposures_profile
+        cap = self.accounts_profile
+        fmap = self.fm_agg_profile
+
+        oasis_files = ['items', 'coverages', 'gulsummaryxref', 'fm_policytc', 'fm_profile', 'fm_programme', 'fm_xref', 'fmsummaryxref']
+
+        with NamedTemporaryFile('w') as exposures_file, NamedTemporaryFile('w') as accounts_file:
+            write_canonical_files(exposures, exposures_file.name, accounts, accounts_file.name)
+
+            keys_file_path = os.path.join(chunks_dir, 'keys.csv')
+
+            chunked_files = self.manager.write_oasis_files_in_chunks(
+                chunk_size=chunk_size,
+                fm=True,
+                lookup=FakeKeysLookup(),
+                canonical_exposures_profile=cep,
+                canonical_accounts_profile=cap,
+                fm_agg_profile=fmap,
+                canonical_exposures_file_path=exposures_file.name,
+                canonical_accounts_file_path=accounts_file.name,
+                model_exposures_file_path=exposures_file.name,
+                keys_file_path=keys_file_path,
+                **{'{}_file_path'.format(f): os.path.join(chunks_dir, '{}.csv'.format(f)) for f in oasis_files}
+            )
+
+            gul_items_df, canexp_df = self.manager.load_gul_items(cep, exposures_file.name, keys_file_path)
+            self.assertEqual(len(pd.read_csv(keys_file_path)), len(exposures))
+
+            full_files = dict(itertools.chain(
+                six.iteritems(self.manager.write_gul_files(
+                    canonical_exposures_profile=cep,
+                    canonical_exposures_file_path=exposures_file.name,
+                    keys_file_path=keys_file_path,
+                    **{'{}_file_path'.format(f): os.path.join(full_dir, '{}.csv'.format(f)) for f in oasis_files[:3]}
+                )),
+                six.iteritems(self.manager.write_fm_files(
+                    canonical_exposures_df=canexp_df,
+                    gul_items_df=gul_items_df,
+                    canonical_exposures_profile=cep,
+                    canonical_accounts_profile=cap,
+                    canonical_accounts_file_path=accounts_file.name,
+                    fm_agg_profile=fmap,
+                    **{'{}_file_path'.format(f): os.path.join(full_dir, '{}.csv'.format(f)) for f in oasis_files[3:]}
+                ))
+            ))
+
+        return chunked_files, full_files
+
+    def assert_oasis_files_are_equivalent(self, chunked_files, full_files):
+        for f in ['items', 'coverages', 'gulsummaryxref', 'fm_programme', 'fm_xref', 'fmsummaryxref']:
+            self.assertTrue(pd.read_csv(chunked_files[f]).equals(pd.read_csv(full_files[f])), f)
+
+        # The policy T & C IDs are assigned chunk by chunk, so the policy
+        # T & C and profile files are compared via the terms of each
+        # (layer, level, aggregation) triple
+        def policytc_terms(files):
+            df = pd.merge(
+                pd.read_csv(files['fm_policytc']),
+                pd.read_csv(files['fm_profile']).drop_duplicates('policytc_id'),
+                on='policytc_id'
+            ).drop('policytc_id', axis=1)
+            return df.sort_values(list(df.columns)).reset_index(drop=True)
+
+        self.assertTrue(policytc_terms(chunked_files).equals(policytc_terms(full_files)))
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        exposures=canonical_exposures_data(
+            from_account_nums=just('A1'),
+            from_tivs1=floats(min_value=1.0, max_value=10**6),
+            from_tivs2=just(0),
+            from_tivs3=just(0),
+            from_tivs4=just(0),
+            from_deductibles1=floats(min_value=0.0, max_value=10**3),
+            from_limits1=floats(min_value=0.0, max_value=10**5),
+            min_size=1,
+            max_size=10
+        ),
+        accounts=canonical_accounts_data(
+            from_account_nums=just('A1'),
+            from_policy_types=just(1),
+            from_account_deductibles=just(0),
+            from_account_min_deductibles=just(0),
+            from_account_max_deductibles=just(0),
+            from_account_limits=just(0.1),
+            from_layer_deductibles=just(1),
+            from_layer_limits=just(1),
+            size=2
+        ),
+        chunk_size=integers(min_value=1, max_value=11)
+    )
+    def test_exposures_with_one_account_and_two_layers_written_in_chunks___oasis_files_are_equivalent_to_those_written_in_full(self, exposures, accounts, chunk_size):
+        accounts[0]['policynum'], accounts[1]['policynum'] = 'A1P1', 'A1P2'
+
+        with TemporaryDirectory() as chunks_dir, TemporaryDirectory() as full_dir:
+            self.assert_oasis_files_are_equivalent(*self.write_files_in_chunks_and_in_full(exposures, accounts, chunk_size, chunks_dir, full_dir))
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        exposures=canonical_exposures_data(
+            from_account_nums=sampled_from(['A1', 'A2', 'A3']),
+            from_tivs1=floats(min_value=1.0, max_value=10**6),
+            from_tivs2=just(0),
+            from_tivs3=just(0),
+            from_tivs4=just(0),
+            from_deductibles1=floats(min_value=0.0, max_value=10**3),
+            from_limits1=floats(min_value=0.0, max_value=10**5),
+            min_size=3,
+            max_size=10
+        ),
+        accounts=canonical_accounts_data(
+            from_policy_types=just(1),
+            from_account_deductibles=just(0),
+            from_account_min_deductibles=just(0),
+            from_account_max_deductibles=just(0),
+            from_account_limits=floats(min_value=0.0, max_value=1.0),
+            from_layer_deductibles=just(1),
+            from_layer_limits=just(1),
+            size=6
+        ),
+        chunk_size=integers(min_value=1, max_value=11)
+    )
+    def test_exposures_with_three_accounts_and_two_layers_per_account_written_in_chunks___oasis_files_are_equivalent_to_those_written_in_full(self, exposures, accounts, chunk_size):
+        for i, it in enumerate(accounts):
+            it['accntnum'] = 'A{}'.format(i // 2 + 1)
+            it['policynum'] = 'A{}P{}'.format(i // 2 + 1, i % 2 + 1)
+
+        # The accounts first appear in the chunks in the reverse of the
+        # order of their aggregation keys
+        exposures[0]['accntnum'], exposures[1]['accntnum'], exposures[2]['accntnum'] = 'A3', 'A2', 'A1'
+
+        with TemporaryDirectory() as chunks_dir, TemporaryDirectory() as full_dir:
+            self.assert_oasis_files_are_equivalent(*self.write_files_in_chunks_and_in_full(exposures, accounts, chunk_size, chunks_dir, full_dir))
+
+    @settings(max_examples=10, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        exposures=canonical_exposures_data(
+            from_account_nums=sampled_from(['A1', 'A2']),
+            from_tivs1=floats(min_value=1.0, max_value=10**6),
+            from_tivs2=just(0),
+            from_tivs3=just(0),
+            from_tivs4=just(0),
+            from_deductibles1=floats(min_value=0.0, max_value=10**3),
+            from_limits1=floats(min_value=0.0, max_value=10**5),
+            min_size=2,
+            max_size=10
+        ),
+        accounts=canonical_accounts_data(
+            from_policy_types=just(1),
+            from_account_deductibles=just(0),
+            from_account_min_deductibles=just(0),
+            from_account_max_deductibles=just(0),
+            from_account_limits=just(0.1),
+            from_layer_deductibles=just(1),
+            from_layer_limits=just(1),
+            size=2
+        ),
+        chunk_size=integers(min_value=1, max_value=11)
+    )
+    def test_pipeline_in_chunks___exposures_are_transformed_in_chunks_and_files_are_equivalent_to_those_of_the_pipeline_in_full(self, exposures, accounts, chunk_size):
+        accounts[0]['accntnum'], accounts[0]['policynum'] = 'A1', 'A1P1'
+        accounts[1]['accntnum'], accounts[1]['policynum'] = 'A2', 'A2P1'
+        exposures[0]['accntnum'], exposures[1]['accntnum'] = 'A2', 'A1'
+
+        with TemporaryDirectory() as d, TemporaryDirectory() as full_dir, TemporaryDirectory() as chunks_dir:
+            resources = dict(
+                write_source_files(exposures, accounts, d),
+                lookup=FakeKeysLookup(),
+                canonical_exposures_profile=self.exposures_profile,
+                canonical_accounts_profile=self.accounts_profile,
+                fm_agg_profile=self.fm_agg_profile
+            )
+
+            def run_pipeline(oasis_files_path, **kwargs):
+                model = self.manager.create_model('Supplier', 'Model', '1', resources=dict(resources, oasis_files_path=oasis_files_path))
+                oasis_files = self.manager.start_oasis_files_pipeline(oasis_model=model, fm=True, **kwargs)
+                manifest = OasisFilesManifest(oasis_files_path)
+                return oasis_files, dict(itertools.chain(*(six.iteritems(manifest.get_outputs(stage)) for stage in ['canonical', 'model', 'keys'])))
+
+            full_oasis_files, full_files = run_pipeline(full_dir)
+
+            with patch.object(OasisExposuresManager, 'transform_canonical_to_model', Mock(side_effect=AssertionError)):
+                chunked_oasis_files, chunked_files = run_pipeline(chunks_dir, chunk_size=chunk_size)
+
+            self.assertEqual(sorted(chunked_files), sorted(full_files))
+            for f in full_files:
+                self.assertEqual(io.open(chunked_files[f], 'rb').read(), io.open(full_files[f], 'rb').read(), f)
+
+            self.assert_oasis_files_are_equivalent(chunked_oasis_files, full_oasis_files)
+
+    @settings(max_examples=3, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        exposures=canonical_exposures_data(
+            from_account_nums=sampled_from(['A1', 'A2']),
+            from_tivs1=floats(min_value=1.0, max_value=10**6),
+            from_tivs2=just(0),
+            from_tivs3=just(0),
+            from_tivs4=just(0),
+            from_deductibles1=floats(min_value=0.0, max_value=10**3),
+            from_limits1=floats(min_value=0.0, max_value=10**5),
+            min_size=2,
+            max_size=5
+        ),
+        accounts=canonical_accounts_data(
+            from_policy_types=just(1),
+            from_account_deductibles=just(0),
+            from_account_min_deductibles=just(0),
+            from_account_max_deductibles=just(0),
+            from_account_limits=just(0.1),
+            from_layer_deductibles=just(1),
+            from_layer_limits=just(1),
+            size=2
+        ),
+        chunk_size=integers(min_value=1, max_value=4)
+    )
+    def test_pipeline_with_binary_files_path___binary_files_are_identical_to_those_converted_from_the_oasis_files(self, exposures, accounts, chunk_size):
+        accounts[0]['accntnum'], accounts[0]['policynum'] = 'A1', 'A1P1'
+        accounts[1]['accntnum'], accounts[1]['policynum'] = 'A2', 'A2P1'
+        exposures[0]['accntnum'], exposures[1]['accntnum'] = 'A2', 'A1'
+
+        with TemporaryDirectory() as d, TemporaryDirectory() as oasis_dir, TemporaryDirectory() as bin_dir:
+            resources = dict(
+                write_source_files(exposures, accounts, d),
+                lookup=FakeKeysLookup(),
+                canonical_exposures_profile=self.exposures_profile,
+                canonical_accounts_profile=self.accounts_profile,
+                fm_agg_profile=self.fm_agg_profile
+            )
+
+            def assert_binary_files_are_converted_oasis_files(binary_files_path, oasis_files):
+                converted_path = os.path.join(bin_dir, 'converted')
+                shutil.rmtree(converted_path, ignore_errors=True)
+                os.mkdir(converted_path)
+                create_binary_files(os.path.dirname(oasis_files['items']), converted_path, do_il=True, native=True)
+
+                self.assertEqual(sorted(os.listdir(binary_files_path)), sorted(os.listdir(converted_path)))
+                for f in os.listdir(converted_path):
+                    self.assertEqual(io.open(os.path.join(binary_files_path, f), 'rb').read(), io.open(os.path.join(converted_path, f), 'rb').read(), f)
+
+            def run_pipeline(oasis_files_path, binary_files_path, **kwargs):
+                model = self.manager.create_model('Supplier', 'Model', '1', resources=dict(resources, oasis_files_path=oasis_files_path))
+                oasis_files = self.manager.start_oasis_files_pipeline(oasis_model=model, fm=True, binary_files_path=binary_files_path, **kwargs)
+                assert_binary_files_are_converted_oasis_files(binary_files_path, oasis_files)
+
+            os.mkdir(os.path.join(oasis_dir, 'full'))
+            run_pipeline(os.path.join(oasis_dir, 'full'), os.path.join(bin_dir, 'full'))
+
+            os.mkdir(os.path.join(oasis_dir, 'chunks'))
+            run_pipeline(os.path.join(oasis_dir, 'chunks'), os.path.join(bin_dir, 'chunks'), chunk_size=chunk_size)
+
+            # The Oasis files written in chunks are reused, so the binary
+            # files are converted from them
+            with patch.object(OasisExposuresManager, 'write_oasis_files_in_chunks', Mock(side_effect=AssertionError)):
+                run_pipeline(os.path.join(oasis_dir, 'chunks'), os.path.join(bin_dir, 'reused'), chunk_size=chunk_size)
+
+
+class WriteOasisFilesFromData(TestCase):
+
+    def setUp(self):
+        self.manager = OasisExposuresManager()
+        self.exposures_profile = canonical_exposures_profile
+        self.accounts_profile = canonical_accounts_profile
+        self.fm_agg_profile = oed_fm_agg_profile
+
+    def test_no_model_exposures_data__oasis_exception_is_raised(self):
+        with TemporaryDirectory() as d:
+            with self.assertRaises(OasisException):
+                self.manager.get_keys_data(lookup=FakeKeysLookup(), keys_file_path=os.path.join(d, 'keys.csv'))
+
+    def test_keys_records_in_several_batches___keys_data_is_the_keys_file_rows(self):
+        modexp_data = pd.DataFrame({'ROW_ID': [str(i) for i in range(1, 8)], 'LOCNUM': [str(i) for i in range(1, 8)]}, dtype=object)
+
+        with TemporaryDirectory() as d, patch('oasislmf.exposures.manager.KEYS_WRITER_BATCH_SIZE', 2):
+            keys_file_path, keys_errors_file_path, keys_data = self.manager.get_keys_data(
+                lookup=FailingFakeKeysLookup(),
+                model_exposures_data=modexp_data,
+                keys_file_path=os.path.join(d, 'keys.csv'),
+                keys_errors_file_path=os.path.join(d, 'keys-errors.csv')
+            )
+
+            self.assertEqual(keys_data.to_csv(index=False), io.open(keys_file_path).read())
+            self.assertEqual(keys_data['LocID'].tolist(), [2, 4, 6])
+
+    @settings(max_examples=10, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        exposures=canonical_exposures_data(
+            from_account_nums=just('A1'),
+            from_tivs1=floats(min_value=1.0, max_value=10**6),
+            from_tivs2=just(0),
+            from_tivs3=just(0),
+            from_tivs4=just(0),
+            from_deductibles1=floats(min_value=0.0, max_value=10**3),
+            from_limits1=floats(min_value=0.0, max_value=10**5),
+            min_size=1,
+            max_size=10
+        ),
+        accounts=canonical_accounts_data(
+            from_account_nums=just('A1'),
+            from_policy_types=just(1),
+            from_account_deductibles=just(0),
+            from_account_min_deductibles=just(0),
+            from_account_max_deductibles=just(0),
+            from_account_limits=just(0.1),
+            from_layer_deductibles=just(1),
+            from_layer_limits=just(1),
+            size=2
+        ),
+        chunk_size=integers(min_value=1, max_value=11)
+    )
+    def test_exposures_and_accounts_data_in_memory___oasis_files_are_identical_to_those_written_from_files(self, exposures, accounts, chunk_size):
+        cep = self.exposures_profile
+        cap = self.accounts_profile
+        fmap = self.fm_agg_profile
+
+        accounts[0]['policynum'], accounts[1]['policynum'] = 'A1P1', 'A1P2'
+
+        oasis_files = ['items', 'coverages', 'gulsummaryxref', 'fm_policytc', 'fm_profile', 'fm_programme', 'fm_xref', 'fmsummaryxref']
+
+        def oasis_files_kwargs(target_dir, files):
+            return {'{}_file_path'.format(f): os.path.join(target_dir, '{}.csv'.format(f)) for f in files}
+
+        with NamedTemporaryFile('w') as exposures_file, NamedTemporaryFile('w') as accounts_file, TemporaryDirectory() as files_dir, TemporaryDirectory() as data_dir, TemporaryDirectory() as chunks_dir:
+            write_canonical_files(exposures, exposures_file.name, accounts, accounts_file.name)
+
+            canexp_data = pd.read_csv(exposures_file.name, dtype=object)
+            canacc_data = pd.read_csv(accounts_file.name, dtype=object)
+
+            keys_file_path = os.path.join(files_dir, 'keys.csv')
+            self.manager.get_keys(
+                lookup=FakeKeysLookup(),
+                model_exposures_file_path=exposures_file.name,
+                keys_file_path=keys_file_path,
+                keys_errors_file_path=os.path.join(files_dir, 'keys-errors.csv')
+            )
+            gul_items_df, canexp_df = self.manager.load_gul_items(cep, exposures_file.name, keys_file_path)
+
+            files = dict(itertools.chain(
+                six.iteritems(self.manager.write_gul_files(
+                    canonical_exposures_profile=cep,
+                    canonical_exposures_file_path=exposures_file.name,
+                    keys_file_path=keys_file_path,
+                    **oasis_files_kwargs(files_dir, oasis_files[:3])
+                )),
+                six.iteritems(self.manager.write_fm_files(
+                    canonical_exposures_df=canexp_df,
+                    gul_items_df=gul_items_df,
+                    canonical_exposures_profile=cep,
+                    canonical_accounts_profile=cap,
+                    canonical_accounts_file_path=accounts_file.name,
+                    fm_agg_profile=fmap,
+                    **oasis_files_kwargs(files_dir, oasis_files[3:])
+                ))
+            ))
+
+            data_keys_file_path, _, keys_data = self.manager.get_keys_data(
+                lookup=FakeKeysLookup(),
+                model_exposures_data=canexp_data,
+                keys_file_path=os.path.join(data_dir, 'keys.csv')
+            )
+            self.assertEqual(io.open(data_keys_file_path).read(), io.open(keys_file_path).read())
+
+            data_gul_items_df, data_canexp_df = self.manager.load_gul_items(cep, None, None, canonical_exposures_data=canexp_data, keys_data=keys_data)
+
+            data_files = dict(itertools.chain(
+                six.iteritems(self.manager.write_gul_files(
+                    canonical_exposures_profile=cep,
+                    canonical_exposures_data=canexp_data,
+                    keys_data=keys_data,
+                    **oasis_files_kwargs(data_dir, oasis_files[:3])
+                )),
+                six.iteritems(self.manager.write_fm_files(
+                    canonical_exposures_df=data_canexp_df,
+                    gul_items_df=data_gul_items_df,
+                    canonical_exposures_profile=cep,
+                    canonical_accounts_profile=cap,
+                    canonical_accounts_data=canacc_data,
+                    fm_agg_profile=fmap,
+                    **oasis_files_kwargs(data_dir, oasis_files[3:])
+                ))
+            ))
+
+            chunked_files = self.manager.write_oasis_files_in_chunks(
+                chunk_size=chunk_size,
+                fm=True,
+                lookup=FakeKeysLookup(),
+                canonical_exposures_profile=cep,
+                canonical_accounts_profile=cap,
+                fm_agg_profile=fmap,
+                canonical_exposures_data=canexp_data,
+                model_exposures_data=canexp_data,
+                canonical_accounts_data=canacc_data,
+                keys_file_path=os.path.join(chunks_dir, 'keys.csv'),
+                **oasis_files_kwargs(chunks_dir, oasis_files)
+            )
+
+            for f in oasis_files:
+                self.assertEqual(io.open(data_files[f]).read(), io.open(files[f]).read())
+
+            for f in ['items', 'coverages', 'gulsummaryxref', 'fm_programme', 'fm_xref', 'fmsummaryxref']:
+                self.assertTrue(pd.read_csv(chunked_files[f]).equals(pd.read_csv(files[f])))
+
+    @settings(max_examples=10, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        exposures=canonical_exposures_data(
+            from_account_nums=just('A1'),
+            from_tivs1=floats(min_value=1.0, max_value=10**6),
+            from_tivs2=just(0),
+            from_tivs3=just(0),
+            from_tivs4=just(0),
+            from_deductibles1=floats(min_value=0.0, max_value=10**3),
+            from_limits1=floats(min_value=0.0, max_value=10**5),
+            min_size=1,
+            max_size=10
+        ),
+        accounts=canonical_accounts_data(
+            from_account_nums=just('A1'),
+            from_policy_types=just(1),
+            from_account_deductibles=just(0),
+            from_account_min_deductibles=just(0),
+            from_account_max_deductibles=just(0),
+            from_account_limits=just(0.1),
+            from_layer_deductibles=just(1),
+            from_layer_limits=just(1),
+            size=2
+        )
+    )
+    def test_fused_pipeline___files_are_identical_to_those_of_the_unfused_pipeline(self, exposures, accounts):
+        accounts[0]['policynum'], accounts[1]['policynum'] = 'A1P1', 'A1P2'
+
+        with TemporaryDirectory() as d, TemporaryDirectory() as unfused_dir, TemporaryDirectory() as fused_dir:
+            resources = dict(
+                write_source_files(exposures, accounts, d),
+                lookup=FakeKeysLookup(),
+                canonical_exposures_profile=self.exposures_profile,
+                canonical_accounts_profile=self.accounts_profile,
+                fm_agg_profile=self.fm_agg_profile
+            )
+
+            def run_pipeline(oasis_files_path, **kwargs):
+                model = self.manager.create_model('Supplier', 'Model', '1', resources=dict(resources, oasis_files_path=oasis_files_path))
+                oasis_files = self.manager.start_oasis_files_pipeline(oasis_model=model, fm=True, **kwargs)
+                manifest = OasisFilesManifest(oasis_files_path)
+                return dict(itertools.chain(
+                    six.iteritems(oasis_files),
+                    *(six.iteritems(manifest.get_outputs(stage)) for stage in ['canonical', 'model', 'keys'])
+                ))
+
+            unfused_files = run_pipeline(unfused_dir)
+            fused_files = run_pipeline(fused_dir, fused=True, write_intermediate_files=True)
+
+            self.assertEqual(sorted(fused_files), sorted(unfused_files))
+            for f in unfused_files:
+                self.assertEqual(io.open(fused_files[f], 'rb').read(), io.open(unfused_files[f], 'rb').read(), f)
@@ -0,0 +1,185 @@
+from __future__ import unicode_literals
+
+import itertools
+import os
+
+from collections import namedtuple
+from unittest import TestCase
+
+import pandas as pd
+
+from backports.tempfile import TemporaryDirectory
+from hypothesis import (
+    given,
+    HealthCheck,
+    settings,
+)
+from hypothesis.strategies import (
+    floats,
+    integers,
+    just,
+    lists,
+    one_of,
+    tuples,
+)
+
+from oasislmf.keys.cache import OasisLookupCache
+from oasislmf.keys.lookup import (
+    OasisLookup,
+    OasisLookupFactory,
+)
+from oasislmf.utils.coverage import (
+    BUILDING_COVERAGE_CODE,
+    CONTENTS_COVERAGE_CODE,
+)
+from oasislmf.utils.exceptions import OasisException
+from oasislmf.utils.peril import (
+    DEFAULT_RTREE_INDEX_PROPS,
+    PERIL_ID_SURGE,
+    PERIL_ID_WIND,
+    PerilAreasIndex,
+)
+from oasislmf.utils.status import KEYS_STATUS_FAIL
+
+
+FakePerilArea = namedtuple('FakePerilArea', ['peril_id', 'coverage_type', 'id', 'bounds', 'coordinates'])
+
+
+class OasisLookupCacheStore(TestCase):
+
+    def test_non_positive_max_size___oasis_exception_is_raised(self):
+        with TemporaryDirectory() as d:
+            with self.assertRaises(OasisException):
+                OasisLookupCache(os.path.join(d, 'cache.db'), max_size=0)
+
+    def test_coordinates_are_not_finite_numbers___key_is_none(self):
+        with TemporaryDirectory() as d, OasisLookupCache(os.path.join(d, 'cache.db')) as cache:
+            for x, y in [(None, 1.0), ('a', 1.0), (float('nan'), 1.0), (1.0, float('inf'))]:
+                self.assertIsNone(cache.get_key('ns', x, y, (1, 2)))
+
+    def test_coordinates_round_to_the_same_values___keys_are_the_same(self):
+        with TemporaryDirectory() as d, OasisLookupCache(os.path.join(d, 'cache.db'), coords_precision=3) as cache:
+            self.assertEqual(cache.get_key('ns', 1.00001, 2.0, (1,)), cache.get_key('ns', 1.0, 2.00002, (1,)))
+            self.assertNotEqual(cache.get_key('ns', 1.001, 2.0, (1,)), cache.get_key('ns', 1.0, 2.0, (1,)))
+            self.assertNotEqual(cache.get_key('ns', 1.0, 2.0, (1,)), cache.get_key('ns', 1.0, 2.0, (2,)))
+            self.assertNotEqual(cache.get_key('ns', 1.0, 2.0, (1,)), cache.get_key('other', 1.0, 2.0, (1,)))
+
+    def test_values_are_put___values_are_persisted(self):
+        with TemporaryDirectory() as d:
+            fp = os.path.join(d, 'cache.db')
+            with OasisLookupCache(fp) as cache:
+                keys = [cache.get_key('ns', i, i, ()) for i in range(3)]
+                cache.put_many([(keys[0], (('success', 'msg', 1, 2),)), (keys[1], (('nomatch', 'msg', None, 3),))])
+
+            with OasisLookupCache(fp) as cache:
+                self.assertEqual(len(cache), 2)
+                self.assertEqual(
+                    cache.get_many(keys),
+                    {keys[0]: (('success', 'msg', 1, 2),), keys[1]: (('nomatch', 'msg', None, 3),)}
+                )
+
+                cache.clear()
+                self.assertEqual(len(cache), 0)
+
+    def test_cache_is_full___least_recently_used_entries_are_evicted(self):
+        with TemporaryDirectory() as d, OasisLookupCache(os.path.join(d, 'cache.db'), max_size=3) as cache:
+            keys = [cache.get_key('ns', i, i, ()) for i in range(5)]
+
+            cache.put_many([(keys[0], 0), (keys[1], 1), (keys[2], 2)])
+            cache.get_many([keys[0]])
+            cache.put_many([(keys[3], 3)])
+
+            self.assertEqual(len(cache), 3)
+            self.assertEqual(sorted(cache.get_many(keys).values()), [0, 2, 3])
+
+
+class OasisLookupFactoryGetResultsWithCache(TestCase):
+
+    def create_lookup(self, data_dir, keys_cache=None):
+        """
+        Creates a combined lookup with 4 x 4 square wind peril areas of side
+        0.5, for buildings and contents, no surge peril areas, and
+        vulnerabilities keyed by peril ID, coverage type and occupancy code.
+        """
+        areas = []
+        for i, j, coverage_type in itertools.product(range(4), range(4), (BUILDING_COVERAGE_CODE, CONTENTS_COVERAGE_CODE)):
+            bounds = (0.5 * i, 0.5 * j, 0.5 * (i + 1), 0.5 * (j + 1))
+            coords = ((bounds[0], bounds[1]), (bounds[2], bounds[1]), (bounds[2], bounds[3]), (bounds[0], bounds[3]), (bounds[0], bounds[1]))
+            areas.append(FakePerilArea(PERIL_ID_WIND, coverage_type, len(areas) + 1, bounds, coords))
+        PerilAreasIndex().save(os.path.join(data_dir, 'areas'), peril_areas=areas)
+
+        pd.DataFrame([
+            {'peril_id': p, 'coverage_type': c, 'occ': o, 'vulnerability_id': 100 * p + 10 * c + o}
+            for p, c, o in itertools.product((PERIL_ID_WIND, PERIL_ID_SURGE), (BUILDING_COVERAGE_CODE, CONTENTS_COVERAGE_CODE), range(1, 4))
+        ]).to_csv(os.path.join(data_dir, 'vulns.csv'), index=False)
+
+        config = {
+            'model': {'supplier_id': 'Supplier', 'model_id': 'Model', 'model_version': '1'},
+            'peril': {
+                'peril_ids': [PERIL_ID_WIND, PERIL_ID_SURGE],
+                'rtree_index': dict(DEFAULT_RTREE_INDEX_PROPS, filename='areas'),
+                'loc_to_global_areas_boundary_min_distance': 0.5
+            },
+            'coverage': {'coverage_types': [BUILDING_COVERAGE_CODE, CONTENTS_COVERAGE_CODE]},
+            'vulnerability': {
+                'file_path': 'vulns.csv',
+                'file_type': 'csv',
+                'key_cols': ['peril_id', 'coverage_type', 'occ'],
+                'col_dtypes': {'peril_id': 'int', 'coverage_type': 'int', 'occ': 'int', 'vulnerability_id': 'int'},
+                'vulnerability_id_col': 'vulnerability_id'
+            },
+            'locations': {'id_col': 'id', 'coords_x_col': 'lon', 'coords_y_col': 'lat'}
+        }
+        if keys_cache:
+            config['keys_cache'] = keys_cache
+
+        return OasisLookup(config=config, config_dir=data_dir)
+
+    @settings(max_examples=20, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        locs=lists(
+            tuples(
+                one_of(integers(min_value=-2, max_value=10).map(lambda x: 0.25 * x), floats(min_value=-1, max_value=3), just(500.0)),
+                one_of(integers(min_value=-2, max_value=10).map(lambda y: 0.25 * y), floats(min_value=-1, max_value=3)),
+                integers(min_value=0, max_value=4)
+            ),
+            min_size=1, max_size=20
+        )
+    )
+    def test_lookup_is_repeated_with_cache___results_are_identical_to_uncached_lookup(self, locs):
+        with TemporaryDirectory() as d:
+            lookup = self.create_lookup(d)
+
+            model_exposures_fp = os.path.join(d, 'locs.csv')
+            pd.DataFrame({
+                'id': range(1, len(locs) + 1),
+                'lon': [x for x, _, _ in locs],
+                'lat': [y for _, y, _ in locs],
+                'occ': [o for _, _, o in locs]
+            }).to_csv(model_exposures_fp, index=False)
+
+            expected = list(OasisLookupFactory.get_results(lookup, model_exposures_fp=model_exposures_fp))
+
+            with OasisLookupCache(os.path.join(d, 'cache.db')) as cache:
+                for _ in range(2):
+                    results = list(OasisLookupFactory.get_results(lookup, model_exposures_fp=model_exposures_fp, cache=cache))
+                    self.assertEqual(results, expected)
+                    self.assertEqual([list(r) for r in results], [list(r) for r in expected])
+
+                # Locations with failed lookups are not cached
+                num_items = len(lookup.peril_ids) * len(lookup.coverage_types)
+                cacheable = [all(r['status'] != KEYS_STATUS_FAIL for r in expected[i:i + num_items]) for i in range(0, len(expected), num_items)]
+                self.assertEqual(cache.hits, sum(cacheable))
+                self.assertEqual(cache.misses, 2 * len(locs) - sum(cacheable))
+
+    def test_cache_is_set_in_the_lookup_config___cache_file_is_used(self):
+        with TemporaryDirectory() as d:
+            lookup = self.create_lookup(d, keys_cache={'file_path': 'cache.db', 'max_size': 10})
+
+            model_exposures_fp = os.path.join(d, 'locs.csv')
+            pd.DataFrame({'id': [1, 2], 'lon': [0.2, 1.2], 'lat': [0.2, 1.2], 'occ': [1, 2]}).to_csv(model_exposures_fp, index=False)
+
+            list(OasisLookupFactory.get_results(lookup, model_exposures_fp=model_exposures_fp))
+
+            with OasisLookupCache(os.path.join(d, 'cache.db')) as cache:
+                self.assertEqual(len(cache), 2)
@@ -32,7 +32,10 @@ from mock import Mock, patch
 from six import StringIO
 from tempfile import NamedTemporaryFile
 
-from oasislmf.keys.lookup import OasisLookupFactory
+from oasislmf.keys.lookup import (
+    OasisBaseLookup,
+    OasisLookupFactory,
+)
 from oasislmf.utils.coverage import (
     BUILDING_COVERAGE_CODE,
     CONTENTS_COVERAGE_CODE,
@@ -201,6 +204,94 @@ class OasisLookupFactoryWriteJsonFiles(TestCase):
             self.assertEqual(written_nonsuccesses, nonsuccesses)
 
 
+class OasisLookupFactoryWriteKeysFiles(TestCase):
+
+    def write_legacy_oasis_keys_file(self, records, heading_row, fp):
+        pd.DataFrame(columns=heading_row.keys(), data=[heading_row] + records).to_csv(fp, index=False, encoding='utf-8', header=False)
+
+    @settings(suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        data=keys_data(from_messages=text(min_size=1, max_size=20, alphabet=string.ascii_letters + ',"\n '), size=20),
+        batch_size=integers(min_value=1, max_value=30)
+    )
+    def test_records_are_given___oasis_keys_files_are_the_same_as_those_written_from_record_lists(self, data, batch_size):
+        for r in data[::3]:
+            r['area_bounds'] = (0.0, 0.0, 1.0, 1.0)
+            r['area_peril_id'] = float('nan') if r['status'] != KEYS_STATUS_SUCCESS else r['area_peril_id']
+
+        successes = [r for r in data if r['status'] == KEYS_STATUS_SUCCESS]
+        nonsuccesses = [r for r in data if r['status'] != KEYS_STATUS_SUCCESS]
+
+        with TemporaryDirectory() as d:
+            fps = [os.path.join(d, fn) for fn in ('keys.csv', 'keys-errors.csv', 'expected-keys.csv', 'expected-keys-errors.csv')]
+
+            result = OasisLookupFactory.write_keys_files((r for r in data), fps[0], errors_fp=fps[1], batch_size=batch_size)
+
+            self.write_legacy_oasis_keys_file(successes, OrderedDict([('id', 'LocID'), ('peril_id', 'PerilID'), ('coverage_type', 'CoverageTypeID'), ('area_peril_id', 'AreaPerilID'), ('vulnerability_id', 'VulnerabilityID')]), fps[2])
+            self.write_legacy_oasis_keys_file(nonsuccesses, OrderedDict([('id', 'LocID'), ('peril_id', 'PerilID'), ('coverage_type', 'CoverageTypeID'), ('message', 'Message')]), fps[3])
+
+            self.assertEqual(result, (fps[0], len(successes), fps[1], len(nonsuccesses)))
+            for fp, expected_fp in ((fps[0], fps[2]), (fps[1], fps[3])):
+                with io.open(fp, 'rb') as f1, io.open(expected_fp, 'rb') as f2:
+                    self.assertEqual(f1.read(), f2.read())
+
+    @settings(suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        data=keys_data(size=10),
+        batch_size=integers(min_value=1, max_value=15),
+        errors_file=booleans()
+    )
+    def test_records_are_given___json_keys_files_are_the_same_as_those_written_from_record_lists(self, data, batch_size, errors_file):
+        successes = [r for r in data if r['status'] == KEYS_STATUS_SUCCESS]
+        nonsuccesses = [r for r in data if r['status'] != KEYS_STATUS_SUCCESS]
+
+        with TemporaryDirectory() as d:
+            keys_fp, keys_errors_fp = os.path.join(d, 'keys.json'), os.path.join(d, 'keys-errors.json')
+
+            result = OasisLookupFactory.write_keys_files(
+                (r for r in data), keys_fp, errors_fp=(keys_errors_fp if errors_file else None), format='json', batch_size=batch_size
+            )
+
+            self.assertEqual(result, (keys_fp, len(successes), keys_errors_fp, len(nonsuccesses)) if errors_file else (keys_fp, len(successes)))
+            with io.open(keys_fp, 'r', encoding='utf-8') as f:
+                self.assertEqual(f.read(), json.dumps(successes, sort_keys=True, indent=4, ensure_ascii=False))
+            if errors_file:
+                with io.open(keys_errors_fp, 'r', encoding='utf-8') as f:
+                    self.assertEqual(f.read(), json.dumps(nonsuccesses, sort_keys=True, indent=4, ensure_ascii=False))
+
+    def test_unrecognised_format___oasis_exception_is_raised(self):
+        with TemporaryDirectory() as d:
+            with self.assertRaises(OasisException):
+                OasisLookupFactory.write_keys_files([], os.path.join(d, 'keys.csv'), format='xml')
+
+    def test_records_generator_raises_an_exception___files_are_removed(self):
+        def records():
+            yield {'id': 1, 'peril_id': 1, 'coverage_type': 1, 'area_peril_id': 1, 'vulnerability_id': 1, 'status': KEYS_STATUS_SUCCESS}
+            raise OasisException('Lookup error')
+
+        with TemporaryDirectory() as d:
+            keys_fp, keys_errors_fp = os.path.join(d, 'keys.csv'), os.path.join(d, 'keys-errors.csv')
+
+            with self.assertRaises(OasisException):
+                OasisLookupFactory.write_keys_files(records(), keys_fp, errors_fp=keys_errors_fp)
+
+            self.assertFalse(os.path.exists(keys_fp))
+            self.assertFalse(os.path.exists(keys_errors_fp))
+
+    def test_records_generator_is_interrupted___interrupt_is_propagated_and_files_are_removed(self):
+        def records():
+            yield {'id': 1, 'peril_id': 1, 'coverage_type': 1, 'area_peril_id': 1, 'vulnerability_id': 1, 'status': KEYS_STATUS_SUCCESS}
+            raise KeyboardInterrupt()
+
+        with TemporaryDirectory() as d:
+            keys_fp = os.path.join(d, 'keys.csv')
+
+            with self.assertRaises(KeyboardInterrupt):
+                OasisLookupFactory.write_keys_files(records(), keys_fp)
+
+            self.assertFalse(os.path.exists(keys_fp))
+
+
 class OasisLookupFactoryGetKeys(TestCase):
 
     def create_fake_lookup(self, return_value=None):
@@ -253,6 +344,113 @@ class OasisLookupFactoryGetKeys(TestCase):
             self.assertEqual(res, data)
 
 
+class FakeLookup(OasisBaseLookup):
+    """
+    Deterministic lookup, defined at module level so that it can be created
+    in the worker processes of a parallel lookup.
+    """
+    def __init__(self, config=None, config_dir=None, loc_id_col='id'):
+        super(FakeLookup, self).__init__(config=config, config_dir=config_dir)
+        self.loc_id_col = loc_id_col
+
+    def lookup(self, loc, peril_id, coverage_type):
+        loc_id = int(loc[self.loc_id_col])
+        return {
+            self.loc_id_col: loc_id,
+            'peril_id': peril_id,
+            'coverage_type': coverage_type,
+            'area_peril_id': loc_id * 10 + coverage_type,
+            'vulnerability_id': loc_id % 7,
+            'status': KEYS_STATUS_SUCCESS if loc_id % 3 else KEYS_STATUS_FAIL,
+            'message': ''
+        }
+
+
+class OasisLookupFactoryGetResults(TestCase):
+
+    def create_fake_lookup(self, num_processes=None):
+        config = {
+            'peril': {'peril_ids': [PERIL_ID_WIND, PERIL_ID_SURGE]},
+            'coverage': {'coverage_types': [BUILDING_COVERAGE_CODE, CONTENTS_COVERAGE_CODE]},
+            'locations': {'col_dtypes': {'id': 'int'}}
+        }
+        if num_processes:
+            config['num_processes'] = num_processes
+        return FakeLookup(config=config)
+
+    def write_model_exposures(self, num_locations, path):
+        pd.DataFrame({'id': range(1, num_locations + 1), 'lat': 0.0, 'lon': 0.0}).to_csv(path, index=False)
+
+    def test_no_model_exposures_are_provided___oasis_exception_is_raised(self):
+        with self.assertRaises(OasisException):
+            list(OasisLookupFactory.get_results(self.create_fake_lookup()))
+
+    def test_non_positive_num_processes___oasis_exception_is_raised(self):
+        with TemporaryDirectory() as d:
+            fp = os.path.join(d, 'modexp.csv')
+            self.write_model_exposures(5, fp)
+
+            with self.assertRaises(OasisException):
+                list(OasisLookupFactory.get_results(self.create_fake_lookup(), model_exposures_fp=fp, num_processes=-1))
+
+    @settings(max_examples=5, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        num_locations=integers(min_value=1, max_value=50),
+        num_processes=integers(min_value=2, max_value=3),
+        successes_only=booleans(),
+        from_config=booleans()
+    )
+    def test_parallel_lookup___results_are_identical_to_serial_lookup(self, num_locations, num_processes, successes_only, from_config):
+        with TemporaryDirectory() as d:
+            fp = os.path.join(d, 'modexp.csv')
+            self.write_model_exposures(num_locations, fp)
+
+            serial_results = list(OasisLookupFactory.get_results(
+                self.create_fake_lookup(), model_exposures_fp=fp, successes_only=successes_only
+            ))
+
+            if from_config:
+                parallel_results = list(OasisLookupFactory.get_results(
+                    self.create_fake_lookup(num_processes=num_processes), model_exposures_fp=fp, successes_only=successes_only
+                ))
+            else:
+                parallel_results = list(OasisLookupFactory.get_results(
+                    self.create_fake_lookup(), model_exposures_fp=fp, successes_only=successes_only, num_processes=num_processes
+                ))
+
+            self.assertEqual(len(serial_results), (num_locations if not successes_only else num_locations - num_locations // 3) * 4)
+            self.assertEqual(parallel_results, serial_results)
+
+    @settings(max_examples=5, deadline=None)
+    @given(num_locations=integers(min_value=1, max_value=50), num_processes=integers(min_value=1, max_value=3))
+    def test_parallel_lookup___partitions_in_flight_are_bounded(self, num_locations, num_processes):
+        in_flight = []
+
+        class FakeAsyncResult(object):
+            def __init__(self, partition):
+                self.partition = partition
+
+            def ready(self):
+                return False
+
+            def get(self):
+                in_flight.append(in_flight[-1] - 1)
+                return [{'id': i} for i in self.partition['id']]
+
+        pool = Mock()
+        pool.apply_async.side_effect = lambda f, args: in_flight.append((in_flight[-1] if in_flight else 0) + 1) or FakeAsyncResult(*args)
+
+        model_exposures_df = pd.DataFrame({'id': range(1, num_locations + 1)})
+
+        with patch('oasislmf.keys.lookup.billiard.Pool', Mock(return_value=pool)):
+            results = list(OasisLookupFactory._get_results_in_parallel(self.create_fake_lookup(), model_exposures_df, num_processes))
+
+        self.assertEqual(list(range(1, num_locations + 1)), [r['id'] for r in results])
+        self.assertLessEqual(max(in_flight), 2 * num_processes)
+        self.assertEqual(0, in_flight[-1])
+        pool.close.assert_called_once_with()
+
+
 class OasisLookupFactoryWriteKeys(TestCase):
 
     def create_fake_lookup(self):
@@ -267,13 +465,14 @@ class OasisLookupFactoryWriteKeys(TestCase):
     @given(
         data=keys_data(from_statuses=just(KEYS_STATUS_SUCCESS), size=10)
     )
-    def test_produced_keys_are_passed_to_write_oasis_keys_file(self, data):
+    def test_produced_keys_are_written_to_oasis_keys_file(self, data):
         with TemporaryDirectory() as d,\
-             patch('oasislmf.keys.lookup.OasisLookupFactory.get_keys', Mock(return_value=(r for r in data))) as get_keys_mock,\
-             patch('oasislmf.keys.lookup.OasisLookupFactory.write_oasis_keys_file') as write_oasis_keys_file_mock:
+             patch('oasislmf.keys.lookup.OasisLookupFactory.get_keys', Mock(return_value=(r for r in data))) as get_keys_mock:
 
             keys_file_path = os.path.join(d, 'piwind-keys.csv')
-            OasisLookupFactory.save_keys(
+            expected_keys_file_path = os.path.join(d, 'expected-keys.csv')
+
+            result = OasisLookupFactory.save_keys(
                 lookup=self.create_fake_lookup(),
                 keys_file_path=keys_file_path,
                 model_exposures=json.dumps(data)
@@ -285,5 +484,9 @@ class OasisLookupFactoryWriteKeys(TestCase):
                 model_exposures_file_path=None,
                 success_only=True
             )
-            write_oasis_keys_file_mock.assert_called_once_with(data, keys_file_path, id_col='id')
+            self.assertEqual(result, (keys_file_path, len(data)))
+
+            OasisLookupFactory.write_oasis_keys_file(data, expected_keys_file_path, id_col='id')
+            with io.open(keys_file_path, 'r', encoding='utf-8') as f1, io.open(expected_keys_file_path, 'r', encoding='utf-8') as f2:
+                self.assertEqual(f1.read(), f2.read())
 
@@ -0,0 +1,152 @@
+from __future__ import unicode_literals
+
+import itertools
+import os
+
+from collections import namedtuple
+
+from unittest import TestCase
+
+import pandas as pd
+
+from backports.tempfile import TemporaryDirectory
+from hypothesis import (
+    given,
+    HealthCheck,
+    settings,
+)
+from hypothesis.strategies import (
+    booleans,
+    floats,
+    integers,
+    just,
+    lists,
+    one_of,
+    tuples,
+)
+
+from oasislmf.keys.lookup import OasisPerilLookup
+from oasislmf.utils.coverage import (
+    BUILDING_COVERAGE_CODE,
+    CONTENTS_COVERAGE_CODE,
+)
+from oasislmf.utils.peril import (
+    DEFAULT_RTREE_INDEX_PROPS,
+    PERIL_ID_SURGE,
+    PERIL_ID_WIND,
+    PerilAreasArrays,
+    PerilAreasGrid,
+    PerilAreasIndex,
+    PERIL_AREAS_ARRAYS_EXTENSION,
+    PERIL_AREAS_GRID_EXTENSION,
+)
+
+
+FakePerilArea = namedtuple('FakePerilArea', ['peril_id', 'coverage_type', 'id', 'bounds', 'coordinates'])
+
+
+class OasisPerilLookupBulkLookup(TestCase):
+
+    def create_lookup(self, index_dir, num_cells, grid=False, area_arrays=False):
+        """
+        Creates a peril lookup with an index of ``num_cells`` x ``num_cells``
+        square wind peril areas of side 0.5, for buildings and contents, and
+        no surge peril areas - optionally with a grid index of the areas, and
+        optionally with a columnar store of the areas rather than areas
+        pickled in the index entries.
+        """
+        index_fp = os.path.join(index_dir, 'areas')
+        areas = []
+        for i, j, coverage_type in itertools.product(range(num_cells), range(num_cells), (BUILDING_COVERAGE_CODE, CONTENTS_COVERAGE_CODE)):
+            bounds = (0.5 * i, 0.5 * j, 0.5 * (i + 1), 0.5 * (j + 1))
+            coords = ((bounds[0], bounds[1]), (bounds[2], bounds[1]), (bounds[2], bounds[3]), (bounds[0], bounds[3]), (bounds[0], bounds[1]))
+            areas.append(FakePerilArea(PERIL_ID_WIND, coverage_type, len(areas) + 1, bounds, coords))
+
+        PerilAreasIndex().save(index_fp, peril_areas=areas, area_arrays=area_arrays)
+
+        if grid:
+            PerilAreasGrid.create(area[:4] for area in areas).save('{}.{}'.format(index_fp, PERIL_AREAS_GRID_EXTENSION))
+
+        return OasisPerilLookup(
+            config={
+                'peril': {
+                    'peril_ids': [PERIL_ID_WIND, PERIL_ID_SURGE],
+                    'rtree_index': dict(DEFAULT_RTREE_INDEX_PROPS, filename='areas'),
+                    'loc_to_global_areas_boundary_min_distance': 0.5
+                },
+                'coverage': {'coverage_types': [BUILDING_COVERAGE_CODE, CONTENTS_COVERAGE_CODE]},
+                'locations': {'id_col': 'id', 'coords_x_col': 'lon', 'coords_y_col': 'lat'}
+            },
+            config_dir=index_dir
+        )
+
+    @settings(max_examples=30, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        num_cells=integers(min_value=1, max_value=6),
+        coords=lists(
+            tuples(
+                one_of(integers(min_value=-4, max_value=16).map(lambda x: 0.25 * x), floats(min_value=-2, max_value=5), just(float('nan')), just(500.0)),
+                one_of(integers(min_value=-4, max_value=16).map(lambda y: 0.25 * y), floats(min_value=-2, max_value=5))
+            ),
+            min_size=1, max_size=30
+        ),
+        grid=booleans(),
+        area_arrays=booleans()
+    )
+    def test_bulk_lookup_of_locations_data_frame___results_are_identical_to_item_by_item_lookup(self, num_cells, coords, grid, area_arrays):
+        with TemporaryDirectory() as d:
+            lookup = self.create_lookup(d, num_cells, grid=grid, area_arrays=area_arrays)
+            self.assertEqual(lookup.peril_areas_index.area_arrays is not None, area_arrays)
+            self.assertIsNotNone(lookup.peril_areas_bounds)
+            self.assertEqual(lookup.peril_areas_grid is not None, grid)
+
+            locs_df = pd.DataFrame({
+                'id': range(1, len(coords) + 1),
+                'lon': [x for x, _ in coords],
+                'lat': [y for _, y in coords]
+            })
+
+            expected = [
+                lookup.lookup(loc, peril_id, coverage_type)
+                for (_, loc), peril_id, coverage_type in itertools.product(locs_df.iterrows(), lookup.peril_ids, lookup.coverage_types)
+            ]
+
+            results = list(lookup.bulk_lookup(locs_df))
+
+            self.assertEqual(len(results), len(expected))
+            for res, exp in zip(results, expected):
+                self.assertEqual(set(res), set(exp))
+                for k in exp:
+                    if exp[k] != exp[k]:
+                        self.assertNotEqual(res[k], res[k])
+                    else:
+                        self.assertEqual(res[k], exp[k])
+                        self.assertEqual(type(res[k]), type(exp[k]))
+
+    @settings(max_examples=20, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        num_cells=integers(min_value=1, max_value=6),
+        coords=lists(
+            tuples(
+                one_of(integers(min_value=-4, max_value=16).map(lambda x: 0.25 * x), floats(min_value=-2, max_value=5), just(500.0)),
+                one_of(integers(min_value=-4, max_value=16).map(lambda y: 0.25 * y), floats(min_value=-2, max_value=5))
+            ),
+            min_size=1, max_size=20
+        )
+    )
+    def test_index_with_areas_store___item_by_item_results_are_identical_to_index_with_pickled_areas(self, num_cells, coords):
+        with TemporaryDirectory() as d1, TemporaryDirectory() as d2:
+            lookup = self.create_lookup(d1, num_cells)
+            arrays_lookup = self.create_lookup(d2, num_cells, area_arrays=True)
+
+            self.assertIsNone(lookup.peril_areas_index.area_arrays)
+            self.assertIsInstance(arrays_lookup.peril_areas_index.area_arrays, PerilAreasArrays)
+            self.assertTrue(os.path.exists(os.path.join(d2, 'areas.{}'.format(PERIL_AREAS_ARRAYS_EXTENSION))))
+
+            for i, (x, y) in enumerate(coords):
+                loc = {'id': i + 1, 'lon': x, 'lat': y}
+                for peril_id, coverage_type in itertools.product(lookup.peril_ids, lookup.coverage_types):
+                    res = arrays_lookup.lookup(loc, peril_id, coverage_type)
+                    exp = lookup.lookup(loc, peril_id, coverage_type)
+                    self.assertEqual(res, exp)
+                    self.assertEqual([type(res[k]) for k in exp], [type(exp[k]) for k in exp])
@@ -0,0 +1,104 @@
+from __future__ import unicode_literals
+
+import itertools
+import os
+
+from unittest import TestCase
+
+import pandas as pd
+
+from backports.tempfile import TemporaryDirectory
+from hypothesis import (
+    given,
+    HealthCheck,
+    settings,
+)
+from hypothesis.strategies import (
+    booleans,
+    integers,
+    just,
+    lists,
+    one_of,
+    sampled_from,
+    tuples,
+)
+
+from oasislmf.keys.lookup import OasisVulnerabilityLookup
+from oasislmf.utils.coverage import (
+    BUILDING_COVERAGE_CODE,
+    CONTENTS_COVERAGE_CODE,
+)
+from oasislmf.utils.peril import (
+    PERIL_ID_SURGE,
+    PERIL_ID_WIND,
+)
+from oasislmf.utils.vulnerability import VulnerabilitiesIndex
+
+
+class OasisVulnerabilityLookupBulkLookup(TestCase):
+
+    def create_lookup(self, data_dir, index_file=False):
+        """
+        Creates a vulnerability lookup for vulnerabilities keyed by peril ID,
+        coverage type and occupancy code, for occupancy codes 1 to 5.
+        """
+        pd.DataFrame([
+            {'peril_id': p, 'coverage_type': c, 'occ': o, 'vulnerability_id': 100 * p + 10 * c + o}
+            for p, c, o in itertools.product((PERIL_ID_WIND, PERIL_ID_SURGE), (BUILDING_COVERAGE_CODE, CONTENTS_COVERAGE_CODE), range(1, 6))
+        ]).to_csv(os.path.join(data_dir, 'vulns.csv'), index=False)
+
+        vuln_config = {
+            'file_path': 'vulns.csv',
+            'file_type': 'csv',
+            'key_cols': ['peril_id', 'coverage_type', 'occ'],
+            'col_dtypes': {'peril_id': 'int', 'coverage_type': 'int', 'occ': 'int', 'vulnerability_id': 'int'},
+            'vulnerability_id_col': 'vulnerability_id'
+        }
+        if index_file:
+            vuln_config['index_file_path'] = 'vulns.idx'
+
+        return OasisVulnerabilityLookup(
+            config={
+                'peril': {'peril_ids': [PERIL_ID_WIND, PERIL_ID_SURGE]},
+                'coverage': {'coverage_types': [BUILDING_COVERAGE_CODE, CONTENTS_COVERAGE_CODE]},
+                'vulnerability': vuln_config,
+                'locations': {'id_col': 'id'}
+            },
+            config_dir=data_dir
+        )
+
+    @settings(max_examples=30, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        occs=lists(one_of(integers(min_value=0, max_value=7), sampled_from([2.0, 2.5, float('nan')])), min_size=1, max_size=20),
+        peril_ids=one_of(just(None), lists(sampled_from([0, PERIL_ID_WIND, PERIL_ID_SURGE]), min_size=20, max_size=20)),
+        string_occs=booleans(),
+        index_file=booleans()
+    )
+    def test_bulk_lookup_of_locations_data_frame___results_are_identical_to_item_by_item_lookup(self, occs, peril_ids, string_occs, index_file):
+        with TemporaryDirectory() as d:
+            lookup = self.create_lookup(d, index_file=index_file)
+            self.assertIsInstance(lookup.vulnerabilities, VulnerabilitiesIndex)
+            self.assertEqual(os.path.exists(os.path.join(d, 'vulns.idx')), index_file)
+
+            locs_df = pd.DataFrame({'id': range(1, len(occs) + 1), 'occ': occs})
+            if string_occs:
+                locs_df['occ'] = locs_df['occ'].astype(str)
+            if peril_ids:
+                locs_df['peril_id'] = peril_ids[:len(occs)]
+
+            expected = [
+                lookup.lookup(loc, peril_id, coverage_type)
+                for (_, loc), peril_id, coverage_type in itertools.product(locs_df.iterrows(), lookup.peril_ids, lookup.coverage_types)
+            ]
+
+            results = list(lookup.bulk_lookup(locs_df))
+
+            self.assertEqual(len(results), len(expected))
+            for res, exp in zip(results, expected):
+                self.assertEqual(list(res), list(exp))
+                for k in exp:
+                    if exp[k] != exp[k]:
+                        self.assertNotEqual(res[k], res[k])
+                    else:
+                        self.assertEqual(res[k], exp[k])
+                        self.assertEqual(type(res[k]), type(exp[k]))
@@ -0,0 +1,106 @@
+#!/bin/bash
+
+rm -R -f output/*
+rm -R -f fifo/*
+rm -R -f work/*
+
+mkdir work/kat
+mkfifo fifo/gul_P1
+
+mkfifo fifo/gul_S1_summary_P1
+mkfifo fifo/gul_S1_summaryeltcalc_P1
+mkfifo fifo/gul_S1_eltcalc_P1
+mkfifo fifo/gul_S1_summarysummarycalc_P1
+mkfifo fifo/gul_S1_summarycalc_P1
+mkfifo fifo/gul_S1_summarypltcalc_P1
+mkfifo fifo/gul_S1_pltcalc_P1
+
+mkdir work/gul_S1_summaryleccalc
+mkdir work/gul_S1_summaryaalcalc
+mkfifo fifo/il_P1
+
+mkfifo fifo/il_S1_summary_P1
+mkfifo fifo/il_S1_summaryeltcalc_P1
+mkfifo fifo/il_S1_eltcalc_P1
+mkfifo fifo/il_S1_summarysummarycalc_P1
+mkfifo fifo/il_S1_summarycalc_P1
+mkfifo fifo/il_S1_summarypltcalc_P1
+mkfifo fifo/il_S1_pltcalc_P1
+
+mkdir work/il_S1_summaryleccalc
+mkdir work/il_S1_summaryaalcalc
+
+# --- Do insured loss computes ---
+
+eltcalc < fifo/il_S1_summaryeltcalc_P1 > work/kat/il_S1_eltcalc_P1 & pid1=$!
+summarycalctocsv < fifo/il_S1_summarysummarycalc_P1 > work/kat/il_S1_summarycalc_P1 & pid2=$!
+pltcalc < fifo/il_S1_summarypltcalc_P1 > work/kat/il_S1_pltcalc_P1 & pid3=$!
+
+tee < fifo/il_S1_summary_P1 fifo/il_S1_summaryeltcalc_P1 fifo/il_S1_summarypltcalc_P1 fifo/il_S1_summarysummarycalc_P1 work/il_S1_summaryaalcalc/P1.bin work/il_S1_summaryleccalc/P1.bin > /dev/null & pid4=$!
+summarycalc -f  -1 fifo/il_S1_summary_P1 < fifo/il_P1 &
+
+# --- Do ground up loss computes ---
+
+eltcalc < fifo/gul_S1_summaryeltcalc_P1 > work/kat/gul_S1_eltcalc_P1 & pid5=$!
+summarycalctocsv < fifo/gul_S1_summarysummarycalc_P1 > work/kat/gul_S1_summarycalc_P1 & pid6=$!
+pltcalc < fifo/gul_S1_summarypltcalc_P1 > work/kat/gul_S1_pltcalc_P1 & pid7=$!
+
+tee < fifo/gul_S1_summary_P1 fifo/gul_S1_summaryeltcalc_P1 fifo/gul_S1_summarypltcalc_P1 fifo/gul_S1_summarysummarycalc_P1 work/gul_S1_summaryaalcalc/P1.bin work/gul_S1_summaryleccalc/P1.bin > /dev/null & pid8=$!
+summarycalc -g  -1 fifo/gul_S1_summary_P1 < fifo/gul_P1 &
+
+eve 1 1 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P1 -i - | fmcalc -a 2 > fifo/il_P1  &
+
+wait $pid1 $pid2 $pid3 $pid4 $pid5 $pid6 $pid7 $pid8
+
+
+# --- Do insured loss kats ---
+
+kat work/kat/il_S1_eltcalc_P1 > output/il_S1_eltcalc.csv & kpid1=$!
+kat work/kat/il_S1_pltcalc_P1 > output/il_S1_pltcalc.csv & kpid2=$!
+kat work/kat/il_S1_summarycalc_P1 > output/il_S1_summarycalc.csv & kpid3=$!
+
+# --- Do ground up loss kats ---
+
+kat work/kat/gul_S1_eltcalc_P1 > output/gul_S1_eltcalc.csv & kpid4=$!
+kat work/kat/gul_S1_pltcalc_P1 > output/gul_S1_pltcalc.csv & kpid5=$!
+kat work/kat/gul_S1_summarycalc_P1 > output/gul_S1_summarycalc.csv & kpid6=$!
+wait $kpid1 $kpid2 $kpid3 $kpid4 $kpid5 $kpid6
+
+
+aalcalc -Kil_S1_summaryaalcalc > output/il_S1_aalcalc.csv & lpid1=$!
+leccalc -r -Kil_S1_summaryleccalc -F output/il_S1_leccalc_full_uncertainty_aep.csv -f output/il_S1_leccalc_full_uncertainty_oep.csv -S output/il_S1_leccalc_sample_mean_aep.csv -s output/il_S1_leccalc_sample_mean_oep.csv -W output/il_S1_leccalc_wheatsheaf_aep.csv -M output/il_S1_leccalc_wheatsheaf_mean_aep.csv -m output/il_S1_leccalc_wheatsheaf_mean_oep.csv -w output/il_S1_leccalc_wheatsheaf_oep.csv & lpid2=$!
+aalcalc -Kgul_S1_summaryaalcalc > output/gul_S1_aalcalc.csv & lpid3=$!
+leccalc -r -Kgul_S1_summaryleccalc -F output/gul_S1_leccalc_full_uncertainty_aep.csv -f output/gul_S1_leccalc_full_uncertainty_oep.csv -S output/gul_S1_leccalc_sample_mean_aep.csv -s output/gul_S1_leccalc_sample_mean_oep.csv -W output/gul_S1_leccalc_wheatsheaf_aep.csv -M output/gul_S1_leccalc_wheatsheaf_mean_aep.csv -m output/gul_S1_leccalc_wheatsheaf_mean_oep.csv -w output/gul_S1_leccalc_wheatsheaf_oep.csv & lpid4=$!
+wait $lpid1 $lpid2 $lpid3 $lpid4
+
+rm fifo/gul_P1
+
+rm fifo/gul_S1_summary_P1
+rm fifo/gul_S1_summaryeltcalc_P1
+rm fifo/gul_S1_eltcalc_P1
+rm fifo/gul_S1_summarysummarycalc_P1
+rm fifo/gul_S1_summarycalc_P1
+rm fifo/gul_S1_summarypltcalc_P1
+rm fifo/gul_S1_pltcalc_P1
+
+rm -rf work/kat
+rm work/gul_S1_summaryleccalc/*
+rmdir work/gul_S1_summaryleccalc
+rm -rf work/gul_S1_summaryaalcalc/*
+rmdir work/gul_S1_summaryaalcalc
+
+rm fifo/il_P1
+
+rm fifo/il_S1_summary_P1
+rm fifo/il_S1_summaryeltcalc_P1
+rm fifo/il_S1_eltcalc_P1
+rm fifo/il_S1_summarysummarycalc_P1
+rm fifo/il_S1_summarycalc_P1
+rm fifo/il_S1_summarypltcalc_P1
+rm fifo/il_S1_pltcalc_P1
+
+rm -rf work/kat
+rm work/il_S1_summaryleccalc/*
+rmdir work/il_S1_summaryleccalc
+rm -rf work/il_S1_summaryaalcalc/*
+rmdir work/il_S1_summaryaalcalc
@@ -0,0 +1,58 @@
+#!/bin/bash
+
+rm -R -f output/*
+rm -R -f fifo/*
+rm -R -f work/*
+
+mkdir work/kat
+mkfifo fifo/gul_P1
+
+mkfifo fifo/gul_S1_summary_P1
+mkfifo fifo/gul_S1_summaryeltcalc_P1
+mkfifo fifo/gul_S1_eltcalc_P1
+mkfifo fifo/gul_S1_summarysummarycalc_P1
+mkfifo fifo/gul_S1_summarycalc_P1
+mkfifo fifo/gul_S1_summarypltcalc_P1
+mkfifo fifo/gul_S1_pltcalc_P1
+
+mkdir work/gul_S1_summaryaalcalc
+
+# --- Do ground up loss computes ---
+
+eltcalc < fifo/gul_S1_summaryeltcalc_P1 > work/kat/gul_S1_eltcalc_P1 & pid1=$!
+summarycalctocsv < fifo/gul_S1_summarysummarycalc_P1 > work/kat/gul_S1_summarycalc_P1 & pid2=$!
+pltcalc < fifo/gul_S1_summarypltcalc_P1 > work/kat/gul_S1_pltcalc_P1 & pid3=$!
+
+tee < fifo/gul_S1_summary_P1 fifo/gul_S1_summaryeltcalc_P1 fifo/gul_S1_summarypltcalc_P1 fifo/gul_S1_summarysummarycalc_P1 work/gul_S1_summaryaalcalc/P1.bin > /dev/null & pid4=$!
+summarycalc -g  -1 fifo/gul_S1_summary_P1 < fifo/gul_P1 &
+
+eve 1 1 | getmodel | gulcalc -S50 -L100 -c - > fifo/gul_P1  &
+
+wait $pid1 $pid2 $pid3 $pid4
+
+
+# --- Do ground up loss kats ---
+
+kat work/kat/gul_S1_eltcalc_P1 > output/gul_S1_eltcalc.csv & kpid1=$!
+kat work/kat/gul_S1_pltcalc_P1 > output/gul_S1_pltcalc.csv & kpid2=$!
+kat work/kat/gul_S1_summarycalc_P1 > output/gul_S1_summarycalc.csv & kpid3=$!
+wait $kpid1 $kpid2 $kpid3
+
+
+aalcalc -Kgul_S1_summaryaalcalc > output/gul_S1_aalcalc.csv & lpid1=$!
+wait $lpid1
+
+rm fifo/gul_P1
+
+rm fifo/gul_S1_summary_P1
+rm fifo/gul_S1_summaryeltcalc_P1
+rm fifo/gul_S1_eltcalc_P1
+rm fifo/gul_S1_summarysummarycalc_P1
+rm fifo/gul_S1_summarycalc_P1
+rm fifo/gul_S1_summarypltcalc_P1
+rm fifo/gul_S1_pltcalc_P1
+
+rm -rf work/kat
+rm -rf work/gul_S1_summaryaalcalc/*
+rmdir work/gul_S1_summaryaalcalc
+
@@ -10,10 +10,14 @@ from itertools import chain
 from backports.tempfile import TemporaryDirectory
 from unittest import TestCase
 
+import filecmp
 import os
 import io
+import shutil
 import subprocess
 
+import pandas as pd
+
 from copy import copy, deepcopy
 from hypothesis import (
     given,
@@ -27,7 +31,7 @@ from pathlib2 import Path
 from oasislmf.model_execution.files import GUL_INPUT_FILES, OPTIONAL_INPUT_FILES, IL_INPUT_FILES, TAR_FILE, INPUT_FILES
 from oasislmf.model_execution.bin import create_binary_files, create_binary_tar_file, check_conversion_tools, \
     check_inputs_directory, prepare_model_run_directory, prepare_model_run_inputs, cleanup_bin_directory, \
-    check_binary_tar_file
+    check_binary_tar_file, write_binary_file, write_binary_tar
 from oasislmf.utils.exceptions import OasisException
 
 from tests.data import (
@@ -73,6 +77,19 @@ class CreateBinaryFiles(TestCase):
             for filename in (f + '.bin' for f in chain(standard, il)):
                 self.assertTrue(os.path.exists(os.path.join(bin_dir, filename)))
 
+    @given(standard_input_files(min_size=1), il_input_files(min_size=1))
+    def test_contains_il_and_standard_files_and_il_files_are_excluded___only_standard_files_are_converted(self, standard, il):
+        with patch('oasislmf.model_execution.bin.INPUT_FILES', ECHO_CONVERSION_INPUT_FILES), TemporaryDirectory() as csv_dir, TemporaryDirectory() as bin_dir:
+            for target in chain(standard, il):
+                with io.open(os.path.join(csv_dir, target + '.csv'), 'w', encoding='utf-8') as f:
+                    f.write(target)
+
+            create_binary_files(csv_dir, bin_dir, do_il=True, exclude_files=il)
+
+            self.assertEqual(len(standard), len(glob.glob(os.path.join(bin_dir, '*.bin'))))
+            for filename in (f + '.bin' for f in standard):
+                self.assertTrue(os.path.exists(os.path.join(bin_dir, filename)))
+
     def test_subprocess_raises___oasis_exception_is_raised(self):
         with TemporaryDirectory() as csv_dir, TemporaryDirectory() as bin_dir:
             Path(os.path.join(csv_dir, 'events.csv')).touch()
@@ -81,6 +98,49 @@ class CreateBinaryFiles(TestCase):
                 with self.assertRaises(OasisException):
                     create_binary_files(csv_dir, bin_dir, do_il=True)
 
+    def test_conversion_tools_fail_in_main_and_ri_folders___all_failures_are_reported_with_the_tool_errors(self):
+        failing_input_files = {k: dict(v, conversion_tool="sh -c 'echo $0-error >&2; exit 1' {}".format(k)) for k, v in INPUT_FILES.items()}
+
+        with patch('oasislmf.model_execution.bin.INPUT_FILES', failing_input_files), TemporaryDirectory() as csv_dir, TemporaryDirectory() as bin_dir:
+            os.mkdir(os.path.join(csv_dir, 'RI_1'))
+            for d in (csv_dir, os.path.join(csv_dir, 'RI_1')):
+                Path(os.path.join(d, 'items.csv')).touch()
+                Path(os.path.join(d, 'fm_xref.csv')).touch()
+
+            with self.assertRaises(OasisException) as cm:
+                create_binary_files(csv_dir, bin_dir, do_ri=True, num_workers=2)
+
+            for p in (os.path.join(bin_dir, 'items.bin'), os.path.join(bin_dir, 'RI_1', 'fm_xref.bin')):
+                self.assertIn(p, str(cm.exception))
+            self.assertEqual(str(cm.exception).count('items-error'), 2)
+            self.assertEqual(str(cm.exception).count('fm_xref-error'), 2)
+
+    @given(standard_input_files(min_size=1), il_input_files(min_size=1))
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    def test_conversions_in_main_and_ri_folders___conversion_times_are_logged(self, standard, il):
+        logger = Mock()
+
+        with patch('oasislmf.model_execution.bin.INPUT_FILES', ECHO_CONVERSION_INPUT_FILES), TemporaryDirectory() as csv_dir, TemporaryDirectory() as bin_dir:
+            os.mkdir(os.path.join(csv_dir, 'RI_1'))
+            for d in (csv_dir, os.path.join(csv_dir, 'RI_1')):
+                for target in standard + il:
+                    Path(os.path.join(d, target + '.csv')).touch()
+
+            create_binary_files(csv_dir, bin_dir, do_ri=True, num_workers=3, logger=logger)
+
+            logged = ' '.join(c[0][0] for c in logger.info.call_args_list)
+            self.assertEqual(logger.info.call_count, 2 * len(standard + il))
+            for target in standard + il:
+                self.assertIn(os.path.join(bin_dir, target + '.bin'), logged)
+                self.assertIn(os.path.join(bin_dir, 'RI_1', target + '.bin'), logged)
+
+    def test_non_positive_num_workers___oasis_exception_is_raised(self):
+        with TemporaryDirectory() as csv_dir, TemporaryDirectory() as bin_dir:
+            Path(os.path.join(csv_dir, 'events.csv')).touch()
+
+            with self.assertRaises(OasisException):
+                create_binary_files(csv_dir, bin_dir, num_workers=0)
+
     @given(standard_input_files(min_size=1), il_input_files(min_size=1))
     @settings(deadline=600, suppress_health_check=[HealthCheck.too_slow])
     def test_single_ri_folder(self, standard, il):
@@ -140,6 +200,56 @@ class CreateBinaryFiles(TestCase):
                 self.assertTrue(os.path.exists(os.path.join(bin_dir, 'RI_2', filename)))
 
 
+# Oasis files and the binary files converted from them by the ktools conversion tools
+ktools_bin_data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'exposures', 'ri_testing')
+
+
+class CreateBinaryFilesNative(TestCase):
+    def test_oasis_files___binary_files_are_identical_to_those_of_the_conversion_tools(self):
+        files = ['items', 'coverages', 'fm_policytc', 'fm_profile', 'fm_programme', 'fm_xref']
+
+        with TemporaryDirectory() as csv_dir, TemporaryDirectory() as bin_dir:
+            for f in files:
+                shutil.copy(os.path.join(ktools_bin_data_dir, f + '.csv'), csv_dir)
+
+            with patch('oasislmf.model_execution.bin.subprocess.check_call') as check_call_mock:
+                create_binary_files(csv_dir, bin_dir, do_il=True, native=True)
+
+            check_call_mock.assert_not_called()
+            for f in files:
+                self.assertTrue(filecmp.cmp(os.path.join(bin_dir, f + '.bin'), os.path.join(ktools_bin_data_dir, 'direct', f + '.bin'), shallow=False))
+
+    def test_ri_oasis_files_with_empty_files___binary_files_are_identical_to_those_of_the_conversion_tools(self):
+        with TemporaryDirectory() as csv_dir, TemporaryDirectory() as bin_dir:
+            os.mkdir(os.path.join(csv_dir, 'RI_1'))
+            for p in glob.glob(os.path.join(ktools_bin_data_dir, 'RI_1', '*.csv')):
+                shutil.copy(p, os.path.join(csv_dir, 'RI_1'))
+
+            create_binary_files(csv_dir, bin_dir, do_ri=True, native=True)
+
+            for p in glob.glob(os.path.join(ktools_bin_data_dir, 'RI_1', '*.bin')):
+                self.assertTrue(filecmp.cmp(os.path.join(bin_dir, 'RI_1', os.path.basename(p)), p, shallow=False))
+
+    def test_data_frame___binary_file_is_identical_to_that_of_the_conversion_tool(self):
+        items_df = pd.read_csv(os.path.join(ktools_bin_data_dir, 'items.csv'))
+
+        with TemporaryDirectory() as bin_dir:
+            write_binary_file(items_df, 'items', os.path.join(bin_dir, 'items.bin'))
+
+            self.assertTrue(filecmp.cmp(os.path.join(bin_dir, 'items.bin'), os.path.join(ktools_bin_data_dir, 'direct', 'items.bin'), shallow=False))
+
+    def test_data_frame_with_missing_columns_or_values___oasis_exception_is_raised(self):
+        with TemporaryDirectory() as bin_dir:
+            with self.assertRaises(OasisException):
+                write_binary_file(pd.DataFrame({'coverage_id': [1]}), 'items', os.path.join(bin_dir, 'items.bin'))
+
+            with self.assertRaises(OasisException):
+                write_binary_file(pd.DataFrame({'coverage_id': [1, 2], 'tiv': [1.0, None]}), 'coverages', os.path.join(bin_dir, 'coverages.bin'))
+
+            with self.assertRaises(OasisException):
+                write_binary_file(pd.DataFrame({'coverage_id': [1], 'tiv': [1.0]}), 'not_an_input_file', os.path.join(bin_dir, 'x.bin'))
+
+
 class CreateBinaryTarFile(TestCase):
     def test_directory_only_contains_excluded_files___tar_is_empty(self):
         with TemporaryDirectory() as d:
@@ -209,6 +319,30 @@ class CreateBinaryTarFile(TestCase):
                 self.assertEqual(len(all_targets), len(tar.getnames()))
                 self.assertEqual(set(all_targets), set(tar.getnames()))
 
+    def test_compression_threads_and_levels___tar_files_have_the_same_members(self):
+        with TemporaryDirectory() as d:
+            os.mkdir(os.path.join(d, 'RI_1'))
+            bin_files = {'items.bin': os.urandom(3 * 2 ** 20), os.path.join('RI_1', 'items.bin'): b'items' * 2 ** 20}
+            for name, data in bin_files.items():
+                with io.open(os.path.join(d, name), 'wb') as f:
+                    f.write(data)
+
+            for compression_level, num_threads in [(0, 1), (1, 3), (9, 2)]:
+                create_binary_tar_file(d, compression_level=compression_level, num_threads=num_threads)
+
+                with tarfile.open(os.path.join(d, TAR_FILE), 'r:gz') as tar:
+                    self.assertEqual(bin_files, {m.name: tar.extractfile(m).read() for m in tar.getmembers()})
+
+                if compression_level == 0:
+                    self.assertGreater(os.path.getsize(os.path.join(d, TAR_FILE)), sum(len(data) for data in bin_files.values()))
+                else:
+                    self.assertLess(os.path.getsize(os.path.join(d, TAR_FILE)), sum(len(data) for data in bin_files.values()))
+
+    def test_invalid_compression_level___oasis_exception_is_raised(self):
+        with TemporaryDirectory() as d:
+            with self.assertRaises(OasisException):
+                write_binary_tar(d, io.BytesIO(), compression_level=10)
+
 class CheckConversionTools(TestCase):
     def test_do_il_is_false_il_tools_are_missing___result_is_true(self):
         existing_conversions = deepcopy(INPUT_FILES)
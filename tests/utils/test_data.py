@@ -0,0 +1,106 @@
+import io
+
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from hypothesis import given
+from hypothesis.strategies import (
+    booleans,
+    fixed_dictionaries,
+    floats,
+    integers,
+    lists,
+    none,
+    one_of,
+    sampled_from,
+    text,
+)
+
+from oasislmf.utils.data import (
+    CSV_NA_VALUES,
+    as_csv_parsed,
+    as_csv_strings,
+    get_dataframe,
+)
+
+
+def csv_round_trip(df, **kwargs):
+    return pd.read_csv(io.StringIO(df.to_csv(index=False)), **kwargs)
+
+
+def rows(**kwargs):
+    return lists(
+        fixed_dictionaries({
+            'ints': integers(min_value=-10**9, max_value=10**9),
+            'floats': floats(allow_nan=False, allow_infinity=False, min_value=-10**9, max_value=10**9),
+            'nullable_floats': one_of(none(), floats(allow_nan=False, allow_infinity=False, min_value=-10**9, max_value=10**9)),
+            'bools': booleans(),
+            'strs': one_of(none(), sampled_from(['', 'NA', 'NULL', 'a', 'B2', 'TX', '1.5x'])),
+            'codes': text(alphabet='ABC123', min_size=1, max_size=4),
+        }),
+        **kwargs
+    )
+
+
+class AsCsvStrings(TestCase):
+    @given(rows(min_size=1, max_size=10))
+    def test_values_are_the_strings_read_from_a_csv_file_of_the_frame(self, data):
+        df = pd.DataFrame(data=data, columns=['ints', 'floats', 'nullable_floats', 'bools', 'strs', 'codes'])
+
+        self.assertTrue(as_csv_strings(df).equals(csv_round_trip(df, dtype=object)))
+
+
+class AsCsvParsed(TestCase):
+    @given(rows(min_size=1, max_size=10))
+    def test_values_are_the_values_read_from_a_csv_file_of_the_frame(self, data):
+        df = pd.DataFrame(data=data, columns=['ints', 'floats', 'nullable_floats', 'bools', 'strs', 'codes'])
+
+        parsed, expected = as_csv_parsed(df), csv_round_trip(df, float_precision='high')
+
+        self.assertEqual(list(parsed.dtypes), list(expected.dtypes))
+        self.assertTrue(parsed.equals(expected))
+
+    def test_string_values_are_parsed(self):
+        df = pd.DataFrame({'a': ['1', '2'], 'b': ['1.5', None], 'c': ['true', 'False'], 'd': ['x', 'NA']}, dtype=object)
+
+        parsed = as_csv_parsed(df)
+
+        self.assertEqual(parsed['a'].dtype, np.int64)
+        self.assertEqual(parsed['b'].dtype, np.float64)
+        self.assertEqual(parsed['c'].tolist(), [True, False])
+        self.assertEqual(parsed['d'].tolist()[0], 'x')
+        self.assertTrue(pd.isnull(parsed['d'].tolist()[1]))
+
+    def test_na_value_strings___values_are_the_values_read_from_a_csv_file_of_the_frame(self):
+        for token in sorted(CSV_NA_VALUES | {'NA', 'NULL', 'nan'}):
+            df = pd.DataFrame({'a': [token, 'x'], 'b': [token, '1']}, dtype=object)
+
+            parsed, expected = as_csv_parsed(df), csv_round_trip(df, float_precision='high')
+
+            self.assertEqual(list(parsed.dtypes), list(expected.dtypes), token)
+            self.assertTrue(parsed.equals(expected), token)
+
+
+class GetDataframe(TestCase):
+    def test_data_frame_column_types_are_kept(self):
+        src_df = pd.DataFrame({'a': [1, 2], 'b': [1.5, None], 'c': ['x', None]})
+
+        df = get_dataframe(src_data=src_df, index_col=False)
+
+        self.assertEqual(list(df.dtypes), list(src_df.dtypes))
+        self.assertTrue(df.equals(src_df))
+
+    def test_records_are_loaded_as_objects(self):
+        df = get_dataframe(src_data=[{'a': 1, 'b': 1.5}], index_col=False)
+
+        self.assertEqual(list(df.dtypes), [object, object])
+
+    def test_data_frame_is_copied(self):
+        src_df = pd.DataFrame({'A': [1, 2]})
+
+        df = get_dataframe(src_data=src_df, lowercase_cols=True, index_col=False)
+
+        self.assertEqual(list(df.columns), ['a'])
+        self.assertEqual(list(src_df.columns), ['A'])
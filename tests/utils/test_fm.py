@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 
+import copy
 import io
 import json
+import math
 
 from unittest import TestCase
 
@@ -35,9 +37,13 @@ from oasislmf.utils.exceptions import OasisException
 from oasislmf.utils.fm import (
     unified_canonical_fm_profile_by_level,
     unified_canonical_fm_profile_by_level_and_term_group,
+    get_fm_policytc_ids,
+    get_fm_terms_by_level_as_df,
     get_layer_calcrule_id,
+    get_layer_calcrule_ids,
     get_layer_level_fm_terms,
     get_sub_layer_calcrule_id,
+    get_sub_layer_calcrule_ids,
     get_coverage_level_fm_terms,
     get_sub_layer_non_coverage_level_fm_terms,
     get_policytc_ids,
@@ -823,6 +829,242 @@ class GetFmTermsByLevel(TestCase):
                 self.assertEqual(calcrule_id, res['calcrule_id'])
 
 
+class TestCalcruleIDsArrayFuncs(TestCase):
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        terms=lists(
+            tuples(
+                sampled_from([0, 100]),
+                sampled_from([0, 1, 2]),
+                sampled_from([0, 100]),
+                sampled_from([0, 100]),
+                sampled_from([0, 100]),
+                sampled_from([0, 1])
+            ),
+            min_size=1,
+            max_size=50
+        )
+    )
+    def test_sub_layer_calcrule_ids_match_scalar_func(self, terms):
+        calcrule_ids = get_sub_layer_calcrule_ids(*zip(*terms))
+
+        for t, calcrule_id in zip(terms, calcrule_ids):
+            expected = get_sub_layer_calcrule_id(*t)
+            self.assertTrue(math.isnan(calcrule_id)) if expected is None else self.assertEqual(expected, calcrule_id)
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        terms=lists(
+            tuples(
+                sampled_from([0, 100]),
+                sampled_from([0, 100]),
+                sampled_from([0, 0.5])
+            ),
+            min_size=1,
+            max_size=50
+        )
+    )
+    def test_layer_calcrule_ids_match_scalar_func(self, terms):
+        calcrule_ids = get_layer_calcrule_ids(*zip(*terms))
+
+        for t, calcrule_id in zip(terms, calcrule_ids):
+            expected = get_layer_calcrule_id(*t)
+            self.assertTrue(math.isnan(calcrule_id)) if expected is None else self.assertEqual(expected, calcrule_id)
+
+
+class GetFmTermsByLevelAsDataFrame(TestCase):
+
+    def setUp(self):
+        self.unified_canonical_profile = unified_canonical_fm_profile_by_level_and_term_group(
+            profiles=[canonical_exposures_profile, canonical_accounts_profile]
+        )
+        self.fm_agg_profile = oasis_fm_agg_profile
+
+    def _assert_same_items(self, expected_items, results_df):
+        results = results_df.to_dict('records')
+
+        self.assertEqual(len(expected_items), len(results))
+
+        for it, res in zip(expected_items, results):
+            for k, v in it.items():
+                if v is None or (isinstance(v, float) and math.isnan(v)):
+                    self.assertTrue(res[k] is None or (isinstance(res[k], float) and math.isnan(res[k])))
+                else:
+                    self.assertEqual(v, res[k])
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        exposures=canonical_exposures_data(
+            from_account_nums=just('A1'),
+            size=10
+        ),
+        accounts=canonical_accounts_data(
+            from_account_nums=just('A1'),
+            from_policy_nums=just('A1P1'),
+            size=1
+        ),
+        fm_items=fm_items_data(
+            from_coverage_type_ids=just(OASIS_COVERAGE_TYPES['buildings']['id']),
+            from_level_ids=just(1),
+            from_canacc_ids=just(0),
+            from_policy_nums=just('A1P1'),
+            from_layer_ids=just(1),
+            from_tiv_elements=just('wscv1val'),
+            from_tiv_tgids=just(1),
+            from_deductible_elements=just('wscv1ded'),
+            from_min_deductible_elements=just(None),
+            from_max_deductible_elements=just(None),
+            from_limit_elements=just('wscv1limit'),
+            from_share_elements=just(None),
+            size=10
+        )
+    )
+    def test_coverage_level_terms_match_coverage_level_generator(self, exposures, accounts, fm_items):
+        lufcp = self.unified_canonical_profile[1]
+        lfmaggp = self.fm_agg_profile[1]
+
+        canexp_df, canacc_df = pd.DataFrame(data=exposures), pd.DataFrame(data=accounts)
+
+        expected = list(get_coverage_level_fm_terms(
+            lufcp, lfmaggp, {i: it for i, it in enumerate(copy.deepcopy(fm_items))}, canexp_df, canacc_df
+        ))
+
+        results_df = get_fm_terms_by_level_as_df(lufcp, lfmaggp, pd.DataFrame(data=fm_items), canexp_df, canacc_df)
+
+        self._assert_same_items(expected, results_df)
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        exposures=canonical_exposures_data(
+            from_account_nums=just('A1'),
+            size=10
+        ),
+        accounts=canonical_accounts_data(
+            from_account_nums=just('A1'),
+            from_policy_nums=just('A1P1'),
+            size=1
+        ),
+        fm_items=fm_items_data(
+            from_coverage_type_ids=just(OASIS_COVERAGE_TYPES['buildings']['id']),
+            from_canacc_ids=just(0),
+            from_policy_nums=just('A1P1'),
+            from_layer_ids=just(1),
+            from_tiv_elements=just('wscv1val'),
+            from_tiv_tgids=just(1),
+            size=10
+        )
+    )
+    def test_non_coverage_level_terms_match_non_coverage_level_generators(self, exposures, accounts, fm_items):
+        ufcp = self.unified_canonical_profile
+
+        for it in fm_items:
+            it['cond1name'] = 0
+
+        canexp_df, canacc_df = pd.DataFrame(data=exposures), pd.DataFrame(data=accounts)
+
+        levels = sorted(ufcp.keys())[1:]
+
+        for l in levels:
+            lufcp = ufcp[l]
+            lfmaggp = self.fm_agg_profile[l]
+
+            for it in fm_items:
+                it['level_id'] = l
+
+            level_fm_terms_func = get_sub_layer_non_coverage_level_fm_terms if l < max(levels) else get_layer_level_fm_terms
+
+            expected = list(level_fm_terms_func(
+                lufcp, lfmaggp, {i: it for i, it in enumerate(copy.deepcopy(fm_items))}, canexp_df, canacc_df
+            ))
+
+            results_df = get_fm_terms_by_level_as_df(lufcp, lfmaggp, pd.DataFrame(data=fm_items), canexp_df, canacc_df)
+
+            self._assert_same_items(expected, results_df)
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        exposures=canonical_exposures_data(
+            from_account_nums=just('A1'),
+            size=10
+        ),
+        accounts=canonical_accounts_data(
+            from_account_nums=just('A1'),
+            from_policy_nums=just('A1P1'),
+            size=1
+        ),
+        fm_items=fm_items_data(
+            from_coverage_type_ids=just(OASIS_COVERAGE_TYPES['buildings']['id']),
+            from_canacc_ids=just(0),
+            from_policy_nums=just('A1P1'),
+            from_layer_ids=just(1),
+            from_tiv_elements=just('wscv1val'),
+            from_tiv_tgids=just(1),
+            from_share_elements=just('wscv1ded'),
+            size=10
+        )
+    )
+    def test_non_coverage_level_items_with_share_elements___share_elements_match_non_coverage_level_generators(self, exposures, accounts, fm_items):
+        ufcp = self.unified_canonical_profile
+
+        for it in fm_items:
+            it['cond1name'] = 0
+
+        canexp_df, canacc_df = pd.DataFrame(data=exposures), pd.DataFrame(data=accounts)
+
+        levels = sorted(ufcp.keys())[1:]
+
+        for l in levels:
+            lufcp = ufcp[l]
+            lfmaggp = self.fm_agg_profile[l]
+
+            for it in fm_items:
+                it['level_id'] = l
+
+            level_fm_terms_func = get_sub_layer_non_coverage_level_fm_terms if l < max(levels) else get_layer_level_fm_terms
+
+            expected = list(level_fm_terms_func(
+                lufcp, lfmaggp, {i: it for i, it in enumerate(copy.deepcopy(fm_items))}, canexp_df, canacc_df
+            ))
+
+            results_df = get_fm_terms_by_level_as_df(lufcp, lfmaggp, pd.DataFrame(data=fm_items), canexp_df, canacc_df)
+
+            # The share elements are those of the level profile at the layer
+            # level, and those of the items at the other levels
+            shr_elm = (lufcp[1]['share']['ProfileElementName'].lower() if lufcp[1].get('share') else None) if l == max(levels) else 'wscv1ded'
+            self.assertEqual([shr_elm] * len(fm_items), [it['shr_elm'] for it in expected])
+            self.assertEqual([shr_elm] * len(fm_items), results_df['shr_elm'].tolist())
+            self._assert_same_items(expected, results_df)
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        exposures=canonical_exposures_data(
+            from_account_nums=just('A1'),
+            size=10
+        ),
+        accounts=canonical_accounts_data(
+            from_account_nums=just('A1'),
+            from_policy_nums=just('A1P1'),
+            size=1
+        ),
+        fm_items=fm_items_data(
+            from_level_ids=just(1),
+            from_canacc_ids=just(1),
+            from_policy_nums=just('A1P1'),
+            size=10
+        )
+    )
+    def test_items_without_source_rows__oasis_exception_is_raised(self, exposures, accounts, fm_items):
+        with self.assertRaises(OasisException):
+            get_fm_terms_by_level_as_df(
+                self.unified_canonical_profile[1],
+                self.fm_agg_profile[1],
+                pd.DataFrame(data=fm_items),
+                pd.DataFrame(data=exposures),
+                pd.DataFrame(data=accounts)
+            )
+
+
 class GetPolicyTcIds(TestCase):
     
     @pytest.mark.flaky
@@ -867,3 +1109,33 @@ class GetPolicyTcIds(TestCase):
         for policytc_id, policytc_comb in policytc_ids.items():
             t = dict(zip(('limit', 'deductible', 'deductible_min', 'deductible_max', 'attachment', 'share', 'calcrule_id',), term_combs[policytc_id]))
             self.assertEqual(t, policytc_comb)
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        fm_items=fm_items_data(
+            from_level_ids=sampled_from([1,6]),
+            from_deductibles=sampled_from([0,100]),
+            from_min_deductibles=sampled_from([0, 100]),
+            from_max_deductibles=sampled_from([0, 100]),
+            from_attachments=just(0),
+            from_limits=sampled_from([0,100]),
+            from_shares=sampled_from([0,0.99]),
+            from_calcrule_ids=just(12),
+            size=10
+        )
+    )
+    def test_fm_policytc_ids(self, fm_items):
+        fm_items_df = pd.DataFrame(data=fm_items)
+
+        policytc_ids = get_policytc_ids(fm_items_df)
+
+        fm_policytc_ids = get_fm_policytc_ids(fm_items_df)
+
+        self.assertEqual(len(fm_items), len(fm_policytc_ids))
+        self.assertEqual(set(policytc_ids.keys()), set(fm_policytc_ids))
+
+        for (_, it), policytc_id in zip(fm_items_df.iterrows(), fm_policytc_ids):
+            self.assertEqual(
+                policytc_ids[policytc_id],
+                {k: it[k] for k in ('limit', 'deductible', 'deductible_min', 'deductible_max', 'attachment', 'share', 'calcrule_id',)}
+            )
@@ -0,0 +1,263 @@
+from unittest import TestCase
+
+import os
+
+from collections import namedtuple
+
+import numpy as np
+
+from backports.tempfile import TemporaryDirectory
+
+from hypothesis import (
+    given,
+    HealthCheck,
+    settings,
+)
+from hypothesis.strategies import (
+    booleans,
+    floats,
+    integers,
+    lists,
+    tuples,
+)
+from mock import Mock, patch
+
+from oasislmf.utils.exceptions import OasisException
+from oasislmf.utils.peril import (
+    get_bounds_containment,
+    PerilAreasArrays,
+    PerilAreasGrid,
+)
+
+
+class GetBoundsContainment(TestCase):
+
+    def assert_containment(self, points, bounds, max_cells_per_area=16):
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+
+        counts, positions = get_bounds_containment(xs, ys, bounds, max_cells_per_area=max_cells_per_area)
+
+        for i, (x, y) in enumerate(points):
+            containing = [j for j, (minx, miny, maxx, maxy) in enumerate(bounds) if minx <= x <= maxx and miny <= y <= maxy]
+            self.assertEqual(counts[i], len(containing))
+            if containing:
+                self.assertIn(positions[i], containing)
+            else:
+                self.assertEqual(positions[i], -1)
+
+    def test_no_points_or_no_bounds___counts_are_zero(self):
+        counts, positions = get_bounds_containment([], [], [(0, 0, 1, 1)])
+        self.assertEqual(len(counts), 0)
+
+        counts, positions = get_bounds_containment([0.5], [0.5], [])
+        self.assertEqual(counts.tolist(), [0])
+        self.assertEqual(positions.tolist(), [-1])
+
+    @settings(suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        points=lists(tuples(floats(min_value=-1, max_value=11), floats(min_value=-1, max_value=11)), max_size=30),
+        areas=lists(
+            tuples(floats(min_value=0, max_value=10), floats(min_value=0, max_value=10), floats(min_value=0, max_value=5), floats(min_value=0, max_value=5)),
+            min_size=1, max_size=30
+        ),
+        max_cells_per_area=integers(min_value=1, max_value=16)
+    )
+    def test_arbitrary_bounds___counts_and_positions_match_direct_containment(self, points, areas, max_cells_per_area):
+        bounds = [(x, y, x + w, y + h) for x, y, w, h in areas]
+
+        self.assert_containment(points, bounds, max_cells_per_area=max_cells_per_area)
+
+    def test_degenerate_and_very_small_bounds___counts_and_positions_match_direct_containment(self):
+        bounds = [(0.0, 0.0, 0.0, 3.118067676057625e-261), (0.0, 1.0, 0.0, 1.0), (5.0, 5.0, 5.0 + 1e-300, 5.0)]
+
+        self.assert_containment([(0.0, 1.0), (0.0, 0.0), (5.0, 5.0), (0.0, 0.5), (10.0, 10.0)], bounds)
+
+    @given(
+        num_cells=integers(min_value=1, max_value=8),
+        points=lists(tuples(integers(min_value=-2, max_value=20), integers(min_value=-2, max_value=20)), max_size=30)
+    )
+    def test_grid_bounds_with_points_on_cell_edges___shared_edges_are_contained_in_all_adjacent_cells(self, num_cells, points):
+        bounds = [(0.5 * i, 0.5 * j, 0.5 * (i + 1), 0.5 * (j + 1)) for i in range(num_cells) for j in range(num_cells)]
+
+        self.assert_containment([(0.25 * x, 0.25 * y) for x, y in points], bounds)
+
+
+class PerilAreasGridCreate(TestCase):
+
+    def grid_areas(self, num_cols, num_rows, cell_width, cell_height, missing=(), coverage_types=(1,)):
+        areas = []
+        for coverage_type in coverage_types:
+            for i in range(num_cols):
+                for j in range(num_rows):
+                    if (i, j) not in missing:
+                        bounds = (-90 + i * cell_width, 30 + j * cell_height, -90 + (i + 1) * cell_width, 30 + (j + 1) * cell_height)
+                        areas.append((1, coverage_type, len(areas) + 1, bounds))
+        return areas
+
+    @given(
+        num_cols=integers(min_value=1, max_value=10),
+        num_rows=integers(min_value=1, max_value=10),
+        cell_width=floats(min_value=0.001, max_value=1),
+        cell_height=floats(min_value=0.001, max_value=1),
+        two_coverage_types=booleans()
+    )
+    def test_areas_form_a_grid___grid_is_detected(self, num_cols, num_rows, cell_width, cell_height, two_coverage_types):
+        coverage_types = (1, 3) if two_coverage_types else (1,)
+        areas = self.grid_areas(num_cols, num_rows, cell_width, cell_height, coverage_types=coverage_types)
+
+        grid = PerilAreasGrid.create(areas)
+
+        self.assertIsNotNone(grid)
+        self.assertEqual((grid.num_cols, grid.num_rows), (num_cols, num_rows))
+        self.assertAlmostEqual(grid.cell_width, cell_width)
+        self.assertAlmostEqual(grid.cell_height, cell_height)
+        self.assertEqual(grid.keys(), [(1, c) for c in coverage_types])
+        self.assertEqual(sorted(id for c in coverage_types for id in grid.area_ids(1, c).tolist()), [area_id for _, _, area_id, _ in areas])
+
+    def test_areas_with_missing_cells___grid_is_detected(self):
+        grid = PerilAreasGrid.create(self.grid_areas(5, 4, 0.1, 0.1, missing=((1, 1), (4, 0), (0, 3))))
+
+        self.assertEqual((grid.num_cols, grid.num_rows), (5, 4))
+        self.assertEqual(len(grid.area_ids(1, 1)), 17)
+
+    def test_overlapping_areas___no_grid_is_detected(self):
+        self.assertIsNone(PerilAreasGrid.create([(1, 1, 1, (0, 0, 1, 1)), (1, 1, 2, (0.5, 0.5, 1.5, 1.5))]))
+
+    def test_irregularly_spaced_areas___no_grid_is_detected(self):
+        self.assertIsNone(PerilAreasGrid.create([(1, 1, 1, (0, 0, 1, 1)), (1, 1, 2, (1, 0, 2, 1)), (1, 1, 3, (2.5, 0, 3.5, 1))]))
+
+    def test_areas_within_the_cells_of_a_declared_grid___areas_are_assigned_to_the_cells(self):
+        areas = [(1, 1, 1, (0.1, 0.1, 0.4, 0.4)), (1, 1, 2, (1.1, 0.1, 1.4, 0.4)), (1, 1, 3, (0.6, 1.6, 0.9, 1.9))]
+
+        grid = PerilAreasGrid.create(areas, spec={'x_origin': 0, 'y_origin': 0, 'cell_width': 0.5, 'cell_height': 0.5})
+
+        self.assertEqual((grid.num_cols, grid.num_rows), (3, 4))
+        counts, positions = grid.get_bounds_containment([0.2, 1.2, 0.7, 0.7], [0.2, 0.2, 1.7, 0.7], 1, 1)
+        self.assertEqual(counts.tolist(), [1, 1, 1, 0])
+        self.assertEqual(grid.area_ids(1, 1)[positions[:3]].tolist(), [1, 2, 3])
+
+    def test_areas_do_not_fit_declared_grid___oasis_exception_is_raised(self):
+        areas = [(1, 1, 1, (0.1, 0.1, 0.9, 0.4))]
+
+        with self.assertRaises(OasisException):
+            PerilAreasGrid.create(areas, spec={'x_origin': 0, 'y_origin': 0, 'cell_width': 0.5, 'cell_height': 0.5})
+
+    @settings(suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        num_cols=integers(min_value=3, max_value=8),
+        num_rows=integers(min_value=2, max_value=8),
+        points=lists(tuples(integers(min_value=-4, max_value=40), integers(min_value=-4, max_value=40)), max_size=40)
+    )
+    def test_grid_bounds_containment___result_is_the_same_as_for_all_bounds(self, num_cols, num_rows, points):
+        grid = PerilAreasGrid.create(self.grid_areas(num_cols, num_rows, 0.1, 0.2, missing=((0, 0), (2, 1))))
+        xs = [-90 + 0.025 * x for x, _ in points]
+        ys = [30 + 0.05 * y for _, y in points]
+
+        counts, positions = grid.get_bounds_containment(xs, ys, 1, 1)
+        expected_counts, expected_positions = get_bounds_containment(xs, ys, grid.area_bounds(1, 1))
+
+        self.assertEqual(counts.tolist(), expected_counts.tolist())
+        self.assertEqual(positions[counts == 1].tolist(), expected_positions[counts == 1].tolist())
+
+    def test_grid_is_saved_and_loaded___loaded_grid_is_the_same(self):
+        grid = PerilAreasGrid.create(self.grid_areas(4, 3, 0.1, 0.1, missing=((1, 1),), coverage_types=(1, 3)))
+
+        with TemporaryDirectory() as d:
+            loaded = PerilAreasGrid.load(grid.save(os.path.join(d, 'areas.grid')))
+
+        self.assertEqual(
+            (loaded.x_origin, loaded.y_origin, loaded.cell_width, loaded.cell_height, loaded.num_cols, loaded.num_rows),
+            (grid.x_origin, grid.y_origin, grid.cell_width, grid.cell_height, grid.num_cols, grid.num_rows)
+        )
+        self.assertEqual(loaded.keys(), grid.keys())
+        for key in grid.keys():
+            self.assertEqual(loaded.area_ids(*key).tolist(), grid.area_ids(*key).tolist())
+            self.assertEqual(loaded.area_bounds(*key).tolist(), grid.area_bounds(*key).tolist())
+
+    def test_save_fails___existing_grid_is_unchanged(self):
+        grid = PerilAreasGrid.create(self.grid_areas(4, 3, 0.1, 0.1))
+
+        with TemporaryDirectory() as d:
+            fp = grid.save(os.path.join(d, 'areas.grid'))
+
+            with patch('oasislmf.utils.peril.np.savez', Mock(side_effect=IOError('disk full'))):
+                with self.assertRaises(OasisException):
+                    PerilAreasGrid.create(self.grid_areas(2, 2, 0.1, 0.1)).save(fp)
+
+            self.assertEqual(grid.num_cols, PerilAreasGrid.load(fp).num_cols)
+            self.assertEqual(['areas.grid'], os.listdir(d))
+
+
+FakePerilArea = namedtuple('FakePerilArea', ['peril_id', 'coverage_type', 'id', 'bounds', 'coordinates'])
+
+
+class PerilAreasArraysCreate(TestCase):
+
+    def peril_areas(self, num_coords):
+        return [
+            FakePerilArea(
+                1 + i % 2, 1 + i % 4, 100 + i, (float(i), 0.0, i + 1.0, 1.0),
+                tuple((i + 0.5 * j, 0.25 * j) for j in range(n))
+            ) for i, n in enumerate(num_coords)
+        ]
+
+    @given(num_coords=lists(integers(min_value=0, max_value=6), max_size=20))
+    def test_store_is_saved_and_loaded___areas_are_the_same(self, num_coords):
+        peril_areas = self.peril_areas(num_coords)
+
+        with TemporaryDirectory() as d:
+            fp = PerilAreasArrays.create(peril_areas).save(os.path.join(d, 'areas.areas'))
+            arrays = PerilAreasArrays.load(fp)
+
+            self.assertEqual(len(arrays), len(peril_areas))
+            for i, pa in enumerate(peril_areas):
+                self.assertEqual(arrays[i], (pa.peril_id, pa.coverage_type, pa.id, pa.bounds, pa.coordinates))
+                self.assertEqual([type(v) for v in arrays[i][:3]], [int, int, int])
+
+    def test_store_is_saved_over_a_loaded_store___loaded_store_is_unchanged(self):
+        peril_areas = self.peril_areas([3, 4])
+
+        with TemporaryDirectory() as d:
+            fp = PerilAreasArrays.create(peril_areas).save(os.path.join(d, 'areas.areas'))
+            arrays = PerilAreasArrays.load(fp)
+
+            PerilAreasArrays.create(self.peril_areas([5, 1, 2])).save(fp)
+
+            self.assertEqual([arrays[i] for i in range(len(arrays))], [(pa.peril_id, pa.coverage_type, pa.id, pa.bounds, pa.coordinates) for pa in peril_areas])
+            self.assertEqual(3, len(PerilAreasArrays.load(fp)))
+
+    def test_save_fails___existing_store_is_unchanged(self):
+        with TemporaryDirectory() as d:
+            fp = PerilAreasArrays.create(self.peril_areas([3, 4])).save(os.path.join(d, 'areas.areas'))
+
+            with patch('oasislmf.utils.peril.write_binary_file_header', Mock(side_effect=IOError('disk full'))):
+                with self.assertRaises(OasisException):
+                    PerilAreasArrays.create(self.peril_areas([5])).save(fp)
+
+            self.assertEqual(2, len(PerilAreasArrays.load(fp)))
+            self.assertEqual(['areas.areas'], os.listdir(d))
+
+    def test_find___first_position_with_the_peril_id_and_coverage_type_is_returned(self):
+        arrays = PerilAreasArrays.create(self.peril_areas([4] * 8))
+
+        self.assertEqual(arrays.find([7, 5, 1, 3], 2, 2), 5)
+        self.assertEqual(arrays.find([0, 4], 1, 1), 0)
+        self.assertIsNone(arrays.find([0, 2, 4], 2, 2))
+        self.assertIsNone(arrays.find([], 1, 1))
+
+    def test_non_integer_area_ids___oasis_exception_is_raised(self):
+        peril_areas = self.peril_areas([4, 4])
+        peril_areas[1] = peril_areas[1]._replace(id='a')
+
+        with self.assertRaises(OasisException):
+            PerilAreasArrays.create(peril_areas)
+
+    def test_file_is_not_a_store___oasis_exception_is_raised(self):
+        with TemporaryDirectory() as d:
+            fp = os.path.join(d, 'areas.areas')
+            with open(fp, 'wb') as f:
+                f.write(b'not an areas store')
+
+            with self.assertRaises(OasisException):
+                PerilAreasArrays.load(fp)
@@ -0,0 +1,109 @@
+from unittest import TestCase
+
+import os
+
+import numpy as np
+
+from backports.tempfile import TemporaryDirectory
+from hypothesis import (
+    given,
+    HealthCheck,
+    settings,
+)
+from hypothesis.strategies import (
+    integers,
+    lists,
+    tuples,
+)
+
+from oasislmf.utils.exceptions import OasisException
+from oasislmf.utils.vulnerability import VulnerabilitiesIndex
+
+
+KEY_COLS = ('peril_id', 'coverage_type', 'occ')
+
+
+def create_index(vulns):
+    return VulnerabilitiesIndex.create(
+        KEY_COLS,
+        [[v[i] for v in vulns] for i in range(len(KEY_COLS))],
+        [v[-1] for v in vulns]
+    )
+
+
+vulnerabilities = lists(
+    tuples(integers(min_value=1, max_value=4), integers(min_value=1, max_value=4), integers(min_value=-10, max_value=10**6), integers(min_value=1, max_value=10**9)),
+    min_size=1, max_size=50
+)
+
+
+class VulnerabilitiesIndexLookup(TestCase):
+
+    @given(vulns=vulnerabilities, other_keys=lists(tuples(integers(min_value=0, max_value=5), integers(min_value=0, max_value=5), integers(min_value=-20, max_value=10**6 + 10)), max_size=20))
+    def test_keys_are_looked_up___results_are_the_same_as_for_a_dict(self, vulns, other_keys):
+        index = create_index(vulns)
+        expected = dict((v[:3], v[3]) for v in vulns)
+
+        self.assertEqual(len(index), len(expected))
+        for key in list(expected) + other_keys:
+            self.assertEqual(index.get(key), expected.get(key))
+            self.assertEqual(key in index, key in expected)
+
+    @given(vulns=vulnerabilities, other_keys=lists(tuples(integers(min_value=0, max_value=5), integers(min_value=0, max_value=5), integers(min_value=-20, max_value=10**6 + 10)), max_size=20))
+    def test_batch_of_keys_is_looked_up___results_are_the_same_as_for_a_dict(self, vulns, other_keys):
+        index = create_index(vulns)
+        expected = dict((v[:3], v[3]) for v in vulns)
+        keys = list(expected) + other_keys
+
+        ids = index.get_vulnerability_ids([[k[i] for k in keys] for i in range(len(KEY_COLS))], missing=-1)
+
+        self.assertEqual(ids.tolist(), [expected.get(k, -1) for k in keys])
+
+    def test_duplicate_keys___last_vulnerability_id_is_used(self):
+        index = create_index([(1, 1, 5, 10), (1, 1, 5, 11), (1, 2, 5, 12)])
+
+        self.assertEqual(index[(1, 1, 5)], 11)
+        self.assertEqual(len(index), 2)
+
+    def test_non_integer_key_values___key_values_match_numerically_equal_integers_only(self):
+        index = create_index([(1, 1, 5, 10)])
+
+        self.assertEqual(index[(1.0, np.int64(1), np.float64(5.0))], 10)
+        self.assertEqual(type(index[(1, 1, 5)]), int)
+        for key in [(1, 1, 5.5), (1, 1, '5'), (1, 1, None), (1, 1, float('nan')), (1, 1), (1, 1, 5, 1)]:
+            with self.assertRaises(KeyError):
+                index[key]
+
+        ids = index.get_vulnerability_ids([[1, 1, 1, 1], [1, 1, 1, 1], [5.0, 5.5, float('nan'), float('inf')]], missing=0)
+        self.assertEqual(ids.tolist(), [10, 0, 0, 0])
+
+    def test_key_value_ranges_are_too_large___oasis_exception_is_raised(self):
+        with self.assertRaises(OasisException):
+            create_index([(1, -2**40, 0, 1), (2, 2**40, 2**40, 2)])
+
+
+class VulnerabilitiesIndexSaveLoad(TestCase):
+
+    @settings(suppress_health_check=[HealthCheck.too_slow])
+    @given(vulns=vulnerabilities)
+    def test_index_is_saved_and_loaded___loaded_index_is_memory_mapped_and_has_the_same_entries(self, vulns):
+        index = create_index(vulns)
+
+        with TemporaryDirectory() as d:
+            loaded = VulnerabilitiesIndex.load(index.save(os.path.join(d, 'vulns.idx')))
+
+            self.assertEqual(loaded.key_cols, KEY_COLS)
+            self.assertEqual(len(loaded), len(index))
+            for v in vulns:
+                self.assertEqual(loaded[v[:3]], index[v[:3]])
+
+            del loaded
+
+    def test_file_is_not_an_index_file___oasis_exception_is_raised(self):
+        with TemporaryDirectory() as d:
+            fp = os.path.join(d, 'vulns.idx')
+            with open(fp, 'wb') as f:
+                f.write(b'peril_id,coverage_type,occ,vulnerability_id\n')
+
+            with self.assertRaises(OasisException):
+                VulnerabilitiesIndex.load(fp)